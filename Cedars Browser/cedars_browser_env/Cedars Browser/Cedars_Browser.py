@@ -1,9 +1,75 @@
 import sys
 import os
+import time
+from single_instance import SingleInstanceServer, forward_to_running_instance, parse_arguments
+
+# Headless batch modes, kiosks and dashboards do their work in their own process
+STANDALONE_FLAGS = ('--pdf', '--screenshot', '--kiosk', '--grid')
+standalone = any(argument in STANDALONE_FLAGS for argument in sys.argv[1:])
+
+# A second launch hands its URLs to the running browser and exits before QtWebEngine is loaded
+if __name__ == "__main__" and not standalone:
+    forwarded = forward_to_running_instance(sys.argv[1:])
+    if forwarded is False:
+        print("Cedars Browser is already running but did not respond", file=sys.stderr)
+    if forwarded is not None:
+        sys.exit(0 if forwarded else 1)
+
 from PyQt5.QtCore import *
 from PyQt5.QtWidgets import *
-from PyQt5.QtGui import QIcon
+from PyQt5.QtGui import QKeySequence
+from PyQt5.QtNetwork import QHostInfo
 from PyQt5.QtWebEngineWidgets import *
+from PyQt5 import sip
+import icon_cache
+from tab_lifecycle import TabLifecycleManager
+from memory_budget import shared_monitor
+from page_pool import shared_pool
+from prerender import SpeculativePage, shared_prerenderer
+from http_cache import HttpCacheMonitor
+from content_blocker import ContentBlockingInterceptor
+from omnibox import OmniboxCompleter, shared_index
+from history_store import HistoryStore
+from page_text_index import PageTextIndex
+from history_view import HistoryWindow
+from internal_pages import InternalPageHandler, SCHEME, error_url, register_scheme
+import offline_archive
+from offline_archive import OfflineArchive, OfflinePageHandler, offline_url
+from navigation_timing import NavigationTimer, summary as timing_summary
+from stall_detector import StallDetector
+from crash_recovery import shared_recovery
+import tracing
+from tracing import traced
+import pdf_batch
+import screenshot_batch
+import kiosk
+import dashboard_grid
+from dashboard_grid import DashboardGrid
+import automation
+from automation import AutomationServer
+
+HOME_URL = 'http://google.com'  # Starting with HTTP for demonstration
+NEW_TAB_URL = 'cedars://newtab'
+SETTINGS_URL = 'cedars://settings'
+# Hidden pages kept warm for new tabs, windows and popups; 0 turns the pool off
+WARM_PAGES = 2
+# Disk cache for the default profile; the dashboards we reload all day fit comfortably
+HTTP_CACHE_MB = 512
+# URL bar, SSL icon, tab title and history updates are applied at most once per frame
+FRAME_INTERVAL_MS = 16
+
+
+def data_path(*parts):
+    # Per-user storage for history, filter lists and caches
+    path = os.path.join(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation), *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def register_schemes():
+    # Custom schemes must be known before the QApplication is created
+    register_scheme()
+    offline_archive.register_scheme()
 
 
 class ClickableLineEdit(QLineEdit):
@@ -14,64 +80,215 @@ class ClickableLineEdit(QLineEdit):
         self.clicked.emit()
 
 class CustomWebEngineView(QWebEngineView):
-    def __init__(self):
+    def __init__(self, profile=None, page=None):
         super().__init__()
+        # Each view owns its page so tabs can be frozen and discarded independently
+        if page is None:
+            page = SpeculativePage(profile or QWebEngineProfile.defaultProfile(), self)
+        else:
+            page.setParent(self)
+        self.setPage(page)
+        self.tabs = None
 
     def contextMenuEvent(self, event):
         event.ignore()
 
+    def createWindow(self, window_type):
+        # Popups and target=_blank links open as tabs in the same window
+        if self.tabs is None:
+            return None
+        background = window_type == QWebEnginePage.WebBrowserBackgroundTab
+        return self.tabs.add_tab(background=background)
+
+class BrowserTabs(QTabWidget):
+    viewCreated = pyqtSignal(QWebEngineView)
+    pageReplaced = pyqtSignal(QWebEngineView)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setTabsClosable(True)
+        self.setMovable(True)
+        self.setDocumentMode(True)
+        self.lifecycle = TabLifecycleManager(self)
+        self.memory = shared_monitor()
+        self.pool = shared_pool()
+        self.prerenderer = shared_prerenderer()
+        self.recovery = shared_recovery()
+        self.previous_view = None
+
+        self.tabCloseRequested.connect(self.close_tab)
+        self.currentChanged.connect(self.current_tab_changed)
+
+    def add_tab(self, url=None, background=False):
+        # A pooled page already has a renderer running
+        view = CustomWebEngineView(page=self.pool.take())
+        view.tabs = self
+        self.attach_page(view.page())
+
+        self.viewCreated.emit(view)
+        index = self.addTab(view, "New Tab")
+        view.iconChanged.connect(lambda icon, view=view: self.setTabIcon(self.indexOf(view), icon))
+        if url is not None:
+            view.setUrl(url)
+        if not background:
+            self.setCurrentIndex(index)
+        return view
+
+    @pyqtSlot(int)
+    def close_tab(self, index):
+        if self.count() < 2:
+            return
+        view = self.widget(index)
+        self.detach_page(view.page())
+        if view is self.previous_view:
+            self.previous_view = None
+        self.removeTab(index)
+        view.deleteLater()
+
+    def attach_page(self, page):
+        self.lifecycle.track(page)
+        self.memory.track(page, self.lifecycle)
+        self.recovery.track(page)
+        page.linkHovered.connect(lambda url, page=page: self.prerenderer.link_hovered(page, url))
+        # Closing a window deletes its pages without going through close_tab; the monitors
+        # are shared by every window and must never touch a deleted page
+        page.destroyed.connect(lambda obj=None, page=page: self.detach_page(page))
+
+    def detach_page(self, page):
+        self.lifecycle.untrack(page)
+        self.memory.untrack(page)
+        self.recovery.untrack(page)
+
+    def replace_page(self, view, page):
+        # Shows a prerendered page in place of the view's current one
+        if sip.isdeleted(view) or self.indexOf(view) < 0:
+            page.deleteLater()
+            return
+        old_page = view.page()
+        self.detach_page(old_page)
+        page.setParent(view)
+        view.setPage(page)
+        old_page.deleteLater()
+        self.attach_page(page)
+        if view is self.currentWidget():
+            self.lifecycle.activate(page)
+        self.pageReplaced.emit(view)
+
+    @pyqtSlot(int)
+    def current_tab_changed(self, index):
+        if self.previous_view is not None:
+            self.lifecycle.deactivate(self.previous_view.page())
+        view = self.widget(index)
+        if view is not None:
+            self.lifecycle.activate(view.page())
+        self.previous_view = view
+
+    def update_tab_title(self, view, title):
+        index = self.indexOf(view)
+        self.setTabText(index, title or "New Tab")
+        self.setTabToolTip(index, title)
+
+    def views(self):
+        return [self.widget(i) for i in range(self.count())]
+
 class NoRightClickToolButton(QToolButton):
     def contextMenuEvent(self, event):
         event.ignore()
 
 class MainWindow(QMainWindow):
     urlChanged = pyqtSignal(QUrl)
-
-    def __init__(self):
+    # Shared by every window since they all use the default profile
+    content_blocker = None
+    http_cache = None
+    history = None
+    page_text = None
+    internal_pages = None
+    offline_archive = None
+    navigation_timer = None
+    stall_detector = None
+
+    def __init__(self, start_url=HOME_URL, phase=None):
         super(MainWindow, self).__init__()
-        self.browser = CustomWebEngineView()
-        self.browser.setUrl(QUrl('http://google.com'))  # Starting with HTTP for demonstration
-        self.setCentralWidget(self.browser)
+        # phase(name) is called as each stage of construction completes; used by startup_benchmark.py
+        phase = phase or (lambda name: None)
+        self.tabs = BrowserTabs()
+        # The tabs, or the dashboard grid when one is shown
+        self.central = QStackedWidget()
+        self.central.addWidget(self.tabs)
+        self.setCentralWidget(self.central)
+        self.dashboard = None
+        self.history_window = None
+
+        # view -> latest URL / title not yet applied to the UI and history
+        self.pending_urls = {}
+        self.pending_titles = {}
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(FRAME_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush_view_updates)
         self.showMaximized()
 
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        app_icon = QIcon(os.path.join(current_dir, 'icons', 'app_icon.png'))
-        self.setWindowIcon(app_icon)
-
-        # Connect the browser's urlChanged signal to update_url method
-        self.browser.urlChanged.connect(self.update_url)
-
-        # Inject custom CSS for scrollbars
-        self.browser.page().profile().scripts().insert(self.custom_css_script())
+        self.setWindowIcon(icon_cache.icon('app_icon'))
+        phase('window')
+
+        # Watches the GUI event loop for freezes and records where they happened
+        if MainWindow.stall_detector is None:
+            MainWindow.stall_detector = StallDetector(data_path('stalls.jsonl'), parent=QCoreApplication.instance())
+            QCoreApplication.instance().aboutToQuit.connect(MainWindow.stall_detector.stop)
+            MainWindow.stall_detector.start()
+
+        # Configured before the first page of the session makes a request
+        if MainWindow.http_cache is None:
+            # Inject custom CSS for scrollbars; the profile is shared, so once for every window
+            with tracing.span('inject_custom_css', 'script'):
+                QWebEngineProfile.defaultProfile().scripts().insert(self.custom_css_script())
+            cache_dir = os.path.join(QStandardPaths.writableLocation(QStandardPaths.CacheLocation), 'http')
+            MainWindow.http_cache = HttpCacheMonitor(QWebEngineProfile.defaultProfile(), cache_dir,
+                                                     HTTP_CACHE_MB, QCoreApplication.instance())
+
+        # Per-navigation timings, appended to a JSONL log
+        if MainWindow.navigation_timer is None:
+            MainWindow.navigation_timer = NavigationTimer(data_path('navigation_timing.jsonl'),
+                                                          QCoreApplication.instance())
+        self.navigation_timer.navigationMeasured.connect(self.navigation_measured)
+
+        # Spare pages for new tabs; the pool fills itself once startup has settled
+        shared_pool().set_size(WARM_PAGES)
+
+        # Block ads and trackers using the EasyList-style lists in the filters directory
+        if MainWindow.content_blocker is None:
+            MainWindow.content_blocker = ContentBlockingInterceptor(QCoreApplication.instance())
+            filter_dir = data_path('filters')
+            os.makedirs(filter_dir, exist_ok=True)
+            MainWindow.content_blocker.load(filter_dir, data_path('content_blocker.cache'))
+            QWebEngineProfile.defaultProfile().setUrlRequestInterceptor(MainWindow.content_blocker)
+        phase('profile')
 
         # navbar
         navbar = QToolBar()
         navbar.setMovable(False)
         self.addToolBar(navbar)
 
-        # Get current directory
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-
         back_btn = NoRightClickToolButton(self)
-        back_btn.setIcon(QIcon(os.path.join(current_dir, 'icons', 'back.png')))
-        back_btn.clicked.connect(self.browser.back)
+        back_btn.setIcon(icon_cache.icon('back'))
+        back_btn.clicked.connect(lambda: self.browser.back())
         back_btn.setCursor(Qt.PointingHandCursor)
         navbar.addWidget(back_btn)
 
         forward_btn = NoRightClickToolButton(self)
-        forward_btn.setIcon(QIcon(os.path.join(current_dir, 'icons', 'forward.png')))
-        forward_btn.clicked.connect(self.browser.forward)
+        forward_btn.setIcon(icon_cache.icon('forward'))
+        forward_btn.clicked.connect(lambda: self.browser.forward())
         forward_btn.setCursor(Qt.PointingHandCursor)
         navbar.addWidget(forward_btn)
 
         reload_btn = NoRightClickToolButton(self)
-        reload_btn.setIcon(QIcon(os.path.join(current_dir, 'icons', 'reload.png')))
-        reload_btn.clicked.connect(self.browser.reload)
+        reload_btn.setIcon(icon_cache.icon('reload'))
+        reload_btn.clicked.connect(lambda: self.browser.reload())
         reload_btn.setCursor(Qt.PointingHandCursor)
         navbar.addWidget(reload_btn)
 
         home_btn = NoRightClickToolButton(self)
-        home_btn.setIcon(QIcon(os.path.join(current_dir, 'icons', 'home.png')))
+        home_btn.setIcon(icon_cache.icon('home'))
         home_btn.clicked.connect(self.navigate_home)
         home_btn.setCursor(Qt.PointingHandCursor)
         navbar.addWidget(home_btn)
@@ -94,18 +311,44 @@ class MainWindow(QMainWindow):
         self.url_bar.returnPressed.connect(self.navigate_to_url)
         self.url_bar.clicked.connect(self.url_bar.selectAll)
         navbar.addWidget(self.url_bar)
+        phase('navigation_buttons')
+
+        # As-you-type suggestions from visited pages
+        self.omnibox = shared_index()
+        if MainWindow.history is None:
+            MainWindow.history = HistoryStore(data_path('history.db'), QCoreApplication.instance())
+            QCoreApplication.instance().aboutToQuit.connect(MainWindow.history.close)
+            MainWindow.history.urlsExpired.connect(self.omnibox.remove_all)
+            self.omnibox.load(MainWindow.history.frecency_rows)
+            # Makes history searchable by what the pages said
+            MainWindow.page_text = PageTextIndex(MainWindow.history, QCoreApplication.instance())
+            QCoreApplication.instance().aboutToQuit.connect(MainWindow.page_text.close)
+            MainWindow.history.urlsExpired.connect(MainWindow.page_text.prune)
+            # Error, history, settings and new tab pages
+            MainWindow.internal_pages = InternalPageHandler(
+                MainWindow.history, self.internal_settings, HOME_URL, MainWindow.page_text,
+                QCoreApplication.instance())
+            QWebEngineProfile.defaultProfile().installUrlSchemeHandler(SCHEME, MainWindow.internal_pages)
+            # Pages saved for offline reading, shown when their site cannot be reached
+            MainWindow.offline_archive = OfflineArchive(
+                data_path('offline'), QWebEngineProfile.defaultProfile(), QCoreApplication.instance())
+            QWebEngineProfile.defaultProfile().installUrlSchemeHandler(
+                offline_archive.SCHEME, OfflinePageHandler(MainWindow.offline_archive, QCoreApplication.instance()))
+        self.completer = OmniboxCompleter(self.url_bar, self.omnibox)
+        self.completer.suggestionClicked.connect(self.navigate_to_url)
+        phase('history')
 
 
         # SSL lock icon
         self.ssl_icon = QLabel()
-        self.ssl_icon.setPixmap(QIcon(os.path.join(current_dir, 'icons', 'ssl.png')).pixmap(25, 25))
+        self.ssl_icon.setPixmap(icon_cache.pixmap('ssl', 25, 25, self.devicePixelRatioF()))
         self.ssl_icon.setStyleSheet("margin-right: 40px;")
         navbar.addWidget(self.ssl_icon)
         self.ssl_icon.setVisible(False)
 
         # Add zoom out button
         zoom_out_btn = QToolButton(self)
-        zoom_out_btn.setIcon(QIcon(os.path.join(current_dir, 'icons', 'zoom_out.png')))
+        zoom_out_btn.setIcon(icon_cache.icon('zoom_out'))
         zoom_out_btn.clicked.connect(self.zoom_out)
         zoom_out_btn.setCursor(Qt.PointingHandCursor)
         navbar.addWidget(zoom_out_btn)
@@ -115,19 +358,24 @@ class MainWindow(QMainWindow):
         self.zoom_label.setStyleSheet("font-size: 14px; margin-left: 5px; margin-right: 5px;")
         navbar.addWidget(self.zoom_label)
 
+        # Performance HUD, off unless turned on from the options menu
+        self.timing_label = QLabel()
+        self.timing_label.setStyleSheet("font-size: 12px; color: #666; margin-left: 10px; margin-right: 10px;")
+        self.timing_action = navbar.addWidget(self.timing_label)
+        self.timing_action.setVisible(False)
+
         # Add zoom in button
         zoom_in_btn = QToolButton(self)
-        zoom_in_btn.setIcon(QIcon(os.path.join(current_dir, 'icons', 'zoom_in.png')))
+        zoom_in_btn.setIcon(icon_cache.icon('zoom_in'))
         zoom_in_btn.clicked.connect(self.zoom_in)
         zoom_in_btn.setCursor(Qt.PointingHandCursor)
         navbar.addWidget(zoom_in_btn)
 
-        self.browser.urlChanged.connect(self.update_url)
-        self.urlChanged.connect(self.browser.setUrl)
+        self.urlChanged.connect(lambda url: self.browser.setUrl(url))
         
         # Add options menu button
         options_btn = QToolButton(self)
-        options_btn.setIcon(QIcon(os.path.join(current_dir, 'icons', 'options.png')))
+        options_btn.setIcon(icon_cache.icon('options'))
         options_btn.setPopupMode(QToolButton.InstantPopup)
         options_btn.setCursor(Qt.PointingHandCursor)
         options_btn.setStyleSheet("QToolButton::menu-indicator { image: none; }") 
@@ -141,9 +389,162 @@ class MainWindow(QMainWindow):
         history_action = QAction('History', self)
         history_action.triggered.connect(self.open_history)
         options_menu.addAction(history_action)
+        save_offline_action = QAction('Save Page for Offline', self)
+        save_offline_action.triggered.connect(lambda: self.offline_archive.save(self.browser.page()))
+        options_menu.addAction(save_offline_action)
+        hud_action = QAction('Performance HUD', self)
+        hud_action.setCheckable(True)
+        hud_action.toggled.connect(self.timing_action.setVisible)
+        options_menu.addAction(hud_action)
+        self.dashboard_action = QAction('Dashboard', self)
+        self.dashboard_action.setCheckable(True)
+        self.dashboard_action.setVisible(False)
+        self.dashboard_action.toggled.connect(self.toggle_dashboard)
+        options_menu.addAction(self.dashboard_action)
+        prerender_action = QAction('Prerender Hovered Links', self)
+        prerender_action.setCheckable(True)
+        prerender_action.setChecked(shared_prerenderer().enabled)
+        prerender_action.toggled.connect(shared_prerenderer().set_enabled)
+        options_menu.addAction(prerender_action)
+        trace_action = QAction('Record Trace', self)
+        trace_action.setCheckable(True)
+        trace_action.setChecked(tracing.enabled)
+        trace_action.toggled.connect(tracing.enable)
+        options_menu.addAction(trace_action)
+        save_trace_action = QAction('Save Trace...', self)
+        save_trace_action.triggered.connect(self.save_trace)
+        options_menu.addAction(save_trace_action)
 
         options_btn.setMenu(options_menu)
 
+        new_tab_shortcut = QShortcut(QKeySequence.AddTab, self)
+        new_tab_shortcut.activated.connect(self.navigate_new_tab)
+        close_tab_shortcut = QShortcut(QKeySequence.Close, self)
+        close_tab_shortcut.activated.connect(lambda: self.tabs.close_tab(self.tabs.currentIndex()))
+        phase('toolbar')
+
+        self.tabs.viewCreated.connect(self.setup_view)
+        self.tabs.pageReplaced.connect(self.view_page_replaced)
+        self.tabs.currentChanged.connect(self.current_tab_changed)
+        self.add_tab(QUrl(start_url))
+        phase('first_tab')
+
+    @property
+    def browser(self):
+        # The view in the current tab, or the selected tile; toolbar actions always target it
+        if self.dashboard is not None and self.central.currentWidget() is self.dashboard:
+            return self.dashboard.current_view()
+        return self.tabs.currentWidget()
+
+    def add_tab(self, url=None, background=False):
+        return self.tabs.add_tab(url, background)
+
+    def setup_view(self, view):
+        view.urlChanged.connect(lambda url, view=view: self.view_url_changed(view, url))
+        view.titleChanged.connect(lambda title, view=view: self.view_title_changed(view, title))
+        view.loadFinished.connect(lambda ok, view=view: self.view_load_finished(view, ok))
+        view.recorded_url = None
+        self.page_text.watch(view)
+        self.http_cache.watch(view)
+        self.navigation_timer.watch(view)
+
+    def view_page_replaced(self, view):
+        page = view.page()
+        self.page_text.watch_page(page)
+        self.view_url_changed(view, page.url())
+        self.view_title_changed(view, page.title())
+        # A prerender that already finished will not emit loadFinished again
+        if page.loaded:
+            self.view_load_finished(view, True)
+            self.page_text.page_loaded(page, True)
+            self.http_cache.measure(page)
+
+    def view_url_changed(self, view, url):
+        # Single-page apps can rewrite the URL on every scroll or keystroke; only the
+        # latest value per frame is applied
+        self.pending_urls[view] = url
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def view_title_changed(self, view, title):
+        self.pending_titles[view] = title
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    @pyqtSlot()
+    def flush_view_updates(self):
+        urls, self.pending_urls = self.pending_urls, {}
+        titles, self.pending_titles = self.pending_titles, {}
+        for view, url in urls.items():
+            if sip.isdeleted(view):
+                continue
+            # Only the current tab drives the URL bar
+            if view is self.browser:
+                self.update_url(url)
+            # Fragment and pushState changes also arrive here; count each distinct URL once
+            if url.scheme() in ('http', 'https') and url != view.recorded_url:
+                view.recorded_url = url
+                self.history.record_visit(url.toString(), titles.get(view, view.title()))
+        for view, title in titles.items():
+            if sip.isdeleted(view):
+                continue
+            self.tabs.update_tab_title(view, title)
+            self.history.set_title(view.url().toString(), title)
+
+    def view_load_finished(self, view, ok):
+        url = view.url()
+        if ok and url.scheme() in ('http', 'https'):
+            self.history.set_title(url.toString(), view.title())
+            self.omnibox.record_visit(url.toString(), view.title())
+        elif not ok and url.scheme() in ('http', 'https') and self.offline_archive.has(url.toString()):
+            # Loads also fail when stopped or refused by the server; only an unreachable site gets the saved copy
+            QHostInfo.lookupHost(url.host(), lambda info, view=view, url=url: self.host_looked_up(view, url, info))
+
+    def host_looked_up(self, view, url, info):
+        if info.error() != QHostInfo.NoError and not sip.isdeleted(view) and view.url() == url:
+            view.setUrl(offline_url(url.toString()))
+
+    @pyqtSlot(QObject, dict)
+    def navigation_measured(self, view, record):
+        if view is self.browser:
+            self.show_navigation_timing(record)
+
+    def show_navigation_timing(self, record):
+        if record is None:
+            self.timing_label.clear()
+            self.timing_label.setToolTip('')
+            return
+        self.timing_label.setText(timing_summary(record))
+        self.timing_label.setToolTip('\n'.join(f"{name}: {value}" for name, value in record.items()))
+
+    @pyqtSlot(int)
+    def current_tab_changed(self, index):
+        view = self.tabs.widget(index)
+        if view is None:
+            return
+        self.update_url(view.url())
+        self.show_navigation_timing(self.navigation_timer.last.get(view))
+        self.zoom_label.setText(f"{round(view.zoomFactor() * 100)}%")
+
+    def show_dashboard(self, schedule):
+        # Tiles the pages in this window in place of the tabs
+        self.dashboard = DashboardGrid(schedule, CustomWebEngineView)
+        self.dashboard.currentViewChanged.connect(self.show_view_state)
+        self.central.addWidget(self.dashboard)
+        self.dashboard_action.setVisible(True)
+        self.dashboard_action.setChecked(True)
+        self.dashboard.start()
+
+    @pyqtSlot(bool)
+    def toggle_dashboard(self, checked):
+        self.central.setCurrentWidget(self.dashboard if checked else self.tabs)
+        self.show_view_state(self.browser)
+
+    @pyqtSlot(QWebEngineView)
+    def show_view_state(self, view):
+        self.update_url(view.url())
+        self.zoom_label.setText(f"{round(view.zoomFactor() * 100)}%")
+
     def custom_css_script(self):
         css_code = """
         ::-webkit-scrollbar {
@@ -173,14 +574,52 @@ class MainWindow(QMainWindow):
         script.setRunsOnSubFrames(True)
         return script
 
+    def internal_settings(self):
+        return [
+            ("Home page", HOME_URL),
+            ("Filter lists", data_path('filters')),
+            ("Requests blocked", MainWindow.content_blocker.blocked_count),
+            ("History database", MainWindow.history.path),
+            ("History retention", f"{MainWindow.history.retention_days} days"),
+            ("Renderer memory budget", f"{shared_monitor().budget_kb // 1024} MB"),
+            ("Renderer memory in use", f"{shared_monitor().total_pss_kb() // 1024} MB"),
+            ("HTTP cache", self.http_cache_summary()),
+            ("Link prerendering", "on" if shared_prerenderer().enabled else "off"),
+            ("Warm pages", f"{len(shared_pool().pages)} of {shared_pool().size}, "
+                           f"{shared_pool().memory_kb() // 1024} MB"),
+            ("Renderer crashes", shared_recovery().summary()),
+            ("GUI stalls", MainWindow.stall_detector.summary()),
+            ("Stall durations", ', '.join(f"{label}: {count}"
+                                          for label, count in MainWindow.stall_detector.histogram_rows())),
+            ("Stall log", MainWindow.stall_detector.log_path),
+        ] + (self.dashboard.report() if self.dashboard is not None else [])
+
+    def http_cache_summary(self):
+        cache = MainWindow.http_cache
+        size = "not measured yet" if cache.size_bytes is None else f"{cache.size_bytes // (1024 * 1024)} MB"
+        ratio = cache.hit_ratio()
+        hits = "no requests yet" if ratio is None else f"{ratio:.0%} hits ({cache.hits} hits, {cache.misses} misses)"
+        return f"{size} of {cache.max_bytes // (1024 * 1024)} MB, {hits}"
+
+    @pyqtSlot()
+    def navigate_new_tab(self):
+        self.add_tab(QUrl(NEW_TAB_URL))
+        self.url_bar.setFocus()
+        self.url_bar.selectAll()
+
     @pyqtSlot()
     def navigate_home(self):
-        self.browser.setUrl(QUrl('http://google.com'))
+        self.browser.setUrl(QUrl(HOME_URL))
 
     @pyqtSlot()
+    @traced('navigation')
     def navigate_to_url(self):
         input_text = self.url_bar.text().strip()
         if input_text:
+            if input_text.startswith('cedars://'):
+                # Internal pages are served locally and exempt from the HTTPS rule
+                self.browser.setUrl(QUrl(input_text))
+                return
             if not input_text.startswith('http://') and not input_text.startswith('https://'):
                 if input_text.startswith('http'):
                     full_url = QUrl(f"http://www.google.com/search?q={input_text}")
@@ -197,29 +636,24 @@ class MainWindow(QMainWindow):
                 self.browser.setUrl(full_url)
 
     def show_error_page(self, error_message):
-        error_html = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; text-align: center; padding: 20px;">
-                <h1 style="color: #333; font-size: 28px; margin-bottom: 20px;">{error_message}</h1>
-                <p style="color: #666; font-size: 18px;">You will be redirected to the main page shortly.</p>
-            </body>
-        </html>
-        """
-        self.browser.setHtml(error_html, QUrl('error://site_not_allowed'))
-        QTimer.singleShot(5000, self.navigate_home)
+        # The page itself redirects home after a few seconds
+        self.browser.setUrl(error_url(error_message))
 
     @pyqtSlot(QUrl)
+    @traced('navigation')
     def update_url(self, q):
-        self.url_bar.setText(q.toString())
+        text = q.toString()
+        if self.url_bar.text() != text:
+            self.url_bar.setText(text)
         self.update_ssl_icon(q)
 
     def update_ssl_icon(self, url):
-        if url.scheme() == 'https':
-            self.ssl_icon.setVisible(True)
-        else:
-            self.ssl_icon.setVisible(False)
+        secure = url.scheme() == 'https'
+        if self.ssl_icon.isHidden() == secure:
+            self.ssl_icon.setVisible(secure)
 
     @pyqtSlot()
+    @traced('zoom')
     def zoom_in(self):
         current_zoom = int(self.browser.zoomFactor() * 100)
         new_zoom = min(300, current_zoom + 10)  # Limit maximum zoom to 300%
@@ -227,6 +661,7 @@ class MainWindow(QMainWindow):
         self.zoom_label.setText(f"{new_zoom}%")
 
     @pyqtSlot()
+    @traced('zoom')
     def zoom_out(self):
         current_zoom = int(self.browser.zoomFactor() * 100)
         new_zoom = max(10, current_zoom - 10)  # Limit minimum zoom to 10%
@@ -235,18 +670,106 @@ class MainWindow(QMainWindow):
 
     @pyqtSlot()
     def open_settings(self):
-        # Placeholder method for opening settings
-        print("Opening Settings")
+        self.add_tab(QUrl(SETTINGS_URL))
 
     @pyqtSlot()
     def open_history(self):
-        # Placeholder method for opening history
-        print("Opening History")
+        if self.history_window is None:
+            self.history_window = HistoryWindow(self.history, self.page_text, self)
+            self.history_window.openUrl.connect(self.add_tab)
+        self.history_window.show()
+        self.history_window.raise_()
+        self.history_window.activateWindow()
+
+    @pyqtSlot()
+    def save_trace(self):
+        # Open in chrome://tracing or ui.perfetto.dev, alongside a Chromium trace if wanted
+        default = data_path(f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        path, _ = QFileDialog.getSaveFileName(self, 'Save Trace', default, 'Trace files (*.json)')
+        if path:
+            try:
+                tracing.dump(path)
+            except OSError as error:
+                QMessageBox.warning(self, 'Save Trace', f"Could not save the trace: {error}")
+
+
+open_windows = []
+
+
+def active_window():
+    # The focused browser window, else the one opened last
+    windows = [window for window in open_windows if window.isVisible()]
+    if not windows:
+        return None
+    active = QApplication.activeWindow()
+    return active if active in windows else windows[-1]
+
+
+def open_urls(urls, new_window):
+    # URLs from the command line or forwarded by a later launch
+    window = None if new_window else active_window()
+    if window is None:
+        window = MainWindow(urls[0] if urls else HOME_URL)
+        window.setAttribute(Qt.WA_DeleteOnClose)
+        window.destroyed.connect(lambda obj=None, window=window: open_windows.remove(window))
+        open_windows.append(window)
+        window.show()
+        urls = urls[1:]
+    for url in urls:
+        window.add_tab(QUrl(url))
+    window.raise_()
+    window.activateWindow()
+
+
+def all_views():
+    return [view for window in open_windows for view in window.tabs.views()]
+
+
+def open_automation_tab(url):
+    # Opened in the background, so a controller driving many tabs does not steal focus
+    window = active_window()
+    if window is None:
+        open_urls([], True)
+        window = open_windows[-1]
+    return window.add_tab(url, background=True)
 
 
 if __name__ == "__main__":  
+    if pdf_batch.PDF_FLAG in sys.argv[1:]:
+        sys.exit(pdf_batch.main(sys.argv[1:]))
+    if screenshot_batch.SCREENSHOT_FLAG in sys.argv[1:]:
+        sys.exit(screenshot_batch.main(sys.argv[1:]))
+    register_schemes()
+    if kiosk.KIOSK_FLAG in sys.argv[1:]:
+        sys.exit(kiosk.main(sys.argv[1:]))
+    # Lets the cached icons supply 2x pixmaps on HiDPI screens
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
     app = QApplication(sys.argv)
     QApplication.setApplicationName('Cedars Browser')
-    window = MainWindow()
-    window.show()
+    if dashboard_grid.GRID_FLAG in sys.argv[1:]:
+        # A dashboard keeps to itself rather than taking URLs from later launches
+        schedule = dashboard_grid.parse_grid_arguments(sys.argv[1:])
+        if not schedule:
+            sys.exit(1)
+        open_urls([], True)
+        open_windows[0].show_dashboard(schedule)
+    else:
+        instance_server = SingleInstanceServer(app)
+        instance_server.urlsReceived.connect(open_urls)
+        if not instance_server.listen():
+            # Another browser started at the same time and won the socket; it takes the URLs
+            forwarded = forward_to_running_instance(app.arguments()[1:])
+            if forwarded is not None:
+                sys.exit(0 if forwarded else 1)
+        open_urls(parse_arguments(app.arguments()[1:])[0], True)
+    remote_control_port = automation.port_from_arguments(app.arguments()[1:])
+    if remote_control_port is not None:
+        token_path = data_path('automation_token')
+        automation_server = AutomationServer(all_views, open_automation_tab,
+                                             automation.automation_token(token_path), app)
+        if automation_server.listen(remote_control_port):
+            print(f"Remote control on ws://127.0.0.1:{remote_control_port}/?token=<token>, "
+                  f"token in ${automation.TOKEN_VARIABLE} or {token_path}", file=sys.stderr)
+        else:
+            print(f"Remote control could not listen on port {remote_control_port}", file=sys.stderr)
     sys.exit(app.exec_())
\ No newline at end of file
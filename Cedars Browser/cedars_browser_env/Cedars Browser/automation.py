@@ -0,0 +1,350 @@
+import base64
+import hmac
+import json
+import os
+import secrets
+from collections import deque
+from PyQt5.QtCore import *
+from PyQt5 import sip
+from PyQt5.QtNetwork import QHostAddress
+from PyQt5.QtWebEngineWidgets import QWebEnginePage, QWebEngineScript
+from PyQt5.QtWebSockets import QWebSocketProtocol, QWebSocketServer
+
+# --remote-control-port=9222 starts the server; one token, so single_instance skips it
+REMOTE_CONTROL_FLAG = '--remote-control-port='
+TOKEN_VARIABLE = 'CEDARS_AUTOMATION_TOKEN'
+DEFAULT_TIMEOUT = 30
+# Longer timeouts would overflow QTimer's millisecond interval
+MAX_TIMEOUT = 3600
+# Background tabs are not painted; a screenshot brings the tab forward and waits this long
+SCREENSHOT_SETTLE_MS = 100
+
+
+def port_from_arguments(arguments):
+    for argument in arguments:
+        if argument.startswith(REMOTE_CONTROL_FLAG):
+            try:
+                return int(argument[len(REMOTE_CONTROL_FLAG):])
+            except ValueError:
+                return None
+    return None
+
+
+def automation_token(path):
+    # The token from the environment, else a new one per run in a file only this user can read
+    token = os.environ.get(TOKEN_VARIABLE)
+    if token:
+        return token
+    token = secrets.token_urlsafe(32)
+    descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    # O_CREAT leaves the mode of an existing file alone; on Windows the per-user data directory protects it
+    if hasattr(os, 'fchmod'):
+        os.fchmod(descriptor, 0o600)
+    with os.fdopen(descriptor, 'w') as token_file:
+        token_file.write(token + '\n')
+    return token
+
+
+class Command:
+    # One request from a controller; answered exactly once, by a result, an error or the timeout
+    __slots__ = ('request', 'respond', 'timer', 'answered')
+
+    def __init__(self, request, respond):
+        self.request = request
+        self.respond = respond
+        self.timer = None
+        self.answered = False
+
+    def finish(self, result=None):
+        self.answer({'id': self.request.get('id'), 'ok': True, 'result': result})
+
+    def fail(self, error):
+        self.answer({'id': self.request.get('id'), 'ok': False, 'error': error})
+
+    def answer(self, reply):
+        if self.answered:
+            return
+        self.answered = True
+        if self.timer is not None:
+            self.timer.stop()
+            self.timer.deleteLater()
+        self.respond(reply)
+
+
+class Batch:
+    # A JSON array of commands is answered with one array, in the same order, once all are done
+    __slots__ = ('socket', 'replies', 'remaining')
+
+    def __init__(self, socket, size):
+        self.socket = socket
+        self.replies = [None] * size
+        self.remaining = size
+
+
+class AutomationServer(QObject):
+    # JSON over WebSocket on localhost. Every message is a command or an array of them and
+    # controllers may send more without waiting. Commands for the same tab run in the order
+    # they arrived; different tabs run at the same time.
+    def __init__(self, views, new_tab, token, parent=None):
+        super().__init__(parent)
+        # views() lists the open tabs' views; new_tab(url) opens one and returns its view
+        self.views = views
+        self.new_tab = new_tab
+        self.token = token
+        self.server = QWebSocketServer('Cedars Browser', QWebSocketServer.NonSecureMode, self)
+        self.server.newConnection.connect(self.accept_connections)
+        self.clients = set()
+        # Tabs are addressed by ids that stay valid while other tabs open and close
+        self.tab_ids = {}
+        self.tabs_by_id = {}
+        self.next_tab_id = 1
+        # view -> whether a load is in progress, and commands waiting for it to end
+        self.loading = {}
+        self.load_waiters = {}
+        # tab id -> commands not started yet, and the tabs with a command running
+        self.queues = {}
+        self.busy = set()
+        # Screenshots take turns, since showing one background tab hides another
+        self.screenshots = deque()
+        self.capturing = False
+        self.handlers = {
+            'tabs': self.list_tabs,
+            'new_tab': self.open_tab,
+            'close_tab': self.close_tab,
+            'navigate': self.navigate,
+            'wait_load': self.wait_load,
+            'run_js': self.run_js,
+            'screenshot': self.screenshot,
+            'get_text': self.get_text,
+        }
+        # Commands that act on one tab and need its id
+        self.tab_commands = {'close_tab', 'navigate', 'wait_load', 'run_js', 'screenshot', 'get_text'}
+
+    def listen(self, port):
+        return self.server.listen(QHostAddress(QHostAddress.LocalHost), port)
+
+    @pyqtSlot()
+    def accept_connections(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            # Any local user can connect, and web pages can too, though they always send an Origin
+            token = QUrlQuery(socket.requestUrl()).queryItemValue('token')
+            if socket.origin() or not hmac.compare_digest(token.encode('utf-8'), self.token.encode('utf-8')):
+                socket.close(QWebSocketProtocol.CloseCodePolicyViolated, 'not allowed')
+                socket.deleteLater()
+                continue
+            self.clients.add(socket)
+            socket.textMessageReceived.connect(lambda message, socket=socket: self.message_received(socket, message))
+            socket.disconnected.connect(lambda socket=socket: self.drop(socket))
+
+    def drop(self, socket):
+        self.clients.discard(socket)
+        socket.deleteLater()
+
+    def send(self, socket, reply):
+        if socket in self.clients:
+            socket.sendTextMessage(json.dumps(reply, default=str))
+
+    def message_received(self, socket, message):
+        try:
+            data = json.loads(message)
+        except ValueError:
+            self.send(socket, {'id': None, 'ok': False, 'error': 'invalid JSON'})
+            return
+        if isinstance(data, list):
+            if not data:
+                self.send(socket, [])
+                return
+            batch = Batch(socket, len(data))
+            for position, request in enumerate(data):
+                self.submit(request, lambda reply, batch=batch, position=position: self.batch_reply(batch, position, reply))
+        else:
+            self.submit(data, lambda reply, socket=socket: self.send(socket, reply))
+
+    def batch_reply(self, batch, position, reply):
+        batch.replies[position] = reply
+        batch.remaining -= 1
+        if not batch.remaining:
+            self.send(batch.socket, batch.replies)
+
+    def submit(self, request, respond):
+        if not isinstance(request, dict):
+            respond({'id': None, 'ok': False, 'error': 'a command must be an object'})
+            return
+        command = Command(request, respond)
+        cmd = request.get('cmd')
+        if not isinstance(cmd, str) or cmd not in self.handlers:
+            command.fail(f"unknown command {cmd!r}")
+            return
+        # Checked here, since anything raised from a slot would abort the browser
+        timeout = request.get('timeout', DEFAULT_TIMEOUT)
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or not 0 < timeout <= MAX_TIMEOUT:
+            command.fail(f"timeout must be a number of seconds up to {MAX_TIMEOUT}")
+            return
+        tab = request.get('tab')
+        if tab is not None and (isinstance(tab, bool) or not isinstance(tab, int)):
+            command.fail("tab must be a tab id")
+            return
+        if tab is None:
+            if cmd in self.tab_commands:
+                command.fail(f"{cmd} needs a tab id")
+                return
+            self.start(command, None)
+            return
+        self.queues.setdefault(tab, deque()).append(command)
+        self.run_next(tab)
+
+    def run_next(self, tab):
+        queue = self.queues.get(tab)
+        if tab in self.busy or not queue:
+            return
+        command = queue.popleft()
+        if not queue:
+            del self.queues[tab]
+        view = self.tabs_by_id.get(tab)
+        if view is None:
+            command.fail(f"no tab {tab}")
+            self.run_next(tab)
+            return
+        self.busy.add(tab)
+        # The next command for this tab starts once this one is answered
+        respond = command.respond
+
+        def respond_and_continue(reply, tab=tab):
+            respond(reply)
+            self.busy.discard(tab)
+            self.run_next(tab)
+        command.respond = respond_and_continue
+        self.start(command, view)
+
+    def start(self, command, view):
+        timeout = command.request.get('timeout', DEFAULT_TIMEOUT)
+        command.timer = QTimer(self)
+        command.timer.setSingleShot(True)
+        command.timer.timeout.connect(lambda command=command: command.fail('timed out'))
+        command.timer.start(int(timeout * 1000))
+        if view is not None and view.page().lifecycleState() != QWebEnginePage.Active:
+            # Frozen pages run no scripts and discarded ones have nothing to read
+            view.page().setLifecycleState(QWebEnginePage.Active)
+        try:
+            self.handlers[command.request['cmd']](command, view)
+        except (KeyError, TypeError, ValueError) as error:
+            command.fail(f"bad arguments: {error}")
+        except Exception as error:
+            # Anything escaping this slot would abort the browser, so it ends the command instead
+            command.fail(f"{type(error).__name__}: {error}")
+
+    def register(self, view):
+        tab = self.tab_ids.get(view)
+        if tab is not None:
+            return tab
+        tab = self.next_tab_id
+        self.next_tab_id += 1
+        self.tab_ids[view] = tab
+        self.tabs_by_id[tab] = view
+        self.loading[view] = False
+        view.loadStarted.connect(lambda view=view: self.loading.__setitem__(view, True))
+        view.loadFinished.connect(lambda ok, view=view: self.load_finished(view, ok))
+        view.destroyed.connect(lambda obj=None, view=view: self.forget(view))
+        return tab
+
+    def forget(self, view):
+        tab = self.tab_ids.pop(view, None)
+        self.tabs_by_id.pop(tab, None)
+        self.loading.pop(view, None)
+        for command in self.load_waiters.pop(view, []):
+            command.fail('tab closed')
+
+    def load_finished(self, view, ok):
+        self.loading[view] = False
+        for command in self.load_waiters.pop(view, []):
+            if ok:
+                command.finish({'url': view.url().toString(), 'title': view.title()})
+            else:
+                command.fail('load failed')
+
+    def describe(self, view):
+        return {'tab': self.register(view), 'url': view.url().toString(), 'title': view.title(),
+                'loading': self.loading.get(view, False)}
+
+    def list_tabs(self, command, view):
+        command.finish([self.describe(view) for view in self.views()])
+
+    def open_tab(self, command, view):
+        url = command.request.get('url')
+        view = self.new_tab(QUrl.fromUserInput(url) if url else None)
+        tab = self.register(view)
+        if url:
+            self.loading[view] = True
+        command.finish({'tab': tab})
+
+    def close_tab(self, command, view):
+        tabs = getattr(view, 'tabs', None)
+        if tabs is None or tabs.count() < 2:
+            command.fail("the last tab of a window cannot be closed")
+            return
+        tabs.close_tab(tabs.indexOf(view))
+        command.finish()
+
+    def navigate(self, command, view):
+        self.loading[view] = True
+        view.setUrl(QUrl.fromUserInput(command.request['url']))
+        if command.request.get('wait'):
+            self.load_waiters.setdefault(view, []).append(command)
+        else:
+            command.finish()
+
+    def wait_load(self, command, view):
+        if self.loading.get(view):
+            self.load_waiters.setdefault(view, []).append(command)
+        else:
+            command.finish({'url': view.url().toString(), 'title': view.title()})
+
+    def run_js(self, command, view):
+        # Runs in the page's own world, so page globals are visible
+        view.page().runJavaScript(command.request['script'], QWebEngineScript.MainWorld,
+                                  lambda result, command=command: command.finish(result))
+
+    def get_text(self, command, view):
+        view.page().toPlainText(lambda text, command=command: command.finish(text))
+
+    def screenshot(self, command, view):
+        self.screenshots.append((command, view))
+        self.next_screenshot()
+
+    def next_screenshot(self):
+        while self.screenshots and not self.capturing:
+            command, view = self.screenshots.popleft()
+            if command.answered:
+                continue
+            if sip.isdeleted(view):
+                command.fail('tab closed')
+                continue
+            tabs = getattr(view, 'tabs', None)
+            if view.isVisible() or tabs is None:
+                self.grab(command, view)
+                continue
+            # Shown just long enough to be painted, then the user's tab comes back
+            self.capturing = True
+            previous = tabs.currentWidget()
+            tabs.setCurrentWidget(view)
+            QTimer.singleShot(SCREENSHOT_SETTLE_MS, lambda command=command, view=view, tabs=tabs, previous=previous:
+                              self.grab(command, view, tabs, previous))
+
+    def grab(self, command, view, tabs=None, previous=None):
+        if sip.isdeleted(view):
+            command.fail('tab closed')
+        elif not view.isVisible():
+            command.fail('tab could not be shown, is the window minimized?')
+        else:
+            data = QByteArray()
+            buffer = QBuffer(data)
+            buffer.open(QIODevice.WriteOnly)
+            view.grab().save(buffer, 'PNG')
+            command.finish({'format': 'png', 'data': base64.b64encode(bytes(data)).decode('ascii')})
+        if tabs is not None:
+            if not sip.isdeleted(tabs) and previous is not None and not sip.isdeleted(previous) \
+                    and tabs.indexOf(previous) >= 0:
+                tabs.setCurrentWidget(previous)
+            self.capturing = False
+            self.next_screenshot()
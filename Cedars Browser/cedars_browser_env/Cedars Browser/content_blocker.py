@@ -0,0 +1,427 @@
+import copy
+import glob
+import hashlib
+import os
+import pickle
+import re
+import tracing
+from PyQt5.QtCore import *
+from PyQt5.QtWebEngineCore import QWebEngineUrlRequestInterceptor, QWebEngineUrlRequestInfo
+
+# Bump whenever the compiled layout changes so stale caches are rebuilt
+CACHE_VERSION = 2
+# Longest keyword fed to the Aho-Corasick automaton; keeps the trie small with 100k rules
+MAX_KEYWORD_LENGTH = 8
+MIN_KEYWORD_LENGTH = 3
+
+RESOURCE_TYPES = {
+    QWebEngineUrlRequestInfo.ResourceTypeMainFrame: 'document',
+    QWebEngineUrlRequestInfo.ResourceTypeSubFrame: 'subdocument',
+    QWebEngineUrlRequestInfo.ResourceTypeStylesheet: 'stylesheet',
+    QWebEngineUrlRequestInfo.ResourceTypeScript: 'script',
+    QWebEngineUrlRequestInfo.ResourceTypeImage: 'image',
+    QWebEngineUrlRequestInfo.ResourceTypeFavicon: 'image',
+    QWebEngineUrlRequestInfo.ResourceTypeFontResource: 'font',
+    QWebEngineUrlRequestInfo.ResourceTypeObject: 'object',
+    QWebEngineUrlRequestInfo.ResourceTypePluginResource: 'object',
+    QWebEngineUrlRequestInfo.ResourceTypeMedia: 'media',
+    QWebEngineUrlRequestInfo.ResourceTypeXhr: 'xmlhttprequest',
+    QWebEngineUrlRequestInfo.ResourceTypePing: 'ping',
+    QWebEngineUrlRequestInfo.ResourceTypeCspReport: 'ping',
+}
+
+TYPE_ALIASES = {
+    'xhr': 'xmlhttprequest',
+    'css': 'stylesheet',
+    'frame': 'subdocument',
+    'beacon': 'ping',
+    'object-subrequest': 'object',
+}
+KNOWN_TYPES = set(RESOURCE_TYPES.values()) | {'other', 'websocket'}
+
+# Options that change what a rule does rather than what it matches; such rules are skipped
+UNSUPPORTED_OPTIONS = {
+    'popup', 'csp', 'redirect', 'redirect-rule', 'rewrite', 'removeparam',
+    'elemhide', 'generichide', 'genericblock', 'specifichide', 'header', 'permissions',
+}
+
+SEPARATOR_REGEX = r'(?:[^\w\-.%]|$)'
+# Second-level labels under which registrable domains take three labels (example.co.uk)
+SHORT_SECOND_LEVEL = {'co', 'com', 'net', 'org', 'ac', 'gov', 'edu'}
+
+
+def base_domain(host):
+    # Approximates the registrable domain without shipping the public suffix list
+    labels = host.split('.')
+    if len(labels) > 2 and len(labels[-1]) == 2 and labels[-2] in SHORT_SECOND_LEVEL:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+def host_matches(host, domain):
+    return host == domain or host.endswith('.' + domain)
+
+
+class FilterRule:
+    __slots__ = ('text', 'pattern', 'match_case', 'third_party', 'types',
+                 'excluded_types', 'domains', 'excluded_domains', 'regex')
+
+    def __init__(self, text, pattern, match_case=False):
+        self.text = text
+        self.pattern = pattern
+        self.match_case = match_case
+        self.third_party = None
+        self.types = None
+        self.excluded_types = None
+        self.domains = None
+        self.excluded_domains = None
+        self.regex = None
+
+    def __getstate__(self):
+        # Compiled regexes are rebuilt lazily after loading from the cache
+        return tuple(getattr(self, name) for name in self.__slots__[:-1])
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__[:-1], state):
+            setattr(self, name, value)
+        self.regex = None
+
+    def matches_options(self, resource_type, first_party_host, third_party):
+        if self.third_party is not None and self.third_party != third_party:
+            return False
+        if self.types is not None and resource_type not in self.types:
+            return False
+        if self.excluded_types is not None and resource_type in self.excluded_types:
+            return False
+        if self.domains is not None:
+            if not any(host_matches(first_party_host, domain) for domain in self.domains):
+                return False
+        if self.excluded_domains is not None:
+            if any(host_matches(first_party_host, domain) for domain in self.excluded_domains):
+                return False
+        return True
+
+    def matches_url(self, url):
+        if self.pattern is None:
+            return True
+        if self.regex is None:
+            flags = 0 if self.match_case else re.IGNORECASE
+            self.regex = re.compile(pattern_to_regex(self.pattern), flags)
+        return self.regex.search(url) is not None
+
+
+def pattern_to_regex(pattern):
+    regex = ''
+    if pattern.startswith('||'):
+        regex = r'^[a-z][a-z0-9+.\-]*:/+(?:[^/?#]+\.)?'
+        pattern = pattern[2:]
+    elif pattern.startswith('|'):
+        regex = '^'
+        pattern = pattern[1:]
+    end_anchor = pattern.endswith('|')
+    if end_anchor:
+        pattern = pattern[:-1]
+    for char in pattern:
+        if char == '*':
+            regex += '.*'
+        elif char == '^':
+            regex += SEPARATOR_REGEX
+        else:
+            regex += re.escape(char)
+    return regex + ('$' if end_anchor else '')
+
+
+def parse_options(rule, options):
+    for option in options.split(','):
+        option = option.strip().lower()
+        negated = option.startswith('~')
+        name, _, value = option.lstrip('~').partition('=')
+        name = TYPE_ALIASES.get(name, name)
+        if name in UNSUPPORTED_OPTIONS:
+            return False
+        if name in ('third-party', '3p'):
+            rule.third_party = not negated
+        elif name in ('first-party', '1p'):
+            rule.third_party = negated
+        elif name == 'match-case':
+            rule.match_case = True
+        elif name == 'domain':
+            for domain in value.split('|'):
+                if domain.startswith('~'):
+                    rule.excluded_domains = (rule.excluded_domains or ()) + (domain[1:],)
+                elif domain:
+                    rule.domains = (rule.domains or ()) + (domain,)
+        elif name in KNOWN_TYPES:
+            if negated:
+                rule.excluded_types = (rule.excluded_types or frozenset()) | {name}
+            else:
+                rule.types = (rule.types or frozenset()) | {name}
+        # Anything else (important, collapse, ...) does not affect matching
+    return True
+
+
+def parse_filter(line):
+    # Returns (rule, is_exception) or None for comments, cosmetic and unsupported rules
+    line = line.strip()
+    if not line or line.startswith(('!', '[')):
+        return None
+    if '##' in line or '#@#' in line or '#?#' in line or '#$#' in line:
+        return None
+
+    exception = line.startswith('@@')
+    if exception:
+        line = line[2:]
+
+    pattern, options = line, ''
+    dollar = line.rfind('$')
+    if dollar != -1 and not line.endswith('/'):
+        pattern, options = line[:dollar], line[dollar + 1:]
+    if len(pattern) > 1 and pattern.startswith('/') and pattern.endswith('/'):
+        # Raw regex rules would need a per-request regex scan; they are rare enough to skip
+        return None
+
+    rule = FilterRule(line, pattern or None)
+    if options and not parse_options(rule, options):
+        return None
+    if not rule.match_case and rule.pattern:
+        rule.pattern = rule.pattern.lower()
+    return rule, exception
+
+
+def literal_keyword(pattern):
+    # Every literal run of the pattern must appear in a matching URL; index on the longest
+    body = pattern.lstrip('|').rstrip('|')
+    runs = [run for run in re.split(r'[*^|]', body) if len(run) >= MIN_KEYWORD_LENGTH]
+    if not runs:
+        return None
+    return max(runs, key=len)[:MAX_KEYWORD_LENGTH].lower()
+
+
+def anchored_host(pattern):
+    # Splits "||ads.example.com^/path" into ("ads.example.com", "^/path")
+    if not pattern or not pattern.startswith('||'):
+        return None, None
+    match = re.match(r'\|\|([a-z0-9.\-]+)(.*)$', pattern)
+    if not match or '.' not in match.group(1):
+        return None, None
+    host, rest = match.group(1).strip('.'), match.group(2)
+    if rest and rest[0] not in '^/:|':
+        # The pattern continues inside the host name, e.g. ||ads.example*
+        return None, None
+    return host, rest
+
+
+class AhoCorasick:
+    def __init__(self, keywords):
+        # Flat node arrays keep the automaton compact and cheap to pickle
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+        for keyword in keywords:
+            node = 0
+            for char in keyword:
+                child = self.goto[node].get(char)
+                if child is None:
+                    child = len(self.goto)
+                    self.goto[node][char] = child
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                node = child
+            self.output[node] = self.output[node] + (keyword,)
+
+        queue = list(self.goto[0].values())
+        for node in queue:
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def search(self, text):
+        goto, fail, output = self.goto, self.fail, self.output
+        found = set()
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+        return found
+
+
+class RuleIndex:
+    def __init__(self, rules):
+        # Domain suffix trie keyed on reversed labels; '' holds the rules anchored there
+        self.host_trie = {}
+        self.keyword_rules = {}
+        self.generic_rules = []
+        for rule in rules:
+            host, rest = anchored_host(rule.pattern)
+            if host is not None:
+                node = self.host_trie
+                for label in reversed(host.split('.')):
+                    node = node.setdefault(label, {})
+                if rest in ('', '^'):
+                    # The host match is the whole pattern; no URL check needed
+                    rule.pattern = None
+                node.setdefault('', []).append(rule)
+                continue
+            keyword = literal_keyword(rule.pattern) if rule.pattern else None
+            if keyword is None:
+                self.generic_rules.append(rule)
+            else:
+                self.keyword_rules.setdefault(keyword, []).append(rule)
+        self.automaton = AhoCorasick(self.keyword_rules)
+
+    def candidates(self, url, host):
+        node = self.host_trie
+        for label in reversed(host.split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            yield from node.get('', ())
+        for keyword in self.automaton.search(url):
+            yield from self.keyword_rules[keyword]
+        yield from self.generic_rules
+
+    def match(self, url, lowered_url, host, resource_type, first_party_host, third_party):
+        for rule in self.candidates(lowered_url, host):
+            if not rule.matches_options(resource_type, first_party_host, third_party):
+                continue
+            if rule.matches_url(url if rule.match_case else lowered_url):
+                return rule
+        return None
+
+
+class FilterEngine:
+    def __init__(self, lines=()):
+        blocking, exceptions, document_exceptions = [], [], []
+        self.rule_count = 0
+        for line in lines:
+            parsed = parse_filter(line)
+            if parsed is None:
+                continue
+            rule, exception = parsed
+            (exceptions if exception else blocking).append(rule)
+            if exception and rule.types is not None and 'document' in rule.types:
+                # Matched against the page rather than the request; each index rewrites its own rules
+                document_exceptions.append(copy.copy(rule))
+            self.rule_count += 1
+        self.blocking = RuleIndex(blocking)
+        self.exceptions = RuleIndex(exceptions)
+        # @@...$document rules turn blocking off for every request of the pages they match
+        self.document_exceptions = RuleIndex(document_exceptions)
+
+    def should_block(self, url, host, resource_type='other', first_party_host='', first_party_url=''):
+        host = host.lower()
+        lowered_url = url.lower()
+        first_party_host = first_party_host.lower()
+        third_party = bool(first_party_host) and base_domain(host) != base_domain(first_party_host)
+        rule = self.blocking.match(url, lowered_url, host, resource_type, first_party_host, third_party)
+        if rule is None:
+            return False
+        if first_party_url and self.document_exceptions.match(
+                first_party_url, first_party_url.lower(), first_party_host, 'document',
+                first_party_host, False) is not None:
+            return False
+        return self.exceptions.match(url, lowered_url, host, resource_type,
+                                     first_party_host, third_party) is None
+
+    @classmethod
+    def from_files(cls, paths):
+        def lines():
+            for path in paths:
+                with open(path, encoding='utf-8', errors='replace') as filter_list:
+                    yield from filter_list
+        return cls(lines())
+
+
+def cache_key(paths):
+    digest = hashlib.sha256(str(CACHE_VERSION).encode())
+    for path in sorted(paths):
+        stat = os.stat(path)
+        digest.update(f'{path}\0{stat.st_mtime_ns}\0{stat.st_size}\0'.encode())
+    return digest.hexdigest()
+
+
+def load_engine(filter_dir, cache_path):
+    # Reuses the compiled index from disk unless a filter list changed since it was built
+    paths = sorted(glob.glob(os.path.join(filter_dir, '*.txt')))
+    key = cache_key(paths)
+    try:
+        with open(cache_path, 'rb') as cache:
+            cached_key, engine = pickle.load(cache)
+        if cached_key == key:
+            return engine
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError):
+        pass
+
+    engine = FilterEngine.from_files(paths)
+    temp_path = cache_path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as cache:
+            pickle.dump((key, engine), cache, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+    return engine
+
+
+class EngineLoadTask(QRunnable):
+    def __init__(self, filter_dir, cache_path, done):
+        super().__init__()
+        self.filter_dir = filter_dir
+        self.cache_path = cache_path
+        self.done = done
+
+    def run(self):
+        self.done.emit(load_engine(self.filter_dir, self.cache_path))
+
+
+class ContentBlockingInterceptor(QWebEngineUrlRequestInterceptor):
+    engineLoaded = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.engine = None
+        self.blocked_count = 0
+        self.engineLoaded.connect(self.set_engine)
+
+    def load(self, filter_dir, cache_path):
+        # Compiling or unpickling the index happens off the GUI thread; until it is
+        # ready requests pass through unfiltered
+        QThreadPool.globalInstance().start(EngineLoadTask(filter_dir, cache_path, self.engineLoaded))
+
+    @pyqtSlot(object)
+    def set_engine(self, engine):
+        self.engine = engine
+
+    def interceptRequest(self, info):
+        # Runs for every request, so it only touches the precompiled index
+        engine = self.engine
+        if engine is None:
+            return
+        resource_type = RESOURCE_TYPES.get(info.resourceType(), 'other')
+        if resource_type == 'document':
+            # Never block navigations the user asked for; $document exceptions apply to
+            # the page's requests through the first-party URL below
+            return
+        url = info.requestUrl()
+        if url.scheme() not in ('http', 'https', 'ws', 'wss'):
+            return
+        # Checked inline rather than with a span object; this is the hottest path traced
+        start = tracing.now_us() if tracing.enabled else None
+        first_party = info.firstPartyUrl()
+        blocked = engine.should_block(url.toString(), url.host(), resource_type, first_party.host(),
+                                      first_party.toString())
+        if blocked:
+            info.block(True)
+            self.blocked_count += 1
+        if start is not None:
+            tracing.complete('interceptRequest', 'interceptor', start,
+                             {'url': url.toString(), 'type': resource_type, 'blocked': blocked})
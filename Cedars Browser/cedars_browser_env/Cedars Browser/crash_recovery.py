@@ -0,0 +1,124 @@
+import time
+from PyQt5.QtCore import *
+from PyQt5 import sip
+from PyQt5.QtWebEngineWidgets import QWebEnginePage, QWebEngineScript
+from internal_pages import crash_url
+
+# Reload after 0.5 s, then 1 s, 2 s, 4 s; after that the crash page takes over
+FIRST_RETRY_MS = 500
+MAX_RETRIES = 4
+# A page that stays up this long after recovering starts again from the first retry
+STABLE_SECONDS = 60
+
+REASONS = {
+    QWebEnginePage.AbnormalTerminationStatus: "The page stopped unexpectedly.",
+    QWebEnginePage.CrashedTerminationStatus: "The page crashed.",
+    QWebEnginePage.KilledTerminationStatus: "The page was stopped, possibly because the system ran out of memory.",
+}
+
+
+class PageState:
+    __slots__ = ('url', 'scroll', 'zoom', 'retries', 'last_crash', 'timer', 'restoring')
+
+    def __init__(self):
+        self.url = QUrl()
+        self.scroll = QPointF()
+        self.zoom = 1.0
+        self.retries = 0
+        self.last_crash = 0
+        self.timer = None
+        self.restoring = False
+
+
+class CrashRecovery(QObject):
+    # Reloads pages whose renderer died, backing off between attempts, and puts the
+    # scroll position and zoom back once the page has loaded again
+    pageRecovered = pyqtSignal(QWebEnginePage)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pages = {}
+        self.crash_count = 0
+        self.recovered_count = 0
+
+    def track(self, page):
+        state = PageState()
+        self.pages[page] = state
+        # The last position seen is kept, since a dead renderer cannot report it
+        page.scrollPositionChanged.connect(lambda position, state=state: self.scrolled(state, position))
+        page.renderProcessTerminated.connect(
+            lambda status, exit_code, page=page: self.terminated(page, status, exit_code))
+        page.loadFinished.connect(lambda ok, page=page: self.load_finished(page, ok))
+
+    def untrack(self, page):
+        state = self.pages.pop(page, None)
+        if state is not None and state.timer is not None:
+            state.timer.stop()
+            state.timer.deleteLater()
+
+    def scrolled(self, state, position):
+        # The reloaded page starts at the top; keep the position to restore until it has loaded
+        if not state.restoring:
+            state.scroll = QPointF(position)
+
+    def terminated(self, page, status, exit_code):
+        state = self.pages.get(page)
+        if state is None or status == QWebEnginePage.NormalTerminationStatus:
+            return
+        self.crash_count += 1
+        now = time.monotonic()
+        if now - state.last_crash > STABLE_SECONDS:
+            state.retries = 0
+        state.last_crash = now
+        url = page.url()
+        # A page that died while recovering still reports the URL being restored
+        if not url.isEmpty() and url.scheme() != 'cedars':
+            state.url = url
+        state.zoom = page.zoomFactor()
+        if state.retries >= MAX_RETRIES:
+            state.restoring = False
+            if state.timer is not None:
+                state.timer.stop()
+            page.setUrl(crash_url(state.url.toString(), REASONS.get(status, "The page stopped."), exit_code))
+            return
+        if state.timer is None:
+            state.timer = QTimer(self)
+            state.timer.setSingleShot(True)
+            state.timer.timeout.connect(lambda page=page: self.reload(page))
+        state.timer.start(FIRST_RETRY_MS * 2 ** state.retries)
+        state.retries += 1
+
+    def reload(self, page):
+        state = self.pages.get(page)
+        if state is None or sip.isdeleted(page) or state.url.isEmpty():
+            return
+        state.restoring = True
+        page.load(state.url)
+
+    def load_finished(self, page, ok):
+        state = self.pages.get(page)
+        if state is None or not state.restoring:
+            return
+        state.restoring = False
+        if not ok:
+            return
+        self.recovered_count += 1
+        page.setZoomFactor(state.zoom)
+        if state.scroll.x() or state.scroll.y():
+            page.runJavaScript(f"window.scrollTo({state.scroll.x()}, {state.scroll.y()});",
+                               QWebEngineScript.ApplicationWorld)
+        self.pageRecovered.emit(page)
+
+    def summary(self):
+        return f"{self.crash_count} renderer crashes, {self.recovered_count} pages recovered"
+
+
+shared_recovery_instance = None
+
+
+def shared_recovery():
+    # Pages of every window share one policy and one set of counters
+    global shared_recovery_instance
+    if shared_recovery_instance is None:
+        shared_recovery_instance = CrashRecovery(QCoreApplication.instance())
+    return shared_recovery_instance
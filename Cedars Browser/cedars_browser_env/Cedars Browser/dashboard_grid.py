@@ -0,0 +1,254 @@
+import argparse
+import hashlib
+import heapq
+import math
+import random
+import time
+from PyQt5.QtCore import *
+from PyQt5.QtWidgets import QApplication, QGridLayout, QWidget
+from PyQt5.QtWebEngineWidgets import QWebEngineView
+from crash_recovery import shared_recovery
+from kiosk import parse_schedule
+from memory_budget import shared_monitor
+from pdf_batch import read_urls
+from tab_lifecycle import TabLifecycleManager
+
+GRID_FLAG = '--grid'
+DEFAULT_REFRESH = 60
+# Each refresh comes due up to this fraction early or late, so equal intervals drift apart
+JITTER = 0.1
+# Refreshes start at least this far apart and no more than this many load at once
+MIN_START_GAP_MS = 250
+MAX_CONCURRENT_LOADS = 2
+# A tile whose text has not changed is refreshed up to this many times less often
+MAX_UNCHANGED_BACKOFF = 4
+
+
+def parse_grid_arguments(arguments):
+    parser = argparse.ArgumentParser(prog='Cedars_Browser.py --grid',
+                                     description="Show pages tiled in one window, each refreshed on its own interval.")
+    parser.add_argument(GRID_FLAG, dest='source', required=True, metavar='FILE',
+                        help="file with one URL per line, optionally followed by its refresh interval in seconds")
+    parser.add_argument('--interval', type=float, default=DEFAULT_REFRESH,
+                        help="refresh interval of tiles whose line gives none")
+    # Browser-wide options such as --remote-control-port= are left to the browser
+    args, _ = parser.parse_known_args(arguments)
+    return parse_schedule(read_urls(args.source), args.interval)
+
+
+class Tile:
+    __slots__ = ('index', 'view', 'url', 'interval', 'loading', 'started', 'last_ms', 'total_ms', 'loads',
+                 'failures', 'overruns', 'digest', 'unchanged')
+
+    def __init__(self, index, view, url, interval):
+        self.index = index
+        self.view = view
+        self.url = url
+        self.interval = interval
+        self.loading = False
+        self.started = 0
+        self.last_ms = None
+        self.total_ms = 0
+        self.loads = 0
+        self.failures = 0
+        # Refreshes that came due while the previous one was still loading
+        self.overruns = 0
+        self.digest = None
+        self.unchanged = 0
+
+
+class RefreshScheduler(QObject):
+    # One queue of due refreshes for every tile. Starts are spaced out and capped, so tiles
+    # sharing an interval never reload together and hit the network or the CPU at once.
+    tileLoaded = pyqtSignal(object)
+
+    def __init__(self, tiles, parent=None):
+        super().__init__(parent)
+        self.tiles = tiles
+        # (due time, tile index)
+        self.due = []
+        self.last_start = 0
+        self.paused = True
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.dispatch)
+        for tile in tiles:
+            tile.view.loadFinished.connect(lambda ok, tile=tile: self.load_finished(tile, ok))
+
+    def start(self):
+        # First loads go out one gap apart
+        now = time.monotonic()
+        self.due = [(now + tile.index * MIN_START_GAP_MS / 1000, tile.index) for tile in self.tiles]
+        heapq.heapify(self.due)
+        self.resume()
+
+    def pause(self):
+        self.paused = True
+        self.timer.stop()
+
+    def resume(self):
+        # Refreshes missed while paused run on resume, still spaced out
+        self.paused = False
+        self.dispatch()
+
+    def loading_count(self):
+        return sum(tile.loading for tile in self.tiles)
+
+    def next_due(self, tile, now):
+        backoff = min(2 ** tile.unchanged, MAX_UNCHANGED_BACKOFF)
+        if tile.loads == 0:
+            # Random phase, so tiles loaded together refresh apart from the start
+            return now + tile.interval * random.uniform(0.5, 1.0)
+        return now + tile.interval * backoff * random.uniform(1 - JITTER, 1 + JITTER)
+
+    @pyqtSlot()
+    def dispatch(self):
+        if self.paused or not self.due:
+            return
+        now = time.monotonic()
+        self.give_up_overruns(now)
+        while self.due and self.due[0][0] <= now:
+            if self.loading_count() >= MAX_CONCURRENT_LOADS:
+                # load_finished dispatches again
+                break
+            wait = self.last_start + MIN_START_GAP_MS / 1000 - now
+            if wait > 0:
+                self.timer.start(int(wait * 1000) + 1)
+                return
+            due, index = heapq.heappop(self.due)
+            tile = self.tiles[index]
+            self.refresh(tile, now)
+            heapq.heappush(self.due, (self.next_due(tile, now), index))
+        if self.loading_count() >= MAX_CONCURRENT_LOADS:
+            # Until a load finishes only an overrun can free a slot
+            upcoming = [due for due, index in self.due if self.tiles[index].loading]
+        else:
+            upcoming = [self.due[0][0]] if self.due else []
+        if upcoming:
+            self.timer.start(max(0, int((min(upcoming) - now) * 1000)))
+
+    def give_up_overruns(self, now):
+        # A tile still loading a whole interval later is stopped so its next refresh can run.
+        # This comes before the concurrency check, or stuck tiles would hold their slots forever.
+        overran = False
+        for position, (due, index) in enumerate(self.due):
+            tile = self.tiles[index]
+            if due <= now and tile.loading:
+                tile.overruns += 1
+                # Cleared first, so the load_finished from stop() is not counted as a load
+                tile.loading = False
+                tile.view.stop()
+                self.due[position] = (self.next_due(tile, now), index)
+                overran = True
+        if overran:
+            heapq.heapify(self.due)
+
+    def refresh(self, tile, now):
+        tile.loading = True
+        tile.started = time.perf_counter()
+        self.last_start = now
+        if tile.loads == 0 and not tile.failures:
+            tile.view.setUrl(tile.url)
+        else:
+            tile.view.reload()
+
+    def load_finished(self, tile, ok):
+        if not tile.loading:
+            return
+        tile.loading = False
+        tile.last_ms = round((time.perf_counter() - tile.started) * 1000, 1)
+        if ok:
+            tile.loads += 1
+            tile.total_ms += tile.last_ms
+            tile.view.page().toPlainText(lambda text, tile=tile: self.text_read(tile, text))
+        else:
+            tile.failures += 1
+        self.tileLoaded.emit(tile)
+        self.dispatch()
+
+    def text_read(self, tile, text):
+        digest = hashlib.sha1(text.encode('utf-8', 'replace')).digest()
+        tile.unchanged = tile.unchanged + 1 if digest == tile.digest else 0
+        tile.digest = digest
+
+
+class DashboardGrid(QWidget):
+    # Tiles pages in a grid inside a browser window. Qt only freezes pages that are not
+    # shown, so tiles are frozen while the grid is hidden; visible tiles whose text does
+    # not change are refreshed less often instead.
+    currentViewChanged = pyqtSignal(QWebEngineView)
+
+    def __init__(self, schedule, create_view, parent=None):
+        super().__init__(parent)
+        self.lifecycle = TabLifecycleManager(self)
+        self.memory = shared_monitor()
+        self.recovery = shared_recovery()
+        layout = QGridLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(2)
+        columns = math.ceil(math.sqrt(len(schedule)))
+        self.tiles = []
+        for index, (url, interval) in enumerate(schedule):
+            view = create_view()
+            layout.addWidget(view, index // columns, index % columns)
+            page = view.page()
+            self.lifecycle.track(page)
+            self.memory.track(page, self.lifecycle)
+            self.recovery.track(page)
+            page.destroyed.connect(lambda obj=None, page=page: self.forget_page(page))
+            self.tiles.append(Tile(index, view, url, interval))
+        self.current = self.tiles[0].view if self.tiles else None
+        self.scheduler = RefreshScheduler(self.tiles, self)
+        QApplication.instance().focusChanged.connect(self.focus_changed)
+
+    def start(self):
+        self.scheduler.start()
+
+    def forget_page(self, page):
+        self.memory.untrack(page)
+        self.recovery.untrack(page)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        for tile in self.tiles:
+            self.lifecycle.activate(tile.view.page())
+        if self.scheduler.due:
+            self.scheduler.resume()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.scheduler.pause()
+        # Pages learn they are hidden once the event has been handled
+        QTimer.singleShot(0, self.freeze_tiles)
+
+    @pyqtSlot()
+    def freeze_tiles(self):
+        if self.isVisible():
+            return
+        for tile in self.tiles:
+            self.lifecycle.freeze(tile.view.page())
+
+    def focus_changed(self, old, new):
+        # Clicking into a tile makes it the one the toolbar acts on
+        widget = new
+        while widget is not None and widget is not self:
+            for tile in self.tiles:
+                if widget is tile.view and tile.view is not self.current:
+                    self.current = tile.view
+                    self.currentViewChanged.emit(tile.view)
+                    return
+            widget = widget.parentWidget()
+
+    def current_view(self):
+        return self.current
+
+    def report(self):
+        # (name, value) rows for the settings page
+        rows = []
+        for tile in self.tiles:
+            average = f"{tile.total_ms / tile.loads:.0f} ms" if tile.loads else "n/a"
+            last = f"{tile.last_ms:.0f} ms" if tile.last_ms is not None else "n/a"
+            rows.append((f"Tile {tile.index + 1}", f"{tile.url.toString()} every {tile.interval:.0f} s: "
+                         f"last {last}, average {average}, {tile.loads} loads, {tile.failures} failed, "
+                         f"{tile.overruns} overruns, unchanged {tile.unchanged}x"))
+        return rows
@@ -0,0 +1,238 @@
+import pathlib
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+import tracing
+from PyQt5.QtCore import *
+
+# Writes are grouped into one transaction per batch
+FLUSH_INTERVAL = 0.5
+MAX_BATCH = 500
+# Retention policy, applied by the writer thread
+RETENTION_DAYS = 180
+MAX_VISITS = 1000000
+COMPACT_INTERVAL = 6 * 60 * 60
+# Rows deleted per statement so compaction never holds the write lock for long
+DELETE_CHUNK = 10000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    host TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    visit_count INTEGER NOT NULL DEFAULT 0,
+    last_visit REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS urls_host ON urls(host, last_visit);
+CREATE INDEX IF NOT EXISTS urls_last_visit ON urls(last_visit);
+CREATE INDEX IF NOT EXISTS urls_visit_count ON urls(visit_count);
+
+CREATE TABLE IF NOT EXISTS visits (
+    id INTEGER PRIMARY KEY,
+    url_id INTEGER NOT NULL REFERENCES urls(id),
+    visit_time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS visits_time ON visits(visit_time);
+CREATE INDEX IF NOT EXISTS visits_url ON visits(url_id);
+"""
+
+RECORD_URL = """
+INSERT INTO urls (url, host, title, visit_count, last_visit) VALUES (?, ?, ?, 1, ?)
+ON CONFLICT(url) DO UPDATE SET
+    visit_count = visit_count + 1,
+    last_visit = MAX(last_visit, excluded.last_visit),
+    title = CASE WHEN excluded.title != '' THEN excluded.title ELSE title END
+"""
+RECORD_VISIT = "INSERT INTO visits (url_id, visit_time) SELECT id, ? FROM urls WHERE url = ?"
+UPDATE_TITLE = "UPDATE urls SET title = ? WHERE url = ? AND title != ?"
+
+
+def open_database(path, read_only=False):
+    if read_only:
+        uri = pathlib.Path(path).absolute().as_uri() + '?mode=ro'
+        connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    else:
+        connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute('PRAGMA busy_timeout = 5000')
+    return connection
+
+
+class HistoryStore(QObject):
+    # Emitted from the writer thread with the URLs compaction removed
+    urlsExpired = pyqtSignal(list)
+
+    def __init__(self, path, parent=None, retention_days=RETENTION_DAYS, max_visits=MAX_VISITS):
+        super().__init__(parent)
+        self.path = path
+        self.retention_days = retention_days
+        self.max_visits = max_visits
+        self.local = threading.local()
+        self.queue = queue.Queue()
+
+        connection = open_database(path)
+        # auto_vacuum only takes effect before the first table exists
+        connection.execute('PRAGMA auto_vacuum = INCREMENTAL')
+        connection.execute('PRAGMA journal_mode = WAL')
+        connection.executescript(SCHEMA)
+        connection.commit()
+        self.writer = threading.Thread(target=self.write_loop, args=(connection,),
+                                       name='history-writer', daemon=True)
+        self.writer.start()
+
+    # Writes: only ever queued, so the UI thread never waits on SQLite
+
+    def record_visit(self, url, title='', visit_time=None):
+        host = urlsplit(url).hostname or ''
+        self.queue.put(('visit', url, host, title, visit_time or time.time()))
+
+    def set_title(self, url, title):
+        if title:
+            self.queue.put(('title', url, title))
+
+    def compact(self):
+        self.queue.put(('compact',))
+
+    def close(self):
+        if self.writer.is_alive():
+            self.queue.put(('stop',))
+            self.writer.join()
+
+    def write_loop(self, connection):
+        connection.execute('PRAGMA synchronous = NORMAL')
+        next_compaction = time.monotonic() + COMPACT_INTERVAL
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while len(batch) < MAX_BATCH:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            kinds = {operation[0] for operation in batch}
+            compact = time.monotonic() >= next_compaction or 'compact' in kinds
+            # Decided up front, so close() returns even if the batch fails
+            running = 'stop' not in kinds
+            # A locked or full database loses this batch, never the thread; the transaction rolls back
+            try:
+                with tracing.span('history_write', 'history', {'operations': len(batch)}), connection:
+                    for operation in batch:
+                        kind = operation[0]
+                        if kind == 'visit':
+                            url, host, title, visit_time = operation[1:]
+                            connection.execute(RECORD_URL, (url, host, title, visit_time))
+                            connection.execute(RECORD_VISIT, (visit_time, url))
+                        elif kind == 'title':
+                            url, title = operation[1:]
+                            connection.execute(UPDATE_TITLE, (title, url, title))
+            except sqlite3.Error as error:
+                print(f"History: {len(batch)} writes lost: {error}", file=sys.stderr)
+            if compact:
+                try:
+                    with tracing.span('history_retention', 'history'):
+                        self.apply_retention(connection)
+                except sqlite3.Error as error:
+                    print(f"History: retention failed: {error}", file=sys.stderr)
+                next_compaction = time.monotonic() + COMPACT_INTERVAL
+        connection.close()
+
+    def apply_retention(self, connection):
+        cutoff = time.time() - self.retention_days * 86400
+        while True:
+            with connection:
+                deleted = connection.execute(
+                    "DELETE FROM visits WHERE id IN "
+                    "(SELECT id FROM visits WHERE visit_time < ? LIMIT ?)",
+                    (cutoff, DELETE_CHUNK)).rowcount
+            if deleted < DELETE_CHUNK:
+                break
+
+        excess = connection.execute("SELECT COUNT(*) FROM visits").fetchone()[0] - self.max_visits
+        while excess > 0:
+            with connection:
+                connection.execute(
+                    "DELETE FROM visits WHERE id IN "
+                    "(SELECT id FROM visits ORDER BY visit_time LIMIT ?)",
+                    (min(excess, DELETE_CHUNK),))
+            excess -= DELETE_CHUNK
+
+        # URLs last visited before the oldest remaining visit have no visits left;
+        # visit_count of the survivors keeps counting all-time visits for ranking
+        oldest = connection.execute("SELECT MIN(visit_time) FROM visits").fetchone()[0]
+        if oldest is None:
+            oldest = time.time()
+        expired = []
+        while True:
+            rows = connection.execute(
+                "SELECT id, url FROM urls WHERE last_visit < ? LIMIT ?",
+                (oldest, DELETE_CHUNK)).fetchall()
+            if not rows:
+                break
+            with connection:
+                connection.executemany("DELETE FROM urls WHERE id = ?", [(row[0],) for row in rows])
+            expired.extend(row[1] for row in rows)
+
+        connection.execute('PRAGMA incremental_vacuum')
+        connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        connection.execute('PRAGMA optimize')
+        if expired:
+            self.urlsExpired.emit(expired)
+
+    # Reads: each thread gets its own read-only connection; WAL lets them run beside the writer
+
+    def reader(self):
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = self.local.connection = open_database(self.path, read_only=True)
+        return connection
+
+    def visits_between(self, start, end, limit=1000):
+        return self.reader().execute(
+            "SELECT urls.url, urls.title, visits.visit_time FROM visits "
+            "JOIN urls ON urls.id = visits.url_id "
+            "WHERE visits.visit_time >= ? AND visits.visit_time < ? "
+            "ORDER BY visits.visit_time DESC LIMIT ?",
+            (start, end, limit)).fetchall()
+
+    def urls_for_host(self, host, limit=1000):
+        return self.reader().execute(
+            "SELECT url, title, visit_count, last_visit FROM urls WHERE host = ? "
+            "ORDER BY last_visit DESC LIMIT ?",
+            (host, limit)).fetchall()
+
+    def most_visited(self, limit=100, min_visits=1):
+        return self.reader().execute(
+            "SELECT url, title, visit_count, last_visit FROM urls WHERE visit_count >= ? "
+            "ORDER BY visit_count DESC LIMIT ?",
+            (min_visits, limit)).fetchall()
+
+    def recent_urls(self, before=None, search='', limit=200):
+        # Keyset paging: pass the (last_visit, id) of the last row seen to get the next page.
+        # Walking the last_visit index keeps every page cheap however large history grows.
+        conditions, parameters = [], []
+        if before is not None:
+            conditions.append("(last_visit, id) < (?, ?)")
+            parameters.extend(before)
+        if search:
+            pattern = '%' + search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            conditions.append("(url LIKE ? ESCAPE '\\' OR title LIKE ? ESCAPE '\\')")
+            parameters.extend((pattern, pattern))
+        where = "WHERE " + " AND ".join(conditions) if conditions else ""
+        return self.reader().execute(
+            f"SELECT id, url, title, visit_count, last_visit FROM urls {where} "
+            "ORDER BY last_visit DESC, id DESC LIMIT ?",
+            parameters + [limit]).fetchall()
+
+    def frecency_rows(self):
+        # Feeds the omnibox index; rows are streamed rather than fetched all at once
+        cursor = self.reader().execute("SELECT url, title, visit_count, last_visit FROM urls")
+        for url, title, visit_count, last_visit in cursor:
+            yield url, title, visit_count, last_visit, False
@@ -0,0 +1,187 @@
+import sqlite3
+from PyQt5.QtCore import *
+from PyQt5.QtWidgets import *
+
+PAGE_SIZE = 200
+FILTER_DELAY_MS = 150
+
+
+class HistoryPageTask(QRunnable):
+    def __init__(self, history, page_text, generation, before, search, done):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.history = history
+        # Set when the search is over page contents rather than titles and URLs
+        self.page_text = page_text
+        self.generation = generation
+        self.before = before
+        self.search = search
+        self.done = done
+        self.connection = None
+
+    def run(self):
+        self.connection = self.history.reader()
+        try:
+            if self.page_text is not None:
+                rows = self.page_text.search(self.search, PAGE_SIZE)
+            else:
+                rows = self.history.recent_urls(self.before, self.search, PAGE_SIZE)
+        except sqlite3.OperationalError:
+            # Interrupted because the filter changed
+            return
+        self.done.emit(self.generation, rows)
+
+
+class HistoryModel(QAbstractTableModel):
+    # Rows are pulled from the store a page at a time as the view scrolls, so opening
+    # the window never depends on how much history there is. Pages are queried on a
+    # background thread because a rare search term can scan far before filling one.
+    pageLoaded = pyqtSignal(int, list)
+    headers = ("Title", "URL", "Last visited", "Visits")
+
+    def __init__(self, history, page_text=None, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.page_text = page_text
+        self.search = ''
+        self.full_text = False
+        self.rows = []
+        self.exhausted = False
+        self.generation = 0
+        self.task = None
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.pageLoaded.connect(self.add_page)
+
+    def set_filter(self, text, full_text=False):
+        self.beginResetModel()
+        self.generation += 1
+        if self.task is not None and self.task.connection is not None:
+            self.task.connection.interrupt()
+        self.task = None
+        self.search = text.strip()
+        self.full_text = bool(full_text and self.search and self.page_text is not None)
+        self.rows = []
+        self.exhausted = False
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.exhausted or self.task is not None:
+            return
+        before = None
+        if self.rows:
+            last = self.rows[-1]
+            before = (last[4], last[0])
+        self.task = HistoryPageTask(self.history, self.page_text if self.full_text else None,
+                                    self.generation, before, self.search, self.pageLoaded)
+        self.pool.start(self.task)
+
+    @pyqtSlot(int, list)
+    def add_page(self, generation, page):
+        if generation != self.generation:
+            return
+        self.task = None
+        # Full-text matches are ranked rather than paged, so there is only ever one page
+        if len(page) < PAGE_SIZE or self.full_text:
+            self.exhausted = True
+        if page:
+            self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(page) - 1)
+            self.rows.extend(page)
+            self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        row_id, url, title, visit_count, last_visit = row[:5]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return title or url
+            if column == 1:
+                return url
+            if column == 2:
+                return QDateTime.fromSecsSinceEpoch(int(last_visit)).toString("yyyy-MM-dd hh:mm")
+            return visit_count
+        if role == Qt.ToolTipRole and column in (0, 1):
+            # Full-text matches carry a snippet of the text around the match
+            return row[5] if len(row) > 5 and column == 0 else url
+        if role == Qt.UserRole:
+            return url
+        return None
+
+
+class HistoryWindow(QWidget):
+    openUrl = pyqtSignal(QUrl)
+
+    def __init__(self, history, page_text=None, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("History")
+        self.resize(900, 600)
+
+        self.search_bar = QLineEdit()
+        self.search_bar.setPlaceholderText("Search history")
+        self.search_bar.setClearButtonEnabled(True)
+        self.search_bar.setStyleSheet("font-size: 16px; padding: 5px;")
+
+        self.contents_box = QCheckBox("Page contents")
+        self.contents_box.setToolTip("Search the text of visited pages instead of titles and URLs")
+        self.contents_box.setEnabled(page_text is not None)
+
+        self.model = HistoryModel(history, page_text, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setWordWrap(False)
+        # Fixed row heights let the view lay out any number of rows without measuring them
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setColumnWidth(0, 300)
+        self.table.setColumnWidth(1, 380)
+        self.table.setColumnWidth(2, 130)
+        self.table.doubleClicked.connect(self.open_index)
+
+        search_row = QHBoxLayout()
+        search_row.addWidget(self.search_bar)
+        search_row.addWidget(self.contents_box)
+        layout = QVBoxLayout(self)
+        layout.addLayout(search_row)
+        layout.addWidget(self.table)
+
+        # Wait for a pause in typing before querying
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        self.search_bar.textChanged.connect(self.filter_timer.start)
+        self.contents_box.toggled.connect(self.apply_filter)
+
+    def showEvent(self, event):
+        # Pick up visits made since the window was last shown
+        self.apply_filter()
+        super().showEvent(event)
+
+    @pyqtSlot()
+    def apply_filter(self):
+        self.model.set_filter(self.search_bar.text(), self.contents_box.isChecked())
+
+    @pyqtSlot(QModelIndex)
+    def open_index(self, index):
+        self.openUrl.emit(QUrl(self.model.data(index, Qt.UserRole)))
@@ -0,0 +1,118 @@
+import os
+import shutil
+from PyQt5.QtCore import *
+from PyQt5.QtWebEngineWidgets import QWebEngineProfile, QWebEngineScript
+
+DEFAULT_CACHE_MB = 512
+# Chromium keeps the cache under setHttpCacheMaximumSize itself; the size is only measured for
+# the settings page, since clearHttpCache() would throw away every entry rather than trim it
+MAINTENANCE_INTERVAL_MS = 30 * 60 * 1000
+
+# Resource Timing tells whether each response came over the network or from the cache.
+# transferSize is 0 for cache hits; cross-origin entries without Timing-Allow-Origin
+# report 0 for every size and are counted as unknown.
+CACHE_STATS_SCRIPT = """
+(function () {
+    var hits = 0, misses = 0, unknown = 0;
+    var entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+    for (var i = 0; i < entries.length; i++) {
+        var entry = entries[i];
+        if (entry.transferSize > 0) {
+            misses++;
+        } else if (entry.decodedBodySize > 0) {
+            hits++;
+        } else {
+            unknown++;
+        }
+    }
+    return [hits, misses, unknown];
+})()
+"""
+
+
+def directory_size(path):
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+class CacheMaintenanceTask(QRunnable):
+    def __init__(self, cache_path, stale_paths, done):
+        super().__init__()
+        self.cache_path = cache_path
+        self.stale_paths = stale_paths
+        self.done = done
+
+    def run(self):
+        for path in self.stale_paths:
+            shutil.rmtree(path, ignore_errors=True)
+        self.done.emit(directory_size(self.cache_path))
+
+
+class HttpCacheMonitor(QObject):
+    sizeMeasured = pyqtSignal('qint64')
+
+    def __init__(self, profile, cache_path, max_mb=DEFAULT_CACHE_MB, parent=None):
+        super().__init__(parent)
+        self.profile = profile
+        # Must be configured before the profile's first request opens the cache
+        previous_path = profile.cachePath()
+        profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+        profile.setCachePath(cache_path)
+        profile.setHttpCacheMaximumSize(max_mb * 1024 * 1024)
+        self.cache_path = cache_path
+        self.max_bytes = max_mb * 1024 * 1024
+        # The cache used before this path was configured is never read again
+        self.stale_paths = []
+        if previous_path and not (cache_path + os.sep).startswith(previous_path + os.sep) \
+                and not (previous_path + os.sep).startswith(cache_path + os.sep):
+            self.stale_paths.append(previous_path)
+        self.size_bytes = None
+        self.maintaining = False
+        self.hits = 0
+        self.misses = 0
+        self.unknown = 0
+
+        self.sizeMeasured.connect(self.size_measured)
+        self.timer = QTimer(self)
+        self.timer.setInterval(MAINTENANCE_INTERVAL_MS)
+        self.timer.timeout.connect(self.maintain)
+        self.timer.start()
+        QTimer.singleShot(0, self.maintain)
+
+    def watch(self, view):
+        view.loadFinished.connect(lambda ok, view=view: self.measure(view.page()) if ok else None)
+
+    def measure(self, page):
+        if page.url().scheme() in ('http', 'https'):
+            page.runJavaScript(CACHE_STATS_SCRIPT, QWebEngineScript.ApplicationWorld, self.record)
+
+    def record(self, result):
+        if isinstance(result, list) and len(result) == 3:
+            hits, misses, unknown = (int(value) for value in result)
+            self.hits += hits
+            self.misses += misses
+            self.unknown += unknown
+
+    def hit_ratio(self):
+        known = self.hits + self.misses
+        return self.hits / known if known else None
+
+    @pyqtSlot()
+    def maintain(self):
+        # Walking the cache directory can take a while, so it runs on the thread pool
+        if self.maintaining:
+            return
+        self.maintaining = True
+        stale_paths, self.stale_paths = self.stale_paths, []
+        QThreadPool.globalInstance().start(CacheMaintenanceTask(self.cache_path, stale_paths, self.sizeMeasured))
+
+    @pyqtSlot('qint64')
+    def size_measured(self, size):
+        self.maintaining = False
+        self.size_bytes = size
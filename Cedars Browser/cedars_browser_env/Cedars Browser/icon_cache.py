@@ -0,0 +1,30 @@
+from PyQt5.QtCore import *
+from PyQt5.QtGui import QIcon, QPixmap
+# Registers the icons compiled from icons.qrc; regenerate with: pyrcc5 -o icons_rc.py icons.qrc
+import icons_rc
+
+# Icons and pixmaps are decoded once per process and shared by every window.
+# QIcon and QPixmap are implicitly shared, so handing out copies costs nothing.
+icons = {}
+pixmaps = {}
+
+
+def icon(name):
+    cached = icons.get(name)
+    if cached is None:
+        cached = icons[name] = QIcon(f':/icons/{name}.png')
+    return cached
+
+
+def pixmap(name, width, height, device_pixel_ratio=1.0):
+    # Prescaled to the screen's pixel density so HiDPI displays get a sharp image
+    key = (name, width, height, device_pixel_ratio)
+    cached = pixmaps.get(key)
+    if cached is None:
+        source = QPixmap(f':/icons/{name}.png')
+        cached = source.scaled(round(width * device_pixel_ratio), round(height * device_pixel_ratio),
+                               Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        cached.setDevicePixelRatio(device_pixel_ratio)
+        pixmaps[key] = cached
+    return cached
+
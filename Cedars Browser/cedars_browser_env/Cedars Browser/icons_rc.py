@@ -0,0 +1,4343 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x06\x0e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x05\xc0\x49\x44\x41\x54\x78\x9c\xed\
+\x9d\xcf\x6f\x55\x45\x14\xc7\x3f\xa4\xf2\xca\x46\x0c\x8d\x6b\x0d\
+\x45\x4c\x4c\x04\x29\xfe\xe2\xd1\x82\xc4\x9d\x10\x4d\xa3\x18\x35\
+\x0a\x6a\x8c\x1a\x7f\x2d\x8c\x0b\x63\x8c\x68\xb4\x58\x63\x14\x77\
+\x88\x0b\x35\xa8\x31\x36\xe2\x46\x44\xfc\x81\xb8\x71\x83\x8a\xe5\
+\x1f\xd0\x60\xa9\xd5\x44\xda\x42\xa5\xfc\x48\xa4\xcf\x4c\x72\x8a\
+\x2f\x27\x73\xdb\xfb\x5e\xfb\xee\x3d\xf7\xce\x7c\x92\xd9\xb4\xef\
+\xdd\x73\x66\xbe\xf7\xce\xdc\x39\x73\x66\x1e\x44\x22\x91\x48\x24\
+\x12\x89\x44\xca\xcd\x72\x60\x0b\xb0\x1d\xf8\x14\x38\x02\xfc\x0a\
+\x8c\x01\xe7\xa4\x8c\xc9\xdf\x8e\xc8\x67\xdc\x67\xef\x93\xef\x46\
+\xe6\xc8\x22\x60\x33\xb0\x1b\x38\x06\xd4\xe6\x58\x86\xe4\x5a\x77\
+\x00\xed\x51\x9d\xf4\xac\x06\x76\xc9\xdd\x5e\x6b\x51\x19\x03\xde\
+\x06\xba\xa2\x30\xc9\x74\x03\x7b\x81\xa9\x16\x0a\x51\xf3\x94\x1f\
+\x80\x9b\xa3\x30\xff\xb3\x0c\xf8\x32\x45\xc3\xfd\x03\xec\x97\x71\
+\x61\x2b\x70\x23\xd0\x09\x2c\x01\x2a\x52\x96\xc8\xdf\xdc\xff\xee\
+\x97\xcf\xba\xef\x9c\x4a\x71\xfd\x2f\xe4\xbb\xc1\xe2\x1a\xf0\x45\
+\xe0\xcc\x0c\x8d\x34\x02\xbc\x21\x4f\xcf\xc2\x39\xd8\x5a\x28\xd7\
+\x78\x53\xae\x99\x64\xef\x34\xb0\x4d\x7c\x0b\x0a\x77\x27\xfe\x34\
+\x43\xc3\x7c\x07\xdc\x02\xb4\xb5\xc0\x76\x1b\xb0\x51\x6c\x24\xd9\
+\xff\x11\x58\x4a\x20\xdc\x0e\x9c\x48\x68\x88\xaf\xa5\xbb\xc9\x8a\
+\x2a\xf0\x6d\x82\x2f\xe3\x40\x2f\x25\xe7\x49\xe0\xbc\xa7\xf2\x7f\
+\xc8\xb8\x90\x17\xb7\x02\xbf\x7b\xfc\x72\x2f\x18\xcf\x50\x42\x16\
+\xc8\x00\xeb\xbb\x13\x3f\x02\x2e\xce\xdb\x41\x60\x31\xf0\x71\x82\
+\x8f\x7d\x52\x87\xd2\xb0\x3d\x61\x00\x7d\x08\x7b\x3c\x92\xf0\xa2\
+\xe1\x44\x29\x05\x8f\x27\xf4\xcf\xeb\xb0\xcb\x1a\xe0\xb8\xc7\xef\
+\xa7\x29\xc1\x00\xae\xc7\x8c\x3f\x81\x95\xd8\x67\xa5\xf8\x5a\xef\
+\xfb\xf9\x22\x0f\xf4\x97\x03\xa3\xaa\x42\xee\xed\x6a\x15\xc5\xe1\
+\x6a\x4f\x08\x67\xbc\x88\xaf\xc4\x15\xcf\x3c\xe3\xb4\xf1\x6e\x2a\
+\x89\x9b\x3c\x63\xca\xa1\xa2\x4d\x1e\x5f\xf2\xf4\xbf\x16\x07\xf0\
+\xb4\x3c\xea\xa9\xcf\x0b\x14\x28\x36\xa5\xef\xa8\x4f\x28\x3e\x1f\
+\x7a\x9e\xf8\x42\xc4\xbe\x74\xa0\xf0\x98\x91\x79\xc6\x7c\xcc\x53\
+\x86\x55\xdd\x5c\x74\xda\x34\x55\xcf\xa3\xed\x16\x84\x5a\x49\x4d\
+\x95\x56\x72\x97\xc7\x9e\x0b\x5a\x9a\x65\xbf\x27\x36\x45\x89\x04\
+\x71\x1c\x50\xf6\xf6\x61\x78\xa5\x4f\x37\x8e\x9b\x60\x95\x4d\x90\
+\xb5\x9e\x78\x97\xc9\x95\xc7\x5d\xca\x51\x77\x27\x51\x42\x41\x1c\
+\xdf\x2b\x9b\x3b\x31\x98\x90\xa0\x27\x50\x6e\x3d\xa3\xac\x82\x6c\
+\x54\x36\x47\xad\x25\x4e\xdc\xa9\x1c\x1c\x69\xd1\xe2\x92\x15\x41\
+\x2e\xf2\x84\x55\x5c\x98\xc8\x0c\x1f\x28\xe7\x5e\xcf\xd0\x76\x2d\
+\x07\x41\x1c\x3b\x94\xdd\xf7\x30\x84\xce\x9b\x72\x03\x5f\xd9\x05\
+\x59\xa7\xec\x1e\xc5\x08\x57\x7a\xb2\x43\xe6\x92\x90\x50\x14\x41\
+\x2a\x9e\x6c\x16\x17\xa5\xc8\x9d\x2d\xca\x29\x37\x17\x21\x00\x41\
+\x90\x79\x56\xbd\xed\x7b\x31\xb8\x1a\xd8\x17\x90\x20\xfd\xca\xf6\
+\xcb\x18\x60\x8f\x72\xca\x3d\x31\xa1\x08\xf2\x80\xb2\x3d\x80\x01\
+\x06\x95\x53\x59\xa6\xf1\xe4\x2d\x88\x8e\xdd\x1d\xc6\x00\x47\x95\
+\x53\x6e\xa5\x30\x14\x41\x96\x2a\xdb\xbf\x61\x00\xbd\x4c\xdb\x31\
+\x4f\x0d\x9b\x75\x69\x86\x4b\xd5\x35\xfe\xc6\x00\xe7\x94\x53\x95\
+\x80\x04\x69\x57\xd7\x38\x8b\x01\xa2\x20\x5c\x10\xc4\xb5\x45\xee\
+\xc4\x2e\x8b\x0b\x82\xb8\x5c\xae\xdc\x09\x79\x50\xef\xb4\x18\x3e\
+\x19\xcc\x61\x51\xca\x8a\x20\x7a\xb1\xea\x67\x0c\x4e\x0c\xb7\x06\
+\x24\xc8\x83\x16\x27\x86\x7d\xca\x29\x17\x4a\x09\x45\x90\xd7\x94\
+\xed\x57\x31\x18\x5c\xfc\x2a\x20\x41\xbe\xb1\x18\x5c\x5c\xae\x9c\
+\x9a\xcc\x38\xcd\xb2\x66\x28\xfc\x9e\xf5\x0b\x4d\x22\x43\x39\xe6\
+\x2a\xd5\x72\x12\x64\xbd\x67\x17\x98\x19\x76\x2b\xe7\xdc\xce\xd9\
+\xb2\x0b\xf2\x96\xb2\xeb\xda\xc0\x0c\x9b\x03\x4c\x72\xf8\x4b\xd9\
+\xbd\x0d\x43\xb4\x7b\xd2\x80\x5c\xaa\x4c\x59\x05\xd9\xa4\x6c\x4e\
+\x48\x2a\x94\xe9\x44\x39\xb7\x0f\x3c\x94\x44\xb9\x77\x30\x48\x97\
+\xe7\x9c\x12\xb7\x80\x53\x36\x41\xba\x3d\x36\x57\x50\x90\xad\x08\
+\x6e\x53\x7e\xd9\x04\x39\x98\x53\x4f\xd0\x14\x6b\x3c\x0d\xe4\xb2\
+\x1a\xcb\x22\xc8\x3d\x45\xdb\x8e\x80\x9c\xaa\x53\xef\xf0\xb0\x6c\
+\x76\x29\x3a\x97\xc8\x5c\xa3\xbe\x6e\x9f\x53\x00\x3a\x65\xbb\x57\
+\xbd\xe3\xee\x84\x84\xa2\x33\xe0\x59\x1d\xbc\x8a\x82\xb0\xcd\xf3\
+\x68\x3f\x4c\x71\x79\xcc\x53\x9f\xe7\x29\x10\x15\x39\xe2\xa8\xbe\
+\x02\x67\x24\xdc\x50\x34\x36\xc8\xd3\x50\x5f\x97\x5f\x32\x4e\x97\
+\x9d\x17\x2e\xf3\x2c\xef\x9e\xb4\xba\xdb\x28\x81\x15\x9e\x09\xef\
+\x44\x91\xba\x2a\x4d\x6f\x81\x8f\xd6\xb8\xc6\xb3\x07\x64\xca\x5a\
+\x88\xa4\x19\x9e\xf2\xf4\xbf\xe3\xc6\xbb\xaf\x0d\x09\x87\xac\xb9\
+\x97\x95\x1e\x4a\x80\x5e\x55\x9c\x1e\x53\xdc\x51\x48\x16\x07\xf0\
+\xb3\x1e\x7f\xeb\xbb\x2c\xf3\x73\x8f\xd9\x58\x90\x20\xca\xf4\x2b\
+\xf1\x62\x23\xf3\x8c\x81\x19\x84\x28\x9d\x28\x8e\x27\x12\x8e\xf8\
+\x1b\x31\x70\xc4\xdf\x50\x4a\x31\xa6\xcb\x29\xe9\xda\x0a\x4f\xaf\
+\x8c\x21\xbe\x4a\x1e\xc8\x78\x3b\x5c\xb7\x27\x36\xd5\x48\x99\xc8\
+\xd8\xdf\x96\x66\x8d\x1f\x9a\xa1\xa2\x07\x65\x3d\xa5\xad\x45\x8b\
+\x4b\x9b\x3c\x21\xf4\xfa\x32\x28\x5b\xf3\x82\x12\xa5\x22\x47\x1c\
+\xe9\x30\x8b\x7e\x45\xde\x21\x1b\x2c\x2b\x73\xb4\xb5\x5e\x96\x5d\
+\xf5\x4a\x9f\x0e\x87\x3c\x27\xa2\xf5\x48\x63\xa7\x11\xe5\x64\x46\
+\x4b\x0d\x99\xc5\xbe\xf6\xa6\xa8\xf4\xa4\xec\xe9\xeb\x97\x04\xb5\
+\xaa\x7c\xb7\xa3\xee\xa8\xf1\x0e\xf9\x5b\x55\x3e\xd3\x2f\xa9\x3a\
+\x93\x29\xae\xff\x19\x70\x85\xf2\x2d\x58\x51\x90\xc7\x7e\x5f\xc6\
+\x87\xf1\x4f\xc9\x1a\x4e\xcf\x2c\xe3\x4c\xb0\xa2\x20\xa1\x95\x9d\
+\x9e\xb0\x4b\x6d\x1e\xcb\x98\xd8\x48\x1b\x31\x68\x54\x94\xac\xf3\
+\x9b\x33\x4b\x9c\x70\xc7\x55\xbc\xef\xc9\xb0\xaf\x35\x51\xdc\x5a\
+\xc6\xbb\x72\x7e\xd7\xa2\x26\x9f\xe0\xe0\x45\xa9\x67\x99\xa4\x6a\
+\xbe\x22\x13\xb8\xc3\xf2\xf3\x46\xa3\xb2\x51\xe6\x5f\xb9\xf3\x87\
+\xe5\x00\xce\x3d\x72\xc4\xc7\xdd\x9e\xb1\xa1\x59\xd6\xca\x13\x90\
+\xe6\x06\x38\x91\xc3\x06\xd8\x20\xa9\x36\x20\x4a\x69\xbb\x2f\x6b\
+\x5c\xdb\xc0\x4f\x32\xc5\x27\x25\x23\xa2\x28\x06\x89\xa2\x18\x24\
+\x8a\x62\x54\x94\xb4\xf3\xa6\x38\xa6\x64\x78\x2a\x6b\x23\xa2\xdc\
+\x90\x95\x63\x21\xb3\x3a\x8a\x62\x8f\x28\x8a\x41\xa2\x28\x06\x89\
+\xa2\x18\x8d\x5c\xa7\x1d\xe8\xdd\xb2\xf6\xf5\x79\x3b\x1c\x02\x5d\
+\x51\x14\x7b\x44\x51\x0c\x72\x5d\x03\x01\xc9\x67\xf3\x76\x36\xa4\
+\x27\xe5\xf8\x2c\x62\xb8\x5f\xd0\x8e\x64\xc8\xaa\x19\x44\x89\x62\
+\x18\x12\x25\x8a\x61\x48\x94\x28\x86\xa1\xc9\x63\x1c\xc0\x23\x91\
+\x48\x24\x12\x89\x44\xc8\x9b\xff\x00\x30\xae\x32\xb2\xca\xaa\xee\
+\x45\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\xc9\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x04\x7b\x49\x44\x41\x54\x78\x9c\xed\
+\x9d\x4b\xa8\x55\x55\x18\xc7\x7f\xde\x7b\x35\x9b\x84\x0e\xca\x57\
+\x24\x18\x45\x93\x1e\x6a\x64\x9a\xb3\x1e\x64\xa6\xa0\x64\x2f\x22\
+\x48\x21\x02\xc9\x42\x83\x70\xa2\x83\xa2\x24\x1a\x68\x34\xab\x59\
+\x10\x94\x83\xe8\x41\x05\x3a\xa8\x88\x1e\x54\xf4\x92\x32\x4d\x50\
+\x4c\xc3\x34\x1f\xf9\xb8\xe6\x6b\xc7\x87\xdf\x81\xcb\xa1\xbd\xf7\
+\xda\xf7\xde\x73\xf6\x5a\xfb\xfc\x7f\xb0\x46\x17\xee\xf9\xd6\xfa\
+\x9f\xf5\x7d\xdf\xda\x7b\x9f\xff\x06\x21\x84\x10\x42\x08\x21\x84\
+\x10\x42\x08\x21\xe2\xe0\x12\xe0\x66\xe0\x71\xe0\x55\xe0\x7d\xe0\
+\x47\xe0\x00\x70\x18\x38\x0f\x9c\x06\x0e\x02\xbb\x80\xef\x80\x77\
+\x81\x17\x81\x47\x80\x59\x40\x7f\xdd\x93\x48\x8d\xe9\xc0\xd3\xc0\
+\x47\xc0\x29\x20\x1b\xe1\x38\x02\x6c\x06\x56\x00\x53\xeb\x9e\x5c\
+\xac\x8c\x07\x96\x03\x9f\x02\x17\x46\x61\xd1\xf3\x86\xed\x98\x0f\
+\x80\xc5\xda\x19\x17\x99\x00\xac\xf3\x94\x92\x75\x79\xfc\x01\xac\
+\x76\xf1\x43\xc9\xfb\x5f\xc9\x31\xce\xf3\xfa\x81\x1a\x16\xbe\x7d\
+\xec\xf5\x58\x06\x7a\x45\x80\xf9\xc0\xf6\x08\x16\x3e\x6b\x1b\x56\
+\xdc\x67\x36\x59\x00\xeb\x68\x36\x7a\x1e\xae\xb2\x30\x87\x3d\x6f\
+\x3f\x07\xdc\x0f\xdc\x0a\x4c\x01\x26\x02\x63\x3c\x85\x4c\x02\xae\
+\xf5\xbf\x59\x2d\xd9\x04\x7c\x02\x9c\xa8\xf8\x59\x67\x80\xf5\xc0\
+\xd8\xa6\x09\x30\x03\xf8\xa6\xc2\x42\xec\xf1\x56\x72\xee\x08\x8b\
+\xe5\xa5\xc0\x22\xe0\x75\x6f\x55\x43\x3f\xff\xeb\x9c\x8e\x29\x49\
+\x01\x2c\xe5\xfc\x1d\x30\xe9\x0b\xde\x7a\xde\x01\xf4\x75\x68\x07\
+\xda\xee\xf8\xb9\x42\x6d\xb0\x73\x44\xd2\x02\x2c\x05\x06\x03\x26\
+\xbb\x25\x20\xff\x8e\x16\x96\xb6\x16\x02\xbf\x06\xc4\x75\xd2\x5b\
+\xd6\x24\x05\xb8\x0f\x38\x5b\x32\xc1\x7d\x6d\x13\xec\x26\x96\xe7\
+\x9f\x01\xfe\x29\x89\xf1\x5f\xe0\xde\xd4\x04\x58\xec\x05\xad\x68\
+\x62\x6f\xfa\x39\x20\x86\x93\xf7\x57\x25\xb1\xda\x2e\xbe\x2b\x15\
+\x01\x66\x95\x74\x1f\xf6\x8d\x7a\x82\xf8\xce\x25\x1b\x4b\x4e\xe1\
+\x27\x53\x10\x60\xb2\x9f\x30\xf3\x02\x3d\xe6\x45\x36\x56\x56\x00\
+\xe7\x2a\x74\x4b\x51\x09\xd0\xe7\xc5\xb4\xe8\xa2\xd8\x6c\xe2\xe7\
+\x81\x80\xf4\x19\xa5\x00\xcf\x16\x04\x68\x85\x6e\x0e\xe9\xb0\xa4\
+\xe2\x4e\xa8\x9d\x6b\x0a\xda\xcd\xf3\x35\x76\x3a\x23\x61\x4d\x2a\
+\x02\x58\x5f\xbd\xb5\x20\xb8\xb5\xa4\xcb\x6b\x29\x08\xb0\xa4\x20\
+\xb0\x2d\x1d\x3a\xd5\x8e\x84\xaa\x05\x36\x6a\x01\xec\x3a\xcd\xb6\
+\x82\x8e\x27\xc6\x3b\x50\x59\x93\x04\x78\xb0\x20\xa8\x55\xc4\x49\
+\xd6\x24\x01\xf2\x4e\x90\xbf\x44\x7c\xcb\x2f\x6b\x8a\x00\x33\x0b\
+\x02\xb2\xeb\x40\xb1\x92\x35\x45\x00\xe3\x36\xe0\x8d\xb6\x16\x74\
+\xbb\x77\x46\xb1\x92\x35\x49\x80\x16\x13\xfc\xbe\xaa\x15\xe4\x95\
+\x75\x07\xd3\xcb\x8c\x29\xb8\x9d\x27\x84\x10\x42\x08\x21\x84\x10\
+\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x91\xcb\xd8\xc8\
+\x1f\xb9\x69\x3c\xab\x80\x9d\xfe\x5b\x88\xcb\x89\x80\x46\x3e\xe4\
+\x94\x83\x3d\xe5\xbd\x63\x48\x9c\x83\xfe\x50\x9a\x3d\x9c\x56\x1b\
+\xbd\x24\xc0\x43\x05\x31\xdf\x54\x57\x50\xbd\x22\xc0\x00\xf0\x5b\
+\x4e\xbc\x5f\xd4\x19\x58\xaf\x08\xb0\x3a\xd6\x07\x91\x7b\x41\x80\
+\xe9\xc0\xf1\x9c\x58\x7f\xa8\xfb\x17\x40\x4d\x17\xa0\xdf\x6d\x6f\
+\xf2\x62\x6d\x59\x18\xd4\x46\xc8\x82\x3e\x4f\xba\xac\x2b\x98\x97\
+\x39\xbb\xd4\x4e\xe8\xb7\xfa\x51\xd2\x63\x69\x81\xb9\x94\xb9\x39\
+\x5e\x4d\x42\x02\x98\x3f\xc4\xed\xa4\xc3\xfc\x12\x6f\x08\xb3\xd5\
+\x8c\x82\x2a\xb9\x7d\x30\x86\x9c\x19\xc0\xdc\x12\x0b\x9b\x0f\x63\
+\xba\x1c\x51\xb5\xc0\x9e\xf1\x5f\x56\xc6\xca\x3d\x25\x4e\x2f\x66\
+\xa5\x76\x05\x11\x91\x17\x68\xd1\xf6\x35\x4b\x98\x0d\x81\x36\x91\
+\xdd\xe4\xa9\x12\x83\x29\xdb\x15\xd7\x13\x19\x79\xc1\xde\x19\x60\
+\x55\xf6\x19\x30\xad\xee\x09\xb8\xfb\xe2\xdb\x25\xb1\x9e\x76\xc3\
+\xa6\xe8\xc8\x0b\xd8\x58\xe0\x81\x17\x4d\xec\xa8\x17\xb4\xba\x76\
+\xc3\x32\xe0\xcf\x80\x06\xc2\x9c\x17\x49\x4d\x80\x56\x4e\xcd\x3b\
+\x45\x66\x43\x86\x39\x19\xde\xdd\xc5\xe2\x36\xc7\x7d\xaa\xcb\xe2\
+\x3a\x11\x7b\xe3\x50\x26\x80\x71\x03\xb0\x3b\xb0\x48\xff\x04\x3c\
+\xe6\x16\x93\x9d\x38\xd5\x2e\x2c\x71\x76\x19\x3a\xcc\x56\xf9\x16\
+\x22\x27\x44\x00\xdc\xd9\xf6\xf3\x0a\xdd\xd2\x41\x37\x5b\x5d\xe4\
+\xe6\xab\xc3\x65\xc0\xaf\xd7\xbf\x54\x62\xa5\xd6\x3e\xbe\x04\xae\
+\x22\x01\x42\x05\x68\x2d\xc6\xda\x80\xba\x90\xfd\x4f\x1a\xb0\x74\
+\xf1\x8a\x7b\xba\x59\x9f\x7e\x9d\xfb\xd3\x8d\xf7\x6f\xf6\x44\x2f\
+\xe8\xf3\xbc\xcd\x7d\x01\xf8\xd8\x1d\x5b\xaa\x7c\x96\x9d\x7c\x5f\
+\x76\x13\x3f\x9a\x26\x40\x0b\x6b\xe5\xbe\xad\xb8\x30\x59\x17\xc6\
+\x36\xf7\x9e\x4e\x8a\xe1\x08\x80\x5f\xc2\x5d\x06\xfc\x1e\xc1\xc2\
+\x1f\xf2\x7b\xbc\x9d\xa8\x3b\xd1\x0a\xd0\x62\x9c\x1f\x80\x42\x8b\
+\xf4\x68\x8e\xfd\x9e\x12\x2f\xeb\xe0\xfa\x24\x43\x9f\x77\x28\xef\
+\x0d\xd3\xb7\xb3\x4a\x8e\xdf\xea\x2f\xf8\x49\x26\xcf\x77\x9b\xc9\
+\xde\x8a\xbe\x15\xe8\xba\x1e\x52\xc4\xed\xfd\x03\x4f\x02\x57\xd6\
+\x3d\xb9\xd4\xe8\x07\x6e\x04\x1e\xf6\xce\xe6\x1d\x2f\xe0\x56\x3b\
+\xfe\xf2\x8e\xea\x9c\xbf\xe4\xc1\x52\xca\xf7\xfe\x1a\xab\x4d\xde\
+\x31\x99\xa9\x94\xdc\x5b\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
+\x04\x31\xf0\x1f\x21\x4a\xf4\x00\xb4\x90\x5b\xa4\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x03\x71\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x03\x23\x49\x44\x41\x54\x78\x9c\xed\
+\x9c\xcd\x87\x95\x61\x18\xc6\x7f\x4d\x5f\x4a\xd3\x68\x24\xd1\x87\
+\x48\x24\x22\x11\xad\xda\xb5\x48\x45\x8c\xa4\x16\x2d\x5a\xb4\x6d\
+\x93\xfa\x03\x12\x6d\x6a\x95\x98\xd2\xa6\x65\xb4\x88\x28\xd2\x8c\
+\x76\xe9\x4b\x44\x22\x89\xb4\x88\x46\x99\xa6\x2f\xa9\xb9\xf3\xf2\
+\xbe\x4c\xc7\x98\x73\xe6\x9c\xf7\x3c\xcf\xfd\x3c\xef\xf5\xe3\xda\
+\x0c\x33\xee\xeb\xba\x9f\x8f\x77\x9e\xf7\x39\x07\x84\x10\x42\x08\
+\x21\x84\x10\x22\x0d\x96\x03\x97\x80\x89\x52\x17\xcb\x9f\x89\x00\
+\x6c\x04\x9e\x00\xd6\xa2\x17\xc0\x66\x75\xa0\xbf\xec\x03\x3e\xcf\
+\x12\x7e\xa5\x49\xe0\x90\x9a\x50\x3f\x0b\x80\xb3\xc0\xdf\x39\xc2\
+\xaf\x34\x0d\x5c\x00\x06\xd4\x88\x7a\x18\x04\x6e\x75\x10\x7c\xab\
+\xee\x00\xab\xd4\x84\xde\xd8\x0a\xbc\xea\x22\xfc\x4a\x6f\x80\xed\
+\x6a\x42\x77\x1c\x01\xbe\xf5\x10\x7e\xa5\xa9\xf2\x6f\x89\x0e\x59\
+\x58\xae\xe1\xd3\x35\x84\x3f\x53\xa3\xc0\x62\x75\x61\x6e\x56\x03\
+\xf7\x6b\x0e\x7e\xa6\x1e\x02\x6b\xd5\x84\xd9\xd9\x09\xbc\xeb\x63\
+\xf8\x95\x3e\x00\xbb\xd5\x84\xff\x39\x0e\xfc\x08\x10\x7e\xa5\x5f\
+\xc0\x29\x35\x01\x96\x02\x57\x03\x06\xdf\xaa\x1b\xc0\xb2\xa6\x36\
+\x62\x3d\xf0\x28\x62\xf8\x95\x9e\x03\x9b\x68\x18\x7b\x80\x8f\x0e\
+\xc2\xaf\x54\x1c\xe8\xed\xa5\x21\x9c\x04\x7e\x3b\x08\xdd\x5a\xf4\
+\xa7\x3c\xee\x28\x8e\x3d\xb2\x64\x05\x70\xd3\x41\xd0\xd6\x46\xb7\
+\x81\x21\x32\x63\x0b\xf0\xd2\x41\xb8\xd6\xa1\x5e\x03\xdb\xc8\x84\
+\x03\xc0\x17\x07\xa1\xda\x3c\xf5\x15\x18\xa1\x21\x47\xc8\xe6\x54\
+\xd5\xd1\x76\x71\x3c\x92\x14\xc3\xc0\x3d\x07\x01\x5a\x4d\x1a\x07\
+\xd6\x90\x08\x3b\x80\xb7\x0e\x42\xb3\x9a\xf5\x1e\xd8\x85\x73\x8e\
+\x01\xdf\x1d\x84\x65\x7d\xd2\x4f\xe0\x04\x0e\x59\x54\xae\x95\xd6\
+\x10\x8d\x02\x4b\x70\x42\xf1\xcc\x3c\xe6\x20\x14\x0b\xac\x31\x0f\
+\xff\x2f\xac\x04\x9e\x39\x08\xc3\x22\xe9\x69\xf9\xce\x3a\x0a\x03\
+\x99\x3d\xe9\x58\x97\xba\x1b\xeb\x06\xc6\x19\x07\xe6\xcd\x89\x4e\
+\x87\x0e\x7f\x5d\xe6\x4f\x3b\x36\x4f\x15\x2f\x93\x36\x84\x6c\xc0\
+\x15\x07\xa6\xcd\x99\x2e\x87\x0a\x7f\xa8\xbc\xea\x11\xdb\xb0\x39\
+\x3c\x3b\x0a\xb2\x21\x1f\x75\x60\xd6\x9c\xea\x70\x88\x06\x5c\x77\
+\x60\xd4\x9c\xea\x5a\x88\x06\x34\xf9\xb9\xdf\xda\xe8\x71\x88\x06\
+\x4c\x38\x30\x6a\x4e\xf5\x29\x44\x03\x3c\xbe\xcf\x35\x27\x2a\xb2\
+\xe9\x3b\xb1\x4d\x9a\x73\xa9\x01\xa8\x01\xd1\x47\xa1\x69\x06\xc4\
+\x0f\xc2\xb4\x04\xc5\x0f\xc3\x22\x48\x7b\x00\x6a\x40\xf4\x51\x68\
+\x9a\x01\xf1\x83\x30\x2d\x41\xf1\xc3\xb0\x08\xd2\x1e\x80\x1a\x10\
+\x7d\x14\x9a\x66\x40\xfc\x20\x4c\x4b\x50\xfc\x30\x2c\x82\xb4\x07\
+\xa0\x06\x44\x1f\x85\xa6\x19\x10\x3f\x08\xd3\x12\x54\xef\xd5\xf0\
+\x91\x0e\x6f\x1d\x0c\x96\x5f\xda\x54\x7c\xcc\x48\x7b\x40\x4d\xe1\
+\x0f\x77\xb1\xb3\xad\x2a\x7f\x37\x74\x13\xb2\xdb\x84\x47\x7a\xa8\
+\xb5\xb8\x26\xa2\x06\xf4\x18\xc2\x60\x8f\xb7\xb7\xd5\x80\xc8\x53\
+\xda\xb4\x04\xa9\x01\xb5\x92\xda\x88\xb2\xc4\xea\xcd\xce\x90\x25\
+\x56\x6f\x76\x86\x2c\xb1\x7a\xb3\x33\x64\x89\xd5\x9b\x9d\x21\x4b\
+\xac\xde\xec\x0c\x59\x62\xf5\x66\x67\xc8\x12\xab\x37\x3b\x43\x96\
+\x58\xbd\xd9\x19\xb2\xc4\xea\xcd\xce\x90\x25\x56\x6f\x76\x86\x2c\
+\xb1\x7a\xb3\x33\x64\x89\xd5\x9b\x9d\x21\x4b\xac\xde\xec\x0c\x59\
+\x62\xf5\x66\x67\xc8\x12\xab\x37\x3b\x43\x96\x58\xbd\x6d\x09\xf9\
+\x3d\x11\x93\x0d\xac\xb7\x2d\xe3\x01\x0d\x3d\x68\x60\xbd\x6d\x39\
+\x18\xd0\xd0\xfe\x06\xd6\xdb\x11\xe7\x03\x98\x39\xd7\xe0\x7a\x3b\
+\xfe\x4e\xe8\xb1\x9a\xd7\xd8\xa9\x72\x1a\xf7\x63\x24\xa5\x56\xaf\
+\x10\x42\x08\x21\x84\x10\x42\x08\x41\x7e\xfc\x03\x78\x71\x4f\x36\
+\x8c\xa8\x3f\xbf\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x01\xf1\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x5a\x00\x00\x00\x5a\x08\x06\x00\x00\x00\x38\xa8\x41\x02\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x01\xa3\x49\x44\x41\x54\x78\x9c\xed\
+\xdc\x5d\x6a\xc2\x40\x14\xc5\xf1\xb3\x95\x40\x93\x5d\xc4\x87\xc6\
+\xec\xb1\xad\x6e\x45\xdb\x6e\xc2\x66\x0f\xa5\x42\x49\xdf\x2d\x03\
+\xc9\x73\xae\xc9\x9d\x6b\x6d\xfe\x3f\x18\x10\x11\xa3\xc7\x21\x1f\
+\xe3\x21\x12\x00\x00\x00\x00\x00\x00\xa2\xb5\x92\x76\x92\x3a\x49\
+\x3f\xc3\xf8\x90\xf4\x22\x69\xcb\xcf\xb1\x5c\x25\xe9\x5d\xd2\x65\
+\x62\xbc\x49\x2a\x09\x7c\x9e\x8d\xa4\xb3\x21\xe4\x71\xa4\xd7\xd6\
+\x33\xb7\xb5\xea\x99\x7c\xbe\x22\xe4\x71\x7c\x49\x7a\xb8\xf5\x87\
+\xbf\x27\xc7\x19\x21\x8f\x23\xed\x6a\x60\x3c\xf0\x5d\x16\x8e\xc6\
+\xb2\xa1\xb5\xdb\x3b\x04\xfd\x7c\xeb\x2f\x71\x0f\x3a\x87\xa0\xd3\
+\xa9\x1f\x26\xf4\x0e\x41\xa7\xf7\x40\x40\xd0\xdf\x53\x1b\x81\x5c\
+\x76\x1d\x27\x82\x9c\xb6\x73\x08\xfa\xc9\xb0\x9d\xd5\xdb\x3a\x04\
+\xfd\xb8\xfa\x14\x8d\x0e\x0b\x42\x4e\xeb\x1e\x30\x2a\x24\x7d\xce\
+\x08\x99\x4b\xf0\x19\xea\x21\xb8\x6b\x42\x66\x51\x69\xa6\xb4\xf4\
+\xf9\x6a\x08\x39\xad\x8d\xb0\x98\xe4\xa0\x19\x2e\xab\x4f\xc3\x79\
+\x76\x3f\x3c\x4e\xcf\x71\xe0\x03\x00\x00\xb8\x3b\x2d\xbd\x8e\xbc\
+\x2a\x7a\x1d\xf9\x6d\xe8\x75\xe4\x57\xd1\xeb\x88\x71\x5c\xb0\x4c\
+\x4a\xaf\xc3\x88\x5e\x47\x90\xbd\xc3\x3f\x2c\xf4\x3a\x0c\xe8\x75\
+\x04\xe9\x1d\x66\x34\xbd\x0e\x03\x7a\x1d\x41\x3a\x87\x19\x4d\xaf\
+\xc3\x80\x5e\x47\x90\x2d\xbd\x8e\x38\x07\x7a\x1d\x31\x0a\x7a\x1d\
+\x71\x6a\x7a\x1d\x71\x4a\x7a\x1d\xb1\x1a\x7a\x1d\x00\x00\x00\xff\
+\x49\x4b\xaf\x23\xaf\x8a\x5e\x47\x7e\x1b\x7a\x1d\xf9\x55\xf4\x3a\
+\x62\x1c\xe9\x75\xe4\xd7\x3a\x2c\xfc\x73\xbf\x0e\x03\x7a\x1d\x41\
+\x3a\x87\x19\xcd\xfd\x3a\x0c\xe8\x75\x04\xe9\x1d\x66\x34\xf7\xeb\
+\x30\xa0\xd7\x11\x64\xe7\x30\xa3\xb9\x5f\x87\x01\xbd\x8e\x40\x07\
+\x7a\x1d\x31\x0a\x7a\x1d\x71\x6a\x7a\x1d\x71\x4a\x7a\x1d\xb1\x1a\
+\x7a\x1d\x00\x00\x00\x00\x00\x00\xfa\x33\x7e\x01\x29\xe4\xf3\xb9\
+\xf1\xd3\xfb\xce\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x05\xe2\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x05\x94\x49\x44\x41\x54\x78\x9c\xed\
+\x9d\xcd\x6f\x55\x45\x14\xc0\x7f\x04\x79\x65\x23\x86\xc6\xb5\xa6\
+\x45\x4c\x4c\x04\x29\x7e\x51\x5a\x90\xb8\x13\xa2\x69\x14\xa3\x46\
+\xf1\x23\x46\x8d\x5f\x0b\xe3\xc2\x18\x23\x1a\x05\x6b\x8c\xe2\x0e\
+\x71\xa1\x06\x35\xc6\x46\xdc\x28\x88\x28\xe2\xc6\x8d\x28\x96\x7f\
+\x40\x83\xa5\x56\x13\x69\x0b\x95\x16\x48\xa4\xcf\x4c\x72\x8a\x2f\
+\x27\x73\xdb\xfb\x5e\xdb\x77\xcf\xcc\x9d\x5f\x32\x9b\xf6\xbd\x7b\
+\xcf\xb9\xe7\xce\x9c\x99\x73\xce\xcc\x83\x44\x22\x91\x48\x24\x12\
+\x89\x44\xdc\x2c\x07\xb6\x00\xdb\x81\xcf\x80\xa3\xc0\xaf\xc0\x08\
+\x70\x4e\xda\x88\xfc\xed\xa8\x7c\xc6\x7d\xf6\x3e\xf9\x6e\x62\x96\
+\x2c\x06\x36\x03\xbb\x81\xe3\x40\x75\x96\x6d\x40\xae\x75\x07\xd0\
+\x92\xac\x93\x9f\xd5\xc0\x2e\x79\xdb\xab\xf3\xd4\x46\x80\x77\x80\
+\x8e\x64\x98\x6c\xba\x80\x2f\x81\xc9\x79\x34\x44\xd5\xd3\x7e\x00\
+\x6e\x4e\x86\xf9\x9f\x65\xc0\x57\x39\x1e\xdc\x3f\xc0\x7e\xf1\x0b\
+\xf7\x03\x37\x02\xed\xc0\x52\xa0\x22\x6d\xa9\xfc\xcd\xfd\xef\x01\
+\xf9\xac\xfb\xce\xe9\x1c\xd7\xdf\x2b\xdf\x2d\x2d\xee\x01\xbe\x04\
+\x9c\x99\xe6\x21\x0d\x01\x6f\x4a\xef\x59\x34\x8b\x7b\x2d\x92\x6b\
+\xbc\x25\xd7\xcc\xba\xdf\x04\xb0\x55\x64\x2b\x15\xee\x4d\xfc\x69\
+\x9a\x07\xf3\x1d\x70\x0b\xb0\x70\x1e\xee\xbd\x10\xd8\x28\xf7\xc8\
+\xba\xff\x61\xa0\x8d\x92\x70\x3b\x70\x32\xe3\x41\x1c\x90\xe1\xa6\
+\x59\x74\x02\xdf\x66\xc8\x32\x0a\xf4\x10\x39\x4f\x01\xe7\x3d\xca\
+\xff\x21\x7e\xa1\x28\x6e\x05\x7e\xf7\xc8\xe5\x26\x18\xcf\x12\x21\
+\x0b\xc4\xc1\xfa\xde\xc4\x8f\x81\x8b\x8b\x16\x10\x58\x02\x7c\x92\
+\x21\xe3\x36\xd1\x21\x1a\xb6\x67\x38\xd0\x87\xb1\xc7\xa3\x19\x13\
+\x0d\x67\x94\x28\x78\x22\x63\x7c\x5e\x87\x5d\xd6\x00\x27\x3c\x72\
+\x3f\x43\x04\x0e\x5c\xfb\x8c\x3f\x81\x95\xd8\x67\xa5\xc8\x5a\x2b\
+\xfb\xf9\x90\x1d\xfd\xe5\xc0\xb0\x52\xc8\xcd\xae\x56\x11\x0e\x57\
+\x7b\x42\x38\xa3\x21\x4e\x89\x2b\x9e\x75\xc6\x84\xf1\x61\x2a\x8b\
+\x9b\x3c\x3e\xe5\xc7\xd0\x16\x8f\x2f\x7b\xc6\x5f\x8b\x0e\x3c\x2f\
+\x8f\x79\xf4\x79\x91\x80\x62\x53\xfa\x8d\xfa\x94\xf0\xf9\xc8\xd3\
+\xe3\x83\x88\x7d\xe9\x40\xe1\x71\x23\xeb\x8c\xb9\x58\xa7\x0c\x2a\
+\xdd\x5c\x74\xda\x34\x9d\x9e\xae\xed\x12\x42\xb1\x70\x97\x47\x3f\
+\x17\xb4\x34\xcb\x7e\x4f\x6c\x2a\x36\x0e\x2a\x1d\xf7\x61\x38\xd3\
+\xa7\xdf\x1e\xb7\xc0\x8a\x8d\xb5\x9e\x78\x97\xc9\xcc\xe3\x2e\x25\
+\xa8\x7b\x93\x62\xe5\x7b\xa5\xeb\x4e\x0c\x16\x24\xe8\x05\x94\xcb\
+\x67\xc4\xca\x46\xa5\xeb\xb0\xb5\xc2\x89\x3b\x95\x80\x43\xf3\x94\
+\x5c\xb2\xc2\x45\x9e\xb0\x8a\x0b\x13\x99\xe1\x43\x25\xdc\x1b\xc4\
+\xcf\x0e\xa5\xf3\xfb\x18\x42\xd7\x4d\x39\xc7\x17\x3b\xeb\x94\xce\
+\xc7\x30\xc2\x95\x9e\xea\x90\xd9\x14\x24\x84\x42\xc5\x53\xcd\xe2\
+\xa2\x14\x85\xb3\x45\x09\xe5\xd6\x22\x65\xe1\x80\xd2\xfd\x5e\x0c\
+\x66\x03\xa3\xc9\xac\xe5\xa0\x57\xe9\xfe\x0a\x06\xd8\xa3\x84\x72\
+\x3d\xa6\x2c\x3c\xa8\x74\xef\xc3\x00\xfd\x4a\xa8\x66\x96\xf1\x58\
+\x8b\xdd\x1d\xc1\x00\xc7\x94\x50\x2e\x53\x58\x16\xda\x94\xee\xbf\
+\x61\x00\x9d\xa6\x6d\x6d\xf0\x3a\xd5\x82\x5b\x23\x5c\xaa\xae\xf1\
+\x37\x06\x38\xa7\x84\xaa\x94\xc8\x20\x2d\xea\x1a\x67\x31\x40\x32\
+\x08\x17\x0c\xe2\x9e\x45\xe1\xa4\x21\x8b\x0b\x06\x71\xb5\x5c\x85\
+\x53\x66\xa7\xde\x6e\x31\x7c\xd2\x5f\x82\xa4\x54\xde\x64\xd5\xcf\
+\x18\x5c\x18\x16\x59\xc5\xde\x6c\x1e\xb2\xb8\x30\xdc\xa6\x84\x72\
+\xa1\x94\xb2\xf0\xba\xd2\xfd\x35\x0c\x06\x17\xbf\xa6\x3c\x7c\x63\
+\x31\xb8\xb8\x5c\x09\x35\x1e\x5a\x99\xe5\x1c\x86\xdf\xcd\x4c\x68\
+\x06\x42\xaa\x55\x9a\x23\xd6\x7b\x76\x81\x99\x61\xb7\x12\xce\xed\
+\x9c\x8d\x9d\xb7\x95\xce\xee\x19\x98\x61\x73\x09\x8b\x1c\xfe\x52\
+\x3a\xdf\x86\x21\x5a\x3c\x65\x40\xae\x54\x26\x56\x36\x29\x5d\xc7\
+\xa4\x14\xca\x74\xa1\x9c\xdb\x07\x5e\x96\x42\xb9\x77\x31\x48\x87\
+\xe7\x9c\x12\x97\xc0\x89\x8d\x2e\x4f\xa4\x78\x05\x81\x6c\x45\x70\
+\x9b\xf2\x63\xe3\x50\x48\x23\xc1\x1a\xcf\xdb\xe3\xaa\x1a\x63\xe1\
+\x1e\x8f\x7e\xe6\xa7\xf8\x7b\x95\xc0\x83\xb2\xd9\x25\x74\x2e\x91\
+\xb5\x46\xad\x6e\x5f\x10\x48\x48\x7a\x42\x09\xee\x4e\x48\x08\x9d\
+\x3e\x4f\x76\xf0\x2a\x02\x61\xab\xa7\x6b\x3f\x42\xb8\x3c\xee\xd1\
+\xe7\x05\x02\x8b\xf3\x1c\x56\x0a\x9c\x91\x70\x43\x68\x6c\x90\xde\
+\x50\xab\xcb\x2f\x21\x96\xcb\x5e\xe6\x49\xef\x9e\xb2\xba\xdb\x28\
+\x83\x15\x9e\x05\xef\x58\x48\x43\x95\xa6\x27\xe0\xa3\x35\xae\xf1\
+\xec\x01\x99\xb4\x16\x22\x69\x84\xa7\x3d\xe3\xef\xa8\xf1\xe1\x6b\
+\x43\xc6\x21\x6b\x6e\xb2\xd2\x4d\x04\xe8\xac\xe2\x94\x4f\x71\x47\
+\x21\x59\x74\xe0\x67\x3d\xf2\xd6\x0e\x59\xe6\xd7\x1e\x33\xb1\x20\
+\xc3\x28\x53\x53\xe2\x25\x46\xd6\x19\x7d\xd3\x18\x22\x3a\xa3\x38\
+\x9e\xcc\x38\xe2\x6f\xc8\xc0\x11\x7f\x03\x39\x8d\x31\xd5\x4e\xcb\
+\xd0\x16\x3c\x3d\xe2\x43\x7c\x4a\x1e\x6c\xf2\x76\xb8\x2e\x4f\x6c\
+\xaa\x9e\x36\x16\xcb\xf6\xbd\x36\x39\xe2\x28\x4b\xd1\x43\x92\x4f\
+\x59\x38\x4f\xc9\xa5\x4d\x9e\x10\x7a\x6d\xeb\x97\xad\x79\xa5\x32\
+\x4a\x45\x8e\x38\xd2\x61\x16\x3d\x45\xde\x21\x1b\x2c\x2b\xb3\xbc\
+\xd7\x7a\x49\xbb\xea\x4c\x9f\x0e\x87\x3c\x2f\x46\xeb\x96\x87\x9d\
+\xc7\x28\xa7\x62\x4a\x35\xb4\xcb\xa9\x3a\x33\x29\x3d\x2e\x7b\xfa\
+\x7a\xa5\x40\xad\x53\xbe\xdb\x5a\x73\xd4\x78\xab\xfc\xad\x53\x3e\
+\xd3\x2b\xa5\x3a\xe3\x39\xae\xff\x39\x70\x85\x92\xad\xb4\x46\x41\
+\xba\xfd\xbe\x26\x1f\xc6\x3f\x29\x39\x9c\xee\x19\xfc\x4c\x69\x8d\
+\x82\x84\x56\x76\x7a\xc2\x2e\xd5\x39\x6c\x23\x72\x8f\xbc\x11\x83\
+\x7a\x8d\x12\x65\x7d\x73\x8b\x1c\x57\xf1\x81\xa7\xc2\xbe\xda\x40\
+\x73\xb9\x8c\xf7\xe4\xfc\xae\xc5\x0d\xf6\xe0\xd2\x1b\xa5\x96\x65\
+\x52\xaa\xf9\xaa\x2c\xe0\x8e\xc8\xcf\x1b\x0d\xcb\x46\x99\x7f\xe5\
+\xcd\x1f\x94\x03\x38\xf7\xc8\x11\x1f\x77\x7b\x7c\x43\xa3\xac\x95\
+\x1e\x90\xe7\x05\x38\x59\xb2\x0d\xb0\x85\xd1\x59\x87\x51\xa2\x1d\
+\xbe\xac\x71\x6d\x1d\x3f\xc9\x94\x7a\x4a\x93\x48\x46\x31\x48\x32\
+\x8a\x41\x92\x51\x8c\x1a\x25\xef\xba\x29\xf9\x94\x26\x9e\xca\x5a\
+\x8f\x51\x6e\x68\x96\x60\x65\x66\x75\x32\x8a\x3d\x92\x51\x0c\x92\
+\x8c\x62\x90\x64\x14\xa3\x91\xeb\xbc\x8e\xde\xa5\xb5\xaf\x2f\x5a\
+\xe0\x32\xd0\x91\x8c\x62\x8f\x64\x14\x83\x5c\x57\x47\x40\xf2\xb9\
+\xa2\x85\x2d\x53\x4f\x39\x31\x83\x31\xdc\x2f\x68\x27\x9a\xc8\xaa\
+\x69\x8c\x92\x8c\x61\xc8\x28\xc9\x18\x86\x8c\x92\x8c\x61\x68\xf1\
+\x98\x1c\x78\x22\x91\x48\x24\x12\x89\x04\x45\xf3\x1f\x5c\xfb\xc3\
+\x13\x8e\x3e\x7c\xb7\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\xe8\xf7\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x40\x00\x00\x02\x2f\x08\x06\x00\x00\x00\x9c\x38\x64\xb9\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc2\x00\x00\x0e\xc2\x01\x15\x28\
+\x4a\x80\x00\x00\xe8\x8c\x49\x44\x41\x54\x78\x5e\xec\x9d\x05\x7c\
+\x14\xd7\xf6\xc7\x67\xdd\xb2\x71\x37\x42\x12\x82\x06\x87\xe0\xee\
+\x52\x4a\x69\x81\xba\xd0\x52\xea\xae\xff\xba\xbc\xba\xbf\x3a\x15\
+\x6a\xb4\xa5\x14\x29\xee\x4e\xd0\xe0\x09\xc4\xdd\x75\x5d\x66\xe6\
+\x7f\xce\xee\xa4\xa5\x3c\x24\x10\x5b\x39\xdf\xf7\x39\x6f\xee\x3d\
+\xb3\x49\xc3\xee\xce\x9d\xdf\x9c\x7b\xee\xb9\x22\x9e\xe7\x19\x82\
+\x20\x08\x82\x20\x08\x6f\x42\x2c\x1c\x09\x82\x20\x08\x82\x20\xbc\
+\x06\x12\x40\x04\x41\x10\x04\x41\x78\x1d\x24\x80\x08\x82\x20\x08\
+\x82\xf0\x3a\x48\x00\x11\x04\x41\x10\x04\xe1\x75\x90\x00\x22\x08\
+\x82\x20\x08\xc2\xeb\x20\x01\x44\x10\x04\x41\x10\x84\xd7\x41\x02\
+\x88\x20\x08\x82\x20\x08\xaf\x83\x04\x10\x41\x10\x04\x41\x10\x5e\
+\x07\x09\x20\x82\x20\x08\x82\x20\xbc\x0e\x12\x40\x04\x41\x10\x04\
+\x41\x78\x1d\x24\x80\x08\x82\x20\x08\x82\xf0\x3a\x48\x00\x11\x04\
+\x41\x10\x04\xe1\x75\x90\x00\x22\x08\x82\x20\x08\xc2\xeb\x20\x01\
+\x44\x10\x04\x41\x10\x84\xd7\x41\x02\x88\x20\x08\x82\x20\x08\xaf\
+\x83\x04\x10\x41\x10\x04\x41\x10\x5e\x07\x09\x20\x82\x20\x08\x82\
+\x20\xbc\x0e\x12\x40\x04\x41\x10\x04\x41\x78\x1d\x24\x80\x08\x82\
+\x20\x08\x82\xf0\x3a\x48\x00\x11\x04\x41\x10\x04\xe1\x75\x90\x00\
+\x22\x08\x82\x20\x08\xc2\xeb\x20\x01\x44\x10\x04\x41\x10\x84\xd7\
+\x41\x02\x88\x20\x08\x82\x20\x08\xaf\x83\x04\x10\x41\x10\x04\x41\
+\x10\x5e\x07\x09\x20\x82\x20\x08\x82\x20\xbc\x0e\x12\x40\x04\x41\
+\x10\x04\x41\x78\x1d\x24\x80\x08\x82\x20\x08\x82\xf0\x3a\x48\x00\
+\x11\x04\x41\x10\x04\xe1\x75\x90\x00\x22\x08\x82\x20\x08\xc2\xeb\
+\x20\x01\x44\x10\x04\x41\x10\x84\xd7\x41\x02\x88\x20\x08\x82\x20\
+\x08\xaf\x43\xc4\xf3\xbc\xd0\x24\x08\xc2\xc3\x10\x81\x49\xc0\xe4\
+\x70\x95\x2b\x18\x9e\x57\x71\x60\x70\xcd\x2b\xc0\x64\x60\x52\x30\
+\x09\x98\x18\x86\x01\x78\x18\x72\x1c\xe1\x67\xe0\xe8\xfc\x59\x68\
+\x3a\xfa\x8e\xf6\xdf\xbe\xb3\xc0\x93\x42\x0b\x5f\x89\x2f\xc4\x97\
+\xa1\x8f\x17\x89\x44\x60\x0c\x07\x47\x16\x4d\x2c\x12\xd9\xe0\x68\
+\x05\xb3\x80\x99\xd1\xe0\x75\x68\x36\x30\x3b\xfe\x0c\x18\x41\x10\
+\x44\x9b\x40\x02\x88\x20\xdc\x0b\x14\x21\x32\x30\x14\x31\x6a\xc1\
+\xb0\x2d\x05\x71\xf3\xaf\x88\xae\xc3\xc7\x71\x6a\x8b\xd5\x16\x68\
+\x34\x99\x42\xeb\x1a\x74\x51\x95\x35\x35\xd1\x35\x75\xf5\x21\x75\
+\xf5\x0d\x01\x7a\xa3\x51\x63\x34\x99\x55\x66\x8b\x55\x61\xb1\x5a\
+\xe5\x56\x9b\x4d\x66\xb7\xdb\xa5\x36\x9b\x4d\x6a\x67\x59\x09\x1a\
+\xc7\x72\x62\x96\x43\x63\x1d\xbf\x1b\x7e\xe7\xdf\x22\x08\x04\x0c\
+\x2f\x16\x89\x79\xb1\x58\xcc\x49\xc0\xa4\x52\x09\x2b\x91\x48\x58\
+\x29\x9a\x54\xca\xca\xa4\x52\xbb\x5c\x26\xb3\xa9\x94\x0a\xb3\x8f\
+\x46\x63\xf0\xf7\xd5\xd6\x07\xf8\xf9\xd6\x04\xfa\xfb\x55\x06\xf8\
+\xf9\x95\xf9\xf9\x6a\x4b\x35\x2a\x55\xb9\x42\x2e\xaf\x91\x48\xc4\
+\x06\xf8\x7d\x0e\x11\x24\xc2\x7f\x22\x8a\x29\x87\x80\x12\xd9\xc1\
+\x50\x30\x19\xc0\x6b\x82\xf3\x16\x30\x7c\x1d\x07\x46\x10\x04\x71\
+\xc5\x90\x00\x22\x08\xd7\x02\x05\x06\x46\x6d\x1a\x45\x8e\x1c\xfb\
+\x8d\x57\x29\xcf\xf1\x4a\x9b\xdd\x16\x56\xaf\xd3\x77\x2a\x2c\x29\
+\xed\x9d\x91\x95\xd3\xeb\x74\x4e\x5e\x62\x69\x65\x65\xb0\xc9\x6c\
+\x56\xa0\x60\x11\x5e\xca\x80\x20\xc2\xeb\xfb\x6f\xc1\xe2\xea\xa0\
+\xe0\xc1\xa3\x18\x85\x95\x44\xcc\xf9\xa8\xd5\xa6\xb0\xe0\xe0\xea\
+\xce\xf1\x71\x59\xdd\x92\x12\x0f\x47\x87\x87\x1d\xd5\x6a\x34\xb9\
+\x52\x99\xb4\x1a\x5e\x63\x84\xd7\xb3\x8e\x1f\x44\xd1\xe4\x14\x4f\
+\x56\xb0\xb3\x05\x12\x0d\x6e\x04\x41\x5c\x10\x12\x40\x04\xd1\x3e\
+\xa0\x30\x69\xb4\x46\x70\x5a\xca\xd7\x6a\xb3\x45\x57\xd7\xd6\xf5\
+\x3d\x9a\x7e\x7a\xec\xee\x03\x87\x87\xe4\x14\x16\x46\xb1\x20\x6c\
+\xdc\x49\xcc\xb4\x15\x18\x79\x52\xab\x55\xe6\xae\x09\xf1\x39\xc3\
+\x53\xfa\x6f\x49\xea\x18\xb7\x0d\x44\xd2\x29\x89\x44\x5c\x0e\xa2\
+\xc8\x08\x2f\x69\x14\x49\x8d\xe0\x80\xd7\x68\x04\x41\x78\x31\x24\
+\x80\x08\xa2\x6d\xc1\x6b\x2e\xa4\xb6\xbe\x7e\xc4\x8e\x7d\x87\x6e\
+\xdc\x7f\xf4\x78\x3f\xa3\xc9\xa4\x62\xd9\x7f\xa6\x98\x70\xca\xc9\
+\xe6\x98\x8a\x02\xb3\xdb\xa4\x28\x7e\x1a\xcf\xe1\x91\xf8\x87\xc6\
+\xa8\x11\x4e\xbf\xc9\xa5\x32\xbb\x5c\x2e\xb3\xe1\x14\x1c\xfa\x1b\
+\xcf\x49\x24\x12\x4e\xa9\x50\x58\x62\x22\xc3\x4b\xfa\x25\x77\x4f\
+\xed\x92\x10\xbf\xc9\xd7\x47\x93\x26\x16\x8b\xcb\xe1\x34\x46\x8d\
+\x08\x82\xf0\x42\x48\x00\x11\x44\xeb\xa2\x31\x18\x8d\x29\xc7\xd2\
+\xcf\x5c\x73\xfc\xf4\x99\xbe\x35\x75\xf5\xfe\x20\x6c\x64\x7a\xa3\
+\x51\x5d\x5d\x57\xe7\x67\x30\x18\x31\x31\xd9\x21\x6c\x48\xe0\xb4\
+\x3c\x8d\x22\x08\xa7\xd5\x64\x32\x99\x5d\xa3\x56\x99\xfc\xb4\x5a\
+\xbd\x4a\xa9\x34\xcb\xa4\x12\xcc\x2f\xe2\x31\x6f\x09\xfc\xc6\xa8\
+\xb0\xb0\xe2\xce\x09\x1d\x0f\xc7\x45\x47\xee\x04\xc1\x74\x0a\xce\
+\x55\xc3\x8f\x9e\x1b\x41\x22\x08\xc2\x43\x20\x01\x44\x10\x2d\x83\
+\x94\x65\xd9\x8e\xa5\x95\x55\x63\x8e\x67\x9c\x19\x55\x51\x55\x1d\
+\x0e\x7d\x09\xcb\x72\x92\x9a\xfa\x7a\xff\xe2\xf2\x8a\xb0\xda\xba\
+\x7a\x9c\xde\xc2\x95\x57\x24\x74\x5c\x04\x14\x40\x8d\x39\x47\x1a\
+\x95\xca\x1c\xe0\xe7\xd7\x10\x14\xe0\x5f\xab\xf5\xd1\xe8\xe5\x52\
+\xa9\x4d\x2e\x97\x59\xc1\x57\xdd\x25\xa1\xe3\x89\x98\xc8\x88\x1d\
+\x0a\xb9\x3c\x0d\x7e\xac\xde\xf9\xd3\x04\x41\xb8\x33\x24\x80\x08\
+\xe2\xf2\x41\x01\xa3\x31\x98\x4c\xfd\x33\x73\xf2\x26\x95\x55\x56\
+\xc5\x5a\xac\x56\x65\x83\x5e\xef\x57\x58\x52\x16\x95\x57\x54\x1c\
+\xa5\xd3\x1b\xd4\x14\xd9\x71\x6f\x9c\xd1\x21\x31\xa7\x06\x61\x14\
+\x1a\x14\x54\x83\x53\x68\x21\x81\x81\x95\x0a\xb9\xcc\xa2\x51\xab\
+\x74\x5d\x13\xe2\xd3\x42\x82\x83\x76\x4a\x25\x92\xd3\xf0\x72\xcc\
+\x37\x22\x08\xc2\x8d\x20\x01\x44\x10\x4d\x00\xae\x93\x20\x9d\xc1\
+\x90\x92\x5b\x58\x3c\x4c\xa7\xd7\x07\x5a\x6d\x36\x45\x71\x59\x79\
+\x6c\xda\xc9\x8c\x1e\x95\xd5\x35\x01\x14\xd9\xf1\x0e\x1a\xa7\xd4\
+\x30\x5a\x94\xd0\x21\xa6\xb0\x53\xc7\xb8\xac\x90\xc0\x80\x72\x85\
+\x42\x6e\xf2\xf7\xf3\xad\x8d\x8d\x88\x48\xf3\xd1\xa8\x37\xc1\x4b\
+\x28\x4a\x44\x10\x2e\x0e\x09\x20\x82\xb8\x00\x2c\xcb\x26\x56\xd6\
+\xd4\x0e\xab\xad\x6f\x88\xa9\xd7\xe9\x42\x4e\x67\xe7\x26\xef\x3d\
+\x7c\xa4\x2f\xf4\xb5\x24\x76\x88\xb3\xc1\xd5\x68\x81\xfe\x7e\x0d\
+\xbd\xba\x75\x49\xef\xd3\xbd\xeb\x3e\x95\x52\xa9\x53\xab\x94\xba\
+\xc8\xb0\xd0\xc3\x0a\xb9\xe2\xb8\x48\xc4\x54\xc1\xcb\xa8\x76\x11\
+\x41\xb8\x10\x24\x80\x08\xe2\x1f\xfc\x8c\x26\x73\xcf\xea\xda\xda\
+\x64\x8e\xe7\x25\xc5\x65\xe5\x5d\xb6\xee\xd9\x37\xee\x74\x4e\x5e\
+\x9c\xd9\x62\xc1\x7a\x3c\x04\xd1\x64\x82\x02\xfc\xeb\x47\xa4\x0c\
+\x48\xed\xde\x29\xe1\x90\xaf\xd6\xa7\x42\x2e\x93\x59\xb4\x1a\x4d\
+\x8d\x46\xad\x4a\x17\x8b\xc5\x38\x6d\x46\x2b\xd0\x08\xa2\x1d\x21\
+\x01\x44\x78\x33\x32\x8e\xe3\x22\x4d\x66\x4b\x3c\x08\x9c\x60\x9d\
+\xc1\x10\xb1\xef\xc8\xb1\x49\x2b\x37\x6e\x19\x6f\xb7\xb3\xb8\x45\
+\x04\x45\x79\x88\x16\x01\xa7\xce\x94\x0a\x85\x35\x3e\x36\xa6\x68\
+\xc4\xc0\x7e\x3b\xba\x76\x4a\xd8\x01\x82\xc8\xa4\x51\xa9\xaa\xe5\
+\x72\xd9\x69\x38\x4f\x4b\xf2\x09\xa2\x8d\x21\x01\x44\x78\x13\x28\
+\x6a\x82\xcd\x16\x6b\x02\xc7\x73\x72\x9b\xcd\xae\xcd\x2f\x2e\x19\
+\xbc\x65\x77\xea\x94\xc3\x27\x4e\x75\xb3\x58\xad\x58\x7d\x99\x20\
+\x5a\x9d\xc6\xd5\x67\x3d\xbb\x76\x3e\x33\x7d\xdc\xe8\x25\xd1\x11\
+\xe1\x87\x54\x4a\x45\x8d\x4c\x2a\xad\x16\x8b\xc5\x05\xf0\x12\xbd\
+\xf3\x95\x04\x41\xb4\x16\x24\x80\x08\x4f\x07\x93\x93\xfd\x59\x96\
+\x0b\xb2\xb3\xf6\x80\x82\x92\xd2\x51\x0b\x17\xff\xf1\x60\x71\x79\
+\x79\x08\x45\x79\x08\x57\x01\x05\x91\xbf\xaf\x56\x3f\x7e\xf8\xd0\
+\xed\xa3\x07\x0f\xfc\xc1\xcf\x57\x7b\x0a\x04\x92\x1d\xc4\x10\xe6\
+\x0e\x61\x42\x35\x6e\xef\x41\x10\x44\x0b\x42\x02\x88\xf0\x44\x50\
+\xd4\x60\xa2\xb2\xc2\x66\xb7\x47\x64\xe6\xe6\x5f\xb3\xe8\x8f\xe5\
+\xf3\xf3\x8a\x8a\x23\x9c\xa7\x09\xc2\xb5\x91\xc9\xa4\xf6\xe8\xf0\
+\xf0\x8a\xdb\x67\xcf\xfc\x3c\xb1\x43\xec\x0a\x89\x44\x52\x09\x22\
+\x09\x97\xda\xa3\x91\x18\x22\x88\x16\x80\x04\x10\xe1\x69\xe0\x77\
+\x3a\x68\x7b\xea\x81\xb7\xfe\x5c\xbf\x69\x46\x79\x65\x55\x20\x45\
+\x79\x08\x77\x47\xa5\x54\x5a\x6e\x9a\x39\x7d\xc9\x88\x94\xfe\x9f\
+\x2a\xe4\xf2\x7d\x82\x9b\x06\x6f\x82\x68\x06\x24\x80\x08\x8f\x00\
+\xbe\xc7\x81\x79\x45\xc5\xb7\x7e\xfb\xdb\x9f\x0f\xd5\xeb\xf5\x3e\
+\x3a\x9d\x5e\x83\x2b\xb7\xdc\x6d\x47\x74\x82\x38\x1f\x38\x45\xa6\
+\x06\x11\xa4\x56\x29\xcd\x81\xfe\xfe\xf5\x43\xfa\xf7\xd9\x3b\x76\
+\xc8\xa0\xf7\xe5\x72\xd9\x01\xe1\x25\x04\x41\x5c\x26\x24\x80\x08\
+\xb7\x05\xbe\xbb\x21\x25\xe5\x95\x57\xff\xb5\x79\xeb\x1d\x35\xb5\
+\x75\x01\x55\x60\xa5\xe5\x15\xc1\x24\x7a\x08\x4f\x06\x6b\x0e\x69\
+\x7d\x34\xc6\xf0\x90\x90\x2a\x5f\x1f\x8d\x3e\x38\x30\xa0\x7a\xd6\
+\x94\x09\xef\x69\x35\x9a\x1d\x70\x9a\x0a\x30\x12\x44\x13\x21\x01\
+\x44\xb8\x1b\x22\xbd\xd1\x38\xe6\xc8\xc9\xf4\xeb\xd2\x33\x73\x92\
+\x8b\xca\xca\x23\x72\x0a\x0a\xa3\xa9\x12\x33\xe1\x6d\x60\x54\x08\
+\x8f\xb8\xbc\xbe\x4b\x42\xc7\xdc\x90\xc0\xc0\xea\x88\xb0\x90\xe2\
+\xe1\x03\xfa\x2d\xf7\xd5\xfa\xac\x86\x53\x0d\x78\x9e\x20\x88\xf3\
+\x43\x02\x88\x70\x07\xc4\xf0\x3d\x0d\x38\x9e\x71\xe6\xd1\x92\xf2\
+\x8a\x8e\xb9\x45\xc5\xf1\xa7\xce\x64\x75\xaa\xa8\xae\x09\x20\xd1\
+\x43\x10\x4e\x50\x10\x61\x64\xa8\x5b\x62\x42\x76\xc7\xd8\xe8\xdc\
+\xe0\x80\x80\xba\xce\xf1\x71\x39\x41\x01\x01\xc7\x45\x62\x51\xa5\
+\xdd\x6e\xd7\x49\xa5\xd2\x4a\xb1\x73\x97\x7b\x8b\xf3\xa7\x08\xc2\
+\x7b\x21\x01\x44\xb8\x32\x3e\x46\x93\xb9\xef\xc9\x33\x99\x33\xeb\
+\x75\xfa\xc0\x75\xdb\x77\x4d\x28\xad\xa8\x08\xb6\xd9\xec\x52\xe1\
+\x3c\x41\x10\xe7\x01\xc5\x10\x46\x86\x22\xc3\x42\x2b\x3b\x44\x47\
+\x16\x85\x05\x05\xe9\x38\x9e\x33\xfb\xa8\xd5\x3a\x95\x52\x69\x50\
+\x2a\xe4\xc6\xf8\xd8\x98\x53\x41\x01\xfe\x1b\xe0\xb5\x79\xc2\x8f\
+\x11\x84\x57\x41\x02\x88\x70\x39\x38\x9e\x8f\xac\xab\xaf\x1f\x92\
+\x5f\x5c\x3a\x20\x33\x37\xbf\xc7\xaa\xcd\xdb\xc6\xd1\x56\x14\x04\
+\xd1\x72\x28\xe4\x72\x5b\xb7\x4e\x09\xd9\x43\xfa\xf7\xd9\x15\x17\
+\x1d\x95\x11\x15\x1e\xb6\x5b\x2a\x91\x60\x42\x35\xeb\x7c\x05\x41\
+\x78\x3e\x24\x80\x08\x97\x81\x65\xd9\x84\xda\x86\x86\xfe\x85\x25\
+\x65\x7d\x77\x1d\x38\x34\x76\xcf\xc1\xb4\x3e\x2c\xc7\x89\x85\xd3\
+\x04\x41\xb4\x30\x18\x29\xc2\x4d\x5c\xa7\x8c\x1e\xb1\xa9\x57\xd7\
+\x2e\xdb\x43\x83\x03\x4f\x2b\x15\x8a\x43\x70\xaa\x06\x8c\x6e\x0e\
+\x84\x47\x43\x02\x88\x68\x6f\xe4\x76\x3b\xdb\x51\x67\x30\x74\xcb\
+\xce\x2f\x18\xb6\x7c\xfd\xe6\x6b\x33\xf3\xf2\x63\x28\xb7\x87\x20\
+\xda\x0e\x14\x42\xb8\x35\xc7\x98\x21\x83\x52\xc7\x0c\x4d\x59\x16\
+\x16\x1c\x7c\x5a\xa3\x56\xe1\x1e\x65\x39\x70\x9a\x0a\x2f\x12\x1e\
+\x09\x09\x20\xa2\xbd\x50\xb2\x2c\x1b\xa9\x37\x1a\xbb\x1d\xcf\x38\
+\x33\xed\x9b\x5f\x97\xde\x6a\x34\x9b\x15\x24\x7c\x08\xa2\xfd\x89\
+\x8e\x08\xaf\xb8\x76\xca\x84\x3f\x7a\x75\xed\xb2\x42\xa5\x54\x94\
+\x88\xc5\xe2\x6c\x70\x9b\x9c\x67\x09\xc2\x33\x20\x01\x44\xb4\x35\
+\x0a\x8e\xe3\x83\x0c\x46\x63\xf2\xa1\x13\x27\xaf\xfb\xea\x97\xdf\
+\x6f\xc3\x3d\xb9\x84\x73\x04\x41\xb8\x10\x3e\x6a\xb5\x69\xe4\xa0\
+\x01\xfb\xae\x99\x3c\xfe\x5d\x68\x67\x8a\x44\xa2\x22\x70\xa3\x10\
+\xa2\x1b\x07\xe1\xf6\x90\x00\x22\xda\x0a\x09\x7c\xd5\x7c\xcc\x16\
+\x73\xf2\xd6\xbd\xfb\xef\xff\x79\xf9\x5f\xb3\x68\x35\x17\x41\xb8\
+\x07\x52\xa9\x84\x8d\x08\x0d\xad\x7a\xe9\xe1\xfb\xee\xf2\xd1\xa8\
+\x0f\x83\x10\xc2\x4d\x5a\xad\x60\x74\x03\x21\xdc\x16\x12\x40\x44\
+\x9b\x00\x62\x27\x79\xf1\xca\xd5\x1f\x6d\xdc\xb9\x67\x18\x16\x2d\
+\x44\x1f\x4d\x77\x11\x84\x7b\x80\x39\x42\x42\x93\x89\x08\x0d\xa9\
+\x7e\xf1\xe1\xfb\x1e\x08\xf0\xf3\xc5\x62\x8b\x3a\xa7\x97\x20\xdc\
+\x0f\x12\x40\x44\x6b\x22\xb7\x58\xad\x3d\xfe\xfb\xfd\xcf\xdf\x17\
+\x95\x95\x87\x57\xd7\xd6\xf9\x41\x5f\x46\xc2\x87\x20\xdc\x17\xdc\
+\x8a\xc3\xdf\xcf\x57\x97\x10\x1b\x53\x78\xf3\x35\x57\x7d\x16\x16\
+\x12\xfc\x3d\xb8\x29\x3f\x88\x70\x3b\x48\x00\x11\xad\x81\x4a\x67\
+\x30\x0c\xff\x6d\xe5\xda\x17\x8a\xcb\x2b\xc2\xb3\xf2\xf2\x63\x69\
+\xab\x0a\x82\xf0\x2c\xb0\x96\x10\x88\x9f\xea\xc4\xb8\xd8\xbc\x71\
+\xc3\x06\x6f\x4a\xec\x10\xfb\x36\xb8\x29\x22\x44\xb8\x0d\x24\x80\
+\x88\x16\xa5\x41\x6f\x98\x94\x7a\xf8\xc8\x4d\xc7\xd2\x4f\xf7\x3a\
+\x9a\x7e\xba\x33\x46\x7c\x84\x53\x04\x41\x78\x20\x28\x84\x22\x42\
+\x43\xaa\xfa\x74\xef\x7a\x7c\x48\xbf\x3e\x07\x3a\x44\x47\xbe\x06\
+\x6e\xb3\xf3\x2c\x41\xb8\x2e\x24\x80\x88\x16\xc1\x64\xb6\x0c\x39\
+\x93\x9b\x37\x6d\xf7\xc1\xc3\x63\x8f\x9e\xca\xe8\x5a\x5b\xdf\xa0\
+\x15\x4e\x11\x04\xe1\x05\xc8\x64\x52\x7b\x4c\x44\x44\xf9\xf0\x81\
+\xfd\xf6\x0e\x1b\xd0\x77\xbd\x9f\x56\xbb\x0a\xdc\x65\xce\xb3\x04\
+\xe1\x7a\x90\x00\x22\x9a\x83\x88\xe5\xb8\xd8\xd3\xd9\xb9\xb7\x1e\
+\xcb\x38\x3d\xf8\xc0\xd1\x13\x7d\x8a\x4a\xcb\x42\x69\xaa\x8b\x20\
+\xbc\x93\xc6\x64\xe9\x01\x3d\x7b\x9c\xec\xdf\xab\xc7\xe1\x41\x7d\
+\x7a\xad\x50\x2a\x14\x3b\xc1\x55\x89\x7e\x82\x70\x25\x48\x00\x11\
+\x57\x82\x98\xe3\xf9\xb0\xdc\x82\xc2\x1b\x4b\x2b\x2a\x13\x7f\x5f\
+\xbd\xfe\xda\xf2\xca\xaa\x40\x12\x3e\x04\x41\x34\x82\xc9\xd2\xa3\
+\x87\xa4\xec\x1b\x36\xa0\xef\x8e\xa4\x8e\x71\x9b\xa5\x52\xe9\x56\
+\x70\x53\x55\x69\xc2\x65\x20\x01\x44\x5c\x16\x20\x7c\xa2\xea\x1b\
+\x74\x03\x0b\x4a\x4a\x07\x7c\xfe\xe3\xe2\xfb\x70\xaa\x8b\x84\x0f\
+\x41\x10\x17\x42\xeb\xa3\x31\x8e\x1e\x34\x70\xef\xa4\x51\xc3\x7f\
+\x09\x0a\xf0\x3f\x26\x12\x89\x0e\x0a\xa7\x08\xa2\x5d\x21\x01\x44\
+\x34\x15\xa5\xd5\x66\xeb\x92\x95\x57\x70\xd5\x5f\x9b\xb6\xce\x39\
+\x7c\xe2\x54\x57\x12\x3e\x04\x41\x34\x95\xc8\xb0\xd0\xaa\x09\x23\
+\x86\x6e\x1e\x35\x68\xe0\xcf\x6a\x95\x72\x2f\xb8\x70\xc3\x55\xce\
+\x71\x92\x20\xda\x01\x12\x40\xc4\x25\x81\xef\x48\x88\xc1\x68\xea\
+\xbd\x65\x4f\xea\x82\xc5\x2b\x56\x5f\x4d\x3b\xb4\x13\x04\x71\x25\
+\x60\x8e\x90\x9f\xd6\xc7\xf0\xfc\x43\xf7\x3e\x13\x11\x12\x72\x44\
+\x2a\x95\x9c\x00\x77\x9d\xf3\x2c\x41\xb4\x2d\x24\x80\x88\x8b\x02\
+\xdf\x0f\xff\xc2\x92\xd2\x9b\x7e\x5f\xb5\xee\xee\xfd\x47\x8f\xf7\
+\x10\xdc\x04\x41\x10\xcd\x22\x36\x2a\xb2\xec\xe9\x7b\xee\x7c\x26\
+\x38\x30\x60\x0b\x74\x71\x6b\x0d\xa3\xe3\x04\x41\xb4\x11\x24\x80\
+\x88\x8b\x21\xcd\xce\x2f\x7c\xe8\x87\xa5\x2b\xee\x4b\xcf\xca\xee\
+\x28\xf8\x08\x82\x20\x5a\x04\x8c\x08\x5d\x3d\x71\xdc\x86\x19\x13\
+\xc6\x7c\xae\x56\x2a\x37\x81\x0b\x45\x10\xdd\x94\x88\x36\x81\x04\
+\x10\x71\x21\x24\x66\xb3\x65\xe0\x9b\x9f\x2f\xfc\x09\xc5\x0f\x7c\
+\x4f\x28\xdf\x87\x20\x88\x16\xa5\x71\xd9\x3c\x88\x1f\xcb\x9d\xd7\
+\x5f\xfb\xdb\xd0\xfe\x7d\x9f\x82\x6e\x39\xfa\x08\xa2\xb5\x21\x01\
+\x44\x9c\x0f\x09\xc7\x71\x51\x2f\x7f\xf8\xd9\xb6\xac\xfc\xfc\x18\
+\xda\xb5\x9d\x20\x88\xd6\x04\x85\x90\x46\xa5\x32\xf7\x4d\xee\x76\
+\xf2\xa6\xab\xa7\x2f\xf4\xf7\xf3\xfd\x52\x38\x45\x10\xad\x06\x09\
+\x20\xe2\x5c\xa4\x56\xab\x2d\xf9\xe3\xef\x7e\xfc\xe1\xf0\xc9\x53\
+\x5d\x59\x96\x13\x53\xf4\x87\x20\x88\xb6\x40\xa9\x50\x58\xa3\x23\
+\xc2\xcb\x87\xf6\xef\x73\x6c\xea\x98\x91\x37\x81\xab\x1e\x8c\x6e\
+\x52\x44\xab\x40\x02\x88\xf8\x1b\x8c\xfa\x94\x94\x57\x4c\x5f\xbe\
+\x61\xf3\xbc\xdd\x07\x0e\xf7\xe5\x40\xf8\x90\xf8\x21\x08\xa2\x2d\
+\xc1\x02\x8a\x6a\xb5\xca\x3c\x7c\x40\xbf\x03\xb3\xa7\x4f\xfe\x48\
+\xad\x54\x62\x01\x45\x5a\x29\x46\xb4\x38\x24\x80\x08\x07\x3a\x83\
+\x61\x42\xea\xe1\xa3\x37\x1f\x3a\x7e\xb2\x1f\xd6\xf8\x11\xdc\x04\
+\x41\x10\x6d\x4e\x63\x6e\xd0\xb0\x01\x7d\x0f\x8f\x48\x19\x90\xda\
+\xb3\x4b\xd2\xb7\xe0\x3b\xec\x38\x49\x10\x2d\x04\x09\x20\x2f\x07\
+\x3e\xff\xc0\xb2\xca\xaa\x19\x1b\x76\xec\xbe\x65\xe7\x81\x43\x03\
+\x1a\x74\x7a\x8d\x70\x8a\x20\x08\xa2\xdd\x09\x0d\x0a\xac\x9d\x30\
+\x62\xd8\x8e\x49\xa3\x86\x7d\x2d\x97\xc9\x36\x80\xcb\xe6\x3c\x43\
+\x10\xcd\x83\x04\x90\x17\x53\xaf\xd3\x4d\x2b\x28\x2e\x4d\x59\xbb\
+\x6d\xe7\xcc\x43\xc7\x4f\x76\xa3\xe9\x2e\x82\x20\x5c\x11\xa9\x54\
+\xc2\x4e\x1c\x31\x6c\xe7\x55\xe3\xc7\xfc\x10\xe0\xe7\x8b\x75\x83\
+\xf2\x9d\x67\x08\xe2\xca\x21\x01\xe4\x7d\xc0\x67\xce\xf8\x96\x57\
+\x55\x5d\xbd\x6a\xd3\xb6\xbb\x52\x8f\x1c\xed\x4d\x51\x1f\x82\x20\
+\xdc\x81\xde\xdd\xba\x9c\xbe\x7a\xe2\xb8\x3f\xbb\x24\x74\xdc\x28\
+\x16\x8b\x31\x37\x88\x20\xae\x18\x12\x40\xde\x85\xda\x6a\xb3\x75\
+\x2a\xab\xac\x1a\xf6\xda\xc7\x9f\xbf\x59\x0f\xc2\x87\xa2\x3e\x04\
+\x41\xb8\x13\xfe\xbe\x5a\xfd\xd0\x01\xfd\x0e\x5d\x3f\x7d\xca\x5b\
+\x72\xb9\x0c\x45\x90\xd9\x79\x86\x20\x2e\x0f\x12\x40\x5e\x02\x7c\
+\xce\x41\x20\x78\x86\xec\x3d\x7c\xe4\x86\xef\x7e\xff\x73\xae\xe0\
+\x26\x08\x82\x70\x3b\x70\xa5\x58\x50\x80\x7f\xfd\x9b\x4f\x3f\x76\
+\xbb\x8f\x46\x7d\x08\x5c\x58\x3c\x91\x72\x83\x88\xcb\x82\x04\x90\
+\xe7\x23\x81\xcf\x38\xb0\xa0\xa4\x74\xee\x27\xdf\xff\xfc\x6c\x41\
+\x71\x49\xb8\xe0\x27\x08\x82\x70\x5b\x1a\x57\x8a\xbd\xf0\xd0\xbd\
+\x6f\x76\x4d\x8c\x5f\x26\x16\x8b\xd3\xa1\xab\x47\x1f\x41\x34\x05\
+\x12\x40\x9e\x8d\x9c\xe5\xb8\xc8\xd4\xc3\x47\x9f\xfc\xef\xf7\x3f\
+\xdd\x4d\xbb\xb8\x13\x04\xe1\x89\x24\xc6\x75\x28\x7c\xf6\xfe\xf9\
+\xcf\xfb\xa8\xd5\x4b\xa0\x6b\x02\xa3\x1b\x1b\x71\x49\x48\x00\x79\
+\x30\x45\x65\xe5\x77\x2f\x59\xb5\xee\x9e\x03\xc7\x8e\xf7\xa0\x8a\
+\xce\x04\x41\x78\x2a\x18\x0d\xc2\x2a\xd2\xcf\x3d\xb0\xe0\xa3\x4e\
+\x1d\x3b\xbc\x09\xae\x5a\xe7\x19\x82\xb8\x30\x24\x80\x3c\x13\xd1\
+\x8a\x0d\x9b\x97\x6e\x4b\x3d\x30\xac\xaa\xa6\xd6\xdf\x62\xb5\xca\
+\x04\x3f\x41\x10\x84\x47\x82\x22\x08\x13\xa4\xaf\x9b\x3a\x71\xdd\
+\x98\x21\x83\xde\x15\x8b\xc5\xfb\x85\x53\x04\x71\x5e\x48\x00\x79\
+\x16\x12\x96\xe5\x62\x17\xfd\xb1\x6c\x51\x6a\xda\xd1\x3e\x3a\xbd\
+\x41\x4d\xd3\x5e\x04\x41\x78\x0b\x8d\x22\xa8\x5f\x72\xf7\x13\x73\
+\xa6\x4d\xfe\xdd\xcf\x57\xfb\xa1\x70\x8a\x20\xfe\x07\x12\x40\x1e\
+\x02\x7c\x8e\xa1\x65\x95\x55\xd3\x56\x6f\xde\x7e\xc7\xf6\x7d\x07\
+\x06\x5a\x6d\x36\x29\x4d\x79\x11\x04\xe1\x8d\xa8\x94\x4a\x4b\x62\
+\x87\xd8\xc2\xeb\xa6\x4d\xdc\xda\x25\x21\xfe\x21\x70\x61\x5e\x10\
+\x41\xfc\x0b\x12\x40\x1e\x80\xc5\x6a\x1d\x90\x9a\x76\x74\xfe\x81\
+\x23\xc7\x07\xed\x3f\x7a\xbc\x87\xe0\x26\x08\x82\xf0\x5a\x70\xa9\
+\x7c\xa0\xbf\x5f\xc3\xcd\xb3\x66\xac\x1e\xd4\xa7\xd7\xf3\xe0\xc2\
+\xea\xd1\x9c\xe3\x24\x41\x00\x24\x80\xdc\x1b\x91\xce\x60\x18\xbf\
+\x69\xd7\xde\x7b\xd7\x6f\xdf\x35\xba\xa6\xae\xde\x57\xf0\x13\x04\
+\x41\x78\x3d\x38\x25\x26\x91\x88\xb9\xbb\x6f\x98\xf3\xeb\x88\x94\
+\xfe\x1f\x41\xff\x28\xb8\xad\xce\xb3\x84\xb7\x43\x02\xc8\x7d\x91\
+\xd7\x35\xe8\x26\xad\xd9\xb2\xfd\xfe\x55\x5b\xb6\x8d\xb1\xdb\x59\
+\x89\xe0\x27\x08\xb7\x20\x3c\x24\x98\x81\x27\x74\xc6\x6c\xb1\x32\
+\x4a\x85\x9c\x39\x95\x99\x2d\x9c\x21\x88\x96\x05\x85\xd0\x2d\xb3\
+\x66\x2c\x99\x34\x72\xd8\x67\x12\x89\x64\x1f\xb8\xa8\x7a\x34\x41\
+\x02\xc8\x1d\x81\xcf\x2c\xa0\xa6\xae\x7e\xdc\x9f\x6b\x37\x3e\xbc\
+\x69\xf7\xde\xc1\xd0\xa7\x5c\x1f\xc2\x25\xe8\xdf\xb3\x07\x33\xb8\
+\x6f\x6f\x66\xf7\xc1\xc3\x4c\x58\x70\x90\x43\xe0\xfc\xbc\x7c\x95\
+\x70\xf6\xdf\x7c\xf4\xd2\xb3\x4c\x44\x68\x88\xd0\x63\x98\x2f\x7f\
+\xfe\x8d\xd9\xbc\x3b\x55\xe8\xfd\xc3\xa8\x41\x03\x99\x91\x83\x06\
+\x30\x55\xb5\xb5\xdc\xf7\x4b\x96\x89\x0c\x46\x13\x7d\xdf\x89\xcb\
+\x06\x45\xd0\x4d\x33\xa7\xff\x39\x69\xe4\xf0\xaf\x65\x32\xe9\x5e\
+\x70\x35\x38\xcf\x10\xde\x0a\x09\x20\xf7\x42\xc4\x72\x5c\x6c\x59\
+\x45\xd5\x84\x1f\x96\x2e\x7f\xf4\xc8\xa9\x8c\xce\x24\x7e\x88\xd6\
+\x00\x45\x4c\x4a\x9f\x9e\xcc\x90\x7e\x7d\xf8\xb4\x93\xe9\x36\x1f\
+\xb5\xda\x60\x67\x59\xcb\xe1\x13\xa7\x14\xb5\x75\xf5\xbe\x22\xb1\
+\x48\xbc\x3d\xf5\xc0\xdf\xdf\xbd\x20\x7f\x7f\x66\xc1\x4d\x73\xf8\
+\x5e\xdd\xba\x60\xb2\x69\x09\x58\xd5\xaa\xcd\xdb\x94\x5b\xf7\xee\
+\x8f\xc0\x52\x0c\xd1\x11\x61\x70\xcf\x91\x89\xf4\x46\x23\xaf\xd3\
+\xeb\x39\xb3\xc5\xca\x62\x8e\x86\x5c\x2e\x13\x75\x49\x88\x97\x5c\
+\x35\x7e\xb4\xf4\xc0\xb1\x13\xa2\xa5\x6b\x36\x38\x7e\x5f\x23\x78\
+\xd3\xfa\xe6\xed\xd7\x58\x1f\x8d\xfa\x00\x74\x2b\x0d\x26\x93\x68\
+\xc5\xfa\xcd\x31\x39\x85\x85\xf1\x9d\xe2\xe2\x7c\x4b\x2a\x2a\x98\
+\xf4\xcc\x6c\xa6\xae\x41\xe7\xfc\x01\x82\xb8\x08\xf8\x7d\x9a\x31\
+\x7e\xcc\xa6\xab\x27\x8d\xfb\x5a\xad\x54\xee\x00\x17\x6e\xa1\x41\
+\x78\x29\x24\x80\xdc\x07\x99\xdd\x6e\x4f\x38\x99\x99\x7d\xcb\x77\
+\xbf\xff\x79\x57\x49\x79\x45\xb0\xe0\x27\x88\x16\xe7\xb1\xf9\xb7\
+\xb3\x29\xbd\x7b\x16\x42\xb3\x0a\xac\x1a\xac\x58\x38\x06\x80\x25\
+\x1d\x3a\x7e\x2a\xf0\xf3\x9f\x16\x77\x34\x18\x8c\x2a\x0e\x44\xb8\
+\xd6\x47\x63\x7c\x64\xde\xad\x65\xdd\x93\x12\x8f\xc1\xf9\xcd\x60\
+\x87\xad\x36\x5b\x48\x6e\x41\xd1\x88\xd0\xe0\xa0\xae\x01\x7e\xbe\
+\x98\x9f\x86\x25\x19\x58\x30\xab\xcd\x6e\x37\x57\xd7\xd4\xda\xca\
+\xaa\xaa\xa5\xf9\x45\xc5\x9a\xec\xfc\xc2\xa0\xc2\xd2\x32\x87\x58\
+\x6a\xac\x5b\x85\x37\xab\xa1\xfd\xfb\x9a\x1f\xbc\xfd\x26\xac\xe7\
+\xf2\x14\xd8\x11\x74\x83\x8d\x2f\x28\x29\x9d\x73\x3a\x3b\xb7\x6b\
+\x9f\xee\x5d\x03\x83\x03\x03\x02\xcf\xe4\xe4\xaa\xce\xe4\xe6\x4b\
+\x41\xa0\x31\x27\x4e\x67\x3a\x84\x19\xfc\x1b\xf8\xf8\xd8\x68\x56\
+\xa7\x37\xe8\x8d\x66\xb3\xae\xae\x5e\x27\x5f\xbd\x65\x9b\x6f\x5e\
+\x61\xb1\x02\xff\xe6\x19\x13\xc6\x88\xe4\x32\x19\x6f\xb6\x58\x98\
+\x63\xe9\x67\x98\xbc\xa2\x62\x7a\x98\xf0\x12\x06\xf5\xe9\x75\xec\
+\xd6\x6b\xaf\x5e\x18\x14\xe0\xbf\x0c\xba\x45\x4e\x2f\xe1\x6d\x90\
+\x00\x72\x0f\x14\x70\x53\xe8\xbe\x6e\xdb\xce\xe7\xfe\x58\xb3\x61\
+\x1a\x15\x36\x24\xce\xa6\x43\x74\x24\x53\x55\x53\xc7\x18\x8c\x46\
+\xc1\xd3\x34\x7c\x34\x6a\x30\x0d\xef\xa3\x56\xe3\x0e\xdb\x7c\x58\
+\x48\xb0\x2d\x2a\x2c\xc4\x10\x1a\x14\xdc\x90\x18\x17\x5b\xaf\x56\
+\x29\xb1\x86\xca\x6a\xb0\x4a\xc7\x0f\xfc\x83\xc4\xce\xb2\x7d\x76\
+\x1f\x38\xfc\x62\x69\x45\x65\xb7\x90\xa0\x40\x29\x88\xa5\x53\xf0\
+\xfb\x16\xc1\xb9\xdf\xc0\xce\x37\xa8\xa0\xb8\xb8\xd0\x60\xa3\x80\
+\x71\x28\x19\xc4\xcf\x0d\xa7\x32\xb3\x47\x83\xb8\x09\xaf\xae\xab\
+\x53\x06\xfa\xf9\x99\x67\x4e\x1c\x77\x0a\xc4\xd5\x4c\x78\xcd\xb9\
+\xd3\x15\x98\xf3\x16\x09\xff\xe6\xb1\xf0\x37\x4c\x94\x48\x24\x09\
+\x70\x33\x0b\xb2\x5a\x6d\xfe\xef\x7d\xfd\x9d\xca\x21\x9e\xfa\xf5\
+\x35\x4c\x1a\x35\xac\x18\xce\xa5\xc1\x6b\x51\x3c\x85\x64\x64\xe7\
+\x0c\xf9\xee\xf7\x65\x5d\x8c\x66\x53\xe0\x27\x2f\x3f\x87\xbf\xc3\
+\x0e\xe6\x48\x8a\xfd\x65\xc5\x5f\x9a\x15\x1b\xb6\xe2\xde\x79\x24\
+\x84\xbc\x80\xb8\xe8\xa8\xd2\xf9\x37\xcc\xfe\x15\xbe\xeb\x6f\x40\
+\x17\x85\x3e\xdd\x0c\xbd\x0c\x12\x40\xae\x8f\xd4\x68\x32\x0d\x5d\
+\xf8\xeb\xd2\xf7\x77\x1d\x38\xd4\x57\xf0\x11\x5e\x8c\x42\x2e\x47\
+\xc1\xc2\x94\x57\x55\x33\x29\x7d\x7a\x31\x31\x11\xe1\x4c\xe7\x84\
+\x8e\x4c\x4d\x5d\x3d\xf3\xf9\x8f\x8b\x1d\xaf\x01\x31\xc0\x24\x75\
+\x8c\x63\x64\x32\x19\x0f\xe7\xb9\xc8\xf0\x50\x1b\xf8\xec\x5a\xb5\
+\x9a\xd3\xa8\x55\x8c\x5a\xa5\x72\xbc\x0e\xc0\x01\x00\xa3\x32\xa8\
+\x9e\x30\xe2\xb3\x06\x6c\x21\x58\x05\x58\x53\x96\x0c\x77\x03\xc3\
+\xdf\x81\xd3\x5e\xf5\xe8\x68\x26\x18\xd9\x1c\x02\x36\x08\x0c\x9f\
+\xcc\xbf\x00\x6b\xd2\xd2\x65\x18\xcb\x3a\x14\x95\x95\xdf\x50\x5e\
+\x59\x35\xb4\x7f\xcf\x1e\xb8\x33\xf8\x46\xb0\x3f\xc0\xf0\xdf\xd2\
+\x88\x12\xc4\xdb\x3d\x1c\xc7\x5d\x27\x97\xc9\x22\xa0\x8f\xe2\x2e\
+\x0f\x8c\x4b\xcf\xca\x19\xf6\xca\x87\x9f\x46\x50\xf1\x50\xef\x01\
+\x77\x94\x07\x11\xf4\x67\x9f\xee\x5d\x9f\x80\x6e\x0d\x18\xdd\x10\
+\xbd\x08\x12\x40\x2e\x4e\x4d\x5d\xdd\xb5\x6f\x7f\xf1\xed\x87\xf9\
+\x45\xc5\x34\x30\x13\x0e\x34\x6a\xf5\xdf\xd1\x9e\x90\xa0\x40\xe6\
+\xde\x9b\xaf\x67\xba\x27\x25\x32\x9b\x77\xef\x65\x56\x6c\xd8\xc2\
+\x54\xd7\xd5\x31\xff\x79\xf2\x11\xa6\x43\x54\x24\xbe\x04\x57\xbb\
+\x9c\x01\xc3\x4d\x22\x31\xdc\x8f\x53\x59\xe8\x3b\xdf\x85\xdf\x28\
+\x86\xd0\x9a\x4a\x63\xb4\xa4\x25\x07\x12\xfc\x9e\xa3\x35\xfe\x3d\
+\x97\x03\x46\x75\xa4\xce\xa6\x23\xba\x73\xbe\x9f\xef\x05\xf6\x00\
+\xd8\x08\x30\x7c\x2f\x50\x68\x61\x12\x51\xef\xb5\xdb\x76\x24\xfc\
+\xf6\xd7\x5a\x89\xd1\x44\x8b\x84\xbc\x01\x8c\x14\xe2\x1e\x62\x73\
+\xa7\x4f\xd9\x39\x79\xf4\xf0\x79\xe0\x2a\x70\x9e\x21\xbc\x01\x12\
+\x40\xae\x8b\x28\xbf\xb8\xe4\xfe\x4f\x17\xfd\xf2\x4c\x51\x59\x59\
+\x28\x2d\x73\x27\xce\x26\x26\x32\x82\x19\x37\x6c\x30\x33\x79\xd4\
+\x70\x8c\xba\xe0\xd2\xa9\xaf\xc1\x72\xe1\x7a\x76\x4c\xe7\xc0\xc0\
+\x8e\x47\x0b\x18\x0a\x00\x8c\x86\xa0\x62\xc2\x04\x65\x14\x05\x5e\
+\x8d\x9d\x65\x7b\x6d\xd8\xbe\xfb\xf9\xa5\xeb\x36\x4c\xf6\x51\xab\
+\xa5\xb1\x91\x11\xd6\xb0\x90\x60\x6b\x80\x9f\xaf\x32\xa1\x43\x8c\
+\xca\x4f\xab\x15\x7d\xf8\xcd\x22\x26\xb7\x10\xb5\x22\xe1\xe9\xa0\
+\x08\x52\x2b\x95\x96\xb1\xc3\x06\x9f\xbc\xf1\xea\x69\xf7\x42\x9f\
+\xf6\x10\xf3\x12\x48\x00\xb9\x26\xca\x93\x67\xb2\x9e\xfe\x69\xd9\
+\x5f\xf3\xf2\x0a\x8b\x22\x29\xf2\xe3\xdd\xf8\xf9\x6a\x99\x40\x3f\
+\x5f\x26\x2a\x3c\x0c\xa7\xb5\xf8\xee\x9d\x3b\xd9\x63\x22\xc2\x77\
+\xc3\x29\x9c\xef\xc2\x9a\x26\x18\xbd\xc0\x69\x9e\xb3\x23\x3b\x78\
+\xa4\xaa\xb7\xe7\x01\xae\xa7\xb8\x8d\x3b\x76\xff\xe7\x97\x15\xab\
+\x67\x35\xe6\xd3\x89\xe1\x26\x88\x47\x4c\x8e\x56\xc8\xe5\xa2\x3e\
+\xdd\xbb\x32\xc7\x32\xce\x5c\x76\x5e\x15\xe1\xbe\x60\x24\x68\xe4\
+\xa0\x01\x27\x6f\xbf\x6e\xe6\x73\x62\xb1\x18\xa7\x82\x09\x0f\x87\
+\x04\x90\x8b\x01\x9f\x47\xd8\xc1\x63\x27\x9f\xfa\x73\xdd\xc6\xeb\
+\x72\x0a\x0a\xa3\xa0\x4f\x09\x99\x1e\x4e\x72\x97\x24\xc7\x32\xf2\
+\xa0\x40\x7f\x26\xc0\xd7\x17\x6b\xe7\xb0\xc1\x01\x01\x86\xc0\x00\
+\xbf\x72\x5f\x1f\x9f\x1c\x78\xc9\x69\xb0\x2c\x30\x5c\xb2\xab\x07\
+\xc3\x28\x0e\xe6\xae\x60\x69\x7f\xcc\x5b\x20\x2e\x0f\xa5\xdd\x6e\
+\x9f\x9a\x5d\x50\x78\xdb\xae\x03\x87\x07\x1d\xcf\x38\xa3\x69\xd0\
+\xe1\xdb\xca\x30\x26\xb3\xd9\xb1\x42\x8c\xae\x3b\xef\x44\x26\x93\
+\xda\x27\x8d\x1c\x76\xf0\x86\xab\xa7\xbf\x2b\x11\x8b\x97\x0a\x6e\
+\xc2\x43\x21\x01\xe4\x3a\x88\x61\x50\x4e\xda\x7b\xf8\xe8\x23\xcb\
+\x37\x6c\x9e\x51\x54\x5a\x16\x4a\x83\xb0\xe7\x82\x39\x3b\xa3\x52\
+\x06\xb0\x29\x7d\x7b\xd7\x28\x15\xf2\x2d\xe0\x3a\x08\x86\xcb\xcc\
+\x51\xdc\x60\xe4\x06\xa7\xad\xf0\xae\x5c\x0b\x86\x2b\x54\x50\xe8\
+\x60\x1f\xa7\xb6\xe8\xa2\x6d\x3e\x41\x60\x89\x60\x31\x60\x2a\x96\
+\x65\x65\x66\x8b\x55\x5d\x5b\x5f\x1f\xb9\xf7\xf0\x91\x61\xdb\xf6\
+\xee\x4f\xae\xaa\xad\xf3\xa3\x6b\xd0\xfb\x50\xc8\xe5\x36\x10\x41\
+\x07\xe6\x5e\x35\xe5\xbf\x12\x89\xc4\xb9\xaa\x80\xf0\x48\x48\x00\
+\xb9\x06\x2a\xa3\xc9\x3c\x60\xd7\x81\x43\xf3\x97\xad\xdf\x34\xad\
+\x1a\x06\x5e\xc1\x4f\x78\x10\x98\x94\x3c\x6a\xf0\x40\xdb\xa8\x41\
+\x03\x4f\x6b\xd4\x2a\xac\x95\x83\xab\x8f\x50\xd4\xe0\xfe\x44\x99\
+\x60\xb8\xd4\x9b\xa6\xad\xda\x1e\x9c\x62\xc6\xc4\x69\x05\x18\xd6\
+\x39\xea\x0a\x82\xa8\x63\x5d\x83\x2e\xf1\xc4\x99\xcc\xc1\x6b\xb7\
+\xee\xec\x95\x53\x50\xa8\x01\x3f\xe1\x25\xe0\x74\xd8\xd8\xa1\x83\
+\xd2\x6e\x9a\x39\x1d\xb7\xce\xf8\x41\x70\x13\x1e\x06\x09\xa0\x76\
+\x06\xde\x7d\xff\xfa\x06\xdd\xf0\x2d\x7b\x52\xef\x5c\xb6\x6e\xd3\
+\x64\xaa\xf1\xe3\x59\x04\xf8\xf9\x32\x23\x07\x0d\xe4\xc7\x0d\x1b\
+\x54\x1a\x1a\x14\x84\xc9\xca\xb8\x22\xeb\x14\xd8\x36\x30\x5c\x76\
+\x4e\xb8\x2e\xb8\x4c\x3e\x05\xac\x27\x5c\x97\x41\x85\x25\x65\x09\
+\x1b\x76\xee\x1e\xba\xef\xf0\x51\x5f\xb3\xd5\x4a\xd3\x64\x1e\x0e\
+\x4e\x87\x8d\x48\x19\x70\xf2\xce\x39\xb3\xde\x03\x11\xf4\xa3\xe0\
+\x26\x3c\x08\x12\x40\xed\x08\xbc\xf7\x21\xd5\xb5\x75\x63\xd7\x6d\
+\xdb\x79\xe7\xca\x4d\x5b\xc7\x0a\x6e\xc2\xcd\x51\x29\x95\xcc\xf0\
+\x01\x7d\xb9\x51\x83\x07\xea\x12\xe3\x3a\xe0\x8a\x92\x52\x30\x8c\
+\xf0\x60\x51\xc1\xe3\x60\x5e\xbf\x12\xcb\x0d\xf1\x01\xeb\x09\x36\
+\x03\x2c\xb0\xa2\xaa\x3a\xe4\xf0\x89\x53\x3d\xb7\xa5\x1e\x88\xcc\
+\x29\x28\xc4\xc8\x11\xe1\x81\x48\xa5\x12\x76\x40\xaf\xe4\x9c\x87\
+\x6e\xbf\xf9\x71\x21\x31\x9a\xae\x5d\x0f\x82\x04\x50\x3b\x01\xef\
+\x7b\x78\x69\x45\xe5\x54\x10\x3e\x77\x6e\xd9\x9d\x8a\x45\xdf\x08\
+\x37\x06\x9e\x16\x99\x81\x3d\x93\xd9\x71\xc3\x07\x57\x74\x4d\x4c\
+\xc8\x86\xc1\x12\xf3\x76\x70\x65\x16\x16\x15\xc4\xed\x21\x70\x49\
+\x3a\xe1\x39\xc4\x83\x5d\x07\xd6\x5b\x6f\x30\xfa\x65\xe7\x17\x06\
+\xee\x3c\x70\x30\x6e\xcf\xc1\xb4\x10\x3b\xcb\xd2\xaa\x4d\x0f\x02\
+\x73\x82\xfa\xf4\xe8\x5a\xf0\xc8\xbc\x5b\xef\x12\x89\x44\x18\xc5\
+\xc5\x72\x12\x84\x07\x40\x02\xa8\x1d\x80\xf7\x3c\x2c\xbf\xb8\x64\
+\xee\x1f\xab\xd7\xdf\xb9\xff\xe8\xf1\x1e\x82\x9b\x70\x43\x12\xe3\
+\x62\xf9\x29\xa3\x47\xe8\x07\xf4\xea\x59\xaa\x90\xcb\x70\x95\xd6\
+\x1e\x30\x0c\x97\x9f\xc4\xf3\x84\x57\xa0\x04\xeb\x0d\x76\xad\xc9\
+\x6c\x19\x94\x53\x50\x28\x3f\x96\x71\xda\x6f\xeb\x9e\x7d\x91\x3a\
+\xbd\x41\x4d\x65\x2c\xdc\x1f\x9c\x0e\x1b\x3f\x7c\xe8\x91\x5b\x67\
+\xcd\x78\x04\x44\xd0\x21\x70\x91\x08\xf2\x00\x48\x00\xb5\x31\xf0\
+\x7e\x07\xa4\x67\xe5\x3c\xf0\xeb\xca\x35\xb7\x67\x64\xe7\xc4\x09\
+\x6e\xc2\x4d\xc0\xa2\x69\x38\xc5\x35\x66\x48\x8a\x7d\xc2\x88\xa1\
+\x55\xe1\x21\xc1\x58\x7b\xe7\x30\x18\x6e\xd9\x80\xbb\x4b\x3b\x0a\
+\x11\x12\x5e\x8d\x1c\x6c\x84\xdd\x6e\xbf\x2f\x23\x3b\xb7\xf3\xfe\
+\x63\x27\xfc\x52\x0f\xa5\xf9\x92\x18\x72\x7f\x6e\xbb\x6e\xe6\x9a\
+\xc9\xa3\x86\xbf\x0e\xe3\x00\xae\xda\xa4\x6b\xdd\xcd\x21\x01\xd4\
+\xb6\x28\x0e\x1c\x3d\xfe\xe6\x6f\xab\xd6\xcd\x2d\x28\x2e\x09\x17\
+\x7c\x84\x1b\x80\xc2\xa7\x5b\xa7\x04\x7e\xdc\xb0\x21\xb6\x94\xde\
+\xc9\x26\xa9\x54\x8a\x65\x82\xef\x07\xc3\x42\x84\xf4\x34\x48\x5c\
+\x8c\x01\x20\x86\xee\xde\x7f\xf4\xc4\xf4\x5d\x07\x0e\xfa\x9c\x3c\
+\x93\x2d\x35\x5b\x2c\x8e\xc5\x0e\x30\xfe\x52\x22\xb5\x9b\xf1\xe0\
+\xed\x37\xff\x3c\x74\x40\xdf\x0f\xe1\x83\xc3\x48\x10\xdd\x40\xdd\
+\x18\x12\x40\x6d\xc8\xc6\x9d\x7b\x7e\xfc\x6b\xf3\xb6\xc9\xe5\x95\
+\x55\x81\x34\xf0\xb9\x07\x72\x99\x0c\x97\xae\x33\x53\x46\x8f\xe0\
+\x23\xc3\x42\xb1\x28\x21\x2e\x89\xfd\x08\x0c\x73\x7a\xf0\x09\x90\
+\x96\xad\x13\x97\xa2\x71\x99\x3d\x46\x86\x3a\xda\x6c\xb6\x5b\xb7\
+\xa5\x1e\xb8\x6b\xf3\xee\x54\x6d\x4e\x41\x21\x8d\x03\x6e\x06\x4e\
+\x87\x3d\xf7\xc0\x82\xf7\xbb\x26\x26\x7c\x0e\x5d\x2c\x65\x41\xb8\
+\x29\x24\x80\xda\x06\xf5\x8a\x0d\x9b\x7f\x02\x01\x34\x0a\x6b\xfc\
+\x50\x18\xdc\xf5\x09\xf4\xf7\x63\x26\x8d\x1c\xce\x4c\x18\x31\x94\
+\x55\xab\x94\xb8\xa3\xf8\x22\x30\xac\xd7\x83\x75\x7b\xb0\x5e\x0f\
+\x41\x5c\x09\x28\x84\x70\x45\x99\x16\x4c\x69\xb6\x58\x6e\xd9\xb2\
+\x3b\xf5\xe6\x65\xeb\x37\xc7\xd4\xeb\x74\x34\x2e\xb8\x09\xb8\x8b\
+\xfc\x03\xb7\xdd\xb4\xb0\x5b\xa7\x84\x8f\xa1\x4b\x1b\xa8\xba\x29\
+\x24\x80\x5a\x19\x8e\xe3\xa2\xd6\x6c\xdd\xf1\xc1\xaa\xcd\xdb\x26\
+\xd6\x37\xe8\x7c\x48\xfc\xb8\x0e\x18\xdd\xb1\xda\xb0\xe0\xf2\x3f\
+\x74\x8c\x89\xe6\xa7\x8f\x1b\xcd\x0d\x1b\xd0\x37\x17\xba\xff\x05\
+\x4b\x03\xc3\x01\x0e\x13\x9c\x69\xaa\x8b\x68\x49\x30\xfa\x13\x2a\
+\x58\x64\x65\x4d\xcd\xb5\x4b\x56\xad\x9b\xb5\x2d\xf5\x00\x16\x63\
+\x24\x5c\x18\x9c\x12\x8f\x0c\x0b\xad\xba\xfd\xba\x99\x4b\x7a\x76\
+\xed\xfc\x3e\xb8\xb2\x9d\x67\x08\x77\x82\x04\x50\x2b\x62\x67\xd9\
+\xa4\x3d\x07\xd3\x1e\xff\x79\xf9\x5f\x73\xeb\x40\xfc\xd0\xb4\x97\
+\xeb\xd1\x21\x3a\x92\x99\x3d\x6d\x32\x93\xd0\x21\xc6\x6a\x32\x99\
+\x4f\x46\x85\x87\x7d\x07\x6e\xdc\x77\x0b\x23\x3d\x19\x60\xb8\x05\
+\x05\xee\xa8\x4e\x10\xad\x09\x4e\x8f\x75\x00\x8b\x63\x61\xdc\x38\
+\x71\x26\xf3\xba\xaf\x17\xff\x31\xbc\xb2\xba\x06\xc7\x68\x1a\x37\
+\x5c\x94\xe8\x88\xf0\x8a\x9b\x66\x4e\xff\xab\x6f\x8f\x6e\x6f\x41\
+\x17\x6b\x7d\x11\x6e\x04\x09\xa0\x56\xc2\x6e\xb7\x77\x3d\x72\x2a\
+\xe3\xce\x9f\x96\xfd\x75\x4b\x49\x79\x45\xb0\xe0\x26\xda\x09\xad\
+\x8f\x86\xd1\xe9\x0d\x42\xef\x1f\xa6\x8f\x1b\xcd\xdc\x7c\xcd\x55\
+\x28\x72\x36\x82\x7d\x03\x86\x89\x8d\xb4\xc1\x28\xd1\x5e\xa0\xd8\
+\xf1\x07\x4b\x06\x4b\xa8\xd7\xe9\x3b\x2d\xdf\xb0\xf9\x86\x0d\x3b\
+\x76\x45\xd9\x6c\x76\x9c\x3e\x23\x5c\x0c\x8c\x04\xcd\x9b\x33\x6b\
+\x79\x72\x97\xa4\x27\xa0\x5b\xe7\xf4\x12\xee\x80\xe4\xa5\x97\x5e\
+\x12\x9a\x44\x4b\x81\x91\x9f\xf4\xac\x9c\x9b\x7e\x5f\xb5\xee\x46\
+\x5a\xed\xd5\x7e\x74\x8e\xef\xc8\xdc\x7a\xed\xd5\xcc\x2d\xb3\x66\
+\x30\x7b\x0f\x1f\x61\xf4\x06\xa3\x70\xe6\x1f\xe4\x32\x39\x3b\x72\
+\xd0\x00\xac\xf0\x8a\x61\x6c\x5c\xc6\x4e\xd3\x5c\x44\x7b\x83\xa5\
+\x15\x70\xa7\xff\xa3\x4a\x85\xfc\x74\xef\x6e\x5d\xf2\xae\x1a\x37\
+\xe6\x60\x97\x84\x8e\xb6\xc2\xd2\xd2\xa0\xba\x06\x9d\xca\xf1\x2a\
+\xc2\x25\xd0\x19\x0c\xea\xd3\xd9\xb9\x71\xdd\x93\x12\xfd\xfc\x7d\
+\xb5\x58\x07\x8c\x96\xc7\xbb\x09\x14\x01\x6a\x61\x58\x8e\x8b\xcb\
+\xcc\xcd\xbb\xe9\x8f\xd5\xeb\x6f\x39\x96\x71\xa6\x93\xe0\x26\xda\
+\x98\x61\x03\xfa\x32\x37\xcd\xbc\xca\x91\xcc\xbc\x64\xf5\x3a\xb0\
+\xf5\xc2\x99\x7f\xc0\x1d\xd9\x9f\x7b\xe0\x9e\x54\x89\x44\xfc\x0e\
+\x74\xff\x74\x7a\x09\xc2\x25\xc1\x65\xf3\xc3\x60\xbc\x4e\x29\x29\
+\xaf\xe8\xb1\x7a\xf3\xf6\x01\x9b\x76\xef\x4d\x72\x9e\x22\xda\x1b\
+\xcc\x09\xd2\xa8\x54\xe6\xf7\x9e\x7f\xf2\x8d\x00\x3f\xbf\xcf\xc0\
+\x55\xed\x3c\x43\xb8\x32\x24\x80\x5a\x10\x78\x2f\x83\xf2\x8a\x8a\
+\x6f\x59\xba\x66\xc3\x1d\x54\xe1\xb9\xfd\xd1\xa8\xd5\xcc\xf8\x61\
+\x83\xb9\xb4\x93\xe9\x6c\x55\x4d\x2d\x6b\xb1\x59\x65\x76\x3b\x2b\
+\x11\x4e\x33\xef\xfc\xdf\x93\xa6\x0e\x51\x11\xaf\x40\x13\xa7\xbe\
+\x2a\x1d\x4e\x82\x70\x7d\x12\xc0\x26\xc3\x77\x7a\xd0\xc1\xe3\x27\
+\x63\x7e\x5b\xb9\x66\xa0\xd1\x6c\x56\xc0\xf8\x43\xb9\x42\xed\x08\
+\x8a\x20\xb9\x4c\x66\xff\xea\xcd\x57\x1e\x57\x29\x15\xbf\x82\x0b\
+\xb7\xc2\x21\x5c\x18\x12\x40\x2d\x87\xa2\xa2\xaa\xfa\xba\xdf\x56\
+\xad\x7d\x78\xe7\xfe\x43\xfd\x04\x1f\xd1\x0e\xe0\xbe\x5c\xd7\x4c\
+\x1a\xcf\xb0\x2c\xc7\xec\x3a\x70\xc8\xf4\xd2\x23\xf7\x57\xe5\x17\
+\x95\x34\x64\x17\x14\xfa\xe4\x17\x15\x07\xda\xec\x76\x99\x52\x21\
+\x37\x3f\x3c\xef\xd6\x03\xf0\xf2\x37\xc0\xb6\x3a\x7e\x90\x20\xdc\
+\x0b\x9c\x0a\x1b\xa8\x37\x18\x17\x1c\xcb\x38\x13\xfc\xe7\xba\x8d\
+\x3d\x4a\x2b\x2a\x82\x29\x57\xa8\x7d\xe9\x18\x13\x5d\xf9\xfa\x13\
+\x0f\x3f\x25\x95\x4a\x96\x43\xb7\xd6\xe9\x25\x5c\x11\x12\x40\x2d\
+\x83\xc8\x60\x34\x8d\xfa\xe6\xb7\xa5\xef\xc2\x0d\xb7\xaf\xe0\x23\
+\xda\x01\x5c\xd5\xf5\xf0\x1d\xb7\x30\x3f\x2f\x5f\xc5\x1c\x39\x95\
+\xce\xf6\xee\xd6\xa5\xf8\xc9\x05\x77\xa2\xd0\x39\x05\x86\x2b\x6d\
+\x70\x13\x4b\x5f\xb0\x32\xb0\xaf\xc1\x30\xe9\x19\x73\x2e\x08\xc2\
+\x9d\x09\x01\x61\xff\xf8\xe1\xe3\x27\x47\xfc\xbe\x7a\x7d\xc7\x92\
+\xb2\xf2\x10\x2a\xb9\xd1\x7e\xcc\x98\x30\x26\xf5\x86\x19\xd3\xde\
+\x12\x89\x44\x38\xf7\x4e\x79\x85\x2e\x0a\x25\x41\x37\x1f\x31\xcb\
+\xb2\x09\xef\x7c\xf9\xcd\xaf\x07\x8f\x9f\xec\x0e\x7d\x0a\x43\xb7\
+\x13\xfd\x7b\xf6\x60\x9e\xbe\xe7\x4e\xe6\xeb\xc5\x7f\xf0\x47\x4e\
+\xa6\xf3\xfe\xbe\xbe\xfa\x9e\x5d\x3a\x1f\xed\x9e\x94\xb8\x0a\x06\
+\xa2\x15\xf0\x92\x0d\x60\xcb\xc0\x16\x83\x2d\x05\xc3\xfa\x3e\x76\
+\x30\x82\x70\x77\x8c\x12\xb1\x78\x53\x74\x44\xf8\xaa\xa1\xfd\xfa\
+\x30\x1c\xcf\x77\xac\xaa\xad\x15\x99\x2d\x16\x05\x9c\xa3\x31\xa9\
+\x8d\x39\x9d\x9d\x1b\x1d\x1b\x15\xc1\xc3\xe7\x51\x08\xdd\x12\x30\
+\x8a\x34\xb8\x20\x14\x01\x6a\x1e\xf8\xfe\x85\x3c\xf8\xe2\xeb\xe9\
+\x15\xd5\x35\x01\x34\x07\xdf\x3e\x28\x15\x0a\x7e\xfe\x0d\xb3\xf9\
+\x61\x03\xfa\xb2\xfb\x8f\x1c\xe7\x16\xfe\xba\xc4\xa6\x56\xa9\xcc\
+\x9d\x3a\x76\xc8\x9d\x3e\x76\xd4\x9f\xb1\x51\x91\xbf\xc3\xcb\x70\
+\x1b\x0b\x82\xf0\x16\xe2\x4d\x66\xf3\x1d\xdf\xfc\xb6\xf4\x61\xb8\
+\x26\x64\x16\xab\x95\xf6\x1e\x6b\x07\x5e\x79\xf4\x81\xaf\xbb\x24\
+\xc6\xe3\x34\x7b\xae\xd3\x43\xb8\x12\x24\x80\x9a\x01\x2e\x77\x7f\
+\xf2\x3f\xef\xee\x2c\x2d\xaf\x08\x86\x27\x2e\x7c\x2f\x69\x70\x69\
+\x03\x34\x2a\x15\x63\x30\x39\xa3\xca\x63\x87\x0e\x66\x66\x4d\x99\
+\x60\x0f\x0e\xf0\xc7\xcd\x49\x97\xd4\x35\xe8\x0e\x5a\x6d\x36\xa9\
+\xcd\x66\x0b\x08\xf4\xf7\x2f\x57\x29\x15\x38\xc5\x85\x83\x0f\x7d\
+\xd1\x09\x6f\x02\xc7\x22\x14\x3d\xa1\x20\x7e\x6e\xf8\xf2\xe7\xdf\
+\x5f\xdc\x7d\xf0\xb0\x8a\xc6\xa8\xb6\x05\x1e\xce\xac\xaf\x3d\xfe\
+\xe0\x22\x78\x08\x7b\x18\xba\xff\x5b\x87\x83\x68\x57\x48\x00\x5d\
+\x21\x66\x8b\x75\xe0\x57\xbf\xfc\xfe\xf9\xde\x43\x69\xbd\x49\xfc\
+\xb4\x1d\xa1\x41\x41\xcc\xec\x69\x93\x18\x9b\xdd\xce\x0c\xe9\xd7\
+\xa7\x0e\x04\xce\x4a\x70\xe3\x96\x15\x98\xd3\x83\xd5\x9b\x71\x93\
+\x52\x04\x57\x7b\x61\x05\x67\xec\x53\x25\x67\xc2\x5b\xc1\x3c\x20\
+\xdc\x7b\x2c\x10\x1e\x0c\xc6\xfc\xf6\xd7\xda\xc7\x56\x6d\xde\xd6\
+\x95\xc6\xab\xb6\x01\x57\x86\x85\x04\x06\xd4\xbd\xf4\xe8\xfd\x4b\
+\x82\x03\x02\xee\x16\xdc\x84\x8b\x40\x02\xe8\x0a\x30\x99\xcd\xc3\
+\xfe\xda\xb4\xed\x19\x18\x48\xc6\x99\x2d\x16\x4c\xac\x25\xda\x80\
+\x88\xd0\x10\xe6\x95\xc7\x1e\x64\xfc\xb4\x3e\x38\x9d\xf5\x25\xd8\
+\x36\x30\xdc\xa3\x0b\xe7\xd8\xff\xbd\xa9\x17\x41\x10\xe7\x82\x15\
+\xa6\xa3\x75\x06\xe3\x8c\xdf\x57\xad\x9d\xbb\x7e\xfb\x2e\x2a\xd5\
+\xd1\x06\x48\xc4\x62\xae\x5b\x52\x62\xc1\x53\x0b\xee\xfc\x46\x2e\
+\x97\xbd\x26\xb8\x09\x17\x80\x92\xa0\x2f\x13\x8b\xd5\xda\x77\xff\
+\x91\xe3\xf3\x56\x6c\xdc\x3c\x55\x6f\x30\xaa\x05\x37\xd1\xca\x74\
+\x8c\x89\x62\xe0\x29\x8a\xf1\xf5\xf1\xc1\xa2\x85\x9f\x83\xad\x03\
+\x3b\x03\x86\xa5\xe7\x39\x30\x82\x20\x2e\x0e\xae\x76\xac\x50\xc8\
+\x65\xd9\x7d\x7b\x74\xdb\x3b\x66\xc8\xa0\xd2\xf2\xca\xaa\x8e\x25\
+\x15\x95\xb8\x2a\x92\x68\x25\x30\xda\xd6\xa0\xd3\xab\x0d\x26\x53\
+\x70\xef\x6e\x5d\x8e\x82\xab\x14\xdd\x8e\x93\x44\xbb\x42\x11\xa0\
+\xcb\x00\xde\xab\xf0\xf4\xac\x9c\xf9\x8b\xfe\x58\x7e\x77\x6e\x61\
+\x51\xa4\xe0\x26\x5a\x19\x18\x34\x98\x47\xef\xba\xcd\xac\x54\x28\
+\x5e\x85\x2e\x26\x34\xe3\x36\x01\x14\xf1\x21\x88\x2b\x07\xa7\xc0\
+\x62\xc1\x06\xd4\xd6\x37\x74\x7b\xf3\xb3\xaf\xef\x2f\x28\x2e\x09\
+\xa2\xa5\xf3\xad\x87\xaf\xd6\xc7\x70\xfb\x75\xd7\x6c\x1d\xda\xbf\
+\xcf\xed\xd0\xc5\x4a\xd1\x74\xf3\x6d\x67\x28\x02\xd4\x74\xa4\xc5\
+\x65\xe5\x37\x2c\x5f\xbf\xf9\xd6\x13\x67\x32\x13\x05\x1f\xd1\xca\
+\x4c\x1d\x33\x92\x79\xe0\xb6\x9b\x6a\xa5\x52\xe9\x8f\xd0\xc5\xfd\
+\xba\x70\xba\x8b\x72\x7a\x08\xa2\xf9\xd4\x83\xa5\xab\x94\x8a\x53\
+\xa3\x87\xa4\x54\x24\xc5\xc7\x95\x9d\xce\xce\xed\x68\x30\x99\x68\
+\xaf\xb1\x56\xc0\x6a\xb3\xc9\x8e\xa6\x9f\x8e\x1b\xd8\x2b\x59\xe3\
+\xeb\xe3\x73\x18\x5c\xff\xbb\x3b\x33\xd1\xa6\x50\x04\xa8\x89\x54\
+\xd7\xd6\x5d\xf7\xeb\x5f\x6b\x9e\xd8\x9e\x7a\x60\x80\xe0\x22\x5a\
+\x11\x85\x5c\xce\xdc\x7f\xdb\x8d\x4c\x4a\xef\x9e\xb8\xb1\xe0\x11\
+\xb0\x9b\xc0\xb2\xc1\x68\xba\x8b\x20\x5a\x1e\x8c\xfc\x24\xd6\xd4\
+\xd5\xdf\xf8\xd9\x0f\xbf\xdc\x7a\xfc\x74\x66\x2c\x4e\xdd\x38\x4f\
+\x11\x2d\x05\x6d\x97\xe1\x5a\x50\xb8\xb3\x09\xe8\x0d\xc6\xf1\xbf\
+\xac\x58\xf5\xd4\x2e\xda\xe2\xa2\x55\x18\x33\x64\x90\xd0\xfa\x87\
+\x99\x93\xc6\xa1\xf8\x41\x75\x8e\x49\xce\xb8\x5b\x7b\x26\x18\x89\
+\x1f\x82\x68\x1d\xf0\xda\x3a\x13\xe8\xef\xf7\x9f\x27\x17\xdc\xf9\
+\x59\xbf\xe4\xee\xa7\xe0\x21\x84\xa6\x99\x5b\x18\x14\x95\x58\x93\
+\xe9\xb3\x1f\x7f\xb9\x97\xe3\x38\x1c\xf8\x34\xce\x33\x44\x7b\x40\
+\x53\x60\x17\x47\x6c\xb3\xdb\xbb\x7d\xbd\x78\xc9\xa7\x07\x8f\x9d\
+\x48\x86\x36\xed\xb1\xd3\x82\x04\x07\x06\xe0\x6e\xec\x8c\x46\xad\
+\x62\xf6\xa5\x1d\x13\xbc\x4e\x4e\xe7\xe4\x32\x99\xb9\xf9\x16\xb5\
+\x4a\xb5\x3f\x3c\x24\xf8\x4d\x78\x72\xa2\x3d\x75\x08\xa2\xf5\x61\
+\x25\x12\xc9\x6e\x10\x40\xd6\xd8\xa8\xc8\xc0\x82\x92\x52\xb5\x4e\
+\x6f\xa0\x9b\x74\x0b\x53\x5c\x56\x1e\x1c\x1d\x11\xc1\xc6\x44\x86\
+\x63\x54\x1b\x4b\x78\xd0\x54\x4c\x3b\x40\x02\xe8\xc2\xe0\xf4\x60\
+\xd0\xea\x2d\xdb\xdf\xdf\x75\xe0\xd0\x40\xbd\xd1\x48\xf3\xe2\x2d\
+\x48\x4a\x9f\x5e\xcc\xff\xdd\x7f\x37\x13\x16\x12\xc4\x7f\xf2\xdd\
+\x4f\x8c\xde\x60\xe0\x25\x12\x31\x27\x97\xc9\xed\x3e\x1a\xb5\x29\
+\xd0\xdf\xbf\x2e\x31\x2e\x36\xbd\x5f\x8f\x6e\xab\xa0\x8f\x2b\xbe\
+\x68\x80\x20\x88\x36\x42\x2a\x95\x1e\x8e\x8e\x08\x3b\x39\x32\x65\
+\x80\xc4\x68\x34\x05\x15\x95\x95\x6b\x59\x96\xc5\xda\x5a\x44\x0b\
+\xb1\xef\xc8\xb1\xe4\x01\xbd\x7a\xd4\xfa\xfb\xfa\x9e\x86\x2e\xe6\
+\x63\x11\x6d\x0c\xe5\x00\x5d\x18\x6d\x55\x4d\xed\xd4\xa7\xde\x7c\
+\xef\x1b\x78\x02\xa2\xe5\xee\x2d\xc8\xbc\x39\xb3\x98\x89\x23\x87\
+\xf1\x16\xab\xd5\xfe\xe9\xa2\x5f\xcc\x30\xb8\x9a\xe2\xa2\xa3\x70\
+\xeb\x0a\x43\x74\x78\x58\x43\x44\x68\x48\x99\xbf\xaf\xf6\x18\x0c\
+\xc2\x5b\xe0\xe5\xfb\xc1\xa8\x82\x2a\x41\xb4\x0f\x18\xf5\x1e\x0e\
+\x37\xeb\x0f\x7e\xfa\x73\x65\x0c\x8c\x89\xfe\xb4\x52\xac\xe5\xc0\
+\x4a\xd1\x1f\xbc\xf0\xf4\x3b\x41\x01\xfe\xb8\x5d\x06\x25\x45\xb7\
+\x31\x24\x80\xce\x8f\xd8\x6a\xb5\xf5\xba\xf5\xd1\xa7\x0f\x52\x95\
+\xe7\x96\xe5\xf1\xf9\x77\xf0\x03\x7b\x27\xf3\x66\x8b\xd5\xb8\x61\
+\xc7\xae\x9c\xbe\x3d\xba\x6d\x8c\x08\x0b\xdd\x22\x11\x8b\xf1\x29\
+\x08\xf3\x7d\x50\xec\x50\xae\x0f\x41\xb8\x16\xbe\x76\x3b\x3b\xeb\
+\xbd\xaf\xbf\x7b\xff\xc8\xc9\x74\x5f\x1a\x17\x5b\x0e\x18\x0f\xd3\
+\x1f\xbe\xe3\x96\xff\xc2\x03\x1f\xd6\x37\xa3\x1b\x72\x1b\x42\x02\
+\xe8\x3c\x98\xcd\x96\xc1\x1f\x7e\xfb\xc3\x37\x69\x27\xd3\xbb\x60\
+\x9f\x2e\xf4\xe6\x83\xab\xba\x9e\xbe\xf7\x2e\xa6\x7b\x52\x22\x6b\
+\x34\x99\xb6\xdb\x59\xf6\x2b\x5f\x1f\x9f\xcd\x70\x0a\xb7\xaf\xc0\
+\x1d\xd9\x51\xf4\x90\xf0\x21\x08\xd7\x05\xab\xde\x87\xa6\xa6\x1d\
+\x5d\xfb\xd1\x37\x3f\x74\xa3\x48\x50\xcb\x20\x95\x4a\xd8\x05\x37\
+\xce\x5d\x3e\x22\xa5\xff\xd3\xd0\xcd\x72\x7a\x89\xb6\x80\xbe\xc0\
+\xe7\x60\xb5\xd9\x7a\xa6\x1e\x39\x3a\xef\xe4\x99\xac\x44\x14\x3e\
+\x24\x7e\x9a\x8f\x8f\x46\xcd\xbc\xf2\xd8\x03\x28\x7e\xb0\xf8\xd7\
+\x73\x4a\x85\xe2\x2e\x10\x3f\x7f\x41\x1b\xfb\x58\x9d\xb6\x51\x00\
+\x11\x04\xe1\xba\x60\x49\x8a\x92\x41\x7d\x7a\x4d\x7d\xfd\xc9\x87\
+\x57\x69\x7d\x34\x34\x35\xdd\x02\xd8\xed\xac\xe4\xa7\x65\x2b\x27\
+\x66\xe5\x17\xbc\x08\x5d\xca\xb3\x6a\x43\x48\x00\x9d\x05\x88\x9d\
+\xa0\xe2\xb2\xf2\x31\x7f\xae\xdb\x74\x35\x2e\x55\x14\xdc\x44\x33\
+\xd0\xa8\x41\xfc\x3c\xfa\x00\xd3\x31\x26\xfa\x20\x74\x1f\x04\xfb\
+\x56\x2c\x16\xe7\xc1\x11\x07\x4f\x0a\x3f\x12\x84\x7b\x81\x0f\x2a\
+\x05\xf1\xb1\x31\x8f\xcf\x9b\x73\xed\x2a\xcc\x61\x71\xba\x89\xe6\
+\x50\xaf\xd3\x6b\x3e\xfb\x61\xf1\x04\xbd\xc1\xf8\xa1\xe0\x22\xda\
+\x00\x5a\x05\xf6\x0f\xe2\xb2\xca\xaa\x39\x3f\x2d\xfb\xeb\xa1\xac\
+\xbc\x7c\x2c\x11\x4f\x34\x13\x9c\xf6\x7a\xf9\xd1\x07\x6c\xb1\x51\
+\x11\xab\xa1\x8b\x7b\x78\x61\x52\x73\x0d\x18\x09\x1f\x82\x70\x6f\
+\x6a\xa2\x23\xc2\xb2\x7d\xd4\xea\xc0\xb4\x93\xe9\xdd\xa1\x4f\x91\
+\xf2\xe6\x21\x32\x9a\x4d\xca\xba\x86\x86\x80\x01\xbd\x92\x4f\x40\
+\xbf\x10\x8c\xc6\xc9\x56\x86\x04\x90\x40\x55\x4d\xed\x9c\x3f\xd7\
+\x6d\xbc\x3f\x35\xed\x68\x2f\xe8\xd2\xc5\xdc\x4c\xe4\x32\x19\x46\
+\x7e\x74\x1d\x63\xa3\x71\x09\xfb\x7b\x60\x7b\xc0\x68\x95\x03\x41\
+\x78\x08\x22\x91\xa8\xa2\x43\x54\x64\xad\x44\x22\x09\x3a\x79\x26\
+\x2b\x49\x70\x13\x57\x08\xc7\xf1\xe2\x9a\xfa\x7a\x55\x64\x58\x68\
+\x0c\xd8\x2a\x70\x59\x9c\x67\x88\xd6\x82\xa6\xc0\x00\xab\xd5\xd6\
+\x67\xe7\x81\x43\x73\xf7\x1c\x4c\xeb\x4b\x39\x3f\x2d\xc3\x73\x0f\
+\x2c\x30\xc4\x77\x88\x39\x04\x4d\xdc\xbf\x6b\x2f\x18\xe6\xfa\x10\
+\x04\xe1\x39\x70\x52\xa9\x74\xdf\xa4\x51\xc3\x7e\x1e\xd2\xaf\x0f\
+\x6e\x57\x43\x34\x93\x06\x9d\x5e\xf3\xe9\xa2\x5f\x46\xe9\xf4\x86\
+\xc7\xa1\x1b\xec\xf4\x12\xad\x05\x09\x20\x86\x91\x9f\xca\xcc\x9a\
+\xb3\xff\xc8\xf1\x7e\x94\xf7\xd3\x32\x3c\x71\xf7\xed\xf6\x2e\x89\
+\xf1\xb8\xac\xfd\x33\xb0\x5d\x60\xb4\x79\x29\x41\x78\x26\x7a\x1f\
+\xb5\x7a\xe7\x2d\xb3\x66\x7c\x31\x7e\xd8\x10\x8c\xf2\x12\xcd\xc4\
+\x68\x36\x2b\x5e\xfe\xf8\xb3\x07\xe0\x61\xbc\x0f\x74\xa9\x06\x5d\
+\x2b\xe2\xf5\x53\x60\xb5\xf5\x0d\x57\x2d\x5d\xb3\xe1\xee\x13\xa7\
+\x69\x87\xf7\x96\xe0\xda\xa9\x13\xf9\x09\xc3\x87\xa2\xf8\xf9\x1a\
+\xec\x7b\x87\x93\x20\x08\x4f\x46\xa7\x52\x2a\x73\x92\xbb\x24\x15\
+\x77\x88\x8a\x94\x29\x14\xf2\x60\x99\x54\xa6\xac\xa9\xab\xa7\x07\
+\xec\x2b\x43\x54\xdf\xa0\x53\x74\x4e\xe8\xc8\x87\x87\x04\xe3\x1e\
+\x41\xb8\x5a\x96\x68\x05\xbc\xb9\x0e\x90\x98\x65\xd9\x8e\x1f\x2c\
+\x5c\xb4\xfc\xf0\xc9\x53\x5d\x71\x29\xa2\xe0\x27\xae\x90\x3e\xdd\
+\xbb\x62\xad\x9f\x5c\x91\x48\x84\x05\xbd\xde\x05\xa3\x24\x3e\x82\
+\xf0\x1e\x30\x7d\xc0\x1f\xec\x79\xb8\xaf\x74\xf9\xfc\xc7\xc5\x3d\
+\xf7\x1e\x3e\x1a\x4a\x91\xf5\x2b\x03\x77\x8e\xff\xf6\xdd\xd7\x1f\
+\xd1\xa8\x54\x8b\xa1\x4b\xbb\xc6\xb7\x02\xde\xac\xd0\xd5\x70\x71\
+\x3e\x9e\x5b\x58\x14\x4d\xe2\xa7\xf9\x44\x86\x85\x32\x8f\xde\x75\
+\x5b\x05\x5c\xb4\x5f\x42\x17\xa7\xbe\x48\xfc\x10\x84\x77\x81\xd7\
+\x3c\x6e\x5a\xfc\x28\x8c\x03\xd7\xdc\x75\xc3\xec\xaf\x52\xfa\xf4\
+\x4c\xf7\xd5\xfa\xd0\xe2\x87\x2b\x00\xf3\x51\x3f\xfa\xf6\xc7\xc7\
+\xe0\x38\x0e\xba\x24\x22\x5b\x01\x6f\x15\x40\x0a\xb3\xc5\xda\xed\
+\xc7\x3f\x57\xdc\x58\x55\x5b\xe7\x27\xf8\x88\x2b\x44\xa5\x54\x32\
+\xcf\xdc\x7b\x97\x59\x21\x97\x7f\x05\x5d\x7c\x5a\xa1\x01\x8f\x20\
+\xbc\x1b\xb3\x4c\x2a\x7d\x65\xfe\x0d\xb3\x9f\x1f\x99\xd2\x7f\x9f\
+\x4c\x26\xc5\x62\xa7\xc4\x65\x72\xe4\x64\x7a\x4c\x5e\x51\x71\x0a\
+\x34\x3b\x3a\x3d\x44\x4b\xe2\x95\x02\xc8\x66\xb7\x27\xdc\xff\xc2\
+\xab\x5b\xea\x1a\x74\x3e\xa8\xb2\x05\x37\x71\x05\xc0\x93\x1e\xf3\
+\xd0\x1d\x37\xf3\x61\x21\xc1\xeb\xa1\xbb\x06\xac\xc0\x71\x82\x20\
+\x08\xaf\x47\x2e\x93\xad\x9c\x36\x76\xf4\xcf\x5d\xe2\xe3\xf3\x70\
+\x4a\x47\x70\x13\x97\xc1\xb3\x6f\x7d\x70\xbf\xd1\x64\xba\x01\x9a\
+\x94\x53\xd5\xc2\x78\xdd\x1b\xca\xb2\x6c\xe2\xbe\xb4\xa3\x0f\xd2\
+\x0e\xef\x2d\xc3\xec\xa9\x93\x98\xbe\x3d\xba\xe5\x43\xf3\x13\x30\
+\xdc\xb9\x9d\x20\x08\xe2\x6f\x02\xfc\x7c\x7f\xba\xf3\xfa\x6b\xdf\
+\x97\x48\xc4\xb4\xdd\xcd\x15\x80\x1b\xcf\xfe\xf0\xe7\xca\xd9\xd0\
+\x5c\xe0\xf4\x10\x2d\x85\xb7\x09\x20\x45\x83\xde\xd0\xe3\xe7\xe5\
+\xab\xe6\x62\xe4\x87\xa2\x3f\xcd\xa3\x5f\x72\x77\xfe\x9a\xc9\xe3\
+\x6d\xd0\xbc\x0b\x6c\x37\x18\x2d\x77\x27\x08\xe2\x5c\xac\x11\xa1\
+\x21\x2b\x5e\x79\xf4\xc1\xe7\x84\x3e\x71\x19\xe0\x7d\x6a\xcf\xc1\
+\xb4\x84\xac\xbc\x02\x9c\x0a\x0b\x75\x7a\x89\x96\xc0\xab\x04\x50\
+\x83\x5e\x3f\xe6\x87\xa5\x2b\x5e\xa8\xa6\xbc\x9f\x66\x13\x16\x12\
+\xcc\x3c\x3c\xef\x16\xa3\x48\x24\xc2\xd0\x6c\x2a\x18\x15\x3a\x24\
+\x08\xe2\x42\x94\xc7\xc7\x46\x6f\x9e\x39\x69\x3c\x4e\x95\x13\x97\
+\x89\xd9\x62\x91\x7f\xf1\xd3\xaf\x93\x4c\x66\xf3\x33\x82\x8b\x68\
+\x01\xbc\x46\x00\xd9\xed\xf6\xae\xa7\xce\x64\x4d\xd9\x7f\xf4\x58\
+\xb2\xe0\x22\xae\x10\xdc\xe3\xeb\xb9\xfb\x17\xd4\xc0\x71\x21\x74\
+\x37\x80\x51\xd2\x33\x41\x10\x17\x83\x15\x8b\xc5\xe9\x33\x27\x8e\
+\xfd\x2c\xd0\xdf\xaf\x81\xf2\x81\x2e\x9f\xc2\xd2\xb2\x90\x3f\xd7\
+\x6d\x1a\x05\xcd\x49\x4e\x0f\xd1\x5c\xbc\x45\x00\x49\xcb\x2a\xab\
+\x46\xae\xdd\xb6\x6b\xaa\xcd\x66\x97\x0a\x3e\xe2\x0a\x79\xe2\xee\
+\x3b\x8c\x61\x21\x41\x47\xa1\x89\xf5\x7e\xf4\x60\x34\x98\x11\x04\
+\x71\x29\xf4\x4a\x85\x62\xc7\x6b\x4f\x3c\xf4\xb4\x8f\x46\x6d\x22\
+\x11\x74\x79\xe0\x54\xd8\xae\x03\x87\x3a\xe6\x16\x16\xdd\x0e\x5d\
+\x4a\xdf\x68\x01\xbc\x42\x00\x35\xe8\xf5\xe3\xb7\xed\xdd\x7f\x6d\
+\x7a\x56\x36\x2d\x25\x6c\x26\x37\x5e\x3d\xcd\xde\xb3\x6b\xe7\x74\
+\x68\x7e\x04\x86\x15\x9f\x29\xb1\x91\x20\x88\xa6\x52\x17\x1c\x10\
+\xf0\xfd\xff\xdd\xbf\xe0\xbd\x88\xd0\x10\xaa\x70\x7c\x99\xd4\xd4\
+\xd5\xfb\x2e\xfa\x63\xf9\x10\x8e\xe3\xe6\x42\x97\x6a\x03\x35\x13\
+\x8f\x17\x40\xa0\x9a\x83\xd2\x4e\xa6\x5f\xb3\x65\xcf\xbe\x21\x82\
+\x8b\xb8\x42\x06\xf6\xee\xc9\xcf\x98\x30\xf6\x24\x34\xb1\xd0\xe1\
+\x0a\x87\x93\x20\x08\xe2\xf2\x30\xc5\xc7\x46\xbf\x7f\xe3\xcc\xe9\
+\x2b\x22\xc3\x42\xab\x04\x1f\xd1\x04\x30\x0a\x94\x5b\x58\x1c\xb2\
+\x2d\xf5\xc0\x23\xd0\xf5\x05\xa3\x48\x50\x33\xf0\x78\x01\x54\x59\
+\x5d\x33\xf9\xe8\xa9\xd3\x7d\xf5\x46\xa3\x4a\x70\x11\x57\x40\x74\
+\x44\x38\xd6\xfb\x39\x03\x4d\xcc\xfb\xf9\xd6\xe1\x24\x08\x82\xb8\
+\x32\xea\xfa\xf7\xec\xf1\xd9\x94\xd1\x23\x76\x61\x4e\x90\xe0\x23\
+\x9a\x80\xc9\x6c\x56\xfc\xbc\xfc\xaf\xee\x36\x9b\xfd\x6a\xe8\x6a\
+\x9d\x5e\xe2\x4a\xf0\x68\x01\xc4\x71\x5c\x87\x35\x5b\x77\xdc\xb9\
+\xf7\x50\x5a\x6f\xc1\x45\x5c\x01\x6a\x95\x92\x79\xe1\xa1\x7b\x2b\
+\x64\x52\xe9\x22\xe8\xfe\xe0\xf4\x12\x04\x41\x5c\x39\x22\x86\x39\
+\x3c\x6e\xd8\xe0\x1f\x46\x0d\x1e\x98\xa6\x52\x2a\x2d\x82\x9b\x68\
+\x02\x46\xa3\x49\xf9\xe9\x0f\xbf\xbc\x01\x4d\xdc\xc4\x9b\xb6\x72\
+\xba\x42\x3c\x59\x00\x89\x8e\x65\x9c\x59\x90\x9e\x95\xd3\x89\xe5\
+\x38\xaf\xc8\x75\x6a\x0e\xb8\xb2\xeb\x42\x3c\x7e\xf7\x3c\x93\xbf\
+\xaf\x16\xa7\xbc\xd6\x82\xd1\xd3\x1a\x41\x10\x2d\x82\x58\x2c\x5e\
+\x36\x6b\xf2\x84\x5f\xfb\x25\x77\x3f\x23\x95\x4a\xa8\x8e\x58\x13\
+\xc1\x7b\xda\x9e\x43\x69\x21\x7a\xa3\x71\x24\x74\x83\x9d\x5e\xe2\
+\x72\xf1\x54\x61\x20\xe2\x78\x3e\x6c\xcd\x96\xed\x33\xf3\x8a\x8a\
+\x23\x04\x1f\x71\x11\x9e\xbe\xf7\x2e\x26\x22\x34\x44\xe8\xfd\xc3\
+\xcd\xd7\x5c\x65\xef\x91\x94\x78\x08\x9a\xbf\x81\x1d\x71\x38\x09\
+\x82\x20\x5a\x08\x99\x54\xfa\xc5\xdd\x37\xce\xfe\x34\x21\x36\xb6\
+\x48\x22\xa6\x6a\xd1\x97\xc3\xff\xbd\xfd\xd1\x1b\x3c\xcf\x0f\x80\
+\x26\xad\x6e\xbe\x02\x3c\x55\x00\xa9\xbf\xfb\x6d\xe9\x92\xcc\xdc\
+\xfc\x0e\x98\x34\x26\xf8\x88\x0b\x70\xef\x2d\xd7\x33\xdd\x93\x12\
+\xf9\xd0\xe0\x20\x1e\x97\xa6\x36\xda\xe0\xbe\xbd\xf9\xe9\xe3\x46\
+\x67\xc0\x4b\x9e\x00\xdb\xec\x78\x31\x41\x10\x44\x0b\xa3\x90\xcb\
+\xbf\x7c\xee\xc1\x05\xcf\xe1\xce\xf1\xb4\x3c\xbe\xe9\x94\x56\x54\
+\x28\xe0\x21\x7f\x26\x34\xbb\x39\x3d\xc4\xe5\xe0\x89\x02\x08\xa3\
+\x3f\xda\xb4\x93\xe9\xdd\x8d\x66\xb3\x42\xf0\x11\x17\xe0\x9a\x49\
+\xe3\x99\x51\x83\x06\x62\x93\xb5\xdb\xed\x36\x0c\x43\x8b\x61\x00\
+\x4a\x8a\xef\x60\x7d\xe0\xf6\x9b\xf6\x82\xff\x7a\xb0\x83\xf8\x02\
+\x82\x20\x88\xd6\x02\x44\xd0\x92\x8f\x5e\xfa\xbf\xdb\xe5\x32\x19\
+\xed\x1c\x7f\x19\xbc\xfa\xd1\xe7\xd7\xb3\x2c\xd7\x17\x9a\xf4\xb0\
+\x7f\x99\x78\x9c\x00\xe2\x38\x2e\x72\xcd\x96\xed\x1f\xd7\xeb\xf4\
+\xb4\xd3\xfb\x25\x18\xda\xbf\x2f\x33\xf7\xaa\x29\xf8\xb4\x95\x07\
+\xb6\x2b\x29\xbe\x63\x6a\xd7\x84\xf8\xdc\x81\x7d\x7a\xe6\x3d\xf7\
+\xc0\x3d\xab\xa4\x12\xc9\xdd\xe0\xc7\x95\x5f\x34\x20\x11\x04\xd1\
+\xda\x58\x94\x0a\xf9\x86\xaf\xde\x7c\x19\x6b\xdc\x10\x4d\xc4\x60\
+\x32\x29\xb7\xef\xdb\x3f\x0f\x9a\xd3\x9d\x1e\xa2\xa9\x78\x9a\x00\
+\x12\xdb\x59\x36\x78\xd5\xe6\x6d\x13\xad\x36\x1b\xcd\x89\x5e\x84\
+\xa4\xf8\x38\x5c\xd6\x8e\xcd\x55\x60\xaf\x83\x58\x7c\x7f\x70\xdf\
+\x5e\x7f\x8e\x1e\x92\xb2\x7d\xc1\x8d\x73\x57\xc1\xd3\xd8\x7b\xe0\
+\xc7\x42\x87\x56\x7c\x11\x41\x10\x44\x1b\xa0\x53\x29\x95\x5b\xbf\
+\x7c\xe3\xe5\x3b\xb5\x3e\x1a\xa3\xe0\x23\x2e\x02\x3e\xe8\xff\xb2\
+\x62\x75\x1f\x93\xd9\xdc\x07\xba\x6a\xa7\x97\x68\x0a\x92\x97\x5e\
+\x7a\x49\x68\xba\x3f\x36\xbb\xbd\xeb\x86\x1d\xbb\x5f\x4c\x4d\x3b\
+\x8a\x5f\x04\x8a\xfe\x5c\x80\xf0\x90\x60\xe6\xa5\x47\xee\x63\xe4\
+\x32\xd9\xd7\xd0\xfd\x0a\x6c\x87\x48\x24\xca\xf5\x51\x6b\xca\x63\
+\x22\x22\x8a\xe4\x72\xd9\x61\xf0\xa5\x81\x91\xf8\x21\x08\xa2\xad\
+\xb1\xaa\x94\x8a\x82\x84\xd8\x18\x9f\x8c\xec\x9c\x24\x83\xd1\x44\
+\x35\xdc\x2e\x81\xc5\x6a\x95\xcb\xa4\x32\xdf\xee\x49\x89\xb8\x35\
+\x11\x6e\x53\x44\x34\x01\x4f\x8a\x00\x69\xea\x1a\x74\xbd\x96\x6f\
+\xd8\x3c\x59\xe8\x13\xe7\x41\xa3\x56\x33\xcf\x3d\xb0\xc0\x0a\xc7\
+\x9f\xa0\x8b\xe2\x07\x77\x72\xc7\x6a\xac\xf5\x52\xa9\x24\x47\x22\
+\x11\xef\x87\x36\x5e\x40\xb4\xbb\x3b\x41\x10\xed\x01\xae\x04\xab\
+\xe9\xd1\xb9\xd3\xe7\xa3\x06\x0f\x3c\x8c\x89\xd1\x4e\x37\x71\x31\
+\xd6\x6c\xd9\xde\xad\xba\xb6\x0e\x77\x3c\xf0\x71\x7a\x88\x4b\xe1\
+\x31\x02\xc8\x64\xb6\xf4\xda\xb6\x77\xff\x8d\x0d\x3a\xbd\x46\x70\
+\x11\xe7\x20\x12\x89\x98\xc7\xe6\xdf\x66\x0e\x0d\x0e\xc2\xe8\xce\
+\x27\x60\xc7\xc1\xce\x16\x3a\x18\xf1\xa9\x07\xa3\xd0\x33\x41\x10\
+\xed\x09\x8a\xa0\xd3\x57\x4f\x18\xfb\x49\xbf\xe4\xee\xa7\x14\x72\
+\xb9\xcd\xe9\x26\x2e\x04\xe6\x02\xad\xda\xbc\x0d\x97\xc4\x5f\xe3\
+\xf4\x10\x97\xc2\x23\x04\x10\xc7\x71\x51\x99\x79\xf9\x53\x96\xad\
+\xdf\x38\x49\x70\x11\xe7\xe1\x9a\xc9\xe3\xd9\x1e\x49\x9d\x8a\xa0\
+\xf9\x31\x18\x8a\x20\xaa\xbe\x4a\x10\x84\xcb\x22\x91\x48\x56\xde\
+\x3a\xeb\xea\x2f\xfb\xf6\xe8\x76\x8a\x96\xc7\x5f\x9a\xcd\xbb\x53\
+\xbb\xe7\x14\x14\xce\x86\x66\xa0\xd3\x43\x5c\x0c\x8f\x10\x40\x35\
+\xf5\xf5\xc3\xb6\xa7\xee\x9f\x64\xb7\xb3\x54\x12\xfc\x02\x74\x4e\
+\xe8\xc8\xcf\x9e\x3a\xa9\x18\x9a\x38\xf5\xf5\x0b\x18\x3d\x51\x11\
+\x04\xe1\xf2\xa8\x55\xca\x6f\x6f\x9a\x39\xfd\xbb\x9e\x5d\x92\x32\
+\x05\x17\x71\x01\xcc\x16\x8b\x7c\xf9\xfa\xcd\x9d\x78\x9e\xc7\x7d\
+\xc2\x88\x4b\xe0\xf6\x02\x88\xe3\xb8\x98\x8c\xac\xdc\x51\xbb\x0e\
+\x1c\xc6\x3a\x08\xc4\x79\xd0\x6a\x34\xcc\x53\x0b\xe6\x95\xc1\x13\
+\x14\x56\x73\x7e\xd9\xe9\x25\x08\x82\x70\x0b\xf8\x90\xa0\xc0\x45\
+\x73\x67\x4c\xfd\x21\x26\x32\xa2\x5c\xf0\x11\x17\xe0\xe0\xf1\x13\
+\x09\x7b\x0f\x1d\x79\x08\x9a\xb8\x45\x06\x2d\x06\xba\x08\x6e\x2f\
+\x80\x72\x0a\x0a\xaf\xdf\xb0\x63\xf7\x24\xaa\xf9\x73\x61\x9e\x5c\
+\x30\xaf\xc1\x47\xa3\xf9\x1d\x9a\x9e\xb3\xe4\x8f\x20\x08\x6f\xa2\
+\x2e\x3e\x26\xfa\xaf\xab\x27\x8c\x5d\x41\xf9\x40\x17\x07\x67\x42\
+\x56\x6d\xd9\x1e\xca\x72\x1c\x4e\x85\xc9\x9c\x5e\xe2\x7c\xb8\xbb\
+\x00\xd2\xe6\x16\x16\x27\x67\x64\xe7\xc4\x09\x7d\xe2\x1c\xe6\x4e\
+\x9f\x62\xef\x9c\xd0\x71\x35\x34\x71\x17\x77\x4a\x6e\x26\x08\xc2\
+\x2d\x11\x89\x44\xc7\x06\xf6\x4e\x5e\xd5\x3d\x29\x31\x8b\xf2\x81\
+\x2e\x4e\x76\x7e\x41\xd8\x5f\x9b\xb6\xbc\x02\x4d\x3f\x30\x0a\x0e\
+\x5c\x00\xb7\x16\x40\x27\xce\x64\x3e\xbe\x3d\xf5\xc0\x08\xa1\x4b\
+\x9c\x43\x8f\xce\x9d\xf8\x99\x93\xc6\xe5\x40\x73\x03\x18\xd6\xf6\
+\x21\x08\x82\x70\x5b\x14\x72\xf9\xaa\x07\x6e\xbb\xe9\x31\xa1\x4b\
+\x5c\x00\x9c\x11\x59\xbb\x75\x97\x9a\xe3\x38\x5c\x11\xe6\xeb\xf4\
+\x12\xe7\xe2\xce\x02\x48\x92\x9e\x99\xd3\x2f\xa7\xb0\x30\x4a\xe8\
+\x13\x67\xa1\x51\xa9\x98\x87\xee\xb8\x85\x85\x27\x25\x5c\xf1\xf5\
+\xab\xd3\x4b\x10\x04\xe1\xd6\xf0\x1a\xb5\xea\xe4\x73\x0f\x2c\x78\
+\x5d\xe8\x13\x17\xa0\x41\xa7\x53\xac\xdc\xb4\x05\xdf\xa7\x70\xa7\
+\x87\x38\x17\xb7\x15\x40\xa7\x32\xb3\xff\x2f\xed\x64\x7a\x4f\x96\
+\xe5\xdc\x3e\x8f\xa9\x35\x58\x70\xf3\x5c\xc6\x4f\xeb\xf3\x22\x34\
+\x97\x83\x51\x51\x43\x82\x20\x3c\x85\x92\xae\x89\x09\x2b\x03\xfc\
+\x7c\x75\x34\x15\x76\x61\x38\x9e\x17\x2d\x5b\xbb\x29\x80\xe7\xf9\
+\xae\xd0\xa5\xe2\x88\xe7\xc1\x5d\xc5\x83\x78\xf7\x81\xc3\x13\x8b\
+\x4a\xcb\xc2\x28\xf9\xf9\x7f\x19\x3e\xb0\x1f\x93\xd2\xbb\xe7\x01\
+\x68\x6e\x07\x2b\x73\x38\x09\x82\x20\x3c\x03\xbb\x54\x2a\x49\x7f\
+\xfb\xd9\xc7\xef\xf4\xd1\xa8\x4d\x82\x8f\x38\x07\xbc\x37\x9a\x2c\
+\x16\xf1\xde\xc3\x69\xcf\x42\x17\x45\x10\x71\x0e\xee\x28\x80\x14\
+\x67\x72\xf3\x9e\x4c\xcf\xce\x49\xb4\x58\xad\x94\xe1\x7e\x0e\xf0\
+\x54\xc4\xdf\x31\x67\x16\x56\x51\xfd\x00\xec\x04\x18\x8b\x7e\x82\
+\x20\x08\x0f\xc2\xe0\xa7\xd5\x6e\xb8\xfb\x86\xd9\xab\x30\x12\x24\
+\xf8\x88\xf3\xb0\xf0\xd7\xa5\xbd\x39\x8e\xeb\x06\x4d\xad\xd3\x43\
+\x34\xe2\x76\x02\x88\x07\x01\xf4\xe7\xda\x8d\xb7\x54\x56\xd7\x60\
+\x68\x8f\xa2\x3f\xe7\x70\xff\xad\x37\x5a\x35\x2a\x15\xe6\xfd\x6c\
+\x06\xc3\x6d\x2d\x08\x82\x20\x3c\x0d\x9c\xfa\xd2\x0d\xe8\x95\xfc\
+\x7e\x5c\x74\x54\xb1\x54\x2a\xa1\x07\xbd\x0b\xa0\x37\x18\x65\x87\
+\x8e\x9f\xba\x0d\x9a\xfd\x9c\x1e\xa2\x11\x77\x13\x40\x3e\xd5\xb5\
+\xb5\x93\xb3\xf2\x0b\x62\xad\x36\x9b\x54\xf0\x11\x02\x13\x46\x0c\
+\xb3\x27\x77\x49\x2a\x84\xe6\xe7\x60\x35\x0e\x27\x41\x10\x84\x67\
+\x82\x8b\x3c\xf6\xdd\x7d\xe3\x9c\x4f\x3b\xc7\xc7\xe7\x09\x3e\xe2\
+\x3c\x7c\xf0\xcd\xf7\xc3\x2d\x56\x2b\xd6\x05\xc2\x48\x10\x21\xe0\
+\x56\x02\x88\xe5\xb8\xe0\x65\x6b\x37\x3d\x68\x32\x9b\x15\x14\xfd\
+\xf9\x37\x21\x41\x81\xfc\xcd\xd7\x4c\xaf\x86\xe6\x97\x60\x38\x18\
+\xd8\xd1\x4f\x10\xed\x84\x1c\xcc\x1f\x1e\xd4\x23\x18\x9e\x8f\x82\
+\x63\x28\xf4\x31\x04\x8f\xd3\xd6\x74\xed\x12\x2d\x46\xa0\xbf\xdf\
+\xc2\xb1\x43\x53\xb6\x84\x05\x07\xd1\x43\xdf\x05\xc0\xe2\x88\x5f\
+\x2f\x5e\x32\xd5\x68\x32\xcd\x82\x2e\xad\x9c\x16\x10\x81\x90\x10\
+\x9a\x2e\x8f\xc2\x60\x34\x0e\xbd\xe3\x89\xe7\x36\x61\x87\x04\xd0\
+\xbf\x79\xfd\xc9\x47\x6a\x3b\xc5\xc5\xae\x82\xe6\xad\x60\xb4\x32\
+\x82\x68\x6b\x94\x76\xce\x1e\xad\xb3\x9b\xe2\xad\x9c\x55\x6b\xe5\
+\x6c\x6a\xbd\xcd\x14\xa0\xb7\x1b\xfd\x58\x9e\x93\x28\x24\x32\xb3\
+\x46\xaa\x6a\x50\x49\x94\x0d\xa1\x12\x85\x5e\x22\x96\xd7\x4a\xa4\
+\xca\x33\x22\x91\x18\x93\xf4\xe9\xfb\x4a\x34\x0b\x9b\xcd\x3e\xe1\
+\xa7\x65\x2b\xff\x6f\xed\xb6\x9d\x54\x17\xee\x22\x0c\x1b\xd0\xef\
+\xf0\xac\xc9\xe3\xbf\x89\x0a\x0f\x5b\x02\xdd\x4a\xa7\xd7\x7b\x71\
+\x1b\x01\xc4\xb2\x6c\xc2\x81\xa3\xc7\x1f\x7e\x7f\xe1\xa2\xfb\x05\
+\x17\x21\x30\x61\xc4\x50\xfb\x9d\x73\xaf\xdd\x0d\xcd\x07\xc0\x8e\
+\x3b\x9c\x04\xd1\x46\xc0\x18\x12\x5e\x67\xd3\xf5\xda\x5f\x7d\x62\
+\xca\xb7\xd9\x2b\xae\x3a\x5e\x97\x15\x6d\xe1\xac\xe7\x9d\xa2\x96\
+\x88\x24\xdc\x97\xea\x58\x63\x60\x60\x97\xac\xb8\x8e\x93\x16\xfb\
+\xf9\x77\xfc\x13\x86\xa1\x7c\x38\x45\xdb\x1b\x10\xcd\x22\x33\x2f\
+\xff\xbf\xaf\x7d\xfc\xc5\x9d\x38\x43\x20\xb8\x88\xf3\x30\xb4\x7f\
+\xdf\xb4\xbb\xae\xbf\xee\x23\xb5\x4a\xb9\x18\xba\x56\xa7\xd7\x3b\
+\x71\x97\x29\x30\xb1\xc1\x64\x4a\xfa\xf4\x87\xc5\x77\x0b\x7d\x42\
+\x00\xbe\xc4\xcc\x0d\x33\xa6\x96\x42\x73\x07\x18\x89\x1f\xa2\x8d\
+\xe1\x83\x74\xba\xc2\x5b\x1e\x4f\xfb\xe0\xc3\xfb\x0f\xbe\xf9\xc0\
+\xc1\x9a\x53\x71\x17\x12\x3f\x08\xcb\xb3\x62\x8b\xa5\xde\xa7\xac\
+\x6c\x7f\xaf\x03\x07\xde\x79\xd9\x6c\xae\x7b\x02\xdc\x91\x60\xee\
+\xb8\x22\x95\x70\x21\x7c\xd4\xea\x33\x9d\xe2\x62\x0b\x84\x2e\x71\
+\x01\xf6\x1c\x4a\xeb\xfd\xe7\xba\x8d\xf7\x40\x33\xd9\xe9\xf1\x5e\
+\xdc\x62\xd0\x81\x27\xcc\xc0\xba\xfa\x86\x04\x5a\xf6\xfe\xbf\xdc\
+\x7c\xcd\x0c\xbb\x5a\xa5\x5a\x0b\x4d\xda\xe5\x9d\x68\x6b\x7c\x6a\
+\x6b\x33\x1f\xc9\xce\x5a\x7e\xef\xb6\xf2\x83\x5d\xb0\xf0\x9a\xe0\
+\xbf\x24\x38\x85\xcd\xda\x4d\x0a\x9d\xae\x60\x1e\x74\xc7\x80\x05\
+\x38\x4e\x10\xc4\x15\x12\x11\x1a\xb2\x6e\xf4\x90\x14\x8c\x84\x13\
+\x17\x01\xaf\xbd\x8d\x3b\xf7\xf4\xce\x2d\x2c\x7a\x1f\xba\x5e\xfd\
+\xe0\xe1\x16\xff\xf8\xea\xda\xba\x71\x1f\x7c\xf3\xc3\x0b\x42\x97\
+\x10\x48\xe8\x10\xc3\x8c\x1d\x3a\xe8\x24\x34\xf7\x83\xd1\x32\x50\
+\xa2\x2d\x91\xff\x90\xbb\xea\xab\xab\x0f\xbd\x7d\xef\xec\xe2\x4d\
+\xb1\x82\xaf\x49\xdc\x67\xaf\x71\xd8\xfd\x60\x43\x52\x9f\x17\x1f\
+\x3f\xfa\xf5\x27\x36\x9b\x7e\x14\x9c\x52\x3a\x5f\x41\x10\x57\x44\
+\xb6\x9f\x56\x8b\xab\x60\x89\x4b\x60\xb6\x58\xe4\x9b\x77\xa7\x46\
+\x40\x33\x1e\xcc\x6b\x45\x90\x3b\xfc\xc3\xd5\x7a\xa3\x31\xac\xac\
+\xa2\x32\x48\xe8\x13\x02\x77\xce\xbd\x0e\x0f\x6b\xc0\x7e\xc1\x06\
+\x41\xb4\x01\x32\x2b\x67\xeb\x7e\xcf\x81\xd7\x0f\x7d\x7c\x7a\xf1\
+\x8c\x52\x53\x95\xdf\xe5\x44\x7e\xce\x06\x7f\x0e\xed\x9a\x82\xbf\
+\xd4\x93\x76\x3c\xf6\xa5\x4e\x57\xf4\x10\xe6\x13\x09\xa7\x09\xe2\
+\x72\x61\x83\x03\x03\xca\xe3\xa2\xa3\x30\x25\x80\xb8\x08\x18\x05\
+\xda\x73\x30\x2d\xba\xa2\xba\x7a\x21\x74\x55\x4e\xaf\xf7\xe1\xf2\
+\x02\xa8\xbc\xaa\x7a\xd6\x6f\x7f\xad\x9d\xcf\x72\xb4\xe7\xd7\xd9\
+\x8c\x1f\x3e\x04\x23\x40\xab\xa1\x89\xab\xe2\xa8\x1c\x3c\xd1\x16\
+\x68\x6a\xad\x0d\x63\xe6\xef\x7f\xf5\xcf\x9d\x15\x69\x9d\xeb\x6d\
+\x3a\x15\xe6\xf4\x08\xe7\xae\x18\x14\x41\x05\xc6\xd2\xc0\xd9\x07\
+\xdf\x7c\xe4\xb5\x93\x0b\x7f\xb5\x98\xeb\x30\xd7\x8f\xea\x7c\x11\
+\x97\x4d\x78\x48\xf0\x8a\x79\x73\x66\x7d\x27\x74\x89\x8b\x60\x30\
+\x99\x94\x6b\xb6\xec\xe8\x0e\x4d\x35\x98\x57\xae\xaa\x76\x75\x51\
+\x21\xa9\xae\xad\xeb\x78\xf2\x4c\x56\xa2\xd0\x27\x00\x8d\x5a\x8d\
+\x89\xcf\xb8\x6a\x06\xab\x3d\xe3\x9e\x5f\x04\xd1\xda\xc8\xeb\x6d\
+\xfa\x41\xff\x77\xf4\xd3\x77\x76\x57\x1e\xe9\x84\x89\xce\x57\x1a\
+\xf9\x39\x1f\xf8\xbb\xb2\xf4\x05\xa1\x7f\x16\x6e\x4e\x29\x29\xd9\
+\xf3\x78\x43\x43\xfe\x5b\xe0\xa6\xbc\x20\xe2\x72\x29\x4d\x8a\x8f\
+\xdb\x70\xe3\xd5\xd3\x30\x2f\x92\xb8\x08\x18\x05\xda\xba\x77\xbf\
+\xd6\x66\xb3\x3f\x06\xdd\x60\xa7\xd7\xbb\x70\x69\x01\x64\x32\x5b\
+\x52\xce\xe4\xe4\xf5\xc1\xf9\x4a\xc1\x45\x00\x70\x71\xa3\x08\xfa\
+\x02\x9a\x78\x91\xd3\x3e\x38\x44\xab\x63\xb3\x19\x86\x7c\x72\xfa\
+\xd7\xe7\x36\x96\xed\xed\xd1\x38\x75\x25\x9c\x6a\x31\xf0\x77\x36\
+\xd8\x0c\xca\xc3\x87\x3e\x4a\xd8\x9f\xfa\xe6\xf5\x56\x6b\xc3\xf3\
+\xc2\x29\x82\x68\x2a\x58\x1d\xfa\xc8\xc4\x91\xc3\x7f\x4e\xe8\x10\
+\x5b\x24\xf8\x88\x0b\x60\xb5\x5a\x65\x5b\xf6\xee\xbb\x11\x9a\xfe\
+\x4e\x8f\x77\xe1\xd2\x02\x28\xaf\xa8\x78\xec\x9e\x43\x69\x29\x42\
+\x97\x00\xa2\x23\xc2\x31\xf1\x19\x97\x7a\x62\xd1\xc3\x2c\x87\x93\
+\x20\x5a\x11\x2b\x67\xeb\xb6\xa1\xe2\xf0\x75\xbf\xe4\xad\x1d\xd6\
+\x1a\xc2\xe7\x5c\x9e\x54\xc8\x45\xf7\x5a\x4a\xc3\x8e\x1d\x5d\x38\
+\x1d\xba\x43\xc0\x24\x8e\x13\x04\xd1\x34\xea\x95\x0a\xf9\xb6\x3b\
+\xe7\x5e\x8b\x55\xf1\x89\x8b\x80\xd7\xf3\x92\xd5\xeb\xb0\x32\x34\
+\x26\x43\x7b\x5d\x2e\x90\xcb\x0a\x20\x4c\x86\xcc\x2d\x2c\xea\x9e\
+\x5f\x5c\x42\x49\x91\x67\x31\x6f\xce\x2c\x06\x9e\x70\x30\x71\x0d\
+\x57\x7f\xd1\x76\x17\x44\x6b\x23\x2a\x34\x96\x0f\xfd\x39\x6f\xed\
+\xa4\x8b\xd5\xf7\x69\x69\x30\xb7\xc8\x60\x28\xc3\xed\x33\x16\x80\
+\x51\x04\x98\xb8\x5c\x4a\xe3\xa2\xa3\x56\xfb\xfb\x6a\xf5\x30\x5e\
+\x52\xa5\xf1\x0b\x80\xd3\x60\x0d\x3a\xbd\xa8\xa2\xaa\x1a\xa3\x40\
+\x97\xb5\x9a\xd3\x13\x70\x59\x01\x54\x5a\x51\x39\x35\x23\x2b\xa7\
+\x2b\x7e\x40\x82\xcb\xeb\x49\xe9\xdd\x93\xed\x9e\x94\x78\x1a\x9a\
+\x58\xc1\xb3\xd8\xe1\x24\x88\x56\x84\xe7\xb9\x98\x13\x75\x59\xfd\
+\xf6\x55\x1f\xc7\x27\xc4\x36\xc5\x6a\xa9\xf7\x81\xc3\x04\x30\xdc\
+\x43\x8c\xc6\x01\xe2\x72\xe0\x24\x12\x71\x7d\xe7\xf8\x8e\xb9\x70\
+\xe4\x04\x1f\x71\x01\x7e\x5e\xb1\xea\x6a\x38\xc4\x80\x79\xd5\x75\
+\xe6\xaa\x02\x48\xbc\xff\xc8\xf1\x69\x47\x4e\x65\x74\x11\xfa\x04\
+\x70\xe3\xcc\xe9\x58\xb6\x1c\xc3\xba\xb8\xe9\x29\x41\xb4\x3a\x05\
+\xc6\xf2\xd1\xdb\x2a\x0e\x0e\x10\xba\x6d\xca\x02\x4b\x89\xb8\xa0\
+\x60\x8b\xd6\x6e\x37\x8f\x84\xae\xc6\xe9\x25\x88\xa6\x01\x0f\xcf\
+\xe6\x7e\xc9\xdd\x8f\x4b\x25\x52\xaa\x91\x76\x09\xf6\x1e\x3a\x02\
+\xd7\x99\xbd\x33\x34\x03\x9d\x1e\xef\xc0\x25\x05\x10\xcb\x71\x31\
+\x35\x75\x75\x41\x94\xfc\xfc\x0f\x63\x86\xa4\x58\xc3\x43\x82\x33\
+\xa1\xf9\x35\x58\xad\xc3\x49\x10\xad\x8b\xe6\x60\xcd\xa9\xe1\x1b\
+\x4b\x53\xdb\xad\x64\xfe\x89\x63\xdf\x28\x8e\x1d\xfd\xf2\x59\x8e\
+\xb3\x47\x43\xd7\xa5\x73\x16\x09\x97\xc3\x1a\x13\x19\x91\x29\x11\
+\x8b\x39\x9a\x06\xbb\x34\x47\xd2\x4f\x63\x61\xb9\x9e\xce\x9e\x77\
+\xe0\x92\x03\xca\x99\x9c\xbc\x5b\xb2\xf2\x0b\xe3\x84\xae\xd7\x83\
+\x17\xef\xb5\x53\x26\xe2\xce\xbd\x6f\x83\x59\x1c\x4e\x82\x68\x65\
+\xec\x76\xf3\xe0\x53\xf5\x39\x89\x26\xd6\xd2\x6e\x5b\xd0\x80\xf0\
+\x91\x94\x14\xef\xe9\x6d\x32\x55\x0d\x82\xae\x9f\xd3\x4b\x10\x97\
+\x06\xc6\x4d\x6b\xa0\xbf\x6f\x4e\x72\x97\x24\xab\x46\xe5\xb5\xb5\
+\xfe\x9a\xcc\xc2\xc5\x4b\x86\xc2\x21\x09\xcc\x6b\x6a\x70\xb9\xa2\
+\x00\x12\xad\xdb\xb6\x73\x56\x6e\x41\x21\x66\xa6\x13\xc0\xe8\xc1\
+\x03\xb9\xe0\xc0\x80\x32\x68\xfe\x0c\x46\xbb\x66\x13\x6d\x81\x4f\
+\xe6\x99\x3f\x1e\x5e\x9c\xb7\x0e\x07\xc5\x76\xe3\x21\xc6\xe8\xb0\
+\xd1\xbb\x1e\xff\x2f\xcb\x5a\x50\x04\xd1\x8a\x30\xa2\xa9\x98\x02\
+\xfc\xfc\x0e\x3f\x7a\xd7\x6d\xf9\x9f\xbd\xfe\x82\x2d\x29\x3e\x8e\
+\xa2\x40\x17\xa1\xa6\xae\x5e\x0a\x86\xd3\x60\x1d\x9c\x1e\xcf\xc7\
+\xd5\x04\x90\x88\xe7\xf9\x50\xb3\xc5\xa2\x68\x8b\xe5\xb6\xee\xc2\
+\xf5\x33\xa6\xe6\xc1\xe1\x07\x67\x8f\x20\x5a\x9f\xdd\x95\x47\x9e\
+\x7e\xba\xea\x50\x6f\x1b\x6f\x73\x09\xc1\x51\x6b\x6d\x50\x17\x17\
+\xed\x9a\x0d\xcd\x1e\x4e\x0f\x41\x5c\x12\x7c\x58\xcc\x84\x7b\xca\
+\xc2\x35\x5b\xb6\x97\x5b\x2c\x56\x12\x40\x97\xe0\x87\x3f\x57\xdc\
+\x0e\x07\x4c\x88\xf6\x0a\x5c\x4d\x00\x29\xb7\xef\x3b\xf0\x7a\x51\
+\x69\x19\x2d\x7d\x17\x18\x3d\x78\x20\xe3\xa7\xd5\xe6\x42\x13\x97\
+\xbe\x13\x44\x6b\x23\x62\x79\x2e\x7a\x71\xfe\xba\xe9\xa7\x1b\xf2\
+\xc2\x5d\xe5\x41\x04\xff\x8e\x8c\xf4\xc5\xb3\xe0\x66\xd6\x6e\xf9\
+\x48\x84\x5b\x82\x0b\x47\x7e\x53\x28\x14\x7b\x8d\x26\x53\x83\xd3\
+\x45\x5c\x88\x7d\x87\x8f\xfa\x5a\xac\x56\x2c\x8a\xe8\x15\xf9\xb7\
+\xae\x26\x80\xa4\x9b\x76\xee\x1d\x5f\xdb\xd0\xa0\xa5\xe5\xef\x4e\
+\x66\x4f\x9b\x9c\x0f\x87\x5d\x60\x46\x87\x83\x20\x5a\x17\xe5\xcf\
+\x79\x6b\xde\x4e\xab\xc9\x88\xb3\x71\x76\x97\x9a\x6e\xb2\x58\xea\
+\x7c\x18\x86\xc7\xbd\x8b\x70\xb9\x2e\x41\x34\x05\x5e\x24\x12\x55\
+\xf6\xea\xda\x79\x6b\xd7\x4e\x09\x25\xd7\x4e\x9e\x60\x57\x29\x15\
+\xc2\x29\xe2\x5c\x70\xcf\xcd\xe3\x19\x67\x86\x41\x73\x92\xd3\xe3\
+\xd9\xb8\x92\x00\x12\x73\x1c\xe7\x5f\x55\x5b\xeb\xcf\xb2\xb4\xf1\
+\x29\x32\xa8\x4f\x2f\x26\x28\xc0\xff\x10\x34\x17\x39\x3d\x04\xd1\
+\xaa\x88\x59\x9e\x0b\xfe\xbd\x60\xc3\xa8\x6a\x6b\xbd\xcb\x2d\x3b\
+\x7f\x58\x64\x11\x15\x15\xed\x98\x6e\xb3\xe9\x71\x59\x3c\x41\x34\
+\x15\x2e\x34\x38\x68\xef\x8c\x09\x63\x73\x66\x4f\x9f\x6c\x99\x35\
+\x19\x4b\x4b\x11\x17\x62\xe9\xda\x8d\x7d\xe0\x80\x22\xc8\xe3\x71\
+\x19\xa1\xc1\xf3\x7c\xe0\xa9\xac\xec\x3b\x2d\x16\xab\x9c\xa2\x3f\
+\x4e\xae\x9b\x3a\x11\x43\xb6\x38\xfd\x85\x39\x40\x04\xd1\xda\xf8\
+\x1f\xad\x3d\x73\x53\xb1\xb1\x22\xc0\xd5\xa2\x3f\x8d\x18\x0c\xe5\
+\x89\x36\x9b\x11\x8b\x32\xd2\x6e\xf1\x44\x93\x91\xcb\x64\x59\x31\
+\x11\xe1\xb8\x79\x74\x06\xcf\x33\x26\x5a\x16\x7f\x61\x72\x0a\x0a\
+\x7d\xeb\x75\x3a\xac\xc2\x8e\xbb\xc4\x7b\x34\x2e\x23\x80\x30\xfa\
+\xb3\x64\xd5\xfa\x9b\xa9\xf6\x8f\x93\x5e\xdd\xba\x30\x31\x91\x11\
+\x3b\xa1\x89\x7b\x7e\x11\x44\x6b\x23\xe6\x38\x36\xec\xd3\xcc\xdf\
+\x6e\x69\xcf\x65\xef\x97\x22\xe3\xd4\xcf\x8a\xc2\x82\xad\xfd\xe1\
+\x91\x09\xf7\x08\x23\x88\xa6\x62\x00\xfb\xcb\x66\xb3\x7d\x1e\x1c\
+\xe8\xbf\x74\xe2\x88\xa1\x67\x14\x72\x39\xad\xa8\x3d\x0f\x18\x80\
+\x38\x71\x3a\x13\x8b\x10\x4f\x76\x7a\x3c\x17\x57\x11\x40\x72\x8b\
+\xd5\x16\x91\x91\x9d\x13\x47\xab\xbf\x9c\xcc\x9a\x34\xde\x0c\x87\
+\x03\x60\x7b\x1d\x0e\x82\x68\x45\x60\xd0\x0b\x33\x18\x4a\xa7\xed\
+\xac\x48\x4b\xc2\x7d\xb8\x04\xb7\x4b\x52\x54\xb4\x23\x05\xc4\xda\
+\x38\x68\xd2\x54\x39\x71\x39\x64\xcb\x64\xb2\xa5\x43\xfb\xf7\xfd\
+\xf8\x8e\x39\xb3\x3e\x7e\xe3\xa9\x47\xd6\x25\x74\x88\xa5\xfd\x14\
+\xcf\xc3\xaa\xcd\xdb\x51\x00\x4d\x71\xf6\x3c\x17\x97\x18\x40\x38\
+\x8e\x8b\x4c\xcf\xca\x9e\x81\xca\x93\xa6\xbf\x18\xa6\x63\x4c\x34\
+\xd3\x25\x31\x3e\x15\x9a\x07\xc1\xa8\xf0\x21\xd1\xda\xc8\xea\x6d\
+\xfa\xee\x8f\x9c\xfa\xf6\x76\x14\x3f\xae\xfc\x10\xf2\x98\x94\x67\
+\x16\x98\x0a\x43\x4a\x8a\x77\x0f\x86\x2e\x1a\x41\x5c\x0e\x75\x60\
+\xf8\x60\xb9\x28\x2a\x3c\xec\xcb\x5e\xdd\x3a\x1f\x75\x78\x89\x7f\
+\x81\xd3\x60\x95\x35\x35\x58\x7d\xdd\xa3\x67\x64\x5c\x42\x00\x99\
+\x2c\x96\xb8\x45\x4b\x57\xdc\x26\x74\xbd\x9e\x99\x13\xc7\xe2\xd2\
+\xcd\x65\x60\xdb\x1c\x0e\x82\x68\x45\xec\x9c\xbd\x43\x5a\xed\xe9\
+\x09\x5b\xcb\x0f\x74\x15\x5c\x2e\x0d\x0a\xb4\x1b\x32\x7e\xe8\x6f\
+\xb1\xd4\xdf\x01\x5d\x5a\xd2\x43\x5c\x09\x06\x91\x48\x74\x30\xa5\
+\x77\x4f\x2c\x2e\x4b\x9c\x03\x06\x22\xd2\xb3\x72\x70\x39\xbc\x47\
+\xd7\xdd\x72\x05\x01\x24\xb7\x5a\x6d\x01\xe5\x95\x55\x5e\xb5\x09\
+\xdb\x85\x08\xf0\xf3\x65\x06\xf5\xed\x7d\x0a\x9a\xb8\xef\x17\xce\
+\x5b\x13\x44\x6b\x22\x2d\x35\x57\x0f\x7a\xfb\xd4\xf7\xb7\x08\x7d\
+\xb7\xa0\xd8\x54\xe1\x6f\xb3\x19\x7a\xf1\x3c\x37\x50\x70\x11\xc4\
+\xe5\x52\x13\x19\x16\xba\x5f\x68\x13\xe7\xb0\x75\x4f\x6a\x2c\x1c\
+\x6e\x76\xf6\x3c\x93\x76\x17\x40\x2c\xcb\xc5\xe4\x17\x15\xa7\xd0\
+\xd4\x97\x93\xab\xc6\x8f\xc6\xd5\x09\x9f\x80\xed\x71\x38\x08\xa2\
+\x15\xe1\x79\x36\x26\x53\x57\xd0\xeb\x8c\x2e\x3f\x4c\x70\xb9\x0d\
+\x36\xab\xbe\x87\xc9\x58\xf9\x1a\x34\x69\xa7\x78\xe2\x4a\x60\x45\
+\x22\x91\x49\x68\x13\xe7\x90\x91\x95\x1b\x5a\x54\x5a\xe6\xd1\x25\
+\x27\xda\x5d\x00\xd5\x35\x34\xf4\xfd\x65\xc5\x6a\xb7\x7a\xfa\x6c\
+\x2d\xe4\x32\x19\x33\x76\xe8\x60\xbc\x20\xb1\xf8\x61\xbd\xc3\x49\
+\x10\xad\x87\xe4\x58\x5d\xf6\x75\x2f\x1c\xfb\xec\x2e\xa1\xef\x56\
+\x1c\x3a\xf8\xbe\xe2\xc4\x89\xef\xe2\xcd\xe6\x9a\x69\xd0\x75\xd9\
+\x95\x6b\x84\xcb\x82\xf7\x3f\xfa\xde\x5c\x00\x2c\x8a\x78\x2a\x33\
+\x5b\x09\x4d\x8f\x7d\xc0\x68\x77\x01\x64\xb5\xd9\xb4\x85\x25\xa5\
+\x6e\xf7\xf4\xd9\x1a\x8c\x1c\x34\x80\x51\x2a\x14\xbf\x40\xb3\xc0\
+\xe9\x21\x88\xd6\xc3\xc4\x5a\x7a\x1f\xae\x4d\xef\x57\x6e\xae\xf6\
+\x15\x5c\x6e\xc5\xdd\xe6\x62\xe6\xa6\x8a\xd4\xc8\x69\x7b\x9e\xfd\
+\x2f\xc3\xf0\x58\xb7\xc4\x15\xa6\xf4\x09\xf7\x41\x2c\x95\x48\xf0\
+\x06\x4f\x5c\x80\xdd\x07\xd3\x30\x35\x65\x01\x98\x47\x26\x43\xb7\
+\xeb\x80\xc1\x33\x8c\xbf\xc1\x68\x0c\xa6\xa5\xef\x4e\x26\x0c\x77\
+\x6c\xbc\xfd\x2d\x18\x15\x3e\x24\x5a\x1b\xe5\xd6\xf2\x03\xb7\x7f\
+\x9e\xb9\x64\xaa\x3b\x5f\x7f\x3c\xc3\x89\x8a\x8c\xe5\x01\xa9\x7b\
+\x5f\xdb\x00\xdd\x8e\x4e\x2f\x41\x34\x09\x4e\x2c\x16\x9b\x43\x83\
+\x02\x71\xbb\x0c\x2a\x8c\x78\x1e\xb2\xf2\xf3\x83\x72\x0b\x8b\xee\
+\x81\x26\x09\xa0\x96\xa6\xbe\x41\x37\x7c\xe7\xfe\x43\x53\x29\xff\
+\x87\x61\x92\x3a\xc6\xf1\x1d\xa2\x23\x31\xe9\x19\x97\x69\x52\x81\
+\x2e\xa2\x35\x91\x6c\x29\x3f\xf0\xea\x67\x99\xbf\x5f\x83\xbb\xac\
+\x0b\x3e\xb7\x04\xc5\x1b\x2e\xdd\xaf\xa8\x38\x92\x64\xb5\xea\xbe\
+\x00\x49\xd4\x5b\x38\x45\x10\x97\x02\x6b\x00\xe9\xbb\x77\xee\x84\
+\x35\xd7\x88\xf3\x60\xb7\xb3\x92\xd4\xb4\xa3\x41\xd0\xc4\x48\x99\
+\xc7\xdd\xa7\xdb\x55\x00\x55\xd7\xd6\x76\xde\x77\xe4\x18\x0d\x58\
+\xc0\xc4\x91\xc3\x70\xe9\xfb\x67\x60\xd5\x0e\x07\x41\xb4\x0e\xa2\
+\x7d\xd5\x27\x9e\xfb\x3a\x6b\xe9\xac\x2c\x5d\x61\xa8\x27\x44\x5f\
+\xf1\xdf\xf0\x88\xc8\x2a\xdd\xbb\xe7\xe5\xa1\xd9\xd9\xab\xff\x63\
+\xb7\x9b\x86\x0b\xa7\x08\xe2\x52\x98\xc3\x82\x82\x72\x25\x12\x31\
+\x27\xf4\x89\xb3\xc0\xe0\xc4\xe1\x63\xa7\x30\xfa\x83\x55\xa1\x7d\
+\x1c\x4e\x0f\xa2\x3d\x05\x90\xdc\x60\x32\xfb\xd7\xd6\x37\x68\x85\
+\xbe\xd7\xa2\x52\x2a\x99\x41\x7d\x7b\xa1\x00\xfa\x01\xac\xd6\xe1\
+\x24\x88\x96\x47\x5e\x5f\x9f\x7b\xdf\xe7\x99\xbf\xdf\x70\xbc\x2e\
+\x2b\xda\x55\xf7\xfb\xba\x52\xee\x68\x38\xad\x9a\x93\xb9\x78\xe4\
+\xd7\xb9\xab\x1e\x63\x59\xeb\x58\xc1\x4d\x10\x17\x84\x67\x18\x5d\
+\xc7\xd8\xe8\x0d\x32\xa9\x8c\x2a\x42\x5f\x80\x92\xca\x0a\x79\x6d\
+\x7d\xfd\xdd\xd0\xc4\x48\x90\x47\xd1\x6e\x02\xc8\x62\xb5\x26\x17\
+\x96\x94\x76\xa2\xe9\x2f\x86\x19\x33\x74\x10\x2b\x93\x4a\x71\xd5\
+\x17\xae\xfe\xa2\xe9\x2f\xa2\x35\xd0\x1a\x8d\x15\x33\x4f\x9e\xf8\
+\xee\x9e\x43\x35\xe9\x71\xae\xbc\xdf\x57\x73\xc0\x29\xbd\x1f\x72\
+\x57\x8d\x31\x18\x4a\xaf\x86\x6e\x82\xd3\x4b\x10\xe7\x07\x6e\x3e\
+\xfa\x84\xd8\x98\x8d\x32\x99\x94\x04\xd0\x05\xc0\x69\xb0\xbd\x87\
+\x8f\xf6\x87\xa6\xca\xe9\xf1\x1c\xda\x4d\x00\x15\x97\x95\x8f\x3c\
+\x70\xf4\x04\xbe\xa9\x5e\xcf\x94\xd1\x23\x50\xfc\xfc\x06\x46\xe2\
+\x87\x68\x0d\x7c\xac\x56\x5d\x4a\x46\xfa\x2f\x0f\x55\x94\x1f\x4e\
+\x32\xda\xcd\x1e\x5d\xde\xbe\xc2\x5c\xa3\xad\xab\xcd\xc6\xbd\xc2\
+\x26\x39\x3d\x04\x71\x41\x2c\x1a\xb5\x3a\x5d\x2a\x91\xb0\x42\x9f\
+\x38\x07\x0c\x52\xec\x3f\x72\x0c\x2b\xae\x07\x80\x79\xd4\x83\x53\
+\xbb\x09\xa0\x92\xf2\xca\x4e\x99\x79\x79\x58\x69\xd2\xab\xe9\xd6\
+\x29\x81\x0f\x09\x0c\xc0\xbc\x9f\x4f\xc1\x68\xdf\x2f\xa2\xa5\x51\
+\xda\xed\xe6\x9e\x3f\x15\x6e\x9e\x3f\xa7\x64\xcb\xa0\x27\x64\x62\
+\x8f\x9a\xf6\xba\x10\x63\x8f\x7d\xd8\xd9\x60\x28\x9b\xc2\xf3\x5c\
+\x1f\xc1\x45\x10\xe7\x83\x15\x8b\x45\xb8\xf0\x84\xb8\x08\x19\xd9\
+\xb9\x98\x6b\x37\x0a\x9a\x21\x4e\x8f\x67\xd0\x5e\x02\x48\x62\xb7\
+\xdb\xe5\x18\x5a\x13\xfa\x5e\xcb\x84\x11\x43\xb1\xf0\x61\x36\x58\
+\x2e\x18\x2d\xc5\x24\x5a\x12\xa9\x99\xb5\x74\x5d\x5d\x96\x7a\xcb\
+\x9b\xa7\xbe\x9f\x85\xc9\xc2\x9e\x90\xf4\xdc\x14\xf0\xdf\xb9\x3f\
+\xf5\xf5\x7e\x65\x65\xfb\xb1\xc8\xaa\xd7\x8f\x33\xc4\x85\x11\x89\
+\x44\xac\x44\x2c\xe6\x68\x29\xfc\x85\xe1\x38\x8e\xc9\xce\x2b\x98\
+\x0b\x4d\x8f\x0a\x5a\xb4\x8b\x00\xe2\x79\xde\xdf\x6c\xb1\xa8\xbc\
+\x3d\xff\x47\x22\x91\x30\xfd\x93\x7b\x60\xde\x0f\x6d\xc8\x47\xb4\
+\x34\x62\x8e\xb3\x27\x6e\xaf\x38\x74\xdb\x53\x47\x3e\xba\x13\x97\
+\x8a\x0b\x7e\xaf\xa1\xa1\xa1\x20\xac\xac\xf4\xc0\x60\x18\x71\x7a\
+\x0a\x2e\x82\x38\x1f\x7c\x50\x40\x40\x9d\x54\x4a\xd3\x60\x17\x63\
+\x5b\xaa\x63\xb3\x64\x8f\x5a\xb4\xd4\x2e\x83\xa2\xd5\x66\xeb\x58\
+\xa7\xd3\xe1\x7c\xa2\x57\xd3\x2f\xb9\x3b\x2f\x97\xcb\xb0\xea\xf3\
+\x62\xa7\x87\x20\x5a\x06\x9e\xe7\xa2\xd6\x97\xed\xbb\xef\xf1\xb4\
+\x0f\x16\x78\xda\x6a\xaf\xa6\xf2\xa8\x84\x63\xee\x28\xdf\xdd\x2b\
+\xfd\xe4\x4f\x1f\x40\x97\xf6\x0b\x23\x2e\x84\x7d\xec\xb0\x41\x9b\
+\xfc\xb5\x5a\xbd\xd0\x27\xce\xc3\xc1\x63\xc7\xa5\x70\xc0\x5c\x20\
+\x8f\x79\x98\x6a\x97\x7f\x88\x48\x24\x8a\xa9\x6b\xd0\xe1\x56\xfb\
+\x5e\xcd\xb0\x01\xfd\x70\xe9\xbb\x0e\x8c\x9e\x3c\x88\x96\xc4\xa7\
+\xa6\x3a\xfd\xe9\x17\x8f\x7f\x7e\xbb\xa7\x27\x3c\x5f\x8a\x06\x9b\
+\x41\x59\x53\x7b\xba\x13\x08\xc2\x59\xd0\xc5\xc1\x9b\x20\xce\xc5\
+\x3c\x7c\x40\xbf\x57\x23\xc3\x42\x2b\x68\x1a\xec\xc2\xd4\xd6\x37\
+\x60\xf0\x02\xa3\x40\xb8\xed\x8c\x47\xd0\x5e\x11\x20\xad\xc5\x62\
+\xf5\xea\xc1\x48\x26\x93\x32\xfd\x92\xbb\x9d\x82\xe6\x4a\xa7\x87\
+\x20\x5a\x86\x3d\x95\x47\x9f\xba\x2b\xfd\xdb\xe9\xee\x5e\xe5\xb9\
+\xa5\xb8\xbd\xf6\x44\xf8\xfe\xd4\x37\xde\xe3\x38\x5b\x67\xe8\xd2\
+\xe6\x97\xc4\xb9\xf0\x62\xb1\xb8\x50\x21\x97\xe3\x03\x29\x71\x11\
+\xd2\x4e\xa6\xdf\x0a\x07\x8f\x59\xbd\xdd\x2e\x02\xc8\x64\xb6\xa8\
+\x6d\x36\x9b\x57\x0f\x44\xfd\x93\x7b\x30\x32\xa9\x94\x04\x10\xd1\
+\xa2\xe8\x6c\x86\x11\x7f\x15\xef\x18\x97\x51\x9f\x17\xe1\x2d\x09\
+\xcf\x97\x02\xf7\x0b\x33\x9b\xab\x03\x8e\xa6\x7d\xbe\x9c\x65\x2d\
+\x38\x78\x7b\x75\x54\x8c\x38\x2f\xbc\x44\x22\x61\xc5\x14\x01\xba\
+\x28\x5b\x76\xa7\x26\xc2\xc1\x63\x0a\x22\xb6\x8b\x00\xaa\xa9\xab\
+\x0b\xd6\x19\x8c\x5e\x3d\x27\x3f\xa4\x5f\x6f\xbc\xd0\x70\x05\x58\
+\x83\xc3\x41\x10\xcd\x47\xf5\x6d\xce\x8a\xa7\x36\x97\xef\x4b\xb6\
+\x70\x56\x9c\xaf\x27\x00\x14\x82\x3c\xcf\x89\xeb\xeb\x73\x3b\x64\
+\x9c\x5a\xfc\x39\xdc\xeb\xb0\x46\x10\x45\xc7\x88\x7f\xd1\xbf\x67\
+\x8f\x7d\x61\x21\xc1\x35\x42\x97\x38\x0f\x47\x4e\x65\xc8\x79\x9e\
+\xc7\x7d\xc1\x3c\x22\xaf\xb0\x5d\x04\x50\x65\x75\x6d\x14\x88\x20\
+\x3f\xa1\xeb\x75\xc8\x65\x32\xa6\x6f\x72\x77\x5c\xf6\x9e\x0e\x46\
+\x4f\x1c\x44\x4b\xa0\x5e\x5a\xb8\xf9\x93\x3f\x0b\xb7\x0c\xa6\xa9\
+\xaf\xff\x65\x9e\x3e\x5b\x34\x4f\x9f\x25\x9e\x95\xbf\xa2\xc7\xc9\
+\x13\x8b\x5e\x35\x99\xaa\x30\x27\xc8\xeb\xf3\x10\x89\x7f\x18\xd8\
+\x3b\xf9\xbb\xc4\xb8\xd8\x3c\xa1\x4b\x9c\x07\x5c\xb9\xad\x33\x18\
+\x92\xa0\xd9\xc1\xe9\x71\x6f\xda\x2b\x02\x14\x5a\xaf\xd3\x7b\xdc\
+\xc6\x6a\x4d\x65\x40\xaf\x64\x9c\xfe\xda\x0d\xcd\xf5\x4e\x0f\x41\
+\x5c\x31\x22\x96\xe7\xa2\x57\x15\xef\x78\xf7\xa3\x8c\x5f\x66\x95\
+\x9a\xaa\xfc\x68\xea\xeb\xc2\xe0\x8a\xb8\x99\xb9\xcb\x7b\x3f\x73\
+\xea\xbb\x47\xf4\xba\xa2\x9b\xc1\x15\xe9\x3c\x43\x78\x3b\x0a\xb9\
+\xfc\x48\x78\x48\x48\x19\x1c\xa9\x22\xff\x45\x38\x93\x93\x37\x0c\
+\x0e\x1e\x51\x60\xb4\x7d\x72\x80\x2c\x16\x95\xc5\x6a\xf5\xda\x1c\
+\xa0\x21\xfd\x1c\x1b\xe0\x63\xfd\x9f\xd3\xd8\x20\x88\x2b\x44\xc9\
+\x71\xb6\xfe\xcb\x8b\xb6\xbe\xf4\xca\x89\xaf\x6e\x29\x35\x57\xfa\
+\x79\x63\xbd\x9f\xcb\x05\xdf\xa3\xd5\x25\x3b\x7b\x67\x67\xaf\x9a\
+\xcf\x71\x2c\x26\x75\xc6\x3b\xcf\x10\x5e\x8e\x79\xec\xd0\x94\x9f\
+\x53\xfa\xf4\x3c\x2a\xf4\x89\xf3\xb0\xe7\x50\x1a\xae\x04\xf3\x88\
+\x6b\xa6\x3d\x06\x4b\xa5\xdd\x66\x97\x79\x73\x11\xc4\xe4\x2e\x9d\
+\x71\xe9\x3b\xe6\xfe\xd0\x06\x7c\xc4\x15\xc2\x87\x56\x98\x6b\x26\
+\x2d\xca\x5b\xf3\xf8\xf3\x47\x3f\xbb\xb5\xda\x52\xaf\xa1\xc8\x4f\
+\xd3\xc1\xf7\xea\xda\xc2\x35\xdd\x0f\x1f\xfa\xe0\x8e\xea\xea\x53\
+\x77\x70\x9c\xbd\x8b\x70\x8a\xf0\x62\x02\xfc\xfc\x56\x8e\x1b\x3a\
+\x78\x7d\x6c\x54\x64\x99\xe0\x22\xce\xe1\xf0\x89\x74\x9c\xbd\xc1\
+\x1c\x5e\xb7\x1f\x6f\xda\x5c\x00\xd9\x6c\xf6\x4e\x3a\xa3\xd1\x6b\
+\xa7\xbf\x7a\x74\xee\xc4\x28\x15\xf2\x34\x68\x66\x38\x3d\x04\x71\
+\x79\xb0\x3c\xdb\x21\x4b\x57\x34\xf3\xb3\xcc\xdf\x1f\x7d\xed\xc4\
+\xc2\xd9\x94\xf0\x7c\x65\xa0\x08\x9a\x53\xba\x3d\xf1\xf6\x13\x5f\
+\xdd\xbe\xa9\xfc\xe0\xdd\x1c\x67\x4b\x06\x37\x45\xd0\xbc\x1b\x63\
+\x97\xc4\xf8\x35\xf7\xdd\x72\x7d\x6a\xd7\xc4\x04\xca\xcf\x3c\x0f\
+\x46\x93\x49\x64\x32\x9b\xb1\x90\x71\xb0\xd3\xe3\xbe\xb4\xf9\xc5\
+\x5e\x50\x52\x3a\xa1\xb4\xbc\x32\x4c\xe8\x7a\x1d\x7d\xba\x77\xc3\
+\xc3\x66\xb0\x7d\xd8\x20\x88\xcb\x81\xe7\xf9\x88\x13\x75\xd9\x73\
+\xde\x4e\xff\xfe\xc1\x1f\x73\x57\x0f\x17\xdc\x44\x33\x38\x59\x9f\
+\x1d\xf9\xda\x89\xaf\x6f\x2b\x2a\xda\xf9\x30\xbc\xbf\x28\x82\x68\
+\x99\xbc\x77\xb3\x47\xa5\x54\xee\x29\xaf\xaa\xc2\x48\x3d\x71\x1e\
+\x8a\xcb\xca\xf1\x46\xe6\xf6\xf5\x80\xda\x5c\x00\x1d\x38\x76\x7c\
+\x5c\x51\x59\x99\xd7\x0a\xa0\x7e\xc9\xdd\x30\xc1\x0e\xb7\xbf\xa8\
+\x70\x38\x08\xa2\xe9\x04\xe9\xf5\x45\x73\x3e\xcd\xfc\xed\xd6\xcd\
+\x65\xfb\x1d\x4a\x9a\x68\x19\x8a\x4d\x15\xfe\x27\x8e\x7d\x7d\x93\
+\xc5\x5c\xf3\x8c\xb0\x83\xbc\xca\x79\x86\xf0\x46\x14\x72\x79\x56\
+\xdf\x1e\xdd\x4e\x0a\x5d\xe2\x1c\x52\x0f\x1f\xed\x07\x87\x11\xce\
+\x9e\xfb\xd2\xe6\x02\xa8\xb4\xbc\x32\xc2\x68\x34\x61\x1d\x01\xaf\
+\x23\x24\x30\x80\x89\x0c\x0b\xc5\xe4\xe7\x3a\xa7\x87\x20\x9a\x84\
+\x88\x61\xf8\xa0\x86\xfa\xbc\x9b\xee\x39\xfe\xc5\xfd\x24\x7e\x5a\
+\x87\x07\x38\xbd\xbc\xfb\xc6\xdb\xe6\xbc\x93\xfe\xe3\xab\x1c\x67\
+\x1b\x0c\x2e\x2a\x27\xe0\xa5\xf8\x6a\x7d\x8e\xf4\x4b\xee\x81\x2b\
+\x75\x89\xf3\x70\xf0\xf8\x49\x2c\x21\xe1\xf6\x05\x11\xdb\x5c\x00\
+\xb1\x2c\x2b\xf1\xd6\x64\xcd\x7e\x3d\x7b\xe0\xe1\x1b\xb0\xfd\xd8\
+\x20\x88\x26\x20\xe1\x19\x3e\xe0\xf7\x82\x8d\xef\x4e\xd9\xff\xf2\
+\xcb\x7b\xab\x8e\x25\x08\x7e\xa2\x95\xf8\x32\xeb\x8f\xf1\x37\xee\
+\x7d\x7e\x61\x89\xa9\xf2\x2a\xe8\xe2\x96\x3d\x94\x5c\xee\x65\x48\
+\xc4\xe2\xa2\xd0\xe0\xc0\x1c\xda\x1b\xec\xfc\x94\x94\x57\x88\x6c\
+\x76\x3b\xe6\x1e\xba\x75\xfe\x61\x9b\x0a\x20\x9e\xe7\xfd\x85\x37\
+\xcd\x2b\xe9\xd3\x0d\x57\x0f\x32\xb8\xc4\xb2\x14\x1b\x04\x71\x09\
+\x34\x16\x4b\xdd\xc4\x29\x5b\x1f\x38\xf5\xea\x89\xaf\x6f\x28\x37\
+\x57\xfb\x0a\x7e\xa2\x95\x39\x54\x93\xd1\xe1\xaa\xed\x0f\x7f\x53\
+\x5e\x76\xf0\x33\x8e\xb3\x77\x17\xdc\x84\xf7\x60\x03\x11\x44\x7b\
+\x83\x5d\x84\xca\xea\x9a\x08\x38\xf4\x74\xf6\xdc\x93\xb6\x14\x40\
+\x12\xa3\xc9\xdc\x07\x4c\xe5\x8d\x4b\xe0\xa5\x52\x09\x93\xdc\x25\
+\x09\x2f\x28\x5c\xfa\x4e\x4f\x15\xc4\x45\xe0\xfd\xf3\x0d\xa5\xb7\
+\x3e\x9e\xf6\xc1\xb6\xab\xf7\x3c\xf7\x6d\xb6\xbe\x28\xc4\xcc\x5a\
+\x64\xb4\xcc\xbd\xed\xc0\x5a\x41\xf5\x36\x9d\xea\xaa\xa3\x1f\xcd\
+\x9e\xbd\xfb\x99\xd5\x59\x99\xcb\xfe\xe0\x38\x36\x45\x38\x4d\x78\
+\x01\x1a\x95\xca\x14\x12\x18\x40\xe9\x0a\x17\xe0\xc4\xe9\x4c\x9c\
+\x8a\xbf\xda\xd9\x73\x4f\x24\x2f\xbd\xf4\x92\xd0\x6c\x75\x14\xc7\
+\x33\xce\x2c\x48\x4d\x3b\x9a\x62\x30\x9a\xbc\x2e\xc1\x30\xb9\x4b\
+\x67\x66\xd4\xa0\x01\x07\xa1\xf9\x27\x58\x89\xc3\x49\x10\x4e\x14\
+\x06\xbb\x69\xe0\xee\xca\xa3\x0f\x2e\x29\xd8\xf8\xc4\x9f\x85\x9b\
+\xef\x5e\x52\xb8\x69\xea\xbe\xea\xe3\x89\x65\xe6\x6a\x3f\x9e\xe1\
+\x31\x0e\x4f\xe2\xa7\x8d\xc1\xf7\xdc\xc8\x9a\xe5\x15\x96\x6a\xdf\
+\xf5\xba\xfc\x98\x7d\xd5\x27\xc6\x1c\xa8\x39\x79\xbd\x9d\xb3\xf7\
+\xec\xa8\x09\x2f\x10\x89\x24\xf5\xf0\x32\xd6\xf9\x6a\xc2\xd3\x50\
+\xc8\xe5\xf6\x40\x3f\x3f\x15\xdc\xb3\x06\x0a\x2e\xe2\x2c\x78\x9e\
+\x51\x0c\x1f\xd8\x0f\xf7\x4e\x5b\xe2\xf4\xb8\x1f\x22\x1e\xfe\x15\
+\x6d\x84\xe6\xf3\x9f\x7e\xdd\xbc\x3f\xed\x58\x2f\x83\xc9\xfb\x92\
+\xa0\x6f\x98\x31\x8d\xb9\x7a\xe2\xd8\x07\xa0\xf9\x3b\x18\xad\x00\
+\xf3\x72\x40\xd4\x04\x56\x98\x6b\x46\xaf\x28\xda\x7e\x83\x89\x35\
+\x2b\x4b\x4c\x95\xc1\x27\xea\xb2\x62\x0b\x8c\x65\x81\x14\xed\x71\
+\x4d\x70\xa7\x70\x11\x23\xe6\x3b\xfa\x44\x55\x0d\x0a\xea\x71\x26\
+\x48\xe1\x5f\xef\x27\xf7\xd1\x75\xf1\xed\x98\xd1\xcd\xb7\xe3\x36\
+\xad\x4c\x73\x00\x5e\x66\x74\xbe\x9a\xf0\x00\x94\x35\x75\xf5\x57\
+\xdd\xf7\xdc\x2b\x8b\x59\x8e\x6b\xf3\x7c\x59\x57\x47\xa9\x50\xf0\
+\x3f\x7c\xf0\xe6\x3a\x68\x4e\x71\x7a\xdc\x8f\xb6\x14\x40\xda\xc7\
+\x5f\x7f\xe7\x4c\x71\x69\x59\xa8\x37\x7e\x99\x5e\x7f\xf2\x61\xa6\
+\x53\x5c\x87\x41\xd0\x3c\x04\x46\x15\xa0\xbd\x18\x8e\xb3\x77\x3e\
+\x50\x9b\x31\x77\x49\xc1\xc6\x69\x6b\x8a\x77\xf5\xb6\xf1\x36\xaf\
+\x5d\x18\xe0\xce\xa0\x20\x52\x4b\x54\xd6\x78\x9f\xa8\xca\xbe\x81\
+\x5d\xb3\x1f\x8a\x19\x7f\x44\xad\x09\xdb\x28\x95\xaa\x56\x0b\x2f\
+\x21\xdc\x1c\x8e\xe3\xba\xae\xdb\xbe\xeb\xc5\xef\x97\x2c\x9b\x23\
+\xb8\x88\xb3\xf8\xee\xdd\xd7\x37\x6a\xd4\xea\xa9\xd0\x74\xcb\xfd\
+\xd3\xda\x4c\x88\x60\x38\xd9\x64\x32\x29\xbd\x71\xa0\x47\xa5\x9c\
+\xd8\x21\x16\xf3\x7f\x68\xfb\x0b\xc2\xdf\x60\x28\x1b\xf9\x6e\xfa\
+\x0f\xb7\x2f\x2b\xdc\xd2\x1f\xab\x38\x93\xf8\x71\x4f\xf0\x73\xd3\
+\xdb\x8d\x8a\x63\x75\x99\xd1\xdf\xe7\xac\x1c\x59\x52\xbc\xf7\xb6\
+\xda\x9a\xd3\x77\xc2\xa9\x58\x30\xfa\x4c\x3d\x00\xb1\x58\x5c\x30\
+\x72\xd0\x80\x45\xa1\x41\x81\xb5\xb4\x22\xec\x7f\xa9\xae\xad\xc3\
+\x74\x96\x18\x67\xcf\xfd\x68\x2b\x01\x24\x62\x78\x5e\x81\x91\x1f\
+\x6f\x4c\x80\x4e\xee\xdc\x89\x85\x8b\x07\x57\x7f\x99\x9d\x1e\xc2\
+\x5b\xe1\x79\xb6\x37\xdc\x28\xa7\x1e\xae\x49\xef\x20\xb8\x08\x0f\
+\xc1\x66\xd3\xfb\xd5\xd6\x66\x0d\x81\xe6\xf5\x60\x54\x4d\xda\x33\
+\x30\x68\x54\xaa\x83\x2f\x3d\xfa\xc0\x57\xf0\x20\x4b\xab\xc2\xce\
+\xa1\xa8\xbc\x02\xb7\xc3\xc0\xef\xbc\x5b\xd2\x56\x02\x48\x66\xb5\
+\xd9\x62\x39\x2f\x9d\x47\xed\xde\x25\x09\xc3\x83\x3f\x82\xd5\x3a\
+\x1c\x84\xb7\x22\xd1\xe9\x8a\xfa\x2f\x28\xde\x30\x4c\xe8\x13\x1e\
+\xc4\xd5\xf9\x2b\x99\x59\xd9\xbf\xf9\xdb\x6c\xc6\x9b\xa0\x2b\x73\
+\x7a\x09\x0f\xa0\x2a\x38\xc0\xff\x03\x3f\x5f\xad\x9e\xa2\x40\xff\
+\x26\x33\x27\x37\x04\x0e\xa3\x9d\x3d\xf7\xa3\x4d\x04\x09\xcf\xf3\
+\x3e\x45\xa5\x65\xa3\xed\x76\x56\x22\xb8\xbc\x8a\x6e\x09\xf1\x28\
+\x80\x56\x82\xe1\x14\x18\xe1\xa5\x60\x41\xc3\x54\x43\x69\x54\x91\
+\xb1\x1c\x37\x12\x24\x3c\x10\x4c\x60\xaf\xaa\x3a\x16\x05\x4d\xaf\
+\x7c\xd8\xf3\x50\x50\xf4\x18\xfd\xb5\x5a\x9d\x54\x2a\xa1\x55\x7f\
+\x67\x71\x3a\x27\x4f\x0b\x87\x2e\xce\x9e\xfb\xd1\x26\x17\x29\xc7\
+\xf3\x7e\xeb\xb6\xef\x9a\x6d\xb1\x59\xbd\xee\xa9\x08\xf3\x7f\x3a\
+\x44\x47\xe2\x05\x84\xd1\x1f\xce\xe1\x24\xbc\x12\xa3\xdd\x9c\x98\
+\x67\x28\x89\xa5\x9c\x1f\xcf\x05\x3f\x5b\x78\xe0\xc3\x71\x95\x3e\
+\x63\xcf\x82\x57\xc8\x65\x56\xb1\x48\x4c\x11\xa0\xb3\xc8\x29\x28\
+\x92\xc1\xf7\x1d\x45\x90\x5b\xd2\x36\x11\x20\x8e\x53\xee\x4b\x3b\
+\xd6\xcb\x1b\x23\x40\xdd\x93\x12\x19\x91\x48\x84\x4f\x0d\x74\xe1\
+\x78\x39\x95\x96\xda\xae\x27\xea\xb3\xe2\x85\x2e\xe1\xa1\x70\xac\
+\x15\xc5\x0f\x6d\xa1\xe1\x41\xc0\xe0\x2d\xae\xae\xab\xf7\xb7\xdb\
+\xed\x5e\x39\x8b\x71\x21\x38\x8e\x13\x55\xd7\xd5\xa1\x8e\x70\xcb\
+\x88\x67\xdb\x08\x20\x18\x08\x2c\x56\xef\x8b\xfe\x20\x5d\x3b\x25\
+\xe0\xaa\xaf\x72\x30\x12\x40\x5e\x4e\x80\xdd\xe2\x77\x83\xc5\xe2\
+\x23\x74\x09\x0f\xc5\xcf\x3f\x11\x0f\x38\xde\x91\x00\xf2\x0c\x70\
+\x11\x8f\xca\x68\x32\x29\xa9\x1e\xd0\xff\x52\x51\x55\x83\xdb\x5b\
+\x05\x82\xb9\xdd\xf7\xbd\x2d\x3e\x4c\x31\xcf\xf1\xf8\x34\xe4\x95\
+\x74\x8e\x8f\xc3\xbc\x9f\xe5\x60\x6e\x59\x27\x81\x68\x39\x64\x32\
+\x4d\xa5\x52\x15\x48\x89\xf0\xde\x01\x45\x7d\x3d\x04\x9e\xe7\xfd\
+\x8a\x4a\xcb\x66\x59\xad\x36\x4a\x6c\x3f\x0f\x45\x65\x65\x6a\x38\
+\xe0\x4a\x30\xb7\x8b\x8e\xb5\x85\x00\xf2\xad\x6b\x68\xe8\x8e\xcb\
+\xdf\xd1\x04\x9f\xd7\x10\x17\x15\x85\x37\xbc\x1f\xc0\x48\x00\x79\
+\x39\x4a\x65\xd0\xbe\xa0\xa0\xee\xc7\x85\x2e\xe1\xa1\x88\x44\x0e\
+\xe1\x63\x02\x23\x01\xe4\x01\x70\x1c\x1f\xf0\xe7\xba\x4d\x77\x9a\
+\xad\x16\x2a\x6d\x70\x1e\x72\x0a\x8a\x30\x07\x08\x8b\x21\xba\x9d\
+\x40\x6c\x75\x01\xc4\xb2\x6c\xd8\xb1\x8c\x33\xe3\x85\xae\x57\x11\
+\x19\x16\xca\x28\x14\x72\xac\x1d\x91\x0d\x46\x09\xd0\x5e\x8e\x58\
+\x2c\x29\x08\x0e\x49\xce\x0b\x90\xfb\xd2\x76\x09\x1e\xc8\xcf\x21\
+\x29\xcc\xaf\xe1\xc3\xad\x3e\x3e\x51\xf9\xd0\xa5\xd5\x42\x1e\x03\
+\x2f\xcb\x2b\x2a\x8e\xe6\x39\x5a\xbc\x70\x3e\xb2\xf3\x0a\xb0\x18\
+\x62\x3f\x30\x8a\x00\x9d\x8b\xcd\x66\x0f\x3c\x74\xfc\x64\x7f\xa1\
+\xeb\x55\x74\x8a\x8b\x45\xd1\x83\x39\x40\x14\xfd\x21\x10\xab\x4a\
+\x15\xb4\x74\xdb\xb0\x77\x16\x7d\x2c\xd2\xda\x3f\xe4\x95\x0c\x1a\
+\xe1\xde\xfc\x16\x3e\xc2\x61\x83\x06\x3f\xc7\x0f\x18\xf8\x64\x11\
+\xb8\x70\xcf\x3f\x8c\x00\x11\x1e\x80\x58\x2c\x66\x43\x83\x02\xab\
+\x45\x62\xaa\x01\x74\x3e\x8a\x4a\xcb\xb0\xce\x5f\x04\x34\x29\x07\
+\xe8\x5c\x58\x8e\x55\xe5\x16\x16\x45\x0b\x5d\xaf\xa2\x7b\x52\x27\
+\xcc\xff\xa1\x29\x0f\xe2\x6c\x4e\x6b\x34\xe1\x9f\xc2\xcd\xf2\xb5\
+\x88\x88\x14\xfa\x6e\x78\x08\x72\xb9\x16\x77\x86\x5f\x0f\xf6\x38\
+\xd8\x0e\x30\x8a\x00\x79\x08\x22\x91\xa8\xe6\x86\x19\xd3\xbe\x56\
+\xca\xa9\x12\xf4\xf9\xc0\xd2\x0f\x95\xd5\x35\x18\x05\x22\x01\x74\
+\x2e\x3c\xcf\x48\x74\x06\x03\x26\x49\x79\x1d\x49\xf1\x71\x85\x70\
+\x58\xe2\xec\x11\x84\x03\x56\x24\x12\x9f\x0c\x0a\xee\xf6\x45\xff\
+\x81\x8f\xbd\x36\xed\xaa\xdf\x5e\xd8\x37\xe4\x8d\xbf\x3e\x93\x05\
+\x37\xbc\xcf\x52\x8d\x11\x77\xe1\xa7\xa0\x7e\xcc\xde\x94\x57\x2d\
+\x69\x23\xff\xbb\xaf\xff\xc0\x27\x3e\xee\xd9\x7b\xc1\xf3\xe0\x7e\
+\x1b\x6c\x99\xe3\x05\x84\x27\xd1\x10\x1b\x15\xb1\x2c\x24\x28\xb0\
+\x96\x0a\x21\xfe\x2f\x98\xdb\x5b\x5d\xeb\x58\x0a\xef\x76\xb4\xfa\
+\x6e\xf0\x20\x7e\x26\xcc\x7f\xea\x85\xb5\xde\xb6\x7c\x10\x9e\x1a\
+\x98\xc5\x9f\xbc\xbb\x45\x2c\x16\x5f\x03\x5d\x7c\x3a\x24\x88\xf3\
+\x81\x4b\x48\x07\xf3\x3c\x37\x06\x2c\xbe\xb4\x74\xdf\x10\xb3\xa9\
+\x2a\x3e\x3b\x6b\xa5\xe3\x7a\xb9\xc7\x5a\x81\x07\xa2\x9d\x59\x12\
+\x35\x8e\x49\xea\x7c\x1d\xb4\x44\xac\x44\x22\xcf\x53\xa9\x82\xb6\
+\x41\xa7\x0a\xec\x20\xd8\x1e\xb0\x12\x30\xc2\x73\x51\x64\xe6\xe5\
+\x3f\xf1\xd9\x0f\x8b\x1f\x2c\x2e\x2b\xc7\xed\x1f\x88\xb3\xb8\xe7\
+\xa6\xb9\xf5\xa3\x87\xa4\xc4\x41\xb3\xce\xe9\x71\x0f\xda\x22\x02\
+\x24\xf6\xc6\xca\xb7\x1d\x63\xa2\x79\x10\x3f\x18\x32\x25\xf1\x43\
+\x5c\x0c\xcc\x11\xdb\x29\x12\x89\x5f\x16\x8b\xa5\xcf\x05\x07\xf7\
+\xf8\xd4\xdf\x3f\x71\xb3\x56\x1b\x53\xea\x3c\x4d\xb8\x06\x22\x5e\
+\x24\x92\x34\xc8\xe5\xda\x15\x0a\x85\xef\x67\xe0\x78\x5a\xb0\x3f\
+\xc0\x48\xfc\x78\x3e\x96\x4e\x71\x1d\xde\x1c\x37\x6c\xf0\xd6\xa0\
+\x00\x7f\x1a\xd3\xcf\xa1\xba\xae\x0e\xef\xf1\x38\x0d\xe6\x56\x81\
+\x8e\xd6\xfe\x63\x65\x2c\xcb\xaa\xbc\x71\xf9\x7b\x7c\x6c\x34\x86\
+\x4a\x29\xf9\x99\xb8\x1c\x0a\x15\x0a\xbf\x0f\x03\x83\xba\x3c\xd3\
+\x29\x69\xd6\x8f\xe1\x11\x29\x69\xbe\x32\x8d\x59\x38\x47\xb4\x13\
+\x2a\x89\xc2\xa6\xd6\x84\x16\x83\xf8\x59\x2a\x97\xfb\x3c\x20\x16\
+\xcb\x3e\x00\x37\x46\x7f\x08\xef\xc2\x3e\x7e\xf8\x90\x2f\xfa\x74\
+\xef\x9a\x45\x9b\xa2\xfe\x9b\xaa\x1a\x87\x00\xc2\x9d\xe1\xdd\x6a\
+\x25\x58\xab\x0a\x20\x10\x3e\x5a\xbd\xd1\x18\x2e\x74\xbd\x8a\x4e\
+\x1d\x3b\xe8\xe0\x40\x4f\xf1\xc4\x65\x23\x12\x49\x0e\x05\x87\x24\
+\xbf\xd0\xb3\xd7\xfc\x47\xf7\x8c\xfc\x64\xfb\xa6\x1e\xf7\x1c\x5f\
+\x9d\x74\x63\xc9\xb2\x0e\xd3\xcd\x1f\x31\x1a\x4e\x4c\x83\x6f\xab\
+\xf1\x99\x2c\x84\xf9\x42\x11\xc1\x6e\xe8\x3e\x5f\xbf\xb5\xd7\xc3\
+\x45\x19\x93\x7f\x3b\x75\x64\xe2\x8f\x7b\xbb\x74\x99\xfb\x95\x4c\
+\xa6\xbe\x0b\x5e\x82\xd1\x1e\x7a\xff\xbd\x14\xb9\x4c\xb6\x75\x68\
+\xff\xbe\xd9\x6a\xa5\xd2\x22\xb8\x08\xa0\xb2\xba\x06\xb5\x44\x67\
+\x30\xb7\x2a\x7a\xdc\xaa\x39\x40\x76\xbb\xbd\xcb\xc1\xe3\x27\xef\
+\x7d\xff\xeb\xef\x71\x59\xa8\x57\xf1\xee\x73\x4f\x1e\x89\x8d\x8c\
+\xf8\x10\x9a\x8b\x9c\x1e\x82\xb8\x22\x70\x60\xc1\x32\xf3\x73\xc0\
+\x66\x81\x75\x68\x68\xc8\x93\xe3\xd4\x72\x65\xf9\x61\x19\xcb\x5a\
+\xd4\xc5\xc5\xbb\x55\x3c\xcf\x89\xe7\x9b\x30\xe7\x9e\xb8\x14\xef\
+\xda\x9c\x25\xb9\x82\x83\x93\x99\x90\xd0\xde\xbc\x48\x24\xc6\xbc\
+\x1e\x53\x58\x58\x5f\x83\xd6\x37\x16\x23\xb7\x58\xa7\x09\x57\xe8\
+\xad\x06\xdb\x0a\x86\x75\x7d\xa8\x8e\x17\xe1\x20\x23\x3b\xe7\x85\
+\x9f\x97\xad\xba\xe3\x74\x4e\x6e\x07\xc1\xe5\xf5\x84\x04\x05\x58\
+\x3e\x7d\xf5\x85\x2f\xa0\xf9\x1f\x30\xb7\x49\x5c\x6c\xd5\x08\x90\
+\xd9\x6a\x8d\x3a\x79\x3a\xb3\x8f\xd0\xf5\x2a\xc2\x82\x83\xb1\xf8\
+\x21\x26\x4a\x12\x44\x73\xc0\x1b\x2f\x4e\xb7\x7c\x0a\x36\x06\x2c\
+\xc1\xd7\x37\x2e\xc6\xcf\x2f\x2e\xa9\x63\xc2\xb4\xeb\xc2\xc2\x07\
+\xfc\xaa\x52\x05\xd7\x4a\x24\x0a\xab\x42\x2c\xb7\x4b\x44\x12\x47\
+\x84\x88\xa2\x44\xff\xa6\xf1\x3d\x41\x13\xc1\x7b\x04\x82\xc7\x0e\
+\x66\x85\xf7\xcd\xa8\xd1\x84\x65\x46\x44\xa6\xfc\x17\xc4\x4f\x0a\
+\xbc\x34\x06\x2c\x09\x0c\xc5\xe6\xb7\x60\xb9\x60\x24\x7e\x88\xbf\
+\xf1\xd3\x6a\x8b\x02\xfd\xfd\xdc\x2a\xd9\xb7\xb5\xa9\xad\x6f\x90\
+\x5a\x6d\xf6\x61\xd0\xd4\x38\x3d\xee\x41\xab\x46\x80\xaa\x6b\xeb\
+\x66\xff\xe7\xd3\xaf\x3e\x2e\x2c\x29\x0d\x13\x5c\xcd\x22\xc0\xcf\
+\x17\xdf\x68\xa1\xe7\xba\x68\x54\x2a\xe6\xbb\xf7\xfe\xf3\x1d\x34\
+\xe7\x83\x61\x92\x2b\x41\xb4\x06\xb8\x82\x0c\xcb\xcf\x63\x89\x7e\
+\xcc\xb5\x9b\xde\x50\x9f\x77\x8f\xd5\xda\xd0\x85\xe3\xec\xca\xea\
+\xea\x93\xa2\xaa\xaa\x13\xf8\x3a\xa6\xbe\x2e\xc7\x71\x44\x1e\x16\
+\x79\x66\xf4\xfe\x7d\xf6\x9f\xe7\xb9\xa0\xe0\x1e\x4c\x50\x50\x37\
+\x47\xdb\xd7\xb7\x03\xe3\xeb\xd7\xc1\x31\xd0\x89\x44\x62\x93\x8f\
+\x4f\xd4\x01\x68\xfe\x0c\xb6\x05\x0c\xc5\x25\x0a\x1c\xcc\xd7\xc3\
+\x37\x86\x84\x23\x71\x51\xb2\xf3\x0b\x1f\xfb\x75\xe5\xea\xf9\x47\
+\xd3\x4f\xa3\x50\x26\x00\xcc\x89\x7a\xff\xf9\xa7\xea\xa2\xc2\xc3\
+\x06\x43\xf7\xb4\xd3\xeb\xfa\xb4\x6a\x04\xc8\x66\xb7\xab\xaa\x6a\
+\x6a\xfd\x85\x6e\xb3\x89\x8d\x8a\x14\x5a\xae\x4d\x7c\x2c\x3e\x44\
+\x3a\x06\x55\x12\x3f\x44\x6b\x82\xdf\x2f\xac\x38\x8c\xab\x52\xca\
+\x61\x10\xfa\xd5\xcf\x3f\x6e\x46\x48\x68\xcf\xe4\xb0\xb0\xbe\x9d\
+\xbb\x76\xbb\xb1\xf7\xa0\xc1\x2f\x4c\x4f\xee\x79\xe7\x1b\x51\x51\
+\xc3\xd2\x64\x32\x8d\xd9\x5b\x92\x37\x31\xba\xa3\xd1\x84\x67\xc2\
+\xbf\xfb\xf3\x88\xc8\x94\x49\x5a\x6d\x74\x37\xb0\xce\x3e\x3e\x91\
+\x3d\xe1\xf4\x8d\x60\xbf\x82\xe5\x81\xe1\x7b\x87\xf9\x7a\x98\x6c\
+\x4e\xe2\x87\xb8\x24\x35\x75\xf5\x51\x35\xf5\x0d\x7e\x42\x97\x10\
+\x28\xaf\xac\xc2\x3d\xc1\x5a\x55\x53\xb4\x34\xad\x1a\x01\x2a\xad\
+\xa8\xbc\xe3\xd1\x57\xde\xfc\xba\xa5\x6a\x00\x4d\x1d\x33\x92\x59\
+\xbd\x65\xbb\xd0\x73\x5d\xa6\x8d\x1d\xc5\xdf\x32\x6b\xc6\x37\xd0\
+\xc4\xa4\x49\x82\x68\x2f\xf0\xba\xc3\xbd\x36\xf0\x21\x24\x08\x0c\
+\xc3\xd3\xe0\xe3\x7d\x2d\x96\xfa\xa9\x46\x63\xd5\x94\xea\xaa\x13\
+\x1d\x4c\xa6\xaa\xbf\x57\x6e\xd8\x6c\x06\x87\x35\x82\x6d\xbb\xdd\
+\xb9\xab\x83\xd5\xd2\x70\xce\x39\x3d\xf3\x18\xc6\xa0\x5a\x89\xcf\
+\xe5\x61\x8c\xc6\x07\x2b\xec\x3b\xc1\x48\x8e\x42\xe1\x7c\x9e\x92\
+\x2b\x7c\x19\x85\xdc\x17\x5a\x22\x4e\x2c\x96\x58\xb4\xda\x98\x33\
+\x6a\x4d\xd8\x9f\xe0\x38\x04\x86\xa2\x06\x73\x79\xf0\x0f\xaf\x01\
+\xab\x14\xda\x04\xd1\x6c\x76\x1d\x38\xf4\xc5\xaf\x2b\xd7\xcc\xae\
+\xa8\xae\x09\x10\x5c\x5e\x0f\x3e\x58\xdd\x7e\xdd\xd5\xcc\xa4\x51\
+\x23\x7a\x40\xf7\x94\xd3\xeb\xfa\xb4\xba\x00\x7a\xf8\xe5\x37\x16\
+\xc2\x7f\xa3\xd9\xcb\xe0\x7b\x75\xed\xcc\x68\x7d\x34\xf0\xe5\x3b\
+\x2c\x78\x5c\x97\xfb\x6e\xbd\xd1\x3e\x32\xa5\xff\x42\x68\xde\xe3\
+\xf4\x10\x84\x4b\x21\x03\x11\xd4\x81\xe7\xb9\x58\x96\xb5\x69\x79\
+\xde\xae\xb2\xdb\xcd\x91\x20\x8a\x12\x2d\xe6\xda\x70\x68\xcb\x78\
+\x86\x17\xf3\x3c\x2b\xb5\xdb\x8c\x32\xe8\x4b\x39\xde\x8e\x6d\x31\
+\xb4\x61\xcc\x60\x25\xac\xdd\xa2\xd0\xeb\x8b\xfc\x9f\xb4\x56\xfa\
+\xd7\xdb\xf4\x2a\x1b\x67\x6f\xd1\xe5\xaf\x98\xab\xf3\x85\x32\xda\
+\x1e\x1c\x92\x5c\x11\x1a\xda\x67\xa7\xd6\x37\xf6\x80\x5c\xee\x5b\
+\x26\x16\x4b\x51\xc8\xf0\x30\xe0\x32\xf8\x3f\x18\x79\x71\x00\x63\
+\x45\x22\x49\x9d\x48\x24\xc6\x7c\x1d\x9c\xd2\xa2\x15\x3a\x44\xab\
+\x71\x3c\xe3\xcc\xab\x8b\x57\xae\xb9\x35\x2b\x2f\xdf\x11\xea\x27\
+\x9c\xc0\x83\x3f\x03\x0f\xfe\xdd\xa1\x49\x02\x08\x10\x17\x97\x55\
+\xcc\x7b\xf4\xd5\x37\xbf\x6c\x09\x01\x74\xf3\x35\x57\x31\xa9\x87\
+\x8f\x32\x99\x79\xb8\x20\xc3\xb5\x79\xf7\xb9\x27\xcb\x62\x23\x23\
+\x3e\x87\xe6\x2b\x4e\x0f\x41\xb8\x34\x18\xc7\xc1\x90\x3e\x56\xb8\
+\xc5\xb0\x0a\x8a\x19\x8c\x1e\x35\x5a\x63\x1f\xaf\xe3\x46\xc3\xdc\
+\x23\x2c\x7c\x86\xdb\xdc\xc8\x40\x14\x29\x60\x28\xf1\xe7\x38\x6b\
+\x18\xb4\x43\x41\x28\x69\x18\xe7\x75\xcf\x32\x22\x31\x26\x1b\x9b\
+\x25\x12\xb9\x1e\x84\x8b\x4e\x2c\x96\xe9\xc1\x8f\x42\x06\xf3\x6e\
+\x30\x52\xd3\x38\x08\xe1\x11\xa7\x8e\x1b\x0d\xcf\xe1\x6b\xb3\xc0\
+\xf0\xc2\xc7\x04\x40\x9c\xf6\x6b\xbd\xa7\x36\x82\xb8\x04\x2c\xcb\
+\x8e\x2c\x2a\x2b\x7f\xe1\xf5\xff\x7e\x39\xba\xae\xbe\xa1\xd9\xf7\
+\x36\x4f\x61\x50\x9f\x5e\xcc\xa3\x77\xdd\x86\x11\xa0\x93\x4e\x8f\
+\xeb\xd3\x9a\x02\xc8\x27\xb7\xb0\xe8\xae\xa7\xdf\x7c\xff\xbd\x96\
+\x10\x40\x6f\x3e\xfd\x28\x03\x5f\x38\x46\xa7\xff\x27\x04\xef\xaa\
+\xfc\xf4\xd1\xdb\x9b\xe5\x32\xd9\xfb\xd0\x5c\xe3\xf4\x10\x84\xc7\
+\x83\x22\x4a\x0b\xda\x24\x08\x86\x94\x00\x38\x82\x38\xc2\xeb\x5e\
+\x84\x22\x06\x44\x8b\xc8\x02\xe2\x07\x45\x0f\x5e\xc0\x78\xc4\x9c\
+\x1b\x14\x33\x28\x74\xce\x16\x40\x8d\x22\x88\x44\x0e\xe1\xaa\xf8\
+\x80\xcd\x33\x18\x4d\xf3\xff\xef\x9d\x0f\xbb\x95\x94\xd3\x76\x35\
+\x48\xb7\x4e\x09\xcc\x4b\x8f\xdc\xdf\x1f\x9a\x47\xc0\xf0\xba\x77\
+\x79\xf0\xa9\xae\x55\x00\x95\x1c\x5e\x55\x53\x1b\x2b\x74\x9b\x85\
+\x4a\xa9\x60\x22\x42\x43\x79\xbd\xc1\xe8\xf2\x83\x22\xae\x00\x03\
+\xf1\x93\x01\xcd\x34\xa7\x87\x20\xbc\x02\x14\x33\xb5\x20\x74\xb0\
+\x4a\xee\x01\x91\x48\xbc\x43\x24\x92\x6c\x87\xe3\x2e\xb0\x54\xf0\
+\xe1\xf5\x80\xd7\x05\x16\x2b\xc2\x69\x2a\x8c\xec\xa0\x08\xc2\xed\
+\x62\x30\x12\x84\x86\xbf\xe3\xec\x88\x10\x41\xb8\x22\xf8\xdd\x5d\
+\x29\x93\x49\xd7\x04\xf8\xf9\x55\x3b\x5d\x84\x10\x9c\xc0\x6a\xd0\
+\xb8\x2a\xd5\x2d\x68\x35\x01\x64\x34\x99\x13\xce\xe4\xe4\xf5\x68\
+\x89\xe8\x4f\xe7\xf8\x8e\x4c\x5d\x43\x03\x0f\xc2\xc2\x0e\x03\x29\
+\xce\xff\xbb\xec\x00\x19\x19\x1e\x8a\x07\x4c\xbc\xa4\xc7\x02\x82\
+\x20\x08\xcf\x24\x17\x1e\xf2\xb7\x75\x8c\x89\x3a\x26\xf4\xbd\x1e\
+\x9d\xc1\x21\x80\xb0\x38\xa4\xdb\xd4\x02\x6a\x35\x01\x54\xaf\xd7\
+\xc7\xa5\x67\xe5\xb4\x48\x9d\x84\xf8\xd8\x18\xbe\xae\x41\x67\xf7\
+\xf7\xd5\xea\x24\x12\x31\x86\xc7\x5d\x96\xf0\x10\x14\xc0\x8e\xa7\
+\x58\xb7\x08\x01\x12\x2e\x0f\x5e\xa3\x38\xa0\xe0\x12\x53\xcc\xbb\
+\x21\x5a\x1f\x25\xcf\xb3\x5d\x39\xce\x36\x8c\x65\xad\xa3\xa0\xdd\
+\x1b\x7c\x58\x8d\x9b\x20\xfe\x46\x26\x95\xe6\x26\x74\x88\xc5\xa8\
+\x26\x01\xc0\x3d\x1a\x0f\x78\xcf\xc7\x29\x42\xb7\xa0\x15\x23\x40\
+\xa6\x80\x92\xf2\x0a\x4c\xaa\x6c\x36\x71\x31\x51\x9c\xc1\x68\xd2\
+\x47\x85\x87\x61\xad\x13\x97\x0e\x8f\x47\x86\x85\x52\xfe\x02\xd1\
+\x12\xa8\x58\x9e\xed\x60\xb4\x9b\xfb\x57\x98\x6b\x26\x14\x1b\x2b\
+\xa6\xe9\x6c\x86\xc1\x66\xd6\xda\x9b\xe7\xb9\x8e\x70\x1e\x05\x11\
+\xd1\x72\xc0\x58\xc8\xfb\xd9\x38\x7b\x97\x5a\xab\x6e\xc4\x57\xd9\
+\xcb\x5f\x9f\xbc\xfd\xe1\xa5\x43\x36\xcd\xfb\xeb\xe5\x13\x5f\x7f\
+\x6c\xb5\x34\x4c\x83\xd7\x50\xed\x17\xe2\x6f\x38\x9e\x97\xda\xec\
+\x36\xb7\x99\xee\x69\x0b\xec\x2c\x1b\x0f\x07\x12\x40\x76\x3b\x2b\
+\x37\x99\xcd\x2d\xb2\x31\x5a\x42\x6c\x8c\x51\x24\x62\x0a\xe2\x63\
+\x63\x70\x99\xab\xcb\x81\xf5\x89\x1a\x89\x89\x88\xc0\x7d\x84\x68\
+\x07\x6f\xa2\x39\x68\x6a\xad\x0d\x23\x3e\xcb\x5c\xf2\xdf\xbe\xeb\
+\xae\xdf\x33\x78\xc3\xad\x7f\x8e\xd8\x34\xef\x97\xde\x6b\xe7\x6e\
+\xef\xbb\xf6\xfa\x03\xb9\x39\x6b\x16\x9a\xcd\x35\x33\x78\x9e\x8f\
+\x81\x9b\x36\x56\x59\xc7\xe8\x04\xae\xc6\x6a\xc5\xaa\x3c\x1e\x05\
+\x4e\xcb\xe3\x8d\x0b\x93\xb6\x83\x19\x9e\x0f\x07\x51\x19\xaf\xd7\
+\x95\xcc\xbe\x7e\xf7\x33\xeb\x87\x6e\xb8\x6d\xf5\xdb\xa7\xbe\x9f\
+\x99\xa5\x2b\x08\xad\xb2\xd4\xf9\xfc\x98\xbb\x7a\x78\x71\xd1\xce\
+\xff\x83\xd7\x5f\x07\x46\xef\x31\xe1\x00\xee\x6f\xb1\x79\x85\xc5\
+\x89\x42\x97\x00\xe0\x3d\x89\x86\x03\xae\x0e\x75\x0b\x5a\x4d\x00\
+\x01\x22\x50\xc8\xcd\xce\xff\xc1\x88\x4f\x48\x50\x60\x59\xa0\xbf\
+\xdf\xde\x0e\xd1\x91\x59\x2d\x91\x53\xd4\x92\x84\x06\x05\x31\x23\
+\x07\x0d\x10\x7a\x20\x80\x22\xc3\x8b\xe0\x50\xee\xec\x11\xc4\x65\
+\x23\x3f\x51\x97\x75\xf7\xdc\xdd\xcf\xfc\xf0\x61\xc6\xcf\xd3\xce\
+\xad\xaf\x63\xe1\xac\xd2\xf1\x27\xbf\x1c\xd3\x7d\xc3\xad\x3f\x76\
+\x5e\x35\x33\x6f\xe4\xa6\xbb\xd2\x5f\x3f\xf9\xcd\x1f\x27\xeb\xb3\
+\xe7\x5b\x38\x5b\x17\x78\x09\x4e\x97\xe1\xcf\x9c\xbd\x74\xdd\x9b\
+\xc1\x7f\x3f\xbe\x0f\x8d\xef\x89\x84\x67\xf8\xc0\x7a\x9b\x7e\xd8\
+\xc6\xb2\xd4\x97\xe7\xef\x7f\x6d\x7b\xaf\xb5\x73\xf3\x12\xff\x9a\
+\x91\xd9\x6b\xeb\x82\xaf\xd2\x6a\x33\x62\xf1\x3d\x86\xd7\xfd\x8b\
+\x71\x27\xbf\x48\x3a\x7d\xfa\xf7\xa7\x39\xce\x8e\xfb\x6b\xfc\xeb\
+\x33\x21\xbc\x93\x06\xbd\x21\x26\x23\x3b\x97\x04\xd0\x59\xe8\xf4\
+\x06\x9c\xf5\x71\x9b\x1d\xe1\x5b\x53\x00\xb5\x08\x51\xe1\x8e\x6d\
+\xc4\x0a\x82\x03\x02\x76\x04\xf9\xfb\x17\xf1\x9c\x6b\x09\xa0\x39\
+\xd3\x27\xe3\x9e\x67\x42\x8f\x61\x82\x03\xfc\x71\x1f\x14\x2c\xb1\
+\x4f\x10\x97\x8b\xef\xfa\xd2\x3d\xef\xdc\x77\xf0\xcd\xe7\x72\xf5\
+\xc5\x8e\x64\xb2\x8b\xc1\x33\x9c\xa8\xd4\x54\xe5\xb7\x38\x6f\xed\
+\xb0\xdb\x53\x5f\x7c\x6d\xfc\xe6\x05\x3b\xb7\x6d\x79\xa4\x60\xfb\
+\xd6\xc7\xcb\x0e\xec\x7f\xe7\x44\x69\xe9\xbe\x1f\x2c\x96\xba\x79\
+\x70\xd3\xee\x23\x44\x8a\xf0\xc9\xcc\x1b\x04\x91\x1c\x23\x3b\xf0\
+\xef\x4e\xb6\x5a\x1a\xae\x2b\x2f\x3b\xf8\xf1\xfd\x07\xdf\x3c\x3c\
+\x61\xcb\x3d\xa5\x63\x37\xdf\x5d\x3e\x6a\xd3\x5d\x99\x53\xb6\xde\
+\xbf\xec\xa9\xb4\x8f\x16\xec\xa8\x38\xdc\xd9\xc8\x9a\x9a\x34\x8d\
+\xa1\xd7\x15\xc7\x65\x64\x2c\x5e\xc3\x71\x36\xcc\x09\xa2\xa9\x0f\
+\x2f\xc7\x6e\xb7\x2b\x0c\x46\xa3\xdb\x44\x3b\xda\x82\x7a\x9d\x1e\
+\xa7\x89\xdd\x26\x57\xb1\xd5\xea\x00\x9d\xca\xcc\x7e\xf1\xe5\x0f\
+\x3f\x7d\xb1\xb9\x11\x9b\xc1\xfd\xfa\x58\x1f\x99\x77\xcb\x12\xf8\
+\xb2\xbd\x53\x59\x53\xdb\x0f\x2b\x4b\xa3\xdf\x15\x22\x41\xfd\x7b\
+\xf6\xe0\x9e\x5c\x30\x4f\x77\x2c\xfd\x74\xe6\x92\xd5\xeb\x43\x0c\
+\x26\x93\xef\xfb\xcf\x3f\xf5\x03\x9c\xfa\x12\x2c\xdd\xf1\x22\x82\
+\x68\x02\x46\xbb\x39\xe5\xa7\xbc\x35\x4f\xfe\x9c\xb7\x66\x34\x8a\
+\x1a\x96\x3f\x6b\x67\xcf\xcb\x04\xab\x28\xcb\x44\x32\x56\x2b\x53\
+\x9b\x03\xe5\x7e\x06\x5f\x99\xc6\x24\x17\xcb\xec\x12\xb1\x98\x93\
+\x8a\xa4\x8e\xe4\x7c\x95\x44\x61\xed\x13\xd0\xf9\xcc\x9c\xb0\x94\
+\xd5\x6a\x4d\xd8\x26\x91\x48\x5c\x06\x6e\x77\x4a\xdc\x97\xf2\x0c\
+\xef\x0f\xef\x5b\x52\x46\x43\xee\xe8\xed\x15\x87\x87\x81\x68\x8c\
+\xb0\x70\x56\x99\x8d\x63\x25\x76\xce\x2e\xb1\x72\x36\xa9\x81\x35\
+\x29\xea\xac\x3a\x35\x5a\x63\x64\xe7\x4a\x23\xd3\xf8\xbe\xe2\x6e\
+\xfb\xbd\xfc\x93\x0a\xbf\xef\xf7\xc4\xab\x2a\x55\xf0\x4a\x70\xe3\
+\x92\x7e\xc2\x0b\x29\xab\xac\xba\xf3\x8b\x9f\x7e\x7b\xe6\x54\x66\
+\x16\xe6\xbd\x10\xc0\x63\xf3\x6f\x33\xa5\xf4\xee\x75\x15\x34\x37\
+\x39\x3d\xae\x4d\xab\x0a\xa0\x97\x3e\xf8\xef\x4b\x42\xf7\x8a\x99\
+\x33\x7d\x4a\xdd\xac\xc9\xe3\xbf\x87\x41\xeb\xdd\x9a\xda\xba\xe1\
+\xf7\x3e\xf7\xca\x62\xe1\x54\xbb\x72\xd7\xf5\xd7\x71\xe3\x87\x0f\
+\x29\x80\xe6\xd3\x20\xce\x0a\xf3\x8b\x4b\x86\x1c\xcb\x38\x33\x65\
+\xe6\xc4\x71\xb8\xc3\x34\xee\x34\xed\x92\xf9\x4a\x84\x4b\x21\xe1\
+\x79\x2e\x6c\x43\x59\xea\x53\x9b\xca\xf6\x0f\xde\x55\x99\xd6\xa5\
+\xca\x52\xeb\xd3\x12\x53\xc7\xe7\x03\x6f\xe0\x42\x93\x11\x31\x62\
+\x3e\x48\xe1\x67\x48\xf0\x89\xae\x88\x50\x85\xd4\x68\xa4\xca\xbf\
+\xf3\xd6\x44\x30\x2c\xe0\x51\x2c\x12\xf3\x52\x91\x84\x05\xf1\x64\
+\x93\x4b\xc0\xe0\x88\x7d\x3c\xc7\x39\x8a\x1c\x62\x08\x19\x45\x81\
+\x98\x05\x61\xc0\x4a\xc5\x12\x50\x6d\x62\x0e\xfe\x3b\x9c\x0c\x5e\
+\xab\x92\xc8\xcd\x2a\x89\xd2\x08\x3f\x67\x81\x73\x76\x7c\x68\xb1\
+\xf3\xac\xd4\xc6\xd9\xe5\x20\x4e\xd0\x14\x16\x38\x82\x58\x91\xb2\
+\x3c\x87\x53\x53\x8e\xdf\x29\xbc\x4e\x02\x22\x50\x02\x62\x46\x0a\
+\xc2\x45\x6e\x65\x6d\x32\x33\x1c\x51\xd8\xe0\xeb\xf0\x35\x56\xf8\
+\xb9\x7a\x9b\x5e\x53\x64\x2c\x0f\x02\x0b\x30\xb2\x66\x79\xa3\x70\
+\x6c\xed\xf7\x70\x40\x60\x8f\xdc\x37\xa2\x46\xee\x8a\x8a\x1e\xf1\
+\xb9\x54\xaa\xda\x07\xae\xd6\x19\x48\x09\x97\xc5\x66\xb7\x0f\xd8\
+\xba\x67\xdf\x43\x0b\x7f\xfd\x03\x37\xd7\x25\x80\x3b\xe7\x5e\x6b\
+\x9f\x30\x62\xe8\x14\x68\x6e\x74\x7a\x5c\x1b\x97\x17\x40\x0f\xdc\
+\x76\x53\xf1\xf0\x81\xfd\x70\x3b\x8d\xcf\x6a\xea\xea\xc7\xde\xf3\
+\x7f\x2f\xff\x26\x9c\x6a\x57\x3e\x79\xe5\xb9\xaa\xb0\xe0\xa0\xe5\
+\xd0\x7c\x14\xcc\x6c\xb6\x58\xfb\x1c\x4b\xcf\x78\x64\x60\xef\x9e\
+\x67\xa0\xff\x0b\x18\x4e\x85\x11\xc4\x79\x81\xef\x73\xa8\xc9\x58\
+\x31\xa5\xb8\x78\xf7\x75\xf7\x15\x6d\x1c\x50\x60\x2c\x0b\x6c\xe9\
+\xfd\xb4\xae\x84\xb3\x45\x12\x82\x42\x09\x44\x0f\x08\x1a\x29\x88\
+\x1c\x14\x37\xe2\xff\x19\x30\x1a\x23\x23\x28\x86\x30\x67\x0f\x44\
+\x10\x8f\xd1\x26\x99\x48\xca\x82\x70\xb2\xe3\x11\xcf\xe3\x6b\x51\
+\xa0\x80\xd8\x11\xe3\xbf\xd5\xc6\x83\xa1\xa0\x01\xb1\x72\x76\xc4\
+\x0b\xc5\x15\xc7\x73\xf0\x87\x80\x10\xe2\xfe\x79\x3d\x88\x22\xf8\
+\x8f\x73\x2d\x92\x5b\xd8\x12\x7c\xa1\x88\xa8\x0d\x8f\x18\x70\xbc\
+\x4b\xd7\x1b\x7e\x91\xc9\xd4\x30\x16\x88\x28\xf7\xcf\xbb\xd0\x66\
+\xe7\x17\xce\x7f\xe6\xad\xf7\xdf\x15\xfa\x5e\xcf\x75\x53\x27\x71\
+\xd7\x4d\x9d\x38\x19\x9a\x1b\x9c\x1e\xd7\xc6\xe5\x73\x80\x82\x02\
+\xfc\x70\x55\x15\x56\xde\x14\xd9\x59\xd6\x65\x92\xab\x58\x96\xc5\
+\x42\x87\x18\xed\xc1\xe2\x07\x36\x91\x08\x46\x66\xb1\x18\x57\xe2\
+\xe0\x06\x79\x97\xcc\xdf\x20\xbc\x17\xb8\x99\x27\x1d\xa8\x39\xb9\
+\xe0\xa9\xf4\xef\x1f\x9e\x7a\xfa\x87\x49\xb9\x86\xe2\x60\x57\x10\
+\x3f\x08\x8a\x8b\xb3\x0d\x85\x09\x4e\x1d\xe9\xed\x46\x05\x6e\x7a\
+\x5a\x6b\x6d\x50\x9f\x6b\xd5\x96\x7a\x4d\x85\xb9\x46\x5b\x66\xae\
+\xf6\xc5\xe9\xbb\x62\x53\x85\x7f\x81\xa1\x2c\x30\x5b\x5f\x14\x92\
+\x5e\x9f\x1b\x71\xac\x2e\x33\x1a\x93\x8b\xd1\xb0\x7d\xb2\x3e\x3b\
+\xf2\x8c\x2e\x3f\x0c\xf3\x9c\x30\x72\x83\xaf\xc7\x9f\x6d\x34\xfc\
+\x5d\xb8\xfa\x0a\x7f\x2f\xfe\x37\xf1\xbf\x8d\x7f\x03\xfe\x2d\xae\
+\x22\x7e\x90\x05\x96\xd2\x80\x59\xf9\xab\x87\xdd\x97\xf6\xfe\x83\
+\xab\x8a\x77\xbe\x68\xb5\xea\x66\x82\xdb\xe5\xc7\x54\xa2\xc5\xd0\
+\xa9\x94\x8a\x7f\x12\x40\x09\x2c\x86\xe8\x32\xd7\x67\x53\x68\xad\
+\x8b\xd5\x11\xa2\x16\xda\xcd\xc2\x4f\xab\xc5\x52\xf9\x66\x78\xec\
+\x94\x59\x2c\x16\x97\xa9\xc3\x61\xb7\xdb\x71\xca\xa0\xd4\xd9\x73\
+\x64\xbf\x27\xb2\x76\x7b\x04\x34\x71\x55\x80\x23\x73\x9b\x20\xce\
+\x05\xae\x8b\x0e\x27\xea\xb3\xae\x79\x2f\xfd\xc7\xdb\xd7\x94\xec\
+\xea\xe5\x6a\x37\x75\xe2\xf2\xc0\xcf\x6f\x73\xd9\xfe\x6e\xaf\x9f\
+\xfc\xe6\xa6\xe2\xa2\x5d\x8f\x9a\x8c\x95\xf3\xc1\xed\x36\xab\x60\
+\x88\xe6\x21\x12\x89\x38\xa9\xd4\x39\x2d\x4c\x30\x8c\xc1\x68\x22\
+\x01\x04\x88\x61\xa0\x6f\x91\xdf\xad\x51\xab\x6d\xf0\xbb\x2c\x60\
+\x72\x9d\xc1\xe8\x32\x91\x15\x9b\xdd\x2e\x6c\xfe\xe8\x40\x5c\x5d\
+\x57\x17\x2f\x16\x8b\x03\xa0\x8d\x7f\x23\xee\xa8\x4d\x10\xff\x82\
+\x67\x78\xdf\x5c\x43\xf1\xf8\x6f\xb3\x57\xcc\x3d\x58\x73\x2a\x4e\
+\x70\x13\x1e\x00\x46\xad\x26\x9f\xfa\x6a\xf0\x1d\x69\xef\x3d\xa9\
+\x6b\x28\xb8\x1d\x5c\x58\x0c\x8e\x84\xad\x87\x23\x11\x8b\x6d\x5a\
+\x8d\x06\x67\x29\x08\xc0\x66\xc3\x2d\xfd\xdc\xe7\x7b\xdf\x5a\x02\
+\x48\x02\x4f\xb5\x2d\xf2\xbb\x55\x0a\x85\x09\xc4\x8f\xd1\x21\x80\
+\xf4\xfa\x20\xc1\xdd\xee\xd8\x6c\x76\x5c\xfe\x88\x11\x1f\x44\x04\
+\x7f\x67\x43\x80\xbf\x1f\x6e\x86\x82\xd3\x75\x16\x87\xf7\xfc\xe0\
+\xd3\x21\x15\x53\xf3\x3e\x54\x55\x96\xba\x51\x7f\x14\x6c\x9e\xbd\
+\xae\x74\x77\x4f\xc1\x47\x78\x10\x38\x8d\x79\xa8\x26\xa3\xc3\xbe\
+\xd4\xff\xbc\x62\xb5\x36\x5c\x0f\x92\x37\x0a\xdc\x74\xad\x7b\x30\
+\x32\x99\xcc\x14\x14\x10\x40\xd3\x60\x02\x36\x3b\xee\x67\xec\xd0\
+\x15\x6e\x21\x82\x5a\x4f\x00\x71\x5c\x8b\xe4\x34\x28\x14\x72\x14\
+\x14\xf5\x28\x80\x1a\xf4\x06\x8c\xb0\xb8\x04\x56\x9b\x1d\x6b\x1d\
+\x34\xfe\x3d\x6c\x44\x58\xe8\xce\x88\xd0\x90\x6d\xd0\xde\x0c\x96\
+\xe5\xf0\xfe\x2f\x2a\x10\x4e\x78\xf3\x0b\x07\xa3\xa7\x43\xef\x00\
+\x3e\x67\x3e\xca\x62\xa9\x1f\xb7\x30\x6b\xd9\x43\xdf\xe6\x2c\x1f\
+\x43\x53\x5e\x9e\x0b\x4e\x89\xe9\xf5\xc5\xc1\x85\x85\xdb\xde\x37\
+\x99\xaa\x6f\xe5\x38\x5b\x0a\xb8\xb1\x38\x1c\x15\x4f\xf4\x40\x64\
+\x52\xa9\x29\x24\x30\x00\x37\xbf\x26\x00\x41\x00\xe1\xf8\xe6\xd5\
+\x02\x48\xc6\xb2\x5c\xb3\x9f\x7c\x34\x2a\x47\x8d\xa9\x3a\x91\x48\
+\x54\x05\x02\x48\xa2\x33\x18\x5c\x68\x6a\x89\xc7\x55\x2d\x7f\x47\
+\x7a\xe0\x42\x38\xea\xa3\x56\xbf\x07\xcd\x0f\xc1\x8e\x38\x9c\xe7\
+\x60\xb1\x5a\x7b\xe4\x16\x15\xdd\x05\xcd\xbe\x60\x34\x20\x7a\x2e\
+\xf8\xd9\xfa\xda\x79\x36\xc1\xcc\x5a\x7b\xed\xaa\x3c\x72\xef\x4d\
+\x07\x5e\xff\x04\xc4\xcf\x68\x57\x49\x76\x26\x5a\x8f\xc7\xa4\x8c\
+\x68\xc2\xc9\xaf\x7d\x7a\x6d\xba\xf3\x95\x47\xd3\x3e\xfc\xa4\xa1\
+\x3e\xef\x66\x9e\xe7\xf0\xc1\x07\xa7\xc7\x5b\x6b\xcc\x25\xda\x01\
+\xa9\x54\x62\x00\x01\x44\xb5\xa0\x04\x84\x29\x30\xb7\xf9\x8e\xb7\
+\xca\x1f\x0a\x62\x45\xc6\x71\x6c\xb3\x05\x90\x4a\xa5\xc4\x03\x86\
+\x17\xf1\x0b\x26\x36\x9a\x4c\x2e\xb3\xcd\xbe\x44\x22\xc1\x24\x68\
+\x2c\x1e\x77\x36\x85\x60\xb8\x14\xd6\xf1\x2d\x38\x97\x53\x99\xd9\
+\xd7\x9a\xcd\x96\x81\xd0\xc4\xfc\x00\x97\xde\xd5\x9e\xb8\x22\x14\
+\x3c\xc3\x07\x80\xc8\x49\xc8\xd1\x17\xcd\x7e\xf4\xf0\x7b\x7f\xa4\
+\xac\xbf\x39\xf5\xf6\xd4\x17\x9f\x39\x5c\x93\xde\x81\x22\x3f\xde\
+\x05\x46\x83\xfe\x2a\xde\xd1\xa7\xff\x8e\x87\xdf\xb9\x71\xcf\x73\
+\x7f\xec\xae\x3c\xf2\x30\xcf\xb3\x1d\xe0\x14\xe5\x07\x79\x08\x70\
+\x1f\xd0\x07\x05\x06\x54\x0a\x5d\xaf\xc7\x6a\xa3\x29\x30\xac\x08\
+\x26\xb7\xdb\xd9\x66\x97\xc3\x96\xcb\x1c\xbf\xc2\x20\x12\x89\x1a\
+\x40\x54\x49\x0d\x26\x33\x2e\x33\x77\x09\xe0\x6f\x33\xc1\x01\xf7\
+\xfd\x6a\x32\xf9\x45\x25\x49\x51\xe1\xa1\xa8\xea\x50\x20\x91\x00\
+\xf2\x2c\x14\xe5\xe6\xea\x69\xaf\x9d\x58\xb8\x2c\x79\xcd\x75\xa7\
+\xc6\x6f\xb9\xe7\xeb\xd5\xc5\x3b\x7b\xe3\x12\x6e\x12\x3e\xde\x0d\
+\x0a\xa1\x7d\xd5\xc7\xe3\x6f\x4b\x7d\xe1\xd9\x9d\xdb\x9f\xd9\x65\
+\x30\x94\xbe\x0a\x6e\x8c\x66\xd3\xf7\xc2\xcd\x11\x8b\xc4\x86\x00\
+\x3f\x5f\x12\x40\x02\x67\x45\x80\xdc\x22\x0a\xd4\x3a\x7f\x24\xcf\
+\x2b\x6c\x76\x7b\xb3\xf7\xca\x91\xc9\x1c\x41\x24\xe7\x32\x78\x9e\
+\x97\x98\x4c\x66\x97\xd9\x77\x45\x2a\x91\xe0\xdf\x55\xeb\xec\x35\
+\x09\x11\x8c\x76\xea\xa0\x80\x00\xac\x10\x4d\x21\x53\x0f\x81\x67\
+\xf8\xe0\x6d\xe5\x07\xdf\x9a\xbf\xff\xd5\xc3\xb3\x76\x3e\xfe\xcd\
+\x6f\xf9\xeb\x87\xe0\x0d\x4f\x38\x4d\x10\xff\x62\xbe\x3e\x33\x6c\
+\xe4\xce\xc7\xe7\x4f\xde\x7a\xff\xe9\x57\x4f\x7c\xbd\xd5\x66\x33\
+\x8e\x03\x37\x46\x84\x08\x37\x04\x06\x75\xb3\x5a\xa5\x6a\x10\xba\
+\x5e\x0f\x25\x41\x03\xf0\xc4\xab\x6c\x09\x01\xa4\x90\x3b\x7e\x05\
+\xbe\xa3\x36\xb8\xd3\x88\xcd\x16\x8b\xcb\xd4\xd7\x10\x4b\xc4\xff\
+\xca\x01\xba\x04\x58\x54\x2e\x4c\xab\xd5\xe0\x3f\x68\x2b\xd8\x85\
+\x92\xa4\x09\xf7\x41\x6e\x36\xd7\xdc\xfd\xdc\xd1\x4f\x57\xbe\x7c\
+\xe2\xcb\x3b\x77\x55\x1c\x49\x2a\x37\x57\xfb\x9a\x58\x8b\x8c\x22\
+\x3e\xc4\xf9\xc0\xef\x05\xe6\x80\xd5\xdb\x74\xaa\x2c\x7d\x41\xe8\
+\x9f\x85\x9b\x53\x8e\x1d\xf9\xe2\x9b\xec\xac\xbf\x96\x82\x94\x9e\
+\x00\x2f\xa1\xfc\x30\x37\x43\x24\x12\xd9\xe5\x32\xe9\xdf\xdb\xc8\
+\x78\x3b\x76\xa7\x00\xc2\xef\xb1\x17\x0b\x20\x8e\x53\x59\xac\x56\
+\x47\x02\x4f\x73\x90\x49\xa5\x58\x76\x1f\x8b\x4c\x71\xf0\xa4\x2d\
+\xb6\x58\x6d\x2e\xb3\x03\xb3\x44\xec\x78\xeb\x9a\xfa\x21\x4b\x6b\
+\xeb\xea\x47\xc0\xbf\x07\x43\x5a\x47\xc1\xa8\x64\xbe\x7b\xa3\xae\
+\xb1\x36\x8c\xb9\xef\xe8\x27\x0f\xaf\x2c\xde\xde\x0f\xab\x19\x63\
+\xa5\x62\x12\x3e\x44\x53\xc0\xef\x09\x5a\x83\xcd\xa0\x9c\x5d\xba\
+\x35\xf6\xba\xcc\x5f\x86\x17\x17\xed\x7a\xd1\x66\x33\x60\x25\x69\
+\xc2\xbd\xe0\xc4\x62\xb1\xe3\xae\x4f\x30\x8c\xf5\x1f\x01\xe4\x16\
+\x51\xf0\x56\xf9\x23\x59\x96\x53\x59\xad\xb6\x66\x47\x6b\xce\xda\
+\xa6\x8c\x87\xb6\xd8\x6a\xb3\xb9\xcc\x36\xfb\x62\xb1\x04\x6f\x76\
+\x4d\x7d\x62\x93\x1e\x4b\x3f\x3d\xc9\x64\xb1\xe0\x94\x19\xce\x17\
+\xe3\xf4\x19\xe1\xa6\xb0\x3c\x17\xfc\x55\xd6\xd2\xc7\xf7\x56\x1e\
+\x4b\x34\xda\xcd\x72\x12\x3e\x44\x73\x70\x6c\x31\x52\x97\xdd\x4f\
+\xaf\x2b\xc2\x3d\x94\xba\x3b\xbd\x84\x9b\xc0\xe3\xe6\xbf\x42\xdb\
+\xeb\x11\x72\x80\xf0\x41\xdf\x7b\x05\x10\xc7\x73\x72\x9b\xdd\x51\
+\x27\xa7\x59\xc0\xef\x11\x5a\x4e\x40\x05\xb9\xcc\x8d\x46\x2a\x11\
+\xe3\xdf\xd2\x94\xbf\x47\x61\xb1\xda\xba\x69\x7d\x34\xdd\x52\x7a\
+\xf7\xdc\x05\x7d\x8a\xfe\xb8\x37\x12\x1b\x67\x0b\xfe\x3d\x7f\xc3\
+\x10\x1b\x6f\xa3\x29\x0b\xa2\x45\x28\xc8\xdb\xa4\x38\x7d\xfa\x8f\
+\x51\xd0\x9c\xe8\xf4\x10\x6e\x82\x08\x1e\xce\xe9\x01\x48\xc0\x68\
+\x72\xcc\x06\x7a\x77\x04\x08\x13\x96\x59\x8e\x6d\xf6\xcd\x01\xc3\
+\x3e\xae\x8a\x44\xe2\xd8\xdd\xfa\x92\xa1\x4f\xf8\x37\xf8\x66\xe6\
+\xe6\x5d\xd3\xbf\x67\x0f\x95\x9f\x56\x8b\x02\x88\x12\xa0\xdd\x1b\
+\x4d\xad\x55\x97\x80\x4f\xed\x14\xf9\x21\x5a\x8a\x07\xb8\x7a\xe6\
+\xb6\xea\x83\x1d\x78\x9e\xed\x02\x5d\x12\xd6\xee\x03\xee\x7b\xe9\
+\x16\x37\xfb\x36\x04\xdf\x0f\xb7\x18\x1b\x5b\xe5\x83\x13\xc1\x77\
+\x42\x24\x12\x35\x5b\xbd\x70\xdc\x3f\x11\x20\x91\x88\xe1\xa5\x12\
+\xd7\xd9\x74\x4e\xd8\x00\xef\x52\x7b\xc0\x28\xcd\x16\x6b\xa7\xcd\
+\xbb\x53\x31\xb4\x8d\xaf\xc5\xcd\x53\x9b\x9a\x38\x4d\xb8\x20\x3c\
+\xcf\x05\x9c\xd1\xe5\xf7\x13\xba\x04\xd1\x62\x60\x82\x34\xdc\x4c\
+\xb1\xd6\x19\xed\x25\xe8\x26\xc0\x4d\x4e\xcc\x72\xcd\x2f\xfa\xeb\
+\x61\x34\x75\x76\xa4\xdd\x69\x15\x01\x24\x16\x8b\xec\x20\x56\x9a\
+\x9d\x18\xc6\xb2\x7f\x0b\x20\x7c\x33\x79\xa9\x54\xea\x32\xc9\x66\
+\x52\x89\xe3\x6f\xb9\xa8\x00\x02\x01\x17\x79\xe2\xf4\x99\xeb\x32\
+\xb2\x73\xe2\xed\x76\xbb\x0e\x5c\xb4\x6b\xb0\x9b\x03\x4f\xe8\x7e\
+\x47\x6a\x4f\x27\x0b\x5d\x82\x68\x61\x78\x5c\x3c\xe2\xe7\x6c\x13\
+\x2e\x0f\xcf\x4b\x60\x6c\x77\x99\xc5\x39\x2e\x84\xeb\x4e\xdf\x9c\
+\x45\x2b\x09\x20\xb1\x59\x21\x97\x37\x3b\xd2\xc1\xb2\x2c\x0a\x1f\
+\x47\x38\x4d\xc4\x88\x38\x99\xb4\xf9\xa2\xaa\xa5\x10\xa6\xc0\x2e\
+\xf6\x6f\xf4\xa9\xae\xab\x4f\xf9\x7e\xc9\xb2\xdb\x1a\xf4\x7a\x0d\
+\xc7\x33\x98\x13\xe5\x16\xaa\x98\xb8\x28\xf2\x52\x53\x95\xcb\x6c\
+\xca\x4b\x78\x06\x1f\xf2\x0a\x87\x89\xc5\x32\x7c\x48\xa2\x45\x12\
+\x6e\x02\x0f\xe3\xba\xd5\x66\x73\x99\xfa\x74\xed\x8d\x50\xba\x06\
+\xef\x8d\xde\x2b\x80\x24\x62\xb1\x51\x2e\x93\x35\x5f\x00\x39\xa7\
+\xc0\x9c\x22\x48\xc4\xf0\xf0\xe6\xba\xcc\xc0\x20\x91\x88\xf1\x03\
+\xbe\x60\x44\xc7\x64\xb6\xf4\xdc\x9e\x7a\xe0\x86\xca\x9a\x5a\x7f\
+\x9e\xe7\x45\x72\x99\x14\x37\x40\xa5\x50\xa9\xdb\x23\xe2\x94\x12\
+\xd7\xf9\x1e\x12\x9e\x83\x90\x36\x60\x00\xab\x76\x38\x08\x97\x87\
+\xe7\x39\xa5\xde\x68\xa4\x88\x9d\x80\xb3\xd2\x8b\xe3\xbe\xe8\xbd\
+\x02\x48\x24\x12\x9b\xe5\x72\x59\xb3\x8b\x43\xb1\xac\x43\x5f\xa0\
+\x00\x82\xb1\x41\xc4\xc2\xef\x74\x99\x1b\x8f\x4c\x2a\x75\xfc\x5d\
+\xce\xde\xff\x52\xaf\xd3\x25\xad\xd8\xb0\xd9\xb1\xa2\x83\x65\x39\
+\x7c\x9f\xc3\xc0\x48\x00\xb9\x39\x22\x91\xc4\xd0\xc5\xb7\x23\x56\
+\xf3\x26\x88\x16\x23\x22\x72\x10\x13\x19\x35\x14\x07\x3c\x1c\x37\
+\x29\x4f\xd0\x4d\x80\x87\x74\x75\x5d\x7d\x03\x45\x84\x05\x64\x52\
+\x47\xfe\x3e\x7e\x8f\xff\x49\xe0\x75\x61\x5a\x47\x00\x89\x45\x66\
+\xa9\x44\x7a\xde\x0d\x41\x2f\x07\x21\x07\x08\xff\x46\x34\x4e\x29\
+\x57\xb8\xda\xc0\x70\xc1\xf7\x0f\x57\x06\xd8\xed\xce\x9d\xbf\xd5\
+\xce\x4d\x5d\x31\x4c\xda\x2a\xef\x37\xd1\x76\x80\x10\x2f\x1f\x16\
+\xd2\x7b\x83\xd0\x25\x88\x16\xc3\xc7\x27\x32\x0f\x0e\xa7\x9d\x3d\
+\xc2\x1d\xb0\xd9\xed\xda\x8a\xaa\x1a\x7c\xb8\x25\x00\x99\x33\x02\
+\x84\xa9\x2a\x5e\x2c\x80\x18\xc6\x2a\x93\x49\x9b\x1d\xad\x61\x39\
+\x47\x04\x08\x45\x84\x14\x23\x40\x1a\xb5\x0a\xc3\xc3\xed\x8e\x44\
+\xe2\xd0\x35\x17\x8d\x00\x9d\x8d\x52\xe1\xa8\x09\x89\x82\xd0\x2d\
+\xc2\x82\xc4\x45\xa9\x8f\x54\x06\x1d\xf9\x25\x64\x70\xf5\xb7\xda\
+\x24\xb7\xb8\xc8\x09\xd7\xe5\x03\x4e\xea\xb0\x2e\x5d\x6f\xe0\xe3\
+\x13\xae\x5a\x0e\xae\xef\x9c\x67\x08\x77\xc0\x66\xb3\xfb\x94\x54\
+\x54\x92\x00\x12\x38\x6b\x0a\xcc\x7b\x05\x10\xe8\x02\x9b\x58\x24\
+\x76\xa8\x97\xe6\xc0\x71\x0e\xbd\xd0\x28\x80\x6c\x5a\x1f\x8d\x4b\
+\x6c\x3a\x27\x6c\x83\x81\x7f\x5c\x93\x04\x8d\x5a\xa5\xc2\x2f\x43\
+\x31\x58\xb3\xa3\x62\x44\xbb\xc3\x8b\xc5\xd2\xbc\x94\xc1\xcf\xde\
+\x39\x72\xf4\x7b\xba\xbf\x12\x66\xf3\xef\xda\x38\x06\x8d\x20\x9a\
+\xc2\x8f\x41\xfd\xfe\xb6\xb1\xe3\x3f\x43\xe3\x7d\x7c\x22\xbf\x97\
+\x4a\x95\xbf\xc0\x69\xda\x58\xd3\x8d\xb0\xb3\xac\xaa\xba\xae\xce\
+\x5f\xe8\x7a\x3d\x72\xb9\xa3\xfe\x31\xde\xfb\xbd\x39\x07\x88\x61\
+\xc5\xe2\xe6\x0b\x20\x21\x07\x08\xdf\x51\xb9\x58\x24\xb2\x04\xf8\
+\xf9\xba\x44\x11\x41\xf8\xb7\xe1\x01\x3f\xe0\x26\xdd\xf5\xfc\x7c\
+\x7c\x30\x24\xb8\x1d\xcc\x25\x22\x58\x44\xb3\xc1\xf2\x07\x5b\xc0\
+\xee\x86\x1b\xd7\x19\x89\x44\xee\x32\xab\x13\x09\xf7\x42\x24\x12\
+\xeb\x95\xca\xc0\x77\xa1\xf9\x31\x58\x3a\x98\x5b\xdc\x38\x08\x27\
+\x70\x8f\x92\xeb\x74\x7a\xac\xdd\x44\x00\xc2\x14\x18\xde\x17\xbd\
+\x57\x00\x01\x20\x80\x9a\xbf\x3f\x8a\xb0\xb5\xbe\x43\x00\x89\x40\
+\x00\xf9\xfb\xfa\x56\xa0\xa3\xbd\x39\x2b\x02\x74\x31\x91\xc7\x0b\
+\x3b\xc6\x33\x81\xfe\x7e\xf8\xba\x6d\x60\x24\x80\x3c\x03\xfc\xec\
+\xf1\x49\x7d\x75\x64\xd4\xd0\x47\xbb\x74\xbd\xf1\x2f\x10\x42\xb4\
+\x72\x87\x68\x22\x22\x5e\x22\x51\x58\x12\x12\xa6\xfd\xa8\x52\x05\
+\xdf\x0b\xed\xcf\xc1\x79\x0a\x8c\x76\x15\x77\x33\x30\xd7\xd3\x62\
+\xb3\x36\x7b\xdb\x27\x4f\x81\x04\x90\x93\x16\x89\x00\x99\xcc\x8e\
+\xf1\x00\x13\x68\x54\x20\x80\xcc\xbe\x3e\x1a\x97\x10\x40\x42\x04\
+\x08\xb9\xe0\xbf\x11\xfe\x5e\x5e\x2c\x72\x2c\x95\x67\x02\xfc\x7d\
+\xf1\x75\x98\xdc\x48\xab\x3b\x3c\x0b\xbd\x54\xaa\x5c\x9f\xd4\x79\
+\xd6\x3b\x63\xc7\x7f\xfe\xfe\xe6\x9e\x0f\xa4\x2e\x89\x1a\x67\x7b\
+\xdb\x62\x61\xd0\x08\xa2\x91\x2f\x95\x51\x0e\xdb\x3f\xe4\x2d\x76\
+\xc8\xd0\x17\xf3\x53\x06\x3d\xf3\x64\x58\x78\xff\x0f\x44\x22\xc9\
+\xef\x70\x1a\x57\x15\x52\x69\x05\xf7\x44\xc4\x73\xb4\x25\x4e\x23\
+\x32\x99\x43\x0b\x92\x00\x02\x01\xd0\xec\x08\x90\x00\x86\x17\xb5\
+\xf0\xfb\xac\x2a\x95\xca\x25\x9e\xb2\x79\xe7\x67\x8b\xff\x77\xc1\
+\x0f\x19\x6b\xff\x70\x3c\xe7\xb8\x30\xfc\xb4\x5a\x7c\x5d\x1d\x58\
+\xb3\x45\x21\xe1\x72\xc0\x67\x2a\xda\x2b\x16\x4b\x17\x46\x45\x0d\
+\x79\x3b\x2e\x6e\xc2\xb7\x51\xd1\xc3\x8f\x41\x9f\x3e\x6b\xe2\x5f\
+\xa8\xd4\x21\x35\x2a\x75\xf0\x26\x68\xfe\x07\x0c\xa3\x3e\x69\x60\
+\xa4\x94\xdd\x1c\xda\x13\xf0\x1f\xa4\xce\x05\x42\x78\xef\x6f\xa9\
+\xfb\x7f\xab\xd2\x9a\x53\x60\x2d\x72\x03\xb0\xb3\xac\x0f\x1c\xb0\
+\xd0\x94\x4d\x21\x93\xd5\x3b\x9c\xed\x0c\x28\x7e\xa1\x75\x71\x50\
+\x04\xe1\xd1\x57\x8b\xff\x04\xc6\x04\xe6\x16\x5f\x0a\xe2\x8a\xa8\
+\x90\xc9\x7c\x96\x07\x06\x75\x7d\x63\x60\xca\x33\x1f\x4c\xbb\x6a\
+\xc9\xf7\x9b\x7a\xdc\xb3\xef\xb7\x88\x51\xb6\xc5\x61\xc3\x9a\xf6\
+\x85\x21\x3c\x86\x85\x9a\xf8\xbf\x6d\x5b\xef\xc7\xf8\x71\x13\xbe\
+\x38\x31\x74\xd8\xab\xdf\xa9\xd5\xa1\xef\xc1\xe9\xaf\xc1\x68\x41\
+\x84\x07\x80\x63\x7c\xe3\x38\x4f\xfc\x1d\x01\x72\x9b\xf1\xae\xb5\
+\x04\x10\x27\x16\x39\xf3\x5f\x9a\x8b\xdd\xce\x6a\xe1\x80\x02\xc8\
+\x2e\x95\x4a\x5c\x22\x87\xe6\xac\x0a\xd5\x17\xfb\xe2\xff\x1d\x1a\
+\xf5\xf3\x71\x08\x20\x0c\x71\xd3\x8d\xd0\xb3\xc1\xcf\x37\x5f\x2c\
+\x96\x7e\x2f\x93\x69\x1e\x89\x8e\x1e\xf1\x56\x4c\xec\xe8\x25\x81\
+\x81\x49\xc7\x83\x14\x7e\x06\x71\x0b\x6c\x10\x4c\xb8\x3e\xf8\x39\
+\x3b\xa6\xc0\xc5\x12\x36\x20\x30\x29\xcb\xd7\x37\x16\xeb\x46\x7d\
+\x08\xf6\x3a\xd8\x46\x7c\x0d\x41\x78\x22\x42\x21\x44\xaf\x17\x40\
+\x2d\x86\xdd\x6e\x6f\x8c\x00\x71\xb8\xc7\x98\xc3\xd9\xce\x80\xe2\
+\xc7\x03\x8a\x9b\x8b\x56\x76\x6e\x0c\x8d\xfa\xfa\x3a\xa6\xc0\x68\
+\xa5\x90\x77\xa1\x93\xc9\x7d\x96\x85\x85\xf5\xbd\x29\xb1\xd3\xcc\
+\x37\x52\xc7\x7f\xb7\x6a\xcf\xa0\xd7\x52\x77\xf6\x7f\x36\xfb\x7b\
+\xff\xee\x24\x86\x3c\x88\x8f\x45\x1a\xe6\x13\xb1\x0f\xbf\x32\xfe\
+\x5a\xeb\xba\x2e\xb7\x95\x1f\x1f\xbf\xe8\xf0\xa8\x31\x1f\xee\x1a\
+\x39\xfa\xfd\xad\xbd\xfb\xdc\xf7\x89\x9f\x7f\xfc\xdd\xf0\xb2\x6f\
+\xc0\x6a\x1d\x3f\x40\x78\x0a\x62\xb8\x17\x38\xee\xf8\x84\x13\xb9\
+\x5c\xee\x56\xe3\x5a\xab\x0a\x20\x7c\x0a\x12\x9a\x57\x8c\xd5\x66\
+\xfb\x5b\x00\xc1\xef\x73\x89\xb0\x31\xfc\x4d\x78\xc0\xf7\xce\x51\
+\xe2\xf9\x7c\x9c\x1d\x16\x15\x22\x40\x84\x77\x82\xd7\xc0\xaf\x62\
+\xb1\x6c\x6e\x48\x48\xcf\xa9\x91\x91\x83\x5f\x1a\x3e\xe2\xcd\x2d\
+\x47\xc7\x2e\x4c\x3f\x3e\xee\x9b\xd3\xc7\xc6\x7e\x9d\xbb\xb6\xcb\
+\x6d\xba\x85\x9a\x8e\xec\xd7\xea\x58\x12\x45\x2e\x0c\x0a\x9d\x46\
+\x5b\x1a\x3d\x89\xdf\x9b\xf2\xaa\x65\xff\x90\xb7\xca\xa6\x4e\xff\
+\x35\x6b\xca\xb4\xc5\x19\xdd\x7b\xdc\xba\xbf\x53\xd2\xac\x6f\x95\
+\xca\x80\xeb\xe1\xe5\xa3\xc0\xc6\xe3\x8f\x81\xe5\x83\x11\x9e\x87\
+\x0c\x97\xc1\x0b\x6d\x02\x50\x2b\x95\x24\x80\x04\x5a\xe4\x8d\xb0\
+\xd9\x6c\x6a\x38\xa0\x82\xc0\xb0\xb2\x1d\x45\x55\x4b\x08\xab\xe6\
+\x80\x11\x20\x3b\xcb\x62\xf4\xe7\x42\xbb\x00\xcb\xe1\xc2\x70\x94\
+\x7f\x46\x02\xfd\x69\xaf\x3c\xc2\x01\x46\x00\x7e\x02\xbb\x4a\xad\
+\x0e\xed\x0e\x96\xac\xd1\x84\x4d\x01\x61\xb4\x4c\xeb\x1b\x5b\xa4\
+\x54\x06\xd5\xe2\x54\x99\x42\x2c\xb7\x53\x84\xc8\xf5\xc0\x71\x07\
+\x84\xac\x5d\xa9\x0c\x6c\x50\x28\x7c\x6b\x40\xe8\xa4\xf9\x07\x24\
+\x3c\x0b\xa7\x06\x83\x75\x03\x1b\x0e\x86\xfd\x4c\x30\xca\xf7\xf3\
+\x7c\x94\xf0\x30\x8c\xf7\x27\x42\xc0\xcf\x39\xdb\xe1\x36\x63\x57\
+\xab\x09\x20\xac\x03\x24\x95\x4a\x9a\x9d\x08\x6d\xb6\x5a\x1d\xcb\
+\xe0\xc1\x1c\x02\x48\x22\xd4\xd6\x69\x6f\x40\x98\xe1\x7b\x77\x5e\
+\xf5\x0f\x02\x29\xa8\x5e\xa7\xc7\xdd\xdf\x19\xad\x0f\xd5\xc8\x22\
+\x2e\x88\x0d\x6e\xab\x19\x01\x01\x9d\x6e\xef\x3f\xe0\xf1\x84\x21\
+\xc3\x5e\x89\xdf\x37\x61\xd1\xb3\x47\x27\x2e\x4a\xdf\x98\x7c\x3f\
+\xbf\x39\xf9\x7e\xe6\x87\xc0\xde\xcc\x7b\x76\xd1\xdf\x46\xb4\x0d\
+\x0b\x7d\x12\x1c\xf6\x57\xe2\x1c\x87\x1d\x1a\xfe\x01\x33\x65\xda\
+\x62\xeb\xe4\xa9\x3f\x9e\x1c\x3b\xfe\xb3\xa9\x5d\xbb\xdf\xdc\xc1\
+\xd7\xaf\xc3\x50\x89\x44\xf1\x3d\xbc\xdc\x25\x0a\xb4\x12\x6d\x0b\
+\x8c\xf3\x6a\xb3\xc5\x4a\xe1\xfd\xb3\x08\xf0\xd3\xe2\xf4\x08\x09\
+\x20\x99\x54\x6a\xd6\x6a\x34\x58\x31\xb7\x59\x58\xac\x36\x4c\x2b\
+\x77\xa4\x96\xc3\xf0\xcf\xa9\x55\x2a\x97\xc8\x03\xb2\xd9\xec\x17\
+\xfc\x90\x75\x06\x63\xff\xfd\x47\x8e\x8d\xc2\x69\xb0\x00\x5f\x5f\
+\xc1\x4b\x10\x17\x04\x45\x3d\x3e\x2c\x34\x88\x44\x92\x85\x32\x99\
+\xcf\x98\x0e\x1d\xc6\x75\x89\x8e\x19\x71\x43\x54\xf4\xf0\x4d\x52\
+\xa9\xda\x02\x7e\x9c\x02\xa6\xa8\x50\x1b\x23\x16\x4b\xad\xfe\xfe\
+\x09\xfb\xb4\xbe\xb1\xf7\x42\x37\x09\x6c\x1c\xd8\x3e\x30\x5c\x90\
+\x81\x9f\x1b\x7d\x26\x5e\x0a\x8c\xef\x2a\xb3\xc5\x42\x4f\xb8\x67\
+\x11\xe4\xef\x8f\x05\x62\xdd\x66\x85\x63\xab\x09\x20\x95\x52\x59\
+\x1b\x11\x1a\x5a\x29\x74\xaf\x18\x9b\xcd\x86\x8f\xbd\xce\xbf\x53\
+\x24\xe2\x02\xfd\xfc\x1a\x5c\x61\x7a\xc0\x62\x75\xd4\x2d\x3b\xef\
+\xdf\x51\x55\x53\xd3\xe9\xd0\xf1\x93\xc9\xd8\x0e\xa0\xe9\x2f\xa2\
+\xe9\xe0\xf7\x09\x1f\x1a\xaa\x44\x22\x71\xb6\x54\xaa\x5a\x15\x17\
+\x37\xe1\xae\x69\x57\xfd\x3a\x60\xc6\xcc\x65\xfd\x66\xcc\x5c\x71\
+\xf7\xf1\x71\xdf\xec\xdf\xd8\xfd\x6e\xf3\xfa\xae\x77\x30\x3f\x05\
+\x0f\x70\xd8\x87\xbc\xd2\x61\x44\xd3\x78\xd7\xc6\x3b\xec\x5b\xdf\
+\x2e\xcc\x5f\xf1\xd7\xfe\x6d\x7b\x53\x5e\x61\xce\x4c\xfd\x03\x6c\
+\x69\xdd\xe8\x31\x1f\xfe\x06\x76\x7d\x97\x2e\x73\x07\x45\x46\x0e\
+\xbe\x51\x22\x91\x2f\x86\x1f\x2d\x04\xc3\x68\x8f\xdb\x0c\xf0\x44\
+\xeb\x01\x02\x48\x09\x0f\xe8\x17\x4a\x83\xf0\x4a\x02\xfd\xfd\xcb\
+\xe0\xe0\x36\x15\xcd\x5b\x4d\x00\xf9\x6a\x7d\xf2\x3b\x27\xc4\xe1\
+\x5c\x78\xb3\x10\x04\x90\x23\xf6\x0f\xff\x67\x8f\x08\x0d\xa9\x10\
+\x89\xdb\x5f\x00\x19\x4d\x26\xcc\xfe\x3f\xef\x5d\xc7\x6a\xb3\xab\
+\x1a\xf4\x06\xc7\x93\x81\xbf\x16\x57\xf1\x13\xc4\x65\x83\xd1\x05\
+\x1d\x58\x1e\xd8\x71\xb0\x23\x60\x4b\x55\xaa\x90\x7b\xe2\x3a\x4e\
+\x9c\x12\x17\x37\xf1\x86\xa4\xa4\x6b\x3f\xf5\xf3\xeb\x98\x25\x91\
+\x28\xe8\x86\x7c\x45\x88\x78\xa9\x54\x69\xf0\xf5\x8b\x3b\x12\x13\
+\x3b\xe6\x83\xe0\x90\x1e\xd7\xc2\x7b\x39\x1e\xc4\xce\x0c\x38\xf9\
+\x22\xd8\x6a\x30\x7c\xdf\xb3\xc1\xb0\x90\x29\x45\x7b\x88\xbf\x01\
+\x01\x24\xb7\x5a\xad\xf4\xe4\x71\x16\x7e\x5a\x2d\x5e\x2b\x6e\xb3\
+\xe5\x13\x16\x71\x12\x9a\x2d\x0b\xcb\xb2\x89\x87\x8e\x9f\xbc\xff\
+\xdd\xaf\xbe\x7b\x48\x70\x5d\x11\x4f\xdc\x7d\x87\x6e\x40\xaf\xe4\
+\xaf\xa0\xf9\x38\xc7\x71\x31\x7f\xae\xdb\xf4\xd9\x8a\x0d\x9b\x27\
+\x5a\xac\xed\xbb\xff\xca\xf3\x0f\xde\x73\x38\xb9\x4b\xd2\x23\xd0\
+\xdc\xe1\xf4\x38\xa9\xa9\xab\xbf\xf1\xb7\x55\x6b\x1f\xd8\xb9\xff\
+\x60\x7f\xbb\x9d\x95\x4c\x1a\x35\x9c\xbf\x63\xf6\x35\x18\x16\x8c\
+\x05\xa3\x9d\x9e\x89\x96\x02\x93\x2f\xa3\xc1\xe2\xc1\x30\xcc\x28\
+\xe6\x79\x4e\xc6\xb2\x96\x70\xbb\xdd\xdc\xcd\x6e\x37\x76\xd1\x35\
+\x14\x45\xe8\x74\x05\x3e\x1c\xc7\xca\xf4\xfa\x12\x10\xec\x58\xb4\
+\x8d\x95\x18\x0c\x65\x62\x93\xb1\x5c\x82\x53\xb4\x0f\x70\xa8\xb1\
+\xdc\x93\x8f\xce\x5a\x83\xa0\x50\x06\x30\x1a\x4d\x04\x2b\x91\xc8\
+\x6c\x62\xb1\xdc\xea\xeb\x1b\x6b\xd2\x6a\xa3\x0d\x62\x89\x42\xaf\
+\xd1\x84\x36\x28\x95\x81\xf5\x22\x91\xb8\x46\x24\x92\x94\x82\xc8\
+\x29\x85\x1f\xa9\x01\x43\xe1\x88\x86\x6d\x5c\xa9\x55\x04\x46\x95\
+\x99\x89\x26\x61\xb5\xd9\x06\x6e\xdd\xb3\xef\xa1\x6f\x7e\x5b\x7a\
+\x83\xe0\xf2\x7a\x7e\xfd\xef\x7b\x6f\x89\xc5\x62\xac\x72\xee\x16\
+\x2b\x1f\x5b\x4d\x00\x01\x7e\x59\x79\x05\xf3\x9f\x7d\xfb\x83\xb7\
+\x85\xfe\x25\xf1\xd3\xfa\x30\xf5\x3a\xbd\xd0\x73\xf2\xd0\xed\x37\
+\xeb\x87\x0e\xe8\x8b\x02\xe8\x31\xf8\x5b\xc3\xf6\x1d\x39\xf6\x7f\
+\x9f\xff\xf8\xeb\x7c\x93\xd9\xfc\xf7\x2a\xab\xf6\xe0\xde\x5b\x6e\
+\xc8\x1c\x35\x68\x00\x56\x75\xfd\xd2\xe9\x71\x88\xbe\x84\x0d\x3b\
+\xf7\xbc\xf6\xeb\xca\x35\x33\xcd\x16\x8b\x1c\x6f\x30\x57\x8d\x1f\
+\xcd\xdf\x34\xf3\x2a\x7c\x7a\x8c\x03\x23\x01\xe4\xf9\x60\x54\x15\
+\xa3\x83\x78\x61\xb5\x75\xed\x27\xfc\xef\xfa\x83\xa1\x30\x8a\x02\
+\x0b\x00\xc3\x27\x54\xf4\xe3\xdf\xd5\x18\x4d\xc5\xf6\xdf\xd1\x5f\
+\x14\x45\x70\xc0\x84\x7e\x05\xcb\x5a\x15\x1c\x6b\x93\xf1\x0c\xa7\
+\x00\x41\xa5\xb2\x5a\xf5\xfe\x66\x73\x75\x88\xcd\xaa\x0f\x05\x11\
+\x15\xa8\xd7\x17\xfb\xe0\x6b\xf0\x67\x2c\x96\x06\xfc\x59\x47\x74\
+\xb6\x39\xc8\xe5\xbe\x8e\x41\x48\xad\x0a\xe2\x44\x22\xa9\x5d\xa5\
+\x0e\xb5\x4a\x24\x72\x93\x4a\x1d\xa2\x57\x29\x03\xf5\x62\x89\xac\
+\x41\x2c\x96\x36\xc8\x64\x3e\xf5\x52\xa9\xaa\x4e\x24\x12\xd5\x89\
+\xc5\x32\x54\x6e\x18\x6a\x3f\x7b\x51\x44\x63\x2e\x15\xbe\xef\x38\
+\x47\x8d\x62\x06\x2b\xb0\xa3\xe1\xd4\x22\x0e\x2e\x78\x2d\xe2\x6a\
+\x3c\x6c\xb7\xe5\x76\x25\x8d\xef\x13\x45\x91\x3c\x04\x78\x08\x1f\
+\xbc\x79\x77\xea\x43\xdf\x2f\x59\x36\x47\x70\x79\x35\x72\x99\x8c\
+\xf9\xe9\xa3\xb7\xb1\xe6\xd5\x52\x30\xb7\xd8\x1c\xba\x35\x05\x90\
+\xb4\xa8\xb4\xec\xce\x47\x5f\x7d\x0b\xd5\x60\x93\x18\x35\x68\x20\
+\xb3\x2d\x75\xbf\xd0\x73\x72\xef\xcd\xd7\xeb\x47\x0d\x1e\x88\xa5\
+\xe3\x1f\x85\xbf\x34\x20\x27\xbf\xf0\x8e\xd7\x3f\xf9\xe2\x55\xbd\
+\xd1\xd8\xae\x73\xaf\x57\x8d\x1f\x53\x76\xd3\xcc\xe9\x98\x17\xf0\
+\xa8\xd3\xc3\x30\x67\x72\xf3\x9e\xfe\x6d\xe5\xda\x79\x27\xce\x64\
+\x26\xa0\xf8\x41\xdf\xb5\x53\x26\x72\xb3\xa7\x4d\x2a\x87\x66\x67\
+\x30\xf7\x7d\xdc\x26\x2e\x01\xef\xdb\x60\x33\xf4\x2b\x30\x94\xf5\
+\x31\xb0\x66\x2d\x7c\xf8\xbc\x54\x24\xb5\x29\x24\x32\x73\xa8\x32\
+\x30\x27\x58\xee\x97\x26\x12\x89\x31\xf2\xe0\x8a\xd3\x55\x28\x86\
+\x30\xa2\x8a\x0f\x15\x28\x84\xb0\x8d\x47\xbc\xc6\x30\x8b\x3f\x58\
+\x30\x14\x57\x38\xb5\x8b\xe7\x50\x34\x21\xcd\x16\x40\x02\x38\x10\
+\x35\x0a\x18\x14\x2f\x28\x6e\x30\x94\x8e\x86\xd7\x0d\x1a\x3e\x40\
+\xa0\xe1\x96\x38\x28\x60\x50\xe0\xb8\xaa\xa0\x50\x1a\xec\xa6\xbe\
+\x15\xe6\xda\x2e\x0d\x76\x7d\x90\x9d\xb3\x63\x85\x38\x91\x42\x2c\
+\x37\x75\x56\x87\xe5\xcb\xe5\x5a\x9c\x5e\x43\x61\x46\xb8\x29\x56\
+\x9b\x2d\x05\x04\xd0\xc3\xdf\xfd\xfe\xe7\x5c\xc1\xe5\xd5\x84\x04\
+\x06\x30\x9f\xbe\xf6\xc2\x74\x68\x6e\x05\x73\x8b\x69\xb0\xd6\x14\
+\x40\x4c\x49\x79\xc5\xbc\x87\x5f\x7e\x63\xa1\xd0\xbd\x24\x53\xc7\
+\x8c\x64\x40\x3c\x30\xf9\x45\x25\x82\x87\x61\xee\x9c\x3b\xcb\x30\
+\x61\xc4\x30\x8c\x00\xa1\xd0\xf0\xa9\xae\xad\x9b\xf2\xe4\x1b\xef\
+\x7e\xa7\xd3\x1b\xda\xb5\xfe\x42\xf7\xa4\xc4\xfa\x17\x1f\xbe\x6f\
+\x2d\x34\xb1\xe8\x19\xc3\x71\x5c\xec\x0f\x4b\x57\xfc\xb0\x76\xdb\
+\xce\x11\x8d\xe2\x07\xb9\xe5\x9a\x19\xd6\x69\xe3\x46\x61\x2e\xd4\
+\x20\xb0\x7f\x87\xb7\x08\x0f\x81\x0f\x34\x1a\x2b\x27\x7e\x59\xb0\
+\xf1\xe6\xdf\x0b\x36\x0c\xab\xb6\xd4\x6b\x78\xac\xdb\xc9\x88\x79\
+\xac\xeb\x33\x22\xb4\x6f\xfa\xa3\xe1\x43\x77\x04\x04\x26\xa5\xc9\
+\x64\x3e\x07\x40\x08\x65\xe1\x0f\x39\x7f\x96\xf0\x20\xf0\xba\xf7\
+\xb1\xdb\x8c\xfd\xb2\x4c\xe5\xc9\xdb\x2b\x0e\x8f\xde\x54\xb6\xaf\
+\x6f\x96\xae\x20\x4c\x6f\x37\x3a\x22\xd6\x7e\x32\xad\xe9\xf7\x4e\
+\xd7\x9f\x8e\x88\x1c\xb4\x50\xa5\x0a\x5a\x02\x3f\x82\x4f\xca\x67\
+\x47\xb1\x08\x37\xc1\x6e\xb7\xf7\xde\xb9\xff\xd0\x83\x9f\xff\xf4\
+\xeb\xed\x82\xcb\xab\x49\x8c\x8b\x65\xfe\xf3\xe4\x23\xc3\xa0\x89\
+\x51\x0c\xb7\xc8\x4b\xfc\x3b\x0c\xde\x5a\x5c\xce\xd2\xdd\x06\xbd\
+\x81\xe9\x9a\x98\x20\xf4\x9c\xd8\x59\x16\x7f\xbe\xf1\x77\xd8\x55\
+\x4a\x65\x99\x44\xdc\xfe\xb5\x80\x0a\x4a\x4a\x65\xf0\xb7\xe1\x14\
+\x03\x3e\x09\x8b\x4a\x2b\x2a\x27\x15\x97\x95\x47\x38\x4e\x9e\x85\
+\x42\x29\xc7\x27\x5a\xcc\x31\xa0\x1b\x9e\x67\xe2\x6b\x30\x94\x4f\
+\xcd\x38\xf5\xcb\xc3\x9f\x67\x2e\x99\x58\x61\xae\xd1\xb2\x3c\x2b\
+\xc6\x6d\x50\xf0\x88\xfd\x3f\x0a\x36\x0d\x4c\xdd\xfb\xfa\xe3\xf9\
+\x79\x1b\x5f\x6f\xa8\xcf\xbb\x97\xe7\x59\x1c\x24\x30\xa2\x42\x78\
+\x0e\xfe\x1c\x67\xef\x6f\xb5\x34\x5c\x9f\x9d\xb5\xf2\x85\xeb\x76\
+\x3d\xf9\xee\xbb\xe9\x8b\xae\x3e\x5c\x93\xde\xa1\xc1\x66\x50\xe2\
+\xf7\x01\xad\xd6\xda\xa0\xae\xa9\xce\xe8\x7d\x26\xe3\xf7\xb7\x8c\
+\x86\x8a\x9b\xe1\xe7\x3a\x80\xb5\x6b\x3e\x23\x71\x65\x88\xc4\x62\
+\x83\x46\xad\xa2\xb4\x06\x01\x3f\xe7\x82\x1f\x9c\x6a\x6e\xcb\xa9\
+\xe5\x66\xd1\xaa\x02\xc8\x51\x39\xf5\x32\x04\x90\xde\x68\x64\x3a\
+\xc7\x77\x14\x7a\x4e\x58\xd6\xb1\xf5\xfa\xdf\x02\x48\x2e\x93\x56\
+\xb8\x42\x3d\x14\x9b\xcd\x2e\xad\xae\xab\xc3\xe4\x53\x9c\x16\x50\
+\x1f\x3a\x7e\x72\x62\x61\x69\x59\xf8\xd9\xd1\x1f\x44\x2e\xa5\xb1\
+\xcd\x83\xd1\x94\x99\xab\x27\x3c\x9d\xbe\xe8\xb1\xb9\xa5\xdb\xfa\
+\xa3\xe0\x11\xfc\xff\xc3\xa3\x12\x3b\x33\x29\xe3\xfb\xb8\x01\x3b\
+\x1f\x7d\xf0\x89\x23\x1f\xbf\xaf\x6b\x28\x98\xcb\xb2\x96\x7e\xf0\
+\x7d\x09\x83\xd3\x2d\x35\x8d\x44\xb4\x3d\x1a\x1b\x67\xef\x94\x67\
+\x28\x99\xf9\x6e\xc6\xcf\xaf\xf7\xdc\x78\xeb\x67\x53\x32\x7f\x1e\
+\x6d\xb4\x9b\xe5\x8d\x7b\x01\x9e\xcb\x9c\xb2\xed\xa2\x6b\x8b\xd6\
+\x69\xfa\x6e\x5d\xf0\x76\x75\xf5\xa9\xdb\x59\xd6\x8a\x25\x33\xa8\
+\x9e\x8c\x9b\x01\xf7\x36\xa3\x52\xa9\xa4\xa8\xbe\x80\x20\x80\x30\
+\xf2\xe3\x36\x11\xcd\xd6\x16\x40\x9c\x4c\x26\x6b\x72\x22\xa8\x01\
+\x04\x50\x6c\xd4\xbf\x83\x28\x2c\xf7\x2f\x31\xc9\x4a\x24\x92\x5a\
+\xb1\x58\xdc\xee\x45\xe1\x6c\x36\x9b\x34\xbf\xb0\x38\x90\xe3\xf8\
+\x6e\x16\xab\xb5\x73\x56\x5e\x41\xa2\xce\xf0\xbf\xd3\x72\xf8\x3a\
+\x38\x04\x82\xb5\x7a\xb4\x8d\x68\x33\xe0\xb3\xe4\x03\xac\x56\xfd\
+\xd8\x47\x0f\xbd\xf7\xd6\xfa\xd2\xbd\xc9\x17\x13\x3f\x67\x83\xaf\
+\x5b\x56\xb8\xa5\xff\xae\x9d\xff\xf7\x61\xea\x9e\x57\x97\xd7\xd6\
+\x9e\xb9\x8b\xe7\xd9\xae\x70\x0a\x13\x97\x31\xe7\x86\xc4\x90\xeb\
+\x83\x9f\x91\x1f\xcf\x73\xb1\x56\x6b\xc3\x98\x6f\xb2\x97\xbf\x3d\
+\x7d\xfb\x43\x5f\x7c\x99\xf5\xc7\x78\x10\x43\x8d\xb9\x51\x17\x05\
+\xc5\x11\xbe\xf6\xe0\xfe\xb7\x9f\xcb\xcf\xdf\xf8\x1c\xc7\xd9\x46\
+\x80\x9b\xaa\xa6\xba\x17\xac\x44\x2c\xa6\x4d\xae\x05\x7c\xb5\x0e\
+\x0d\xef\x56\xd3\xb9\xad\x7a\x53\x96\x4a\x24\xe6\xa0\x00\x7f\x4c\
+\x58\x6c\x12\x3a\xbd\x81\x89\x89\x70\xec\x20\xf1\x37\x76\x3b\x87\
+\x83\x4d\xe3\x4d\x01\xb7\xc3\x30\x5e\x8e\xa8\x6a\x2d\x58\x8e\x13\
+\xef\x4b\x3b\x1e\x52\x51\x5d\x7d\xdb\x91\x53\x19\xb7\x16\x94\x94\
+\x46\xe2\xb2\x77\xe1\xf4\xdf\x98\x2c\x16\xf4\x05\xc3\x93\x7e\xe3\
+\x74\x19\xe1\xde\x48\x39\x9e\x8b\x38\x55\x9f\x7b\xcb\xf0\xad\xf7\
+\xfc\x7c\xa0\xe6\x44\xc7\xa6\x8a\x9f\xb3\xb9\x9f\xad\x93\xdc\x52\
+\x7b\x34\x3a\x65\xf7\x13\xaf\x74\x5e\x35\xeb\xf8\x8b\xc7\x3e\x5f\
+\x5c\x6d\xa9\x1f\x03\xdf\x93\x10\x38\x8d\x42\x1a\x85\x33\xe1\x3a\
+\xe0\xb5\xab\xe4\x19\xde\x0f\x3e\xff\xc8\xe3\x75\x59\x77\xde\x7b\
+\xf0\x8d\xd5\xfd\x36\xcd\xfb\xe3\x9d\xf4\x45\x57\x63\xc4\xc7\xf9\
+\xb2\xcb\xe3\x5e\x5b\xb5\x68\xfc\x89\x2f\x66\x5e\xbf\xe7\xb9\xcf\
+\x4e\xd5\xe7\x60\x2e\x09\x3e\x46\xd3\xc3\x92\x7b\xa0\x36\x99\xcd\
+\x54\xe8\x0d\xc0\x80\x84\xbf\x73\x1f\x30\xb7\xa2\x55\x2f\x34\xac\
+\x06\x9d\xd0\x21\xa6\xc9\xf5\x00\x70\x0a\x0c\x89\x3e\x4b\x04\x71\
+\xff\x8e\x00\x21\x7c\x64\x68\x48\x85\xdc\x05\x44\xd0\x9e\x43\x87\
+\xfd\x7e\x5f\xb5\x6e\xee\x37\xbf\xfe\x71\x47\x79\x65\x15\x46\x79\
+\xfe\x07\xb3\xc5\xea\x78\x5a\x2c\x2c\x29\xbd\x8f\xe3\x38\x5c\x9a\
+\x4c\x83\x9b\xfb\x22\x6b\xb0\x19\x86\x3d\x96\xf6\xfe\xca\x6b\x77\
+\x3e\xf1\x6e\x8d\xb5\xbe\x45\xa6\x2d\x30\x61\x7a\x71\xfe\xfa\x21\
+\x23\x37\xcd\x5b\xb6\x65\xd3\xfd\xe9\xb9\x39\x6b\x17\xda\xed\xc6\
+\xd1\x70\x8a\x06\x57\xd7\x00\xcb\x03\xf4\xdc\x5c\xb6\xff\xb5\xe9\
+\xdb\x1f\x4a\xef\xb3\xf6\xfa\xec\x39\xbb\x9e\x7a\x73\x73\xd9\x81\
+\x6e\x66\xd6\xd2\x22\x73\xdc\x87\x6b\xd3\x3b\xcc\xd9\xfd\xd4\xdb\
+\x85\x85\xdb\xbe\xe7\x38\x3b\x46\x04\x09\x17\x07\xc6\xf3\xc4\xcc\
+\xdc\xfc\x1e\x42\xd7\xeb\xd1\x6a\xdc\x6f\x5b\xb4\x56\x5d\x05\x66\
+\x67\xd9\x1e\xa9\x87\x8f\xdc\xff\xf1\x77\x3f\x61\x6d\x80\x26\xf1\
+\xfb\x67\x1f\x30\xef\x7d\xfd\x3d\xb3\x2f\xed\xa8\xa3\x3f\x6b\xca\
+\x84\xfa\x39\xd3\x26\x63\xad\x9d\xa7\x1c\x0e\xd0\x55\xdb\xf6\xee\
+\xff\xef\x6f\xab\xd6\xce\xaa\xae\x75\xe4\xe0\xb4\x1b\xe7\x4e\xc3\
+\x9d\x9b\xff\x83\x4c\x1f\x37\x9a\xb9\xf9\x9a\xab\xb8\x3f\xd7\x6d\
+\x2c\x07\xd1\xb6\x6b\xd2\xc8\xe1\x5f\x4b\xa5\x92\x54\x38\x45\x4b\
+\xe2\xdd\x07\x79\xb5\xa5\x7e\xdc\xd2\xc2\xcd\xf3\xc0\x86\x15\x1b\
+\xcb\x03\x4c\x2d\x74\xe3\x3b\x17\x89\x48\xc2\xf9\xca\x34\x66\x7f\
+\xb9\xd6\xa8\x96\x28\xad\x12\x91\x98\x53\x4a\xe4\xb6\x0e\x9a\xc8\
+\x8a\x29\x91\xc3\xb6\x0e\x09\xec\xba\x42\x2a\x55\x9d\x80\x97\x52\
+\xee\x41\xcb\x03\x17\x34\x1f\xa8\xb7\x19\x7b\x9c\xa8\xcf\x1e\xb3\
+\xa7\xf2\x68\x0a\x1c\xe3\x40\xe8\xfa\x98\x59\xab\xac\xce\xda\xa0\
+\xae\xb7\xe9\x55\x18\xf1\xbb\x50\x7e\x4f\x73\xc0\x7c\x49\xad\x54\
+\x63\x4e\xd0\xc6\x54\xfc\x27\x74\xe0\x81\xc4\x4e\xd7\x3c\x8b\x5b\
+\xa2\xc0\x29\x5a\x25\xe6\x82\x94\x56\x54\x3e\xf1\xd2\x07\xff\x7d\
+\xbe\xb6\xbe\xc1\xeb\x1f\x54\xf0\x5e\xf8\xea\xe3\x0f\xb2\x49\x1d\
+\xe3\x7a\x42\x37\xdd\xe9\x75\x7d\x5a\x55\x00\xc1\xef\x0e\x2e\x2c\
+\x29\x9d\xfb\xf8\xeb\xef\x7c\x22\xb8\x2e\xc9\x77\xef\xbe\xce\xac\
+\xda\xbc\x9d\x59\xba\x76\x83\xa3\x7f\xed\x94\x89\x95\xb3\xa7\x4d\
+\x42\x01\xf4\xbc\xc3\xc1\x30\x52\xf8\xc2\x4d\x7f\xe7\xcb\x6f\x3f\
+\xca\xca\xcb\x8f\x11\x7c\x2e\xcb\xd8\xa1\x83\x99\xbb\x6f\x9c\xcd\
+\xff\xb4\xec\x2f\x0e\x44\x5d\xfd\x83\xb7\xdf\xbc\xab\x53\xc7\x0e\
+\xef\xc0\xa9\x5d\xce\x57\x10\xae\x0a\x4e\x75\x1c\xa9\x3d\x73\xeb\
+\xc6\xb2\xd4\x31\x47\x6b\xcf\xc4\x67\xeb\x0b\x43\x31\xea\xd3\x1a\
+\x37\xbf\x0b\x81\x37\x45\x5c\x4e\xaf\x90\xc8\xec\x61\xca\xa0\x86\
+\x48\x55\x48\x2d\x08\x24\x93\x54\x24\x61\x51\x1c\xc9\xc4\x32\xbb\
+\x56\xa6\x31\x06\xc9\xfd\xea\x63\x35\xe1\xc5\x5d\x7d\x3b\xa6\x45\
+\xa9\x43\x53\xe5\x62\x59\x0e\xfc\x38\xd5\x99\xf9\x37\x72\xbd\xdd\
+\x38\xe0\x54\x7d\xce\xd8\x13\x75\x59\x3d\x4a\x4c\x55\x21\xd0\x57\
+\xd9\x38\x9b\x94\x73\x54\xc9\xe6\x45\x56\xce\x2e\x6d\xb0\xe9\xd5\
+\x95\x96\x3a\x6d\xb5\xa5\xce\x07\x97\xaf\xb7\x96\xe0\xb9\x10\x28\
+\x82\x03\x40\x00\xf7\x0a\x48\x2a\x80\xcf\xbc\x76\x7e\xe2\x35\x5f\
+\xc6\xa8\xc2\xd6\xc2\x5d\x86\x76\x9d\x77\x11\x58\x8e\xeb\xb0\xf7\
+\x50\xda\x33\x9f\x2e\xfa\xe5\x2e\x4c\x87\x10\xdc\x5e\x0b\x0a\xa0\
+\x85\x6f\xbf\x56\xa7\xd5\xa8\x07\x43\xf7\xb4\xd3\xeb\xfa\xb4\xaa\
+\x00\x02\xe4\x35\x75\xf5\xd3\x16\x3c\xfb\x12\x56\x86\x6c\x12\x9f\
+\xbc\xf2\x1c\x93\x5b\x58\xc4\x7f\xb0\x70\x91\x23\xa2\x02\xe2\xa7\
+\x18\x44\x10\x16\x53\x7c\xdd\xf9\x0a\x46\x84\x5b\x62\xbc\xf1\xe9\
+\x57\x1b\x8f\xa6\x9f\xc6\xdd\x99\x5d\x9a\xee\x49\x89\xcc\x8b\x0f\
+\xdf\xc7\x2c\x59\xbd\x9e\xf9\x73\xed\x06\xee\xc6\x99\xd3\x4b\xa7\
+\x8d\x1d\xf5\x18\x9c\xfa\x1d\xcc\xed\xe6\x4c\xbd\x00\x09\xcf\x73\
+\x51\x1b\xcb\xf6\x3f\x72\xb8\x36\x3d\x79\x7f\xf5\x89\xa4\x6c\x5d\
+\x51\xa8\x91\x35\x5d\x70\x55\x4f\x7b\xd0\xb8\xba\x12\x6f\x96\x32\
+\xb1\x94\x55\x49\x14\x36\x5f\x99\x8f\x09\x05\x52\x94\x2a\xb4\xda\
+\x4f\xee\x63\xb8\x46\xa2\xb1\x6a\x34\x11\xd5\x1a\x9f\xc8\x0c\xb5\
+\x3a\xe4\xb4\x58\x2c\xc3\x2a\xc8\x9c\x58\x2c\x35\x88\x44\xd2\x72\
+\x18\xb4\x2a\xa0\x8f\x22\xc9\x13\xbe\x87\x78\x13\xc2\xa8\x1c\x9a\
+\x04\xfe\x49\x32\xf8\x1c\xfd\x6d\x36\x43\x52\x6a\x5d\xd6\xf0\xb4\
+\xda\x8c\x9e\x66\xd6\x2a\x2f\x33\x57\x05\xe6\xe8\x8b\xc3\x2a\xcc\
+\x35\xbe\x28\x6e\x2c\xac\x4d\x8a\x53\x90\xf8\x0b\x5c\xe9\xf3\x45\
+\xf0\x33\x96\x89\x64\x6c\x4a\x70\x72\xf6\x53\x7e\x49\x59\x09\x09\
+\x57\x2d\x92\xc9\x7d\xf0\xc9\xb0\xc9\x79\x95\x44\xeb\x70\x3a\x27\
+\xf7\xd9\xef\x97\x2c\xbf\x27\x3b\xbf\x00\x17\x2f\x78\x3d\x20\x7c\
+\xd8\x6f\xde\x79\x1d\xf7\x2c\x9c\x05\x86\x0f\x5f\x6e\x41\x6b\x0b\
+\x20\xac\xed\x33\xe9\xae\xa7\x9e\x5f\x83\x62\x46\x70\x5d\x94\x37\
+\x9e\x7a\x84\x51\xab\x54\xfc\xc3\x2f\xbf\xd1\x28\x80\x8a\x04\x01\
+\xf4\x1f\xe7\x2b\x1c\x28\xde\xfa\x7c\xe1\xe1\x43\xc7\x4f\x76\x13\
+\xfa\x2e\x4b\x80\x9f\x2f\xf3\xe5\x1b\x2f\x33\xcb\xd6\x6d\x62\x16\
+\xaf\x5c\xcd\x8c\x1b\x36\x44\x3f\xff\x86\xeb\x1e\x80\x53\x3f\x82\
+\xb9\x4d\xbd\x04\xef\x80\x0f\xb3\x5a\xf5\xd3\xf2\xf3\x36\x5d\x75\
+\x5f\xd1\x86\xc1\x05\xc6\xb2\xc0\xa6\xae\xea\x71\x45\x3e\x11\xfb\
+\x72\x5a\xdf\x18\xdc\x52\xa2\xca\xcf\x37\xae\x5a\x2c\x91\x9b\x45\
+\x70\xc9\x2b\x14\x7e\x56\x85\x32\xc0\x20\x11\xcb\x0c\x52\x99\xda\
+\x26\x95\xaa\xed\x62\xb1\xa4\x5e\x22\x51\x64\x83\x1d\x12\x89\xc4\
+\x19\xf0\xe3\x0e\xb1\xe4\xf8\x45\xae\x05\x8e\x23\x58\x73\xa7\x87\
+\xd5\xda\x30\xd8\x6a\xd5\x25\x40\x5b\xcd\xda\xcd\x22\x9b\xdd\x80\
+\xfb\x9b\x89\x61\xe0\x10\xdb\xec\x46\xb1\xc5\x5c\xab\x34\x9b\x6b\
+\x82\x9e\xa9\x3d\x1e\x9b\xa5\x2b\x0c\x6d\xeb\x48\x4e\x4b\xf2\x21\
+\x2f\xb7\x26\xf7\x9c\x7f\x22\x20\xa0\xd3\x76\x5f\xbf\xb8\xbf\xe0\
+\x33\xda\x0e\x6e\x9a\x1a\x6b\x07\xcc\x16\xcb\x20\x18\xcf\x5f\x5e\
+\xbe\x61\xf3\xf8\xa6\xde\xd7\x3c\x9d\x6e\x9d\x12\x2c\x2f\x3d\x72\
+\xff\xf7\xd0\x7c\x09\x0c\x77\x84\x77\x0b\x5a\x5d\x00\xe9\x0c\x86\
+\x09\xf3\x9f\x7a\x61\x6d\x53\xc3\x84\x4f\xdd\x73\x27\xd3\x2f\xb9\
+\x3b\x7f\xdb\x63\xcf\xe2\x8e\xeb\x22\x10\x3f\xe5\x20\x82\x50\x00\
+\xbd\xec\x7c\x85\x93\xb7\xbf\xf8\xe6\xc4\xc1\x63\x27\xba\x0b\x5d\
+\x97\x66\xd1\xfb\x6f\x30\x3f\x2d\xfb\x8b\xd9\xb8\x73\x0f\xd3\x3f\
+\xb9\x87\xe5\xc9\x7b\xe6\xa1\x00\xfa\x0e\x8c\x96\x50\xba\x06\x4a\
+\x9b\xcd\x38\x60\x7d\xc5\xc1\xeb\xd7\x95\xee\x19\xba\xbe\x74\x0f\
+\xd6\x65\x71\xb9\x88\x40\x6b\x80\x51\x06\x8c\x22\x05\xc9\xfd\x0c\
+\x9d\x7c\x63\xcb\x7a\xf9\x77\xce\x8e\xf3\x89\x2c\xd2\x48\x54\x06\
+\x91\x88\x01\x35\x21\xe6\x7a\x49\x54\x46\xb9\x5c\x5b\xa9\x50\xf8\
+\x17\x49\x65\xaa\x52\x91\x48\x5a\x23\x12\x89\xf4\x60\x16\x18\x42\
+\xf0\x3b\x8c\x86\x37\x63\x14\xf4\x78\xc4\x41\xa5\xd1\x10\x7c\x1f\
+\x1b\x0d\xc7\x01\x34\x14\x96\x42\xa4\x86\x57\xc0\x51\x09\x47\x30\
+\x56\xcd\x73\xac\x8a\xe3\xed\x1a\x96\xb5\x6a\x8b\xec\xc6\xa0\x06\
+\x9b\x3e\x48\x6f\x37\x69\x41\x8c\xca\x78\x86\x17\x41\xdb\x27\x47\
+\x57\x14\x9b\x5a\x7d\xbc\xcb\x99\x86\xfc\x70\x8c\xce\xc1\xef\xf2\
+\x8a\xcf\xab\xa3\x4f\x54\xd5\x84\xf0\xc1\x69\xf7\xc4\x8c\xd9\xa5\
+\x52\x05\xef\x95\x4a\x55\xb8\xed\x00\x8d\x23\x6d\xc8\xb1\xf4\xd3\
+\xaf\x2f\x5e\xb9\xe6\x16\x8a\xfe\xfc\xc3\xb8\x61\x83\x8c\xf3\x6f\
+\x98\x83\xb9\xbe\x2b\xc0\xdc\x26\xbf\xb5\xd5\x05\x90\xc1\x68\x1a\
+\x77\xff\xf3\xaf\xfe\x65\x30\x99\x70\x53\xc6\x4b\x72\xdb\x75\x33\
+\x99\x29\xa3\x47\xf0\x6f\x7e\xf6\x35\x93\x76\x32\x9d\xb9\x66\xd2\
+\xb8\x9a\x39\xd3\xa7\x60\x0e\xd0\xff\x39\x5f\xe1\x04\x05\x10\x46\
+\x80\xdc\x41\x81\x3f\xf7\xc0\x02\xe6\xa3\xef\x7e\x74\x2c\xf3\xef\
+\xd4\xb1\x83\xfd\xf5\x27\x1e\xc6\x1d\xf2\xbf\x01\xa3\x9d\xa7\xdb\
+\x19\xb8\xa9\x76\x2e\x34\x96\x0d\x5f\x53\xb2\xfb\xaa\x6f\xb2\x97\
+\x8d\xc7\xaa\xbd\xc2\x29\x02\x68\xcc\x47\x89\xd3\x44\x56\x75\xd2\
+\xc6\x96\xc4\x6a\x22\xca\x82\x14\x7e\xb5\x1a\x89\xd2\x28\x97\xc8\
+\x2d\x52\x91\xc4\x8e\x06\x62\x88\x13\x8b\xc4\xf0\x94\x83\x47\x11\
+\x88\xa0\x73\xeb\x74\x39\x2a\x21\x8b\x51\xc0\xe0\x91\xe3\x39\x09\
+\x0b\x66\xe7\x59\xa9\x95\xb3\x2a\xcc\xac\x55\x61\x62\x2d\x2a\x13\
+\x6b\x56\x1a\xec\x66\x95\xde\x6e\x54\xd7\x5a\x1b\xb4\x25\xc6\xca\
+\xc0\x22\x53\x79\x60\x95\xa5\xce\x07\x57\x5c\x79\x83\xc8\xb9\x14\
+\x28\x5a\x23\x55\xa1\x75\x53\x23\x87\x1f\x1c\x1f\x91\xb2\x25\x59\
+\xdb\x61\x17\x08\xa1\x43\x70\x8a\x72\xbe\xda\x80\x35\x5b\x77\xfc\
+\xf1\xdb\x5f\x6b\xa7\xb5\xf7\x86\xdc\xae\xc4\x4d\xd7\x4c\xd7\x5d\
+\x35\x6e\xcc\x70\x68\x9e\x02\x73\x8b\x6d\x30\x90\x56\x17\x40\x56\
+\xab\x6d\xe8\x7f\x3e\xfd\xea\x87\x53\x99\x59\xf1\x82\xeb\xa2\x4c\
+\x1e\x3d\x82\xb9\x1d\x44\xd0\xaa\xcd\xdb\xf8\x9f\x97\xfd\xc5\xcf\
+\x9e\x3e\xb9\x7c\xe6\xc4\x71\x28\x80\xfe\x15\x01\x7a\xef\xab\xef\
+\x8e\xed\x3f\x7a\xbc\x87\x3b\x08\x20\x85\x5c\x8e\x3b\x07\x3b\xda\
+\x91\x61\xa1\xfc\x87\x2f\x3e\xf3\x38\x34\x71\x7f\x33\x5a\xc9\xd3\
+\x8e\x18\xec\xa6\xc1\x7b\xaa\x8e\x5e\xf7\x63\xee\xea\x69\xbb\x2b\
+\x8f\x74\x12\xdc\x04\xe1\x16\xa0\x10\x52\x4a\x14\xb6\x15\x9d\x6f\
+\x5d\x17\x9f\x30\xed\x5b\x70\xed\x00\xc3\x9d\xee\x89\x56\x24\x3d\
+\x2b\x7b\xf1\x3b\x5f\x7c\x3b\xa3\xbd\x37\xe4\x76\x25\x1e\xbd\xeb\
+\xb6\x86\x41\x7d\x7a\x61\x4e\x2e\xe6\x15\xb6\xae\xa8\x68\x41\x5a\
+\x3d\x7b\x5d\x2a\x95\x54\x0d\x1f\xd8\x6f\xa7\xd0\xbd\x24\x65\x95\
+\xce\x85\x0e\xc3\x07\xf6\x67\x7d\xb5\x3e\x86\x88\xd0\x10\x4c\xa8\
+\xca\x73\x38\xcf\x42\x2a\x95\xda\x71\x00\x10\xba\x2e\x4d\xa3\xf8\
+\x41\xe0\xa9\x01\x05\x1b\x6e\x9f\x41\x35\x5e\xda\x11\x13\x6b\xe9\
+\xff\x43\xee\xaa\xa7\x5e\x3a\xf6\xc5\x3c\x12\x3f\x84\x3b\x82\xd1\
+\x30\x2c\xc0\x38\xfe\xe4\x97\x57\x95\x95\x1d\x7c\x8a\xe3\x6c\xb8\
+\x04\x99\xf6\xde\x69\x65\x02\xfc\xfc\xce\xc0\x83\x6c\xa5\xd0\x25\
+\x80\x90\xa0\x40\xbc\x17\xbb\xdd\x82\x8a\x56\x17\x40\x62\xb1\xb8\
+\xa4\x4f\xf7\xae\x7f\x09\xdd\x4b\x52\x56\xe1\xfc\x5e\xf9\x81\xf8\
+\x99\x33\x7d\xca\xc9\x4e\x1d\x3b\xe0\x9c\xe2\xff\x2c\x19\x57\x2b\
+\x95\x26\x57\xa8\x08\x7d\xb9\x98\xcc\x8e\x59\x2f\xdc\xff\x29\x08\
+\x1b\x44\x9b\x83\x51\xcf\xa8\x4f\x4e\xff\xfa\x9f\xef\x72\x56\x8c\
+\x2b\x33\x57\xd3\xf6\x03\x84\xdb\x73\xec\xc8\xe7\x83\x6b\x6a\x4e\
+\x4f\x82\x66\xac\xd3\x43\xb4\x16\x81\x7e\x7e\x9b\x3a\x27\xc4\x65\
+\x09\x5d\x02\x08\x0b\x3a\x6f\x1d\x60\x97\xa7\xd5\x05\x10\xa0\xf7\
+\xd1\xa8\x33\xb1\x4e\x00\x9a\xe0\xbb\x20\xa5\x82\x00\x02\x0a\x46\
+\x0d\x1e\xf8\x13\x7c\xd9\x7e\x86\x36\x16\x03\xfb\x17\x61\xa1\xc1\
+\x15\x2a\xa5\xc2\xed\x72\x68\xcc\x16\x12\x40\xed\x8c\x52\xa7\x2b\
+\x78\x64\x6d\xe9\xae\x7e\xd5\x96\x96\xa9\xe4\x4c\x10\xae\xc0\xa9\
+\x13\x8b\xee\x81\x03\xd6\x61\x21\x5a\x11\x99\x4c\x7a\x32\x34\x28\
+\xc8\x6d\x56\x3a\xb5\x36\x6a\x95\x92\xf7\xd1\xb8\xe7\x50\xda\x16\
+\x02\x08\x77\x84\xbf\xac\xe9\xaa\xca\x1a\xc7\x34\xf6\x1e\xf8\x99\
+\xed\x20\x9a\x4a\x1c\xce\x73\xe8\xde\x29\xf1\x64\x80\x9f\x5f\x83\
+\xd0\x75\x1b\x40\xb4\x39\x0e\x60\x94\x40\xd7\xf6\x88\xe0\xeb\xe8\
+\x53\x56\xb2\xff\xa6\x62\x63\x25\x4e\x43\x12\x84\xc7\x60\x36\xd7\
+\x60\x65\x7c\xdc\x8f\x80\xf6\x91\x6b\x45\xe0\x9e\x64\xc3\x0d\xb9\
+\x85\xae\xd7\x13\x19\x16\x8a\x07\xb7\x7c\x3f\xda\x42\x00\xe1\x17\
+\x86\x0d\x0b\x09\xae\x69\xaa\x08\x2a\x77\xe6\x01\x1d\x01\x3b\xaf\
+\xf8\x41\x62\x22\xc3\x37\xc2\x1b\x5f\x2e\x74\xdd\x06\xb5\xca\x91\
+\x37\x87\xc2\x8d\x12\xa0\xdb\x1e\x19\xcb\xda\x62\xca\xcb\x0f\xaa\
+\x1b\x8b\xdf\x11\x84\x27\x70\x8f\xb5\xc2\x61\x3c\xcf\xe1\x46\x8a\
+\xc1\x4e\x2f\xd1\x1a\x70\x1c\xd7\xa1\x5e\xa7\xa7\x07\x28\x81\xc8\
+\xd0\x10\x14\x3f\x06\x30\xb7\xca\xff\x41\xda\x44\x00\x81\x5a\xd6\
+\x8f\x1b\x36\x78\xab\x54\x2a\x6d\x52\xe1\x3f\x21\x11\x1a\x0b\xb1\
+\x5d\x70\x59\xa7\x5c\x26\x3b\x12\xe8\xe7\x5b\xdb\x94\x69\x35\x57\
+\xc2\xdf\xd7\x91\xfb\x8c\x49\xdd\xa5\xd8\x20\xda\x14\x99\xdd\x6e\
+\x8c\x31\x99\xab\xdd\xb6\x20\x1e\x41\x5c\x0c\x9e\xb3\x27\xc0\xff\
+\x53\x7d\x9a\x56\x24\xed\x44\xfa\x5d\xbb\x0f\x1e\x4e\x11\xba\x5e\
+\x4f\x64\x78\x38\x2e\x7b\x2f\x06\x73\xbb\x28\x50\x5b\x45\x80\xea\
+\x07\xf7\xed\xbd\x44\x2e\x97\x35\xa9\x3e\x40\x79\x55\x35\x1e\x2e\
+\x25\x6c\x1a\xa4\x32\xa9\xdb\xd4\x1b\x68\x24\x2a\x1c\xd3\x7f\x1c\
+\xe2\x87\x56\x11\xb4\x39\xbc\xc4\x6e\x37\xfb\xc3\x63\x32\x89\x1f\
+\xc2\x23\xe1\x79\xae\x03\xcf\x33\x91\x42\x97\x68\x61\x38\x8e\x8f\
+\xcc\xc8\xce\xe9\x56\x5e\x55\xe5\x9e\x59\xbf\xad\x40\x74\x78\xa8\
+\x11\x0e\xb8\xc1\xb7\xdb\xed\x6c\xd0\x26\x02\x08\x30\xf9\xfb\x6a\
+\x0f\x4b\x25\x92\xa6\x45\x80\x9c\x89\xd0\xb8\x3a\xe7\x62\x79\x32\
+\x7c\x5c\x74\x54\x59\x80\x9f\xaf\x5b\xed\xaa\xde\x35\xd1\x51\x0e\
+\x09\xa7\xbf\xf0\x4b\x43\xb4\x2d\x22\x9e\x67\x1d\x55\x83\x09\xc2\
+\x13\x01\x01\x14\x0a\xff\x4f\x37\xe7\x56\x62\xd7\x81\x43\x2f\x1d\
+\x38\x76\xa2\xb7\xdd\xce\xba\xed\x16\x39\x2d\x4d\x44\x58\x28\xde\
+\xcf\xd6\x82\xb9\xdd\xaa\xec\xb6\x12\x40\xac\x58\x2c\xae\xc1\xc4\
+\xb1\xa6\x4c\x59\x09\x11\x20\x54\x0a\x17\xbd\x90\x93\xbb\x24\xad\
+\x01\x73\x9b\x9d\x67\x91\xb0\x60\xc7\xf4\x7c\xe3\x96\x01\x44\x1b\
+\x23\x16\x4b\x39\x85\x92\xee\x0f\x84\x67\x22\x96\x48\x7d\x40\xe7\
+\x53\x81\xbe\x96\x47\xcc\xb2\x6c\xfc\xee\x83\x87\x87\x97\x57\x52\
+\xf4\xe7\x6c\x22\x42\x82\xf1\x61\xfe\x20\x18\x45\x80\x2e\x04\x08\
+\x1f\x7b\x53\x23\x40\xc2\x52\xf8\x81\x60\x31\xd8\xb8\x10\x1a\x95\
+\x6a\x5b\x7c\x6c\x4c\xb6\x3b\xe5\x01\x6d\x4b\xdd\x8f\x07\x9a\x82\
+\x69\x17\x44\x20\xc0\x25\xb4\xfd\x08\xe1\xc9\xe0\x98\xde\x66\xe3\
+\xba\x17\x21\x3f\x72\xea\xf4\x3d\x25\xe5\x15\xa1\x4d\xdd\xd7\xd2\
+\x1b\x88\x8b\x8e\xe2\x85\xdc\xde\x1a\x30\x4a\x82\xbe\x08\x38\x65\
+\x55\xac\x90\xcb\x2f\x99\xb7\x83\x95\x93\x2b\xab\x6b\x70\x43\xca\
+\x08\xa7\xe7\x82\x54\x86\x06\x05\x16\xfb\xfb\x6a\xdd\x66\x45\xd5\
+\xfe\x23\xc7\xf1\x80\xfb\x4d\xd1\x32\xf8\xb6\x87\x93\x48\x14\x75\
+\xee\x96\x38\x4f\x10\x4d\x47\xa4\x13\x89\x1c\x2b\x72\x88\x96\x45\
+\xb6\x62\xc3\xe6\x6b\x6b\xea\xeb\xa9\x70\xea\x59\x74\xea\x18\x87\
+\xe2\xc7\x2d\x57\x80\x21\x6d\x29\x80\x6c\xe3\x86\x0f\x59\xe5\xdf\
+\xc4\x9c\x9d\xd3\x39\x79\x18\x66\xbc\x64\x28\x37\xa9\x63\x5c\xea\
+\x80\x9e\xc9\xc7\x84\xae\xcb\x83\x85\x10\x1b\xf4\x86\x44\x68\x5e\
+\x34\xba\x45\xb4\x0a\x76\x89\x44\x5e\x2e\xc2\x4d\x3b\x49\x04\x11\
+\x1e\x89\x38\x13\x44\x50\x81\xd0\x21\x5a\x08\x9e\x67\xc4\x95\x35\
+\x35\x01\x94\xfb\xf3\x6f\xba\x27\x25\x60\xd1\xbe\xc3\xce\x9e\xfb\
+\xd1\xa6\x02\xa8\x7b\x52\xe2\x0f\x21\x01\x01\x4d\xda\xac\x2f\xa7\
+\xa0\x10\xff\xb6\x4b\x4e\x15\x69\x7d\x34\x1b\xfa\x26\x77\xdb\xa3\
+\xf5\xf1\x71\x9b\x9c\x9a\x8c\xac\xec\x61\x70\xe8\xeb\xec\x11\x6d\
+\x88\x4d\x2c\x96\x97\x06\x87\xf4\xd4\xe3\x2e\xe7\x82\x8f\x20\xdc\
+\x9e\x0f\x79\x85\xc3\xc4\x62\x09\xe6\x62\x9c\x74\x7a\x89\x16\x02\
+\xee\x43\xbc\x02\x37\xde\x76\x87\xcd\xb7\xdb\x92\x84\x0e\xb1\x85\
+\x70\xf8\xcd\xd9\x73\x3f\xda\x52\x00\x71\x52\x89\x24\x43\xa1\x90\
+\x5b\x9a\x32\x05\x91\x53\x50\x84\x07\x5c\xb1\x73\xa9\xaa\xa6\x0d\
+\x21\x41\x81\x05\x0b\x6e\x98\x8d\xbb\xd0\xba\x05\xdb\x53\x0f\x74\
+\x87\x43\x82\xb3\x47\xb4\x21\x98\x84\x5f\x13\x17\x37\x61\xaf\x9f\
+\xcc\xe7\x82\x35\xa6\x08\xc2\xdd\x48\xec\x34\x93\xe9\xd2\xf5\x7a\
+\x4c\x05\xc0\x6d\x83\xdc\xae\x40\xac\x8b\x23\xb1\xb3\x6c\x30\x89\
+\x9f\xff\x25\x2c\x38\x08\x73\x7f\x70\x09\xbc\x5b\xd2\x96\x02\xc8\
+\x81\x5a\xa5\x34\x49\x24\x97\x2e\x23\x9e\x9d\x5f\x80\x5f\x36\x9c\
+\x26\xc2\xca\xa6\x17\x25\x2a\x2c\x74\x73\xb7\xa4\x84\x3f\x85\xae\
+\xcb\x73\x2c\xe3\x0c\xe6\x00\xe1\xf4\x1e\x85\x53\xdb\x1e\xb3\x4a\
+\x15\xfc\xf2\x4f\x1d\x67\xe6\x29\xc4\x72\xb7\x5b\xb6\x49\x10\xe7\
+\xf2\xb9\x3c\x8c\x49\xea\x7c\x2d\x9f\x90\x38\x63\x0f\x74\xb1\xc8\
+\x2a\xd1\xb2\xc8\x2c\x16\x6b\x14\x25\x3f\xff\x9b\xc4\xb8\x58\x0c\
+\x64\xe0\x18\x6a\x76\x38\xdc\x90\x36\xff\x40\xfb\x74\xef\x76\x20\
+\x2c\x38\x18\x55\xe3\x45\xc1\x44\xe8\xfa\x06\x1d\x4e\x15\xf5\x71\
+\x7a\x2e\x8c\x58\x2c\x4e\x17\x89\xc4\x07\xa5\xd2\xa6\xad\x32\x6b\
+\x6f\xf0\xdf\x66\x30\x1a\x71\x33\xd4\x4b\x8a\x3b\xa2\xc5\x41\xf1\
+\x7d\x2c\x34\xac\xcf\xca\x2e\x7e\x71\xa5\x94\x0b\x44\xb8\x33\xf8\
+\xfd\x75\x46\xd4\x45\x46\xb1\x58\xf2\x2e\xb8\x76\x39\xcf\x10\x2d\
+\x88\xbc\x4e\xa7\x8b\xe7\x58\x12\x40\x67\x93\xe4\x4c\x80\xb6\x3a\
+\x7b\xee\x49\x9b\x7f\xa0\x29\x7d\x7a\x7e\xdc\x2d\x31\x21\x53\xe8\
+\x5e\x94\xd3\x39\x79\xb8\x12\x0c\x13\x86\x2f\x89\x58\x2c\x2a\x19\
+\xd2\xaf\x4f\x9a\xd0\x75\x79\x8a\xca\x2a\x7a\xc3\x61\xa8\xb3\x47\
+\xb4\x35\x7e\x7e\x1d\x5f\xfa\xb2\xf3\x2d\x6b\x7e\x8d\x18\x75\x49\
+\x31\x4e\x10\xae\xc6\xc7\x22\x1f\x87\x7d\x04\x36\x64\xd8\x6b\x8c\
+\x44\x22\xbf\x09\x44\xd0\x5e\x38\x45\x82\xbe\x85\xe1\x79\x5e\x59\
+\x52\x56\xde\x95\x22\x40\xff\xa6\x5b\xa7\x44\x1c\x3b\xdd\x3a\xe2\
+\xd8\xe6\x1f\xa8\x54\x22\xc9\xf2\xd1\xa8\xf5\x4d\xc9\x03\x4a\xcf\
+\xce\xc1\x25\x87\xb8\xbb\xf1\x25\x51\x2a\x14\x7b\x6e\xbd\xf6\xea\
+\x4f\x07\xf6\xee\xe9\x16\x03\xc0\xe9\xec\x9c\x4e\x70\xe8\xe1\xec\
+\x11\xed\x80\x2d\x24\xb4\xd7\xb3\xfd\xfa\x3f\xfa\xdf\xd4\xc1\xaf\
+\xe7\xef\xe8\xf7\x34\xf3\x99\x2c\xd8\x61\x04\xe1\x8a\xbc\x67\x17\
+\x3b\x6c\x55\xe2\x5c\x66\xd2\x94\xef\xd1\x6c\x93\xa6\x2c\x3a\xa3\
+\xd1\x84\x0d\x86\xd3\x1b\xc1\x68\xf9\x7b\x2b\x80\x02\xe8\xc4\xe9\
+\xcc\xbe\x76\xd6\x4e\x29\x0b\x67\x91\xd8\x31\x16\x03\x19\xeb\x9d\
+\x3d\xf7\xa4\x3d\x14\xad\xdd\x57\xeb\x53\xa7\x56\x2a\x2f\x59\x90\
+\x2e\x3b\xaf\x00\xff\xbe\xa6\xfe\x8d\x7a\xad\x46\xb3\x77\xc1\x4d\
+\x73\xbe\x16\xfa\x2e\x4d\x66\x6e\x3e\xee\x26\x8c\xd3\x60\x44\xfb\
+\x81\x4f\x30\x9f\x07\x05\x75\xbd\xcf\xdf\x3f\xe1\x67\xa9\x54\x45\
+\x45\x12\x09\x37\x00\xa7\xbd\xc4\xa7\x24\x12\xf9\x3d\x62\xb1\xec\
+\x5a\x70\xe0\x32\x64\xb7\xad\xc5\xe2\xea\x70\x3c\xaf\x38\x7e\x3a\
+\xb3\x0b\x4d\x81\xfd\x83\x5c\x26\x63\x02\xfd\xfc\x70\x05\x18\xae\
+\x3a\x74\x5b\xda\xe5\x03\xed\xdf\xb3\xc7\xda\x5e\xdd\xba\x64\x08\
+\xdd\x0b\x92\x53\x50\x88\x89\xd0\x32\xb0\xa6\xec\xdf\x84\x17\x7f\
+\xbe\x8f\x5a\xbd\x68\xf6\xb4\xc9\x87\x5d\x3d\x1f\xa8\xa8\xac\x1c\
+\x57\xb7\xe1\xbf\x8d\x68\x5f\xca\xe1\x26\xb2\x4d\xad\x0e\x7d\x7d\
+\xf0\xd0\x17\x17\x24\x75\x9e\xfd\xa7\x4c\x2c\x65\x29\x37\x88\x70\
+\x45\x54\xaa\xa0\x86\xb0\xf0\xbe\x4b\xe0\x3b\xbb\x00\x84\x10\x2e\
+\xfc\x38\x01\xe6\x76\x9b\x42\xbb\x15\x3c\x2f\xa9\xa8\xae\x0e\x00\
+\x21\x44\xab\xc0\x04\x3a\xc6\x44\xe3\x01\xb7\xc0\x70\xec\x5b\xe5\
+\xae\xb4\x8b\x00\x0a\x0d\x0a\xdc\x98\x18\xe7\x08\x9f\x5d\x14\xab\
+\xcd\xc6\xe8\x8d\x46\x5c\x09\xd6\xd4\x25\xe3\x98\x8d\x7e\x74\xc6\
+\xf8\x31\x2f\xfb\x69\xb5\x4d\x9a\x66\x6b\x2f\x4a\xca\x1d\xab\xf6\
+\xe9\x82\x72\x0d\x0c\xf0\x44\x9d\xae\x56\x87\xfd\xd1\x31\x7e\xf2\
+\x9b\xc7\xc6\x2f\x7a\x78\x49\xf4\xa4\x83\x9f\xc9\x42\x4d\x1f\x8b\
+\x34\x24\x84\x88\x76\xe7\xcf\xd8\xa9\xfc\xb4\xab\x7e\xdd\x39\x7e\
+\xe2\xd7\xff\x09\x0c\xec\xf2\x16\xb8\x30\xd9\xb9\x49\x35\xd5\x88\
+\x66\xa1\xd1\x1b\x4d\x89\x54\x00\xf1\xdf\x08\x2b\xc0\x70\x41\x89\
+\x5b\x2c\x3c\xba\x10\xed\x22\x80\x40\x98\x94\xf8\xfa\xf8\xd4\x49\
+\xc4\x97\x5e\x0e\x9f\x5b\x58\xdc\x0f\x0e\x23\x9c\xbd\x26\x61\x90\
+\xc9\xa4\xeb\x1f\xba\xe3\x96\x8f\x23\x42\x43\x5c\x56\x9d\x62\x4d\
+\x09\x10\x78\x24\x80\x5c\x0b\xac\xa3\x72\x40\xae\xf0\xfd\xb6\x77\
+\x9f\x7b\x5f\x9f\x38\x79\xe1\xf3\x53\xa6\xfd\xf2\xeb\xce\xfe\xcf\
+\x16\x7c\x26\x0b\xe1\x3e\x95\xd2\x1e\x88\x44\xeb\xf2\x3e\x2b\x76\
+\xd8\x8a\xb8\xab\x99\x53\x13\x7f\xe2\xc1\xd8\xd3\x53\x7e\xdf\xd9\
+\xab\xf7\x82\xb7\xa4\x52\xd5\x1b\x62\xb1\xe4\x3b\x78\x19\x4e\x79\
+\x91\x30\x6f\x03\x6c\x36\x7b\xfc\xc6\x9d\x7b\xee\xc6\xf1\x9a\xea\
+\x00\xfd\x43\xe7\x84\x38\x8c\xfe\xb8\xcd\x16\x54\x17\xa2\xbd\xe6\
+\x34\xf9\xa0\x00\xff\x92\xc8\xf0\x30\xc7\xae\xa7\x17\x63\x5f\xda\
+\x51\x8c\xfe\x60\xe1\xc0\xcb\xc1\xda\x39\xbe\xe3\x7f\x41\x00\x55\
+\xb8\x72\x14\xc8\x66\xb3\xe1\x53\x45\x53\xa6\xf7\x88\xb6\x05\x2f\
+\xee\x15\x20\xd5\x3f\x12\x89\xc4\xef\x04\x07\xf7\x78\xa7\x47\xf2\
+\x1d\xdf\x45\x44\x0e\x4a\xa3\x0a\xd2\x44\x6b\x23\x97\xfb\x1a\x7d\
+\xfd\xe2\x8e\xc9\x64\xea\xff\xca\x64\x9a\xf7\x24\x12\xe5\x3b\xe0\
+\x46\x5b\x0b\xe6\x36\x05\x5f\xdd\x1d\x3b\xcb\x76\x3a\x96\x71\xe6\
+\x96\x65\xeb\x37\x4e\x12\x5c\x84\x40\xb7\x4e\x89\x39\x70\x38\xe5\
+\xec\xb9\x2f\x92\x97\x5e\x7a\x49\x68\xb6\x2d\x5a\x8d\x46\xd6\xa0\
+\x37\xc4\x67\x64\xe5\x5c\x74\x99\x7b\x7d\x83\x5e\x32\x75\xec\x48\
+\xdc\x41\xf4\x2f\xa7\xa7\x69\xe0\x86\x80\x62\xb1\x38\xb9\xb0\xa4\
+\x34\x4e\xa7\x37\x68\x04\xb7\x4b\x31\x69\xe4\xf0\x74\xb5\x4a\xb9\
+\x05\x9a\x78\xc3\x25\x5c\x0f\x14\x3b\x65\x12\x89\x62\xbf\xaf\x6f\
+\xec\xc1\xf0\xf0\x01\xe5\xb7\x47\x8d\x30\xcf\x54\x85\xeb\xa7\x88\
+\xe4\x21\x33\x14\x21\x92\x65\xa6\x32\x7a\x2a\x24\xae\x98\x2f\x55\
+\x31\xcc\x74\x99\x1f\xf3\x50\xe7\xeb\xad\x77\xc5\x8c\xcb\xef\xdb\
+\xff\x91\xd4\xc4\x4e\x33\xb7\xf8\x07\x24\x2e\x13\x89\x24\x28\xc0\
+\xd7\xc2\x43\xdc\x19\x78\x29\x55\x2e\x6f\x43\x6c\x76\x7b\x8f\x23\
+\x27\x33\xe6\xff\xb4\x6c\xe5\xad\xf5\x3a\x7d\x93\x56\x22\x7b\x0b\
+\xe1\x21\xc1\xcc\xd5\x13\xc7\xe1\xea\xaf\xc5\x60\x97\x0c\x62\xb8\
+\x32\x18\xd6\x13\x9a\x6d\x8e\xe6\xc8\xc9\xf4\xe7\xdf\xf8\xec\xeb\
+\x27\x2f\x15\x5a\xfc\xfe\xfd\x37\x7e\x54\x2b\x95\xf7\x42\xf3\xb2\
+\x42\x6e\x2c\xc7\x75\xfd\xf6\xd7\xa5\x0b\x37\xed\xde\x3b\xd8\x15\
+\xc3\x97\xef\x3f\xff\xf4\x5f\xd1\x11\x61\x4f\x41\x33\xdd\xe9\x21\
+\xdc\x00\x3f\xb0\x21\x60\xb7\x82\x05\xda\xed\xa6\x0e\x45\x45\x3b\
+\x23\x39\xce\xaa\xce\xcd\x59\xe7\x88\xa8\xce\x37\xe6\xe3\x81\x20\
+\xfe\xe6\x13\xb1\x73\x13\xf1\x98\xd8\xd1\x4c\x5c\xc7\x89\x38\xe8\
+\xf2\x62\xb1\xb4\x5e\xa3\x89\xc0\x27\x69\x5c\x8d\x58\x0f\xb6\x0f\
+\x6c\x35\x18\x8d\x07\xed\x87\xd4\x6a\xb3\xf5\xd8\x7d\xe0\xf0\x83\
+\x3f\x2c\x5d\x71\xbd\xc1\x64\xc2\xaa\xfd\xc4\x59\x8c\x1b\x36\x98\
+\x99\x7f\xc3\xec\xd7\xa1\xf9\x32\x98\x5b\x27\xe0\xb7\xd7\x14\x18\
+\x62\xd0\xa8\xd5\xb5\x3e\x1a\xf5\x25\x9f\x6c\x4a\xca\xca\x23\xe1\
+\x70\xc9\x8a\xd0\xe7\x22\x11\x8b\xd3\xa3\x22\xc2\x0a\x35\x2a\x95\
+\x4b\x96\xea\x36\x98\x8c\x78\x33\x75\xa4\xd3\x13\x6e\x03\xde\xa8\
+\x70\x2a\x62\x2e\xd8\x6c\x89\x44\xf1\x96\xbf\x7f\xc2\x3a\x8d\x26\
+\xf2\x88\xd6\x37\xb6\x58\x2a\xbd\x74\x79\x07\xc2\x3b\xc1\xe9\x78\
+\x89\x44\x6e\x86\xef\x4c\x81\x4c\xa6\x39\x20\x97\xfb\x2e\x07\xf7\
+\x63\x60\xd7\x80\x5d\x07\x86\x95\x9c\x49\xfc\xb4\x23\x28\x7e\x96\
+\xaf\xdf\xfc\xfa\x17\x3f\xff\x76\x1b\x89\x9f\xf3\xd3\xbb\x5b\x17\
+\x4c\x7c\xc6\x71\xce\xed\x57\x1f\xb6\xa7\x00\xc2\x50\x5a\x66\xff\
+\x9e\x3d\x70\x7a\xeb\xa2\xec\x39\x74\xa4\x27\x1c\x70\x80\xb8\x6c\
+\x06\xf7\xed\xbd\xb6\x67\xd7\xce\xa7\x85\xae\x4b\x61\x30\x9a\xb4\
+\x70\x88\x70\xf6\x08\x37\xa4\x4e\x24\x12\x7f\x0b\x02\xe8\xba\xb0\
+\xb0\x3e\xd3\xba\x75\xbd\xe1\xed\xb0\xb0\xfe\x87\x92\xb4\x1d\xca\
+\x71\xb3\x55\x5c\x4a\x4f\xcb\xe9\x09\x04\x6b\x4c\x69\x34\x11\x55\
+\x01\x01\x49\x7b\x95\xca\xc0\xe7\xc1\x86\x80\x08\xba\x03\x4e\x6d\
+\x07\x73\xfb\x64\x52\x0f\x41\xfc\xd7\xa6\xad\xaf\xac\xd8\xb8\x79\
+\x02\x25\x3c\x5f\x98\xee\x9d\x3b\x55\xc1\xa1\xce\xd9\x73\x6f\xda\
+\x55\x00\x69\x7d\x34\x6b\xa6\x8c\x1e\xf1\xf3\xa5\x12\x95\x77\xec\
+\x3f\x88\xe5\x79\x9b\xb4\x25\xc6\xb9\x04\xf8\xf9\x2e\xea\xd3\xa3\
+\xeb\x41\x17\x4d\x86\xc6\x27\x0c\x67\x6c\x9c\x70\x73\x44\xa5\x3e\
+\xda\xe8\x8f\xbb\x74\x9d\x3b\x7e\xcd\xa8\x4f\xe6\xee\x1b\xf7\xcd\
+\xba\x75\x5d\xe7\x19\xd6\x74\xbe\xd5\xb6\xb6\xf3\xcd\xdc\xd7\x6a\
+\xc7\xb2\x51\xc2\x0b\xf8\x44\xac\xc5\x65\xeb\x0e\x5b\xd6\x61\x3a\
+\x77\x70\xd8\xbb\x96\x09\x93\x16\x1e\x18\x31\xea\x9d\x07\x23\x22\
+\x07\x8d\x15\x8b\xa5\x3f\xc2\xcb\x28\x99\xde\xc5\x00\xd1\x13\xaa\
+\xd3\x1b\x7c\x6d\x36\x3b\xd6\x68\x23\xce\x03\xd6\xff\xd1\xa8\x54\
+\x58\x75\x1c\xb7\x5d\x71\x7b\xda\x55\x00\x01\x66\xb9\x4c\x76\xc9\
+\x04\x60\xf8\x52\xe2\xc6\xa8\x57\xfc\xb7\x46\x85\x87\x15\xc6\x44\
+\x46\x94\x0b\x5d\x97\x01\xab\x69\x02\xf4\xa4\xe1\x59\x18\x41\x6c\
+\xef\x94\xc9\xd4\x37\x26\x24\x5e\xd5\xb1\x43\xdc\x84\xfb\xd4\x9a\
+\xf0\x33\x62\xb1\x8c\x76\x9e\xf7\x42\xfc\xfd\x13\xd2\xfc\xfc\xe3\
+\x6f\x81\xe6\x34\xb0\x3f\xc0\x48\x08\xbb\x28\x56\x9b\x2d\xc6\x68\
+\x36\xab\x84\x2e\x71\x1e\x7a\x76\x49\xc2\x03\x8a\x9f\x63\xd8\x70\
+\x77\xda\x5b\x00\x61\x84\xa6\x70\xe4\xa0\x01\x07\x84\xee\x79\xc1\
+\x70\x64\x41\x49\x69\x00\x34\x07\x38\x3d\x97\x47\x42\x6c\xcc\xc2\
+\x59\x93\xc6\x2f\x15\xba\x2e\x83\x4a\xa5\xc4\xa7\x40\xaa\xe2\xea\
+\x79\xe0\x1c\xb9\x09\xb4\x6d\xb5\x5c\xae\xfd\x35\x3a\x7a\xc4\xf8\
+\x51\x63\x3e\x1c\x74\x66\xea\x1f\x6f\x9f\x9c\xb0\x28\x67\x43\xb7\
+\xf9\xfc\x4f\x41\xfd\x98\x46\xfb\x80\xa3\x07\x4e\x77\xe4\x5b\xdf\
+\xce\x0e\x5b\x95\x38\xc7\x61\xfb\x87\xbe\x05\xf6\x36\x37\x65\xda\
+\x2f\x75\xbd\x7a\x2f\x78\x1d\xac\x5f\x6c\x87\xb1\x33\x40\xfc\xae\
+\x82\x97\x63\xee\x18\x89\x60\x17\xc6\x62\xb1\x86\x98\xcd\x16\xca\
+\xfb\xb9\x08\xbd\x9c\xf9\x3f\x98\x53\xeb\xd6\xbb\xc0\x37\xd2\xee\
+\x02\x48\xa9\x50\x1c\x98\x31\x7e\xcc\x37\x97\x9a\xa2\x12\xea\x01\
+\x2d\x70\xf6\x2e\x0f\xf8\xdd\x65\xfe\x7e\xbe\x95\xae\xb6\x3d\x46\
+\x90\x9f\x1f\xbe\xff\xb4\x1d\x86\xe7\x82\xdf\x69\xcc\xef\x28\x02\
+\x3b\x26\x91\x28\x3e\x52\x2a\x03\x66\xc6\x75\x9c\x38\xb1\x47\xcf\
+\x79\xcf\x06\x87\x24\x1f\x86\x9b\xa3\xcd\x45\xa7\x67\x89\x26\x02\
+\x9f\xa1\x45\xeb\x1b\x7b\xcc\xd7\xb7\xc3\x7f\x02\x03\x93\xc6\x81\
+\x0b\xed\xbf\x60\xf8\x94\x5c\x0c\x46\x65\x2e\xdc\x80\xf2\xaa\xea\
+\xe4\xba\x06\x1d\xa5\x24\x5c\x00\x89\x58\xcc\x74\xed\x94\x70\x08\
+\x9a\x38\x9e\x79\x04\xed\xb9\x0c\xbe\x11\x91\xde\x60\x9c\x70\xcf\
+\xff\xbd\xfc\x97\xc5\x6a\xbd\xa0\x18\xf0\xf5\xd1\xd8\x17\xbe\xfd\
+\xda\x11\x68\x5e\x51\x14\xc8\x64\xb6\x4c\x59\xb2\x7a\xdd\xe3\xab\
+\x36\x6f\x1b\x2d\xb8\xda\x9d\xdf\x3f\xfb\xa0\x00\x0e\x8b\xc0\x5e\
+\x70\x38\x08\x6f\x01\xbf\xe7\x98\xd7\x16\x07\x86\xe5\xa5\xe5\x76\
+\xbb\xa9\xbb\xd5\xaa\x9b\x5c\x56\x7a\xb0\x3b\xcb\x9a\xb4\xd5\xd5\
+\xa7\x1c\x0f\x27\x75\xb5\x59\xcc\x7d\x76\x5c\x25\x4d\xb4\x25\x1f\
+\x31\x6a\xc7\xd1\x3f\xc0\x99\x7a\x18\x10\x90\xc4\x84\x84\xf4\x84\
+\xc1\x52\xc4\x8b\xc5\x12\x73\x60\x50\xd7\x53\x62\xb1\x74\x0d\x9c\
+\xc2\x62\x70\x3a\x30\x8c\xf0\xe0\xe6\x90\x25\x60\x14\xe9\x71\x43\
+\x96\xaf\xdf\xbc\x6c\xed\xb6\x1d\x63\x6b\xeb\x1b\x70\x71\x0a\x71\
+\x0e\x3d\x3a\x77\x62\x5e\x78\xe8\x5e\x2c\xdb\x82\x39\x6c\xa5\x0e\
+\xa7\x9b\xe3\x0a\x02\x88\x61\x59\xb6\xd7\xef\xab\xd6\xbd\xbd\x6c\
+\xfd\xa6\x09\x82\xeb\x7f\xc0\xa7\xe4\x8f\x5e\x7c\x36\x3d\x3c\x34\
+\x18\x97\xc3\x5f\x49\xf8\x2d\x38\x23\x3b\x67\xc1\x0b\xef\x7d\xf2\
+\xaa\xd0\x6f\x77\x9e\x58\x70\x47\xc3\x80\x9e\xc9\xb8\xa1\xe1\xed\
+\x4e\x0f\xe1\xa5\xa0\xd8\x09\x07\xeb\x22\x1c\x15\x60\x98\x1b\x86\
+\x7e\x5f\x9e\xb7\x77\xe2\x38\xfb\x64\x9e\xe7\x22\x6b\x6b\xb3\x64\
+\x28\x8a\x10\x5d\x03\xea\x67\x86\xd1\x1b\xf0\x9e\xcb\x30\x06\x7d\
+\x09\x73\x3f\x8b\xf7\x61\xe2\x5c\x3e\x62\xfe\x49\xed\xd0\xf8\x60\
+\x55\x0d\x86\xf1\x81\xa3\x56\x8b\x5b\x0d\x3a\xf1\xf3\x8f\x67\x02\
+\x03\x3b\x3b\xda\x0a\x85\x3f\xee\xae\x8e\x05\x08\xf1\x89\x17\x8f\
+\x8d\x53\x58\x38\x60\xe2\x11\x73\x0a\x71\xc9\x7a\x19\x18\x4d\x63\
+\x7b\x00\x1f\x7f\xf7\xd3\xa1\xd4\xb4\x23\xbd\x68\xdf\xaf\xf3\x73\
+\xfd\x55\x53\x99\x99\x93\xc6\xcd\x80\x26\xd6\xaa\x72\xeb\x3d\xc0\
+\x1a\x69\xf7\x29\x30\x44\x22\x91\xe4\x8f\x19\x3a\xe8\x27\xa1\x7b\
+\x5e\x30\x0f\x28\x33\x2f\x1f\x2b\x72\x8e\x01\xbb\x92\xa4\x89\xaa\
+\xb0\xe0\xe0\x9c\xd0\xa0\x40\x97\xd9\x40\xf0\xe7\x65\xab\xb0\x42\
+\x35\x46\x02\x08\xef\x06\x73\xc1\x50\xc5\x60\x55\xf0\x5f\xc0\x70\
+\xbf\xa7\x6f\xc1\xbe\x01\xfb\x4a\x24\x92\x7e\x24\x16\x2b\x5e\x92\
+\x48\x94\xcf\xc1\x0d\xfb\x1b\xb8\x71\x1f\x97\x48\xe4\x46\x7c\x7e\
+\x81\xf3\x44\x8b\x80\x91\x1d\xa9\x49\x22\x51\x6c\x96\xc9\x7c\xde\
+\x00\xc7\xf3\x60\xaf\x81\x7d\x08\xf6\x25\x18\x7e\x16\xf8\x99\xe0\
+\x67\x83\x4f\xc0\x1b\xc0\x30\xe2\x43\xe2\xc7\xfd\x11\xc3\x43\x78\
+\x7c\x83\x4e\xa7\x25\xf1\x73\x61\x7a\x75\xeb\x82\xdf\x75\xac\xdb\
+\xe7\x11\xe2\x07\x69\xb7\xad\x30\xce\xc1\xac\x94\x2b\xb8\x15\x1b\
+\x37\xdf\xcd\xf3\x8e\x27\xdf\xf3\xae\x8c\x92\x4a\x25\xe2\x41\x7d\
+\x7a\xa1\x08\xc2\x6d\x31\x2e\x3b\xcc\xac\x90\xcb\xa4\x72\xb9\x3c\
+\xe8\xf0\x89\x53\xbd\x04\x57\xbb\xa2\x33\x18\xc4\x3d\x3a\x27\x95\
+\x84\x04\x06\x60\x61\x3d\x7c\xe2\x24\x88\x73\xc1\x68\x67\x95\x48\
+\x24\x3a\x02\xb6\x47\x2a\x55\x66\x28\x95\x81\x05\x6a\x75\x68\xa6\
+\x8f\x36\xfa\x14\x88\xa1\x3c\x99\xdc\xa7\x56\x2c\x92\xf2\x56\x4b\
+\xbd\x6c\x0d\x6b\x90\xf2\x0c\xd5\x30\x39\x97\xc9\x67\xa5\xda\x29\
+\x14\xbe\x28\x76\x58\x95\x2a\xd8\xec\xe3\x13\x51\xa3\xd1\x84\x67\
+\xfa\xf9\xc7\xef\xf4\xf5\x8d\x5d\x23\x93\x69\x16\x8b\xc5\x92\x5f\
+\xe1\x65\x3b\xc0\x30\xc2\x83\xa5\xfe\xb1\xe8\x1b\x89\x4d\xcf\x45\
+\x7e\x2c\xe3\xcc\x63\xbb\x0e\xa6\x0d\xd3\x1b\x8c\xce\xb9\x4f\xe2\
+\x5f\xa8\x55\x4a\xe6\xf6\xd9\xd7\x60\x3d\xbd\x25\x60\x94\x03\xd4\
+\xd2\xc0\xdf\xd1\xf1\xbf\x8b\x7e\x5e\xb2\xf7\xf0\x91\xde\x17\x52\
+\xe1\x98\xc4\xfc\xdd\xbb\xff\x29\x53\xc8\xe5\x5d\xa1\x8b\xf3\xee\
+\x97\x8b\xac\x41\xa7\x9f\xfc\xc0\x8b\xaf\xff\x6e\x32\x9b\x71\x9a\
+\xa1\xdd\x49\xe9\xd3\x2b\xf3\xd1\x3b\x6f\x7d\x0f\x6e\x6e\xf8\x94\
+\x49\x10\x4d\xc5\x31\x3d\x06\x16\x05\x86\x0b\x04\x70\xfa\x0c\xe7\
+\x73\x30\x7f\x01\xef\xf6\x72\xab\xb5\x41\x65\xb3\xea\x95\x3c\xcf\
+\xc9\x59\xd6\x2a\x46\x61\x24\x82\x4b\x9e\xe5\x6c\x22\x8e\xb5\x48\
+\xe0\x9a\x93\xb0\xac\x45\x6a\x67\xcd\x52\x8e\x63\xe5\x1c\x67\x53\
+\xda\xad\x7a\x85\xd5\x66\x90\xf3\xbc\xe3\x1a\x14\xd9\xed\x66\x91\
+\xcd\x66\x84\x9f\xe5\xc4\x76\xab\x41\x62\xb3\x1b\xe1\xbf\xeb\xdc\
+\x19\x9b\x65\x4d\x8c\xdd\xe6\x2c\xe4\xce\xb2\x66\x47\x94\x16\x5e\
+\xef\xe8\x3f\x22\xfe\x77\x60\x04\x77\x38\x97\x48\x9c\x0b\x6c\x64\
+\x32\xf5\xdf\x83\x0e\x08\x3a\x46\x22\x55\x39\x04\x9b\x44\xe2\xbc\
+\x24\xd1\xe7\x3c\xaa\x79\xa9\xf0\x33\x38\x05\x0e\x7d\x4e\x2a\x77\
+\xfc\x2c\xfa\xa1\xaf\xe2\x44\x22\x89\x5d\x24\x16\xdb\xa1\x8d\x86\
+\x4f\xa6\x8e\xf3\x32\xa9\x9a\x95\xcb\x7d\x6c\x70\xde\xa0\x54\x05\
+\xd5\x81\xe0\xc1\xc2\x6d\x98\x8c\x8c\x7f\x18\x46\xdc\xf0\x01\x0a\
+\xff\x78\x4c\xb0\xca\x04\x3b\x08\x96\x01\x46\x42\xc7\xbb\xc0\xef\
+\x72\xe0\xd3\x6f\xbe\x7f\xac\xb0\xb4\x34\x8c\x22\x40\xe7\x67\x60\
+\xef\x64\xe6\xf1\xf9\x77\xfc\x07\x9a\x78\x9f\x72\xce\xbd\x7b\x00\
+\x2e\x23\x80\x00\xdf\xb2\xca\xaa\x99\xff\xf7\xce\x87\x9f\xe9\xf4\
+\x86\x0b\xaa\xf0\x27\xee\x9e\x57\x3f\xa0\x57\x8f\x58\x68\x36\x38\
+\x3d\x97\x07\xcb\xb2\x7d\x17\xfd\xb1\xfc\xc3\x75\xdb\x77\x0d\x17\
+\x5c\xed\x8a\x4c\x26\xb5\x3f\x73\xef\xfc\xc3\x3d\x3a\x77\x1a\x0c\
+\x5d\x2a\x8e\x46\xb4\x04\x28\x80\x50\x08\x61\xe9\x08\x34\x9c\x6a\
+\xc5\x69\x63\x14\x1a\x78\xc1\xe3\x20\xef\x10\x49\x60\xa8\x3a\x30\
+\x41\x06\x23\xab\xb8\x35\x8b\x3f\x18\xbe\x1e\xcf\xa1\xc8\x42\xc3\
+\xd7\xe3\xcf\xa3\x0f\x7f\x0e\x7d\xe7\x8b\xd4\x9e\xdb\xc7\x9f\xc3\
+\xd7\x22\xf8\xdd\x46\x73\x08\x14\x74\x08\x9c\xfb\x33\x67\xd3\xf8\
+\x3a\x3c\xe2\xcf\xa2\xc0\x41\x6b\xfc\x5d\x28\x62\x30\x3a\x83\xaa\
+\x0b\x8f\x18\x2d\x6b\x7c\x0d\x9e\xc3\xa8\x2a\xee\x9e\x8e\x9b\xb3\
+\xe5\x82\x61\x05\x5b\x14\x3d\xf8\xb3\x04\x81\xf8\x54\xd7\xd6\x4d\
+\x7e\xf2\x8d\x77\xbf\xbf\xd8\x7d\xc7\xdb\xb9\xeb\xfa\xeb\x98\xf1\
+\xc3\x87\x0c\x85\x26\x96\xac\xf1\x98\x69\x5f\x57\x12\x40\x88\xef\
+\xc3\x2f\xbf\x91\x5d\x5e\x59\x15\xc8\x72\x5c\xe3\xc0\xf9\x2f\xc6\
+\x0d\x1b\xdc\x30\xff\x86\xd9\xf8\xb4\x8b\x49\x88\x57\x32\x90\xa9\
+\x1b\xf4\xfa\x51\x77\x3d\xf5\x02\xd6\xe6\x70\x3c\xb5\x3a\xbc\xed\
+\xc8\xf0\x81\xfd\xb2\x1f\xb8\xed\xa6\xab\xa1\x89\x2b\x4a\x68\x70\
+\x26\x3c\x01\xbc\x7e\x51\x5c\x35\xce\x3d\xe1\xa0\xd9\x28\x50\x08\
+\xc2\x15\x10\xd9\xec\xf6\x6e\xcf\xbc\xf5\xc1\xa6\xe2\xd2\xb2\xd0\
+\x0b\xdd\x73\xbc\x1d\xb1\x58\xcc\x7f\xf5\xc6\xcb\x36\x5f\xad\x4f\
+\x6f\xe8\x7a\xd4\x5e\x75\xae\xf6\x81\xb3\x7d\xba\x77\x3d\xa1\x52\
+\x5e\x78\x43\xc9\x23\xa7\x32\xf0\x49\x74\x14\x18\x3e\xa5\x5e\x09\
+\x46\x8d\x5a\x9d\x13\xe0\xe7\x7b\x25\x53\x68\xad\x42\xda\x89\xf4\
+\xc8\xb2\x8a\xca\x8f\xa1\x49\x55\x48\x09\x4f\x01\x85\x3c\x46\x5b\
+\x30\x52\x8b\xe6\x51\xc9\x93\x84\xfb\x03\xcf\xfe\xbe\xf5\x0d\xba\
+\xe4\x82\xe2\x92\xf0\xe6\x88\x1f\x85\x1c\x03\xa3\x9e\x4b\x8f\xce\
+\x9d\x38\x10\x3f\xb8\xf4\xd4\x23\x8a\x1f\x9e\x8d\xab\x09\x20\xe3\
+\xcd\xb3\x66\xdc\x9c\x18\x17\x5b\x80\x73\xfe\x82\xef\x5f\xd4\x35\
+\x34\x28\x32\xf3\xf2\x5f\x81\x66\x98\xd3\x73\xf9\x48\xc4\xe2\xda\
+\xdb\xae\x9b\xb9\x48\xa9\x50\xb8\xc4\x07\xaa\x37\x1a\x55\xcb\x37\
+\x6c\xee\x0b\xcd\xc6\xa7\x65\x82\x20\x08\xa2\xf5\x10\xe9\x8d\x86\
+\x94\x27\x5e\x7f\x07\x57\xf5\x35\x0b\x8b\xd5\xe3\x74\xc1\xbf\x18\
+\xd2\xaf\x0f\x06\x24\x5e\x07\xc3\xe9\x64\x8f\xc2\xd5\x04\x10\xee\
+\x9e\x5d\x9c\x14\xdf\x31\xb3\x7f\x72\x0f\xc3\xf3\x0f\xdd\xd3\xb8\
+\x5f\xd6\xdf\xb0\x2c\x27\xde\x9e\x7a\x10\x0b\xc8\x35\x47\x2c\x54\
+\x0e\xec\xdd\xf3\x1d\x95\x52\x71\xc1\x48\x53\x5b\x73\xe0\xd8\x09\
+\x19\x3c\x85\xe0\x8e\xf7\x98\x87\x41\x10\x04\x41\xb4\x12\x2c\xcb\
+\x26\x9c\xc9\xc9\x1f\x6f\x74\x91\xc5\x30\xae\x4c\xff\xe4\xee\x98\
+\x4f\x87\x1b\xa0\x62\x55\x7b\x8f\xc2\x15\xe7\x3c\xf9\x99\x13\xc7\
+\x3d\x3a\x66\xe8\xa0\x7d\xc9\x9d\x93\x6c\x83\xfb\xe2\xb4\xe3\xbf\
+\xd9\x97\x76\x14\x93\x2b\x71\xf5\xcb\x95\xee\xdb\xc2\x81\xd0\xaa\
+\xf7\xd1\x68\x8c\x12\xb1\xd8\x25\x72\x6e\x8c\x46\x93\x72\xf7\xc1\
+\xb4\x17\xa1\x19\xea\xf4\x10\x04\x41\x10\xad\x41\x4d\x5d\xfd\xc0\
+\xef\x7e\x5f\x3a\xcf\x15\x72\x40\x5d\x99\x6e\x9d\x12\x79\x5f\xad\
+\x0f\x4e\x5d\x63\xb0\xc0\xa5\x12\x86\x5b\x02\x57\x14\x40\x8c\x44\
+\x22\xce\x49\x8a\x8f\xfb\x14\x9a\xfb\x46\x0f\x49\xf9\x57\xde\x00\
+\x7e\x61\xeb\x75\x3a\x51\x75\x6d\xdd\x83\xd0\xed\xe4\xf4\x5e\x11\
+\xe6\x87\xef\xb8\xf9\xad\xc8\xf0\x30\xac\xf3\xd1\xee\x70\xf0\xef\
+\x5a\xb3\x65\x7b\x04\x34\x71\x35\x8e\x4b\x7e\x2e\x04\x41\x10\xee\
+\x4e\x5d\x83\x6e\xc6\x8a\x0d\x5b\xee\xad\xac\xa9\xc5\x15\x8f\xc4\
+\x45\x18\x99\xd2\x1f\x4b\x47\xec\x03\xbb\xec\xba\x7b\xee\x80\xab\
+\xde\x68\x59\x1f\xb5\x7a\x2b\x88\x9d\x9f\xba\x75\x4a\x38\x14\x19\
+\x1a\xf2\x3f\x6f\xfe\x8e\x7d\x07\x47\xc0\xa1\x39\x55\x94\x6d\x51\
+\xe1\x61\xbf\x06\xf9\xfb\x61\x7d\x90\x76\x07\x85\x5d\x4e\x41\xa1\
+\xd8\x6c\xb1\xdc\x00\x5d\x5c\xe6\x4f\x10\x04\x41\xb4\x20\x30\xce\
+\xc6\x65\x64\xe7\x8c\xdd\x9b\x76\xa4\x0f\x45\x7f\x2e\xcd\x80\xde\
+\x3d\xb1\x74\xc4\xfb\x60\x1e\x99\xe8\xe4\xb2\x91\x06\x91\x88\xa9\
+\x83\xff\xc3\x8a\xcf\xdf\xdf\x38\x73\xfa\x61\xa7\xf7\x1f\xb6\xa5\
+\xee\xc7\x22\x70\x18\x2d\xb9\xd2\xc2\x55\xbc\x48\x24\x2a\x4b\xe9\
+\xd3\xeb\x70\x48\x60\x80\x4b\x88\x20\x64\xd7\x81\xc3\xd7\xc2\x21\
+\xda\xd9\x23\x08\x82\x20\x5a\x08\x49\x6e\x61\xd1\x35\x1b\x77\xec\
+\x99\x4c\x35\x7f\x2e\x4d\xf7\xa4\x44\xde\x47\xad\xc2\x5a\x5a\xbb\
+\xc0\x28\x02\xd4\xd6\x80\x3c\xc7\xfd\x91\x56\xf6\xee\xde\x75\x59\
+\x4c\x64\x04\xd6\xfd\xf9\x9b\xd2\x8a\x4a\x91\xd1\x64\x9e\x04\x4d\
+\xe7\xee\x85\x57\xc8\xf0\x81\xfd\x16\x76\x4e\x88\xcf\xb9\xd0\xaa\
+\xb3\xb6\x66\xe5\xc6\x2d\x1d\xe0\x80\x3b\x84\x5f\xc9\x7e\x67\x04\
+\xd1\x1a\x28\x38\xce\xde\xd7\x62\xa9\xbb\xcf\x66\x33\xdc\xcf\x71\
+\xb6\x69\xf0\xfc\x80\x39\x78\x58\xb6\x01\xbf\xa7\xb8\x20\x01\xd7\
+\x02\x63\x4e\x1e\xfa\x1a\xeb\xff\xe0\x39\x1c\x63\x1a\xad\xb1\xa0\
+\x62\xe3\xcf\xa0\xe1\xcf\xf8\xc1\xef\x8b\xe6\x38\xb6\x1f\xcb\x9a\
+\xa7\xd9\x6c\xfa\x1b\xed\x76\xd3\x4c\x9e\xe7\xba\xc1\x39\x82\x68\
+\x11\x6a\xea\xea\x66\xae\xdb\xbe\x6b\xce\x89\x33\x99\x58\x39\x9d\
+\xb8\x04\xc3\x07\xf4\xc3\xd2\x15\xb8\xdf\x1d\x1e\x3d\x12\x57\x2b\
+\x84\x78\x21\x92\x4f\x9e\xc9\x7a\xe0\x95\x8f\x3e\xbb\xf3\xec\xb0\
+\xe5\x3d\x37\xcd\x2d\x19\x3d\x24\xe5\x61\x68\xe2\xfe\x24\x57\x8a\
+\x68\xe3\xce\x3d\x8b\x96\xac\x5e\x37\xb3\xae\x41\x87\x11\xa5\x76\
+\xe7\x87\x0f\xde\x7a\x5d\xa9\x90\xe3\xe6\x8b\x58\xbd\x96\x20\xda\
+\x15\xa3\xdd\x3c\x70\x43\x59\xea\xbc\x45\x39\x2b\xa7\x70\x0c\x2f\
+\xea\x13\xd0\x39\x67\x58\x48\x9f\x03\x81\x72\xbf\x2a\xa9\x58\x62\
+\x73\xec\x3d\xc6\x33\x22\x8e\xe1\xc4\x30\x9c\xc0\xb3\x04\xae\xe6\
+\x14\xb3\xb8\xed\x86\x18\xdd\x02\x30\xd2\xc0\x53\x86\xf3\xfa\x6d\
+\x3c\x72\x3c\x27\xb1\xb0\x36\xa5\xce\x6e\xf0\x2d\x35\x55\x85\xe7\
+\xea\x8b\xa3\xca\xcd\x35\x01\x7e\x32\x1f\xc3\x63\xd1\xa3\xf7\x05\
+\x07\xf7\xf8\x00\x5e\x86\xa5\xf7\x3d\x2e\x01\x93\x68\x3b\xe0\xbe\
+\x11\xb8\x62\xc3\x96\x6f\x56\x6c\xd8\x3c\xc9\x60\x32\x5d\xe9\xe2\
+\x19\xaf\xe2\xdb\x77\x5e\x3b\xed\xa3\xd1\xbc\x8d\x4d\xa7\xc7\xf3\
+\x70\x17\x01\x24\x61\x39\x6e\xf8\xbb\x5f\x7e\xfb\xe9\xa1\xe3\x27\
+\xff\x7e\x2a\x8c\x8e\x08\xe7\xdf\x7f\xfe\xa9\xbb\xa1\x89\x62\xe1\
+\x8a\x57\x73\xe9\x0c\x86\x1b\xbe\x5f\xb2\xec\xd1\x9d\xfb\x0f\xf5\
+\x13\x5c\xed\xca\x23\x77\xde\x7a\x6a\x70\xdf\xde\x4f\x41\xd3\x51\
+\xad\x9a\x20\xda\x93\x93\xf5\xd9\x0f\x3f\x78\xf0\xed\xe7\xf2\x0c\
+\x25\x41\x82\xab\x4d\xf8\x3d\x72\x74\x79\xbf\xfe\x8f\xbe\x09\xcd\
+\xcf\xc0\x3c\xbb\xd8\x0a\xd1\xaa\x94\x56\x54\xde\xf1\xed\x6f\x4b\
+\x9f\x3a\x9a\x7e\x3a\x49\x70\x11\x17\xa1\x5b\xa7\x04\xfe\xa5\x47\
+\xee\xdf\x02\x4d\xdc\xa1\xc0\xe3\x96\xbf\x37\xe2\xd2\x53\x60\x67\
+\xc1\x4a\xc4\xe2\x8c\x1b\x66\x4c\xfb\x06\x97\xad\x37\x4e\x57\x15\
+\x95\x96\xe1\x34\x58\x3c\x34\x31\x1c\x7f\xc5\x68\x35\x9a\x3f\x7a\
+\x77\xeb\x7a\x48\x21\x97\xbb\xc4\x1e\x27\xab\x36\x6f\xc7\x69\x3d\
+\x2c\xf4\x48\x49\x7a\x44\xbb\x63\xb0\x9b\x7c\x0b\x8c\xa5\x38\x2d\
+\xdb\xa6\x58\x2c\xf5\x58\x13\x6b\x16\x58\x73\x6a\x7e\x11\x84\xcf\
+\xef\xab\xd6\xdd\x7f\x32\x33\x8b\xa6\xbe\x9a\xc8\xb0\x01\xfd\x70\
+\xd9\x3b\x6e\x14\xec\xb1\xe2\x07\x71\x17\x01\x84\x94\x45\x47\x84\
+\xad\xec\xd6\x29\x31\x47\x22\xf9\xa7\x76\xcf\x8e\x7d\x07\xb0\x78\
+\xe0\x78\x67\xef\x8a\xb1\x26\x75\xec\x90\x91\x18\xd7\xc1\x25\x76\
+\xb9\xcd\xcc\xcd\x93\xd8\x59\x16\x37\xb1\x74\x89\x29\x39\xc2\xbb\
+\xc1\xa9\x2b\x2c\xd3\x20\x74\xdb\x0c\x8e\xb3\x61\xae\x10\x2e\x08\
+\x70\xa7\x71\x8a\x70\x2d\xa4\x06\xa3\x71\x42\x59\x65\x55\x08\xed\
+\xf4\xde\x74\x06\xf5\xe9\x85\x1b\x08\xef\x71\xf6\x3c\x17\xb7\x1a\
+\x58\x44\x22\x51\xe9\x43\x77\xdc\xfc\x88\x5a\xa5\x32\x37\x46\x81\
+\x7e\x5f\xbd\x1e\x23\x40\xb8\x6c\xbc\x59\x03\x74\x58\x48\xf0\xc2\
+\xab\xc6\x8f\x5e\xea\x2a\x85\x11\x0b\x8a\x4b\x71\xb7\x7a\x97\x98\
+\x92\x23\x88\xf6\x80\xe7\x1d\xfb\x33\x51\xbe\x06\x71\xa5\x60\x8a\
+\x47\xd0\x7f\x3e\xfd\xfa\xf3\xbc\xc2\xa2\x48\xc1\xd7\x2c\x64\x32\
+\xd4\xe4\x9e\x4d\xd7\xc4\x04\xde\x47\xa3\x3e\x08\xcd\xef\x9d\x1e\
+\xcf\xc5\xdd\x9e\xac\x0c\xbe\x5a\x9f\xed\x28\x80\x84\x3e\xa3\x37\
+\x18\x44\x75\x0d\x3a\xdc\x18\x55\xeb\xf4\x5c\x31\xba\xd0\xe0\xa0\
+\x2a\xf8\xfd\xb8\xec\xaf\xdd\x59\xbe\x7e\x13\x46\xb5\x06\x39\x7b\
+\x04\xe1\xb5\x50\xf4\x87\xb8\x22\x40\xfc\x04\x64\xe7\x17\xde\x52\
+\x5a\x5e\xa1\x6d\xa9\x9d\xde\x13\x3b\x78\x7e\x89\xb6\x31\x43\x53\
+\x30\xb8\x80\x05\x10\x5d\xa6\x3c\x4c\x6b\xe1\x8e\x83\x0b\x3b\x6e\
+\xe8\xa0\xed\x7e\x67\x09\x95\xbf\x36\x6d\x9d\x0b\x87\xfb\x9c\xbd\
+\x2b\x27\x2a\x2c\xf4\xbb\x47\xee\xbc\xed\x2d\xa1\xdb\xae\xec\x3b\
+\x72\x4c\x09\x17\x30\xed\x53\x43\x10\x04\x71\xf9\x88\xec\x76\x36\
+\xea\xcd\xcf\xbf\x7e\xb1\xa5\x56\x7d\xc5\x44\x84\x33\xbe\x3e\x9e\
+\x9d\x95\xa0\x54\x28\x70\xf3\xd3\x3c\x68\x66\x38\x3d\x9e\x8d\x3b\
+\x0a\x20\xd3\xf4\x71\xa3\x1f\xea\x10\x15\x89\x35\x82\x1c\xac\xdb\
+\xbe\x33\xdc\x66\xb7\xb7\x84\x34\xaf\x0e\x0d\x0a\x2c\x0c\xf4\xf7\
+\x6b\x10\xfa\xed\x06\x88\x1f\x51\x4d\x7d\x3d\x6e\x8d\x81\x75\x81\
+\x08\xc2\x5b\x71\x8b\x65\xaa\x84\x6b\x61\xb1\x5a\xfb\x7f\xf9\xcb\
+\x6f\xdf\xb6\x64\xc1\xc3\xb9\x33\xa6\xe2\x83\xa9\xd0\xf3\x4c\x46\
+\x0d\x1e\xc8\xc8\xa4\xd2\x35\xd0\xfc\xc5\xe9\xf1\x6c\xdc\x51\x00\
+\x61\x05\xe7\xa2\x00\x7f\xbf\x3a\x99\x4c\xea\xa8\x4e\x89\xc9\x6d\
+\x45\xa5\x65\x21\xd0\x6c\xae\x08\xe2\x41\xfc\x6c\x7a\xf4\xae\xdb\
+\xde\x10\xfa\xed\xca\x9e\x83\x69\x38\x0d\x86\xab\x60\x08\xc2\x5b\
+\x71\x89\x9c\x3c\xc2\x7d\x80\xfb\x41\xd7\x23\xa7\x32\x6e\xda\x7f\
+\xe4\x78\x4f\x7c\x90\x44\x13\x4e\x5d\x31\x53\xc7\x8c\x64\x4e\x9d\
+\xc9\x12\x7a\x9e\xcb\xc4\x91\xc3\xb0\xe8\x21\x06\x17\x2a\x1c\x0e\
+\x0f\xc7\x6d\xe7\xd7\x6f\x9a\x79\xd5\x7b\xbd\xba\x76\x39\x8d\x6d\
+\xfc\x82\x6f\xda\xb5\xa7\x0f\x34\x6f\xc4\x7e\x33\x29\x8b\x89\x08\
+\x3f\x18\x1e\x1a\x52\x2d\xf4\xdb\x8d\xf5\xdb\x77\xc5\xc0\x81\x96\
+\x6e\x12\xde\x0c\x45\x80\x88\xcb\xc1\xb7\xbc\xaa\x6a\xf8\xb2\x75\
+\x9b\x66\x99\x2d\x16\xac\x4e\xde\x6c\x82\xfc\xfd\x99\xe9\xe3\x46\
+\xf3\x9b\x77\xef\xfd\xbb\x04\x8b\x27\xd2\x39\xbe\x23\xa6\x81\x60\
+\xed\xb9\xed\x60\x5e\xf1\xe0\xe1\xb6\x02\xc8\xd7\x47\xb3\x36\xa1\
+\x43\x4c\x6e\x63\xed\x9e\x9d\xfb\x0f\x47\xeb\xf4\x86\xfe\x8e\x93\
+\xcd\x83\x53\x29\x95\xe9\xf7\xdc\x34\xf7\x23\xa1\xdf\x6e\x54\xd6\
+\xd4\x4a\x75\x06\x03\x26\x78\xd3\x4a\x18\xa2\xdd\x80\xc7\x67\x5e\
+\xdc\x2e\x03\xbf\xe3\xbf\x49\x11\x20\xa2\xa9\x48\xaa\x6b\xeb\x26\
+\xad\xd8\xb8\x65\x5e\x4e\x41\x61\xb3\x6a\xc3\x9d\xcd\x3d\x37\xcf\
+\xe5\xb7\xa7\xee\x67\x25\x62\x89\xb5\x7d\xae\x83\xb6\x61\xfc\xf0\
+\x21\x2c\x1c\x70\xe9\xbb\x67\xcf\xf3\x9d\x85\xdb\x0a\x20\x40\x07\
+\x1f\xd8\x6f\x03\x7a\x25\x1f\xc7\x8e\xc5\x6a\x95\x9d\xca\xca\xc6\
+\x9c\x99\xee\xd8\x6f\x26\xa5\x49\x1d\x3b\x2c\xc7\xfd\xc7\xda\x73\
+\x59\x3c\x46\xb6\xb2\x72\x0b\x12\xa1\x39\xc6\xe9\x21\x88\xb6\x07\
+\xb7\xb4\x10\x31\xe2\xf6\x1a\xf8\x71\x50\x26\x88\x4b\x52\xd7\xd0\
+\x30\xed\xaf\x4d\x5b\xef\xdd\x9e\x7a\x60\x80\xe0\x6a\x36\x83\xfa\
+\xf6\xe6\x7b\x76\xed\x6c\x3f\x72\x2a\xa3\x46\x2e\x97\xb9\x44\xa1\
+\xdc\xd6\x40\xa3\x52\x31\x43\xfb\xf7\x41\xe1\x83\xb3\x2a\x1e\x5d\
+\xfc\xf0\x6c\xdc\x59\x00\x61\x46\xfe\xb2\xbe\x3d\xba\xed\xf7\x51\
+\xab\x4d\x28\x16\x36\x6c\xdf\x15\x07\xee\x5b\x9d\x67\x9b\x05\x27\
+\x91\x48\x4a\xef\x9c\x33\xeb\x0b\xa5\x42\x61\x6d\xcf\xb0\xe7\xe6\
+\x3d\x7b\x71\xeb\x8f\x19\xce\x1e\x41\xb4\x3d\xf8\xfd\x97\x8a\x24\
+\x6d\xfe\x20\x20\x5c\x77\x78\xd3\xf1\xd8\xa7\x6e\xa2\x65\xd0\x19\
+\x0c\x13\x56\x6e\xdc\xfa\xd0\x86\x9d\xbb\x87\xb5\x44\xce\x0f\x82\
+\xa2\xe0\x8e\xd9\xd7\xd8\x4f\x65\x66\xd5\xab\x55\xaa\x2a\x3b\xeb\
+\xb9\x85\x14\x47\x0e\x1a\xc0\xc0\x3d\x6f\x19\x34\x4f\x38\x3d\xde\
+\x81\x5b\x0b\x20\xc0\xd0\xbb\x7b\x97\x1d\x03\x7a\x27\x3b\x42\x76\
+\x27\xce\x64\x85\x67\xe5\x15\x4c\x83\x26\xee\x59\xd4\xdc\x8b\xa0\
+\xaa\x6b\xa7\x84\x0f\x3a\x27\x74\xcc\x95\xcb\x64\x8e\x64\xeb\xf6\
+\xe0\xc0\xd1\x13\xfe\x66\x8b\xd5\xf3\x8b\x4f\x10\x2e\x4b\x3b\x4f\
+\x81\x61\x49\x7e\x82\xb8\x20\x66\xb3\x65\xf0\xb2\x75\x9b\x9e\xde\
+\xbc\x3b\x75\x48\x4b\x56\x7b\xbe\xfb\xa6\x39\xbc\xbf\xaf\xd6\x02\
+\xf7\x95\x5a\xbb\xdd\x2e\xc5\x9c\xa2\xf6\xa8\x88\xde\x16\x4c\x1c\
+\x31\x54\x07\x07\x9c\xfe\xc2\xdd\xdf\xbd\x06\x77\x17\x40\x8c\x8f\
+\x5a\xbd\x74\xf8\x80\x7e\x1b\xa4\x52\x09\x8b\xca\x7f\x7b\xea\x7e\
+\x7f\x70\xb7\xd4\xfe\x41\xe6\xb9\x57\x4d\xf9\x31\x24\x28\xb0\x56\
+\xe8\xb7\x39\xf8\x6f\x2a\x2a\x2d\xc5\x7a\x40\xb8\x35\x06\x41\xb4\
+\x03\x22\x5e\xd2\x2e\x11\x20\xc7\xf4\x33\x6d\x82\x4a\x5c\x08\x11\
+\xcb\x71\x71\xcb\xd6\x6f\x7a\x69\xc7\xfe\x83\x03\x4d\x66\x73\x8b\
+\xd5\x4d\x1b\x99\x32\x80\xe9\xd3\xbd\x2b\xf7\xf5\xe2\x3f\xec\x27\
+\x4f\x67\x49\xf3\x8b\x4b\x22\x51\x5c\xb5\x54\x74\xc9\x95\xe8\x92\
+\x10\xcf\x44\x84\x85\x6e\x83\xa6\x57\xac\xfc\x3a\x1b\xb7\x17\x40\
+\x80\x35\x22\x34\xa4\x28\x21\x36\xb6\x08\x3b\x9b\x76\xed\x0d\xab\
+\xae\xa9\x7d\x15\x9a\x2d\x91\x38\x6c\x89\x8b\x8e\x7a\x23\xb9\x73\
+\xa7\x0c\x95\x52\xd9\x6e\x4f\xa2\x47\xd3\x4f\xe3\xc6\xa8\x4d\xd9\
+\xef\x4c\xcc\xf3\x8c\x1f\x5c\xa4\x58\x3b\xa8\x45\x56\x40\x10\x04\
+\xe6\x00\x09\xcd\x36\x05\x04\x10\xfe\x77\x51\x00\xd1\x14\x18\x71\
+\x2e\xf8\xa5\xd4\x1e\x3a\x76\xe2\xe1\x3d\x87\xd2\xfa\x37\xe8\xf4\
+\xb8\x58\xa4\x45\x08\x0a\xf0\x67\xe6\x4c\x9f\xcc\xbc\xf2\xd1\x67\
+\x7c\x6a\xda\x11\x79\x41\x71\x49\x44\x5d\x83\xce\xc7\x13\xc5\x0f\
+\x4e\x33\x8f\x1f\x3e\x04\xaf\xaf\xf7\xc1\xce\x38\x9c\x5e\x84\x27\
+\x08\x20\xfc\xc2\xae\x9c\x73\xd5\xe4\x45\xf8\x61\x62\xc9\xf3\x6d\
+\xfb\xf6\xa3\xf8\xc1\xdd\xab\x5b\x24\x1c\x7a\xcd\xe4\xf1\xdf\x75\
+\x8e\x8f\xcb\x6b\xaf\x5c\xa0\xd5\x9b\xb7\x77\xb4\xd9\xed\x77\x09\
+\xdd\x8b\xa1\x2d\xaf\xaa\xba\x7a\xf3\xee\xd4\x0f\xa1\xdd\x05\x8c\
+\x76\xd1\x26\x5a\x84\x76\x9c\x02\xa3\x08\x10\x71\x3e\x94\x46\xa3\
+\xa9\xdf\xc2\x5f\xff\x98\x57\x5e\x55\x8d\x63\x7d\x8b\x71\xf7\x8d\
+\x73\x98\xb7\xbf\xf8\x86\xc9\xcc\xcd\x97\x62\x21\xc5\x96\xaa\x24\
+\xed\x8a\xf8\x68\xd4\xcc\xf0\x81\x8e\x9d\xdf\xcb\xc1\xbc\x6e\xba\
+\xd9\x23\x04\x10\x50\x16\x16\x14\x94\xdf\x38\x48\x6f\xd8\xb9\x47\
+\xc9\x71\xdc\x6b\xd0\xc4\xc8\x49\xb3\xf1\xd3\x6a\xbf\xef\xda\x29\
+\x21\xbb\xbd\x96\x40\xe2\x05\x98\x93\x5f\x18\x2e\x74\x2f\x86\xe6\
+\xc4\xe9\xcc\x31\x8b\x57\xae\x9e\x50\x5a\x51\x89\xff\x7e\x14\x41\
+\x04\xe1\x96\x08\x0f\x1c\x24\x80\x88\xff\x01\x1e\x08\x3b\xde\xf3\
+\x7f\x2f\xaf\xab\x6f\xc1\xc8\x0f\x32\x6b\xca\x04\x66\xc3\x8e\xdd\
+\x4c\x5e\x51\xb1\xe0\xf1\x6c\xc6\x0c\x4e\xc1\xfc\xd6\xad\x60\x5e\
+\xb3\xf2\xeb\x6c\x3c\x45\x00\x31\xfe\x7e\xbe\x45\xc3\x53\xfa\xe3\
+\x0e\xb6\x4c\x5d\xbd\x4e\xb6\xfb\xe0\xe1\x99\xd0\xf4\xc5\x7e\x4b\
+\x30\x7d\xdc\xe8\xff\x4c\x1b\x3b\x6a\x8b\xd0\x6d\x73\x4e\xe7\xe4\
+\x62\x34\x4b\xe5\xec\x5d\x10\x7d\xcf\xae\x49\xf8\x65\x66\xbe\xfd\
+\xfd\xcf\x71\x70\x68\x11\x01\x48\x10\xed\x93\xfc\xe9\x10\x40\xb4\
+\x0a\x8c\xf8\x17\xf0\x70\x1b\x95\x99\x9b\x7f\x2d\x96\x3e\x11\x5c\
+\x2d\x42\x72\xe7\x24\x46\x2e\x93\x31\x07\x8f\x79\xcf\x42\xa8\x71\
+\xc3\x87\xe0\xc6\xe2\x4f\x81\x95\x39\x1c\x5e\x86\xc7\x08\x20\x99\
+\x54\xba\xe7\xba\xa9\x13\xff\xdb\x38\x4d\xb5\x72\xe3\x56\x0c\x5b\
+\xa2\x00\x6a\x91\x69\x30\xa9\x44\x72\xb0\x4b\x62\xfc\xdf\x85\x17\
+\xdb\x12\x9c\x7b\xde\x73\xe8\x48\x20\x1c\xef\x85\xee\xc5\x72\x7b\
+\xf4\x21\x81\x81\x1b\xb4\x1a\x8d\xf1\x44\xc6\x19\x85\xd1\x64\x9e\
+\x00\x3e\xac\x23\x44\x10\x57\x0c\xcf\xb4\x6b\xee\x03\xd5\x01\x22\
+\xfe\x85\xc9\x62\xe9\xf4\xf5\xe2\x25\xf7\xe3\xb8\xd8\x52\x79\x39\
+\x7e\x5a\x1f\x66\xf6\xb4\x49\xcc\xe2\x15\xab\x05\x8f\xe7\x33\xa0\
+\x57\x32\x1f\x16\x1c\x84\x11\x56\xcc\x9f\xf5\xd8\x1a\x47\x17\xc3\
+\x63\x04\x10\xa0\xf7\xd3\x6a\x8b\x83\x03\xfc\xeb\xb1\x53\x50\x52\
+\x2a\xaa\xa9\xab\x7f\x06\x9a\x5d\xb1\xdf\x02\x58\xfa\xf6\xe8\xf6\
+\xf9\xf5\x33\xa6\xfe\x29\xf4\xdb\x94\x92\xf2\x8a\x80\x8c\xac\x1c\
+\xac\x71\x74\x31\x01\x84\xa5\xda\xeb\x52\xfa\xf4\x3a\xa4\x56\xab\
+\xcc\x1b\x76\xec\xc6\x28\x58\x0f\xe7\x29\x82\xb8\x52\x78\x11\x07\
+\x5f\x2d\xa1\xd3\xd6\x78\x5c\xe2\x29\x71\xe5\xb0\x2c\x9b\x78\x3a\
+\x3b\x77\x0a\x8c\x87\xc1\x82\xab\x45\x78\x7c\xfe\x1d\xcc\xa2\xa5\
+\xcb\xd9\xf6\xca\xf3\x6c\x0f\xe6\x5e\x35\xa5\x0a\x0e\x9f\x80\x19\
+\x1d\x0e\x2f\xc4\x93\x04\x10\x86\x2f\xb3\xee\xba\x61\xf6\x17\x8d\
+\x4f\x06\x2b\x36\x6e\x19\x0d\xee\x50\xe7\xd9\xe6\x03\x17\xc7\x89\
+\x94\xde\x3d\xf7\x47\x47\x84\xb7\xf9\x72\x41\x0c\xf7\x6e\xdd\xbb\
+\x0f\xf7\x06\xc3\xc8\xd6\xc5\x6e\x0a\xd6\xa9\x63\x46\x7c\x15\x1a\
+\x14\x54\xb3\x74\xed\x86\x0e\xf0\x73\x58\x19\x1b\x37\x8a\x25\x88\
+\x2b\x02\xee\x08\xb8\xdc\xb8\x1d\xc6\x0a\xc7\xd3\xbd\xc7\x16\x9f\
+\x23\x2e\x9f\x06\xbd\x21\x79\xc5\x86\x2d\xd7\xb6\x54\xe4\x07\xb9\
+\xf5\xda\x19\x7c\x56\x41\xa1\xa5\xb4\xbc\xd2\x26\x91\xb4\x5f\xe5\
+\xff\xb6\xa4\x57\xb7\x2e\x7c\x4c\x44\x78\x0d\x34\xbf\x03\xf3\xda\
+\x3c\x3b\x8f\x12\x40\x40\x59\xb7\x4e\x09\xab\x70\x9a\x0a\x95\xfc\
+\xba\x6d\x3b\x7d\xed\x2c\x8b\x22\x08\x2b\x44\xb7\x04\xb6\xa0\x00\
+\xff\xb5\x37\xcf\x9c\xbe\xb4\xad\x9f\x14\xf0\x82\x3f\x78\xec\xa4\
+\x02\x6e\x44\x37\x41\x17\x6b\x1d\x5d\x08\xbb\xaf\x8f\xcf\x16\x7f\
+\x5f\x6d\x83\xdd\x6e\x97\x2c\x5f\xbf\xf9\x1a\xf0\x8d\x05\xa3\x27\
+\x69\xe2\x8a\xc0\xef\x5e\x7b\x44\x80\x84\x9b\x1c\xd6\x76\xa1\xef\
+\x2e\x81\xc8\xf4\x46\x63\x78\x46\x76\x4e\x4b\x8d\xe7\xcc\xf0\x81\
+\x7d\xb9\x81\xbd\x7b\x9a\xf6\xa5\x1d\xad\x10\x83\xf8\xe1\xb9\x96\
+\x13\x56\xae\xcc\xf5\x57\x4d\x2d\x85\x03\xce\x66\x14\x80\x79\x6d\
+\x8e\x9d\xa7\x09\x20\xab\x5c\x26\xcb\xbe\xf3\xfa\x6b\x17\xe1\x16\
+\x16\xe8\xd8\x7f\xe4\x18\x16\x45\x4c\xc6\x76\x0b\x91\xde\xab\x7b\
+\xd7\x9f\x66\x4f\x9b\x84\xbb\xe6\xb6\x29\x66\xab\x45\x9e\x7a\xf8\
+\xc8\xdd\xd0\xbc\xd4\xb2\xcf\x3a\x10\x82\x65\xf8\x1e\x2c\x5f\xbf\
+\xa9\xf7\xce\xfd\x07\x6f\x07\x1f\xe6\x03\x11\x84\x1b\xe1\xb8\x19\
+\x79\xec\x12\x64\xe2\xf2\xb0\xda\x6c\xdd\xb3\x72\xf3\x07\xb4\x54\
+\xf4\x27\x31\xae\x03\xf7\xc0\x6d\x37\xeb\xf7\x1e\x3a\x72\xc2\xcf\
+\xc7\xa7\x0e\xc5\x8f\xa7\x56\x7a\x3e\x9b\xa4\xf8\x38\x3e\x3e\x36\
+\x3a\x17\x9a\x3f\x38\x3d\xde\x8b\xa7\x09\x20\xa4\x7a\x58\xff\xbe\
+\x1f\xaa\x55\x4a\xcc\x6e\x67\x7e\x5e\xb6\xaa\x33\x1c\x22\xc1\xa4\
+\xd8\x6f\x09\xc4\x22\xd1\x91\x69\x63\x47\x7d\xdd\xbb\x5b\x17\xdc\
+\x38\xae\xcd\xc0\x4a\xa4\x1f\x7d\xfb\x63\x17\x18\x08\x86\x40\xf7\
+\xa2\x95\xa1\xc7\x0c\x19\xb4\x26\x36\x2a\xb2\x14\xa7\x2e\xbe\xfd\
+\xed\xcf\x11\xbb\x0f\x1e\x9e\x07\x32\x1f\xf7\x15\x23\x88\xcb\x02\
+\x93\xa0\xdb\xe3\xc6\xc0\xf3\x2c\x8e\x4f\x97\x9a\xf2\x25\xbc\x84\
+\x8a\xea\x9a\x94\xcd\xbb\x53\x31\x9a\xdd\x6c\x02\xfc\x7c\xf9\xa7\
+\xef\xb9\xb3\xa6\xb0\xa4\x6c\x6f\x58\x48\x70\xaa\xde\x68\x52\xe3\
+\x5e\x5f\x2d\x39\xb5\xe6\xaa\xdc\x78\xf5\x74\x4c\xe1\x38\x00\x96\
+\xe1\x70\x78\x31\x9e\x28\x80\x6c\x12\x89\x24\xbf\x53\x5c\x87\x7c\
+\x9c\x0a\xab\xac\xa9\x11\x57\xd7\xd6\x61\x04\xa8\x25\x57\x43\x19\
+\xe1\x77\x1f\xba\x65\xd6\x0c\x47\xa4\xa9\xad\xa7\xc3\x96\xad\xdd\
+\x88\x45\x11\xb1\xc6\xcf\x05\xf3\x23\x34\x6a\xd5\xcf\xe3\x47\x0c\
+\x39\xe8\xef\xab\xd5\x1b\xcd\x66\x05\x0c\x1e\x03\x59\x96\xbd\x4e\
+\x38\x4d\x10\x2e\x8f\x70\x33\xa2\x8a\xe6\x04\x03\xe2\x24\x29\x33\
+\x27\x2f\x25\x33\x2f\x1f\xf3\x20\x9b\x85\x5c\x2e\xe3\x9f\x7b\x70\
+\x41\xb5\xaf\xd6\x67\x37\xb4\xff\x50\x2b\x95\x0d\x65\x95\x95\xc1\
+\x36\x9b\xad\xc5\x1e\x92\x5d\x95\x8e\x31\x51\x4c\xd7\xc4\xf8\xe3\
+\xd0\x5c\xe2\xf4\x78\x37\x9e\x28\x80\x10\xeb\x4d\x33\xa7\xff\x18\
+\x1c\x18\x50\x87\x9d\x45\x4b\x57\xe0\x6a\xa8\x31\xd8\x6e\x41\x4a\
+\xa2\x23\xc2\x7f\xba\x7a\xc2\xd8\x2d\x6d\xbd\x59\xea\xd2\x75\x1b\
+\x87\xeb\x0c\x86\xc9\xd0\x8c\x07\xbb\xd0\x45\x5b\x96\xd2\x2b\x79\
+\xd9\xc0\x5e\x3d\x8f\x8e\x19\x32\xc8\x3a\x73\xe2\xb8\x68\xa9\x44\
+\x32\x10\xfc\x1e\x7f\x91\x13\x2d\x4b\x7b\x6d\x85\x21\x40\x49\xd0\
+\x5e\x0e\x7c\xf9\x7c\x4f\x9d\xc9\xba\x75\xdd\xf6\x5d\x13\x2f\x16\
+\xa1\x81\xf1\x5e\x68\x5d\x9c\x87\xef\xb8\x45\x1f\x13\x11\x91\x6a\
+\xb6\x58\x7e\x82\x07\xc5\x5c\x10\x55\x3d\xf5\x06\xa3\xba\x7d\x12\
+\xfd\xdb\x96\x39\x57\x4d\xc5\x4d\x4f\x8f\x82\xe1\xc6\xa7\x5e\x8f\
+\xc7\x0a\xa0\xd0\xe0\xa0\x8f\xa2\xc3\xc3\xca\x24\x62\x31\x97\x7a\
+\xf8\x48\x64\x6d\x7d\x03\x8a\x85\x8b\x25\x0f\x5f\x09\x85\xd7\x4c\
+\x1e\x7f\x43\x8f\xce\x9d\x32\xdb\xba\x3e\xd0\x67\x3f\x2c\x7e\xa6\
+\x41\xaf\xbf\xdb\x62\xb5\xf6\x86\x41\x21\x02\x5c\xff\xf3\xa4\x2c\
+\x93\xc9\x16\x4f\x1f\x37\xea\x97\xda\xfa\xfa\x9c\x0d\x3b\x76\xe3\
+\xc0\x81\x55\x53\x5b\x6c\x55\x1c\xe1\x3d\xb4\x57\x15\x74\x80\xa6\
+\xbf\xbc\x1b\x45\x5d\x7d\xc3\xd8\xd4\xb4\xa3\xa3\x73\x0b\x8b\x30\
+\x95\xe1\x7f\xc0\x1a\x3e\x8f\xcc\xbb\x95\x1f\xd8\xbb\x27\x7f\xa9\
+\x68\xfc\x6d\xd7\xcd\xb4\xf5\xef\xd9\xe3\x28\xc7\x71\x7f\x4a\xa5\
+\xd2\xe3\xf5\x0d\xfa\xf8\xf5\xdb\x77\x8d\xb6\x7a\x41\xf4\x07\x1e\
+\xd8\x99\xbe\xdd\xbb\xa6\x41\x73\x97\xd3\x43\x78\xb2\xe2\xb5\x4d\
+\x1a\x35\x3c\xc7\x57\xeb\x63\xc0\x8b\x62\xe5\xc6\x2d\x98\x04\x7c\
+\xad\xf3\x54\x8b\xa2\x7b\xe8\x8e\x9b\x1f\x49\xe8\x10\x5b\x88\x62\
+\x4b\xf0\xb5\x3a\x87\x8e\x9f\x94\x3e\xfb\xd6\x87\x8f\x3d\xfd\xe6\
+\xfb\x6b\xb6\xee\xdd\xf7\x1f\x96\x65\xfb\x81\x1b\x93\xa3\xff\x55\
+\x1d\x35\x2c\x24\xf8\x87\xa9\x63\x46\x2e\xfd\x75\xe5\x1a\x4b\x56\
+\x5e\xbe\x1f\xb8\x7a\x39\xcf\x10\x84\x5b\xd0\x9e\xd1\x27\xa2\x7d\
+\x91\x98\xcc\x96\x7e\xbf\xac\x58\xf5\xcc\xe6\xdd\xa9\x83\x04\xdf\
+\xdf\xe0\xb8\x3e\x22\x65\x00\xff\xe1\x8b\xcf\x1a\x06\xf7\xeb\x5d\
+\x35\x73\xe2\xd8\xca\xa8\xf0\x30\xe3\x85\x44\x10\xdc\x0f\xd8\x29\
+\xa3\x47\xe0\xaa\xa7\xe5\xf0\x9a\x4d\x66\xb3\x25\x66\xdb\xde\x7d\
+\xb3\xe1\xe1\x58\xeb\x0d\xb9\x3f\xb3\x26\x4f\xc0\x99\x8a\xcd\x60\
+\x2b\x1d\x0e\xc2\xa3\x05\x10\xd3\xad\x53\xc2\xcd\x13\x46\x0c\xdd\
+\x87\xed\x35\x5b\x77\xf4\xa8\xaa\xad\x4d\x81\x66\x4b\x7f\xd1\xed\
+\x4a\x85\x62\xc3\xb0\x01\x7d\x8f\xf8\xf9\x6a\xdb\x74\x3f\x95\x8a\
+\xea\x6a\x2c\x90\x18\xfc\xe5\xcf\xbf\xdf\x7a\xf3\x23\x4f\xed\x7c\
+\xf9\xc3\xcf\xf6\xdb\xed\xec\x30\x38\x75\xf6\xb4\x81\x3e\x2c\x38\
+\x28\xaf\x63\x4c\x74\xf1\xb7\xbf\x2f\x0b\x87\x01\x05\xa7\xce\x08\
+\xa2\xc9\xb4\x57\x12\xb4\x80\xc7\x4f\x4b\x10\xe7\x45\x6c\xb7\xdb\
+\x3b\xbd\xf7\xd5\xb7\xdf\xef\xd8\x77\xb0\xbf\xe0\xfb\x1b\xdc\xb2\
+\xe2\xb1\xbb\x6e\x67\xee\xbf\xf5\x06\x5e\xa3\x56\x7d\x04\xae\x21\
+\x7e\x5a\x6d\xbf\xd7\x9e\x78\xe8\xab\xc6\x15\xc0\x67\x33\xa0\x57\
+\x32\x73\xc7\xec\x6b\x70\xe9\x37\xee\x7a\xfe\xb3\x9d\x65\x7d\x33\
+\xf3\xf2\xc7\xaf\xdc\xb4\xb5\x45\x92\xaa\x5d\x9d\xd0\xa0\x20\x66\
+\x68\xff\x3e\xd9\xd0\x44\x01\xe8\x15\xb5\x8e\x9a\x82\xa7\x0f\x2e\
+\x86\xa9\x63\x46\x7d\x0b\xe2\xe4\x30\x76\x7e\x5f\xb5\x0e\xf7\xc7\
+\x7a\x1e\xdb\x2d\xcd\xb8\x61\x83\x6f\x1f\x3f\x7c\xc8\x6e\x99\x4c\
+\xda\xa6\xf9\x40\x8d\x4f\x2e\x2c\xcb\x89\xcf\xe4\xe6\x76\xd8\xb1\
+\xff\xc0\xf7\xd0\xc5\x44\xc1\xbf\x45\x90\x8f\x46\x53\x15\x11\x1a\
+\x52\x9e\x5f\x5c\x1c\xbc\x64\xcd\xfa\xe1\xe0\xc2\x2a\xaa\x34\xb5\
+\x40\x34\x19\xbe\x5d\xea\x00\x39\x72\x32\xa8\x0e\x90\xf7\x21\xb7\
+\x5a\x6d\xbd\x5e\xfa\xe0\xd3\xf5\xe9\xd9\x39\x1d\xd1\x71\x76\x84\
+\x46\x21\x97\x33\xff\xf7\xc0\xdd\xfc\xc0\xde\xc9\xf8\xc0\x89\xf9\
+\x9d\x28\x6a\x70\x59\x77\x89\x4a\xa1\x38\xd6\x25\xa1\x23\xb6\xff\
+\x26\x31\x2e\x96\x79\xe4\xce\x5b\x71\x83\xaf\xfb\xc0\x7e\xe4\x19\
+\xc6\x54\x56\x59\x35\xe2\x87\xa5\x2b\xb0\x3c\x88\x57\x30\x73\x92\
+\x43\xe7\x7d\x0e\xf6\x3b\x36\x08\x27\x9e\x2e\x80\x78\xa5\x42\xbe\
+\xea\xea\x09\x63\x57\x25\x74\x88\x2d\xda\x7b\xe8\x48\x54\x51\x59\
+\x39\x2e\x21\x6f\xca\xce\xea\x97\x4b\xc3\x35\x93\xc6\x3f\x74\xdd\
+\x94\x49\xab\x2e\x35\x0f\xdd\xd2\xe0\xe0\x80\x86\xcb\xe4\xb3\xf3\
+\x0b\x71\x03\xd4\x07\xc1\x82\x1c\x27\x01\x99\x54\x5a\x1b\x1c\x18\
+\x50\x89\xe7\xb7\xed\xd9\xd7\x79\xc3\x8e\xdd\xcb\xc1\xad\x76\x9e\
+\x25\x88\x8b\x03\x5f\xe6\x76\x12\x20\x8e\x9b\x1e\xad\x02\xf3\x2e\
+\x94\x46\x93\x39\xe5\x8d\xcf\xbe\x5e\x92\x53\x58\x18\xa5\x54\x28\
+\x24\x77\xdf\x38\x5b\xe4\xa3\xf9\x67\xb8\x7a\x72\xc1\x3c\xbe\x6b\
+\x62\x82\x01\x9a\x3b\xc1\x30\x9f\x05\x2b\x1a\xe3\x9e\x71\x5c\x45\
+\x55\xb5\x52\x67\x30\xfe\xbd\x43\x7c\x44\x58\x28\xf7\x7f\xf7\x2f\
+\xa8\x90\x4a\x24\x4f\x40\x17\x37\xb3\xd6\x19\x8d\xa6\xbe\x07\x8e\
+\x1e\x9f\x54\x56\x51\x19\xe4\x0d\x53\x5f\x81\xfe\x7e\xcc\xd8\xa1\
+\x83\xf7\x43\x33\x1d\xcc\x6b\xb7\xbd\x38\x1f\xde\x10\x5e\xd6\xc5\
+\x44\x46\x2c\x9c\x3d\x6d\xd2\x52\xb9\x5c\x66\xfb\x63\xf5\x3a\xcc\
+\x81\x79\xd2\x79\xaa\x65\x01\xe1\x93\x3d\x75\xec\xc8\x0f\xe6\x4c\
+\x9f\xfc\x97\xe0\x6a\x53\xf0\x62\xae\xac\xae\xc1\xcf\x14\xf7\x3f\
+\xc3\x27\x67\x07\x52\xa9\xa4\x38\x2a\x3c\x2c\x17\xcf\x1b\x4c\x26\
+\xe5\xe2\x15\xab\xfb\x95\x56\x54\x62\x09\xf4\x28\xe7\x2b\x08\xe2\
+\xe2\xd0\x14\x18\xd1\x06\x88\xcc\x66\x4b\x9f\xaf\x7e\xf9\xfd\xe3\
+\x53\x99\x59\xf1\x18\xd5\xbe\xf1\xea\x69\xa2\x31\x43\x06\x31\x31\
+\x11\xb8\xce\xc3\x11\x69\x67\x92\xbb\x24\xe1\x14\x0e\x6e\xe0\x89\
+\x91\x1f\xdc\xfb\xd1\xf1\xc0\x89\xfb\x84\x65\xe6\x15\xf4\x2a\x2d\
+\xaf\x70\x6c\xfd\x83\xa2\xe9\xff\xee\x9b\x6f\xd1\xa8\x55\xef\x40\
+\x17\xeb\xde\x60\xc4\x48\x59\x5c\x5e\x9e\xb2\x75\xcf\xbe\x61\xde\
+\xb0\xea\x0b\x99\x39\x69\x3c\x1e\x70\xbc\x3f\x88\x0d\xe2\x1f\xbc\
+\x65\x70\x29\xea\xd5\xb5\xf3\x0f\xb7\xcc\x9a\xf1\xeb\xd1\x53\xa7\
+\xfd\xf3\x8a\x8a\x87\x82\x0f\x23\x24\x2d\x3d\xa8\x73\x32\xa9\xf4\
+\xe0\xd8\x21\x83\x96\x0e\x1f\xd8\xef\x90\xe0\x6b\x33\xc2\x43\x82\
+\x19\x95\x4a\x85\x83\x01\xce\xf3\xfe\xbd\x2a\x0d\x84\x59\x45\x42\
+\x87\x98\x42\x10\x42\x2c\x8a\x20\xac\x0b\xf4\xc1\xc2\x45\x93\xa1\
+\x8d\xdb\x84\x34\x6d\xed\x28\xe1\xad\x38\xa2\x8b\x42\xbb\x8d\x71\
+\x44\x52\xbd\x72\x97\x6a\x6f\xc4\x68\x32\x0f\x5b\xb6\x61\xf3\x8b\
+\x7b\x0f\x1f\xe9\x85\xdf\x39\x18\x4b\x45\x83\xfb\xf6\xc1\x53\x7c\
+\x61\x49\x09\x17\x11\x1a\xda\x70\xf3\x35\x57\x61\xf1\xd9\x75\x60\
+\x38\x95\x53\x06\xaf\x0b\x33\x5b\x2c\x29\x99\xb9\xf9\x4f\xad\xda\
+\xbc\xed\xed\xf5\xdb\x77\x4d\xc6\xf1\x4d\x26\x93\x32\xcf\xde\x37\
+\x1f\x57\x03\xe3\x74\x18\x46\xbc\x1d\x9b\x64\xd7\xd4\xd5\x4f\xd9\
+\xb5\xff\xd0\x94\x8a\xea\x1a\xaf\x18\xf7\xc2\x82\x83\x98\x89\x23\
+\x86\xe2\xf4\x1f\x2e\x7d\xc7\x48\x19\x71\x16\x5e\xf3\x74\x05\x22\
+\xe0\xe4\xd0\x7e\x7d\xfe\x1c\x91\xd2\x7f\xff\xa6\x9d\x7b\x71\xb5\
+\x14\x26\x03\xb7\xc6\xd2\x47\xa3\x9f\xaf\x76\xf3\xb4\x31\xa3\x56\
+\x06\xf8\xf9\x62\xcd\x85\x36\x21\x28\xc0\x9f\x79\xe9\x91\xfb\x99\
+\x61\xfd\xfb\x62\x0e\xd2\x5e\xb0\xb3\x43\x9d\x86\x40\x7f\xbf\xe2\
+\x91\x83\x06\x96\x34\x4e\xcf\xe5\x17\x97\x68\x4e\x9e\xc9\x5a\x00\
+\x4d\x2c\x0f\x40\x10\x17\x82\x97\x88\xc4\xac\x42\x2c\x6f\xd3\xdc\
+\x36\x44\x22\x71\x24\xb3\xe6\x80\x51\xd2\xa6\x87\x63\x67\xd9\x4e\
+\xa7\x32\xb3\xae\x5e\xbb\x75\xc7\xe8\x46\xc1\x3d\x66\xe8\x20\x46\
+\xa5\x54\xe0\x78\x95\xf1\xfc\x43\xf7\x7e\xfc\xd6\x33\x8f\x3d\xaa\
+\x52\x2a\x9f\x85\xfe\xbb\x60\x5b\x4b\x2b\x2a\xa7\x6e\xdd\xbb\xef\
+\xf5\x15\x1b\xb7\xbc\xf8\xe3\x9f\x2b\x17\x2c\x5f\xbf\x79\xf2\x99\
+\xdc\xbc\x58\xfc\xf9\x87\xe7\xdd\x6a\x4b\x8c\xeb\x80\xdf\x1d\x8c\
+\x12\x15\x82\xd9\x59\x8e\x8b\x3b\x96\x7e\x7a\xea\xbe\x23\xc7\xb0\
+\x74\x48\x7b\x45\x34\xdb\x94\x1b\xae\x9e\x86\x87\x2f\xc0\xb2\xb0\
+\x41\xfc\x1b\x7c\xba\x13\x9a\x5e\x41\x98\xc5\x62\x9d\xb8\x69\xf7\
+\xde\x59\xc3\x06\xf4\xcb\xf0\xd3\xfa\xbc\x08\x3e\xc7\x96\x19\x2d\
+\x0d\xbc\xad\x3d\xf7\x1c\x4a\x7b\xe8\xe3\xef\x7e\xbc\xbd\x2d\x2e\
+\xb6\xe7\x1f\xba\x87\x49\xee\x9c\xc4\x56\x54\x55\x97\x82\x00\x9b\
+\xa9\x90\xcb\x8f\x81\xfb\xec\xd5\x10\xfd\x4c\x16\xcb\x23\xf7\x3e\
+\xfb\xf2\x5c\x78\x42\x72\x08\xdf\xae\x89\x09\xdc\x4b\x8f\xdc\x77\
+\x2f\x34\xff\xbf\xbd\xf3\x00\x8f\xb2\xca\xfa\xf8\x3b\x7d\x32\x35\
+\x65\xd2\x7b\x4f\x48\x48\x01\x42\xef\xbd\x83\x88\x80\x52\x14\x54\
+\xc4\x82\xbd\x7c\xab\xeb\xae\xbb\xeb\xae\xae\xae\x8a\x75\xd7\x86\
+\x88\xa8\x6b\x01\x05\x41\x7a\x2f\x09\x69\x90\xde\x7b\xef\xc9\x64\
+\x92\x4c\x9f\xef\x9c\x64\xc2\x06\x04\xa4\xa4\x4c\x32\xe7\xf7\x3c\
+\xff\x27\xf3\xde\xf7\x9d\x64\x92\xcc\xdc\xf7\x7f\xef\x3d\xf7\x1c\
+\xcc\x0a\xda\x84\x6d\x57\x52\xdf\xd4\xb4\x52\xd9\xaa\x72\x77\x75\
+\x72\x8c\x87\xce\xe7\x22\x34\xf5\xeb\x4e\x37\x62\xe0\xd1\xeb\xda\
+\x17\x55\x57\x27\x3e\x5b\x5f\x9f\x3e\xb1\x2b\x30\xf9\xb7\x31\x6e\
+\xdd\xc6\xfa\x5a\xef\xf5\xee\xf3\xdd\xfc\xde\x67\x82\xcd\x66\x1b\
+\x14\x8a\x88\x12\x77\x8f\x09\xaf\xc2\xe1\xd7\x20\x9a\x09\x1a\xba\
+\x48\xcb\x2a\xab\xd6\xee\xf8\xe9\x97\xcd\x17\x32\xb2\x42\x30\xc8\
+\x99\xc7\xe5\x9a\xde\x7d\xe5\x45\x26\xbf\xa4\x54\x15\x1d\x16\xfa\
+\x06\x5c\xb3\x03\x54\xdc\x79\x35\xc3\xf0\x0c\x06\x63\x38\xf4\xad\
+\x5f\x24\xa7\x67\x0e\xc3\x1c\x3e\x3d\xdf\x4f\xeb\x57\x2c\x53\xcd\
+\x9b\x3a\x09\x67\x3c\xbe\x04\x7d\x07\x52\x82\x44\x39\x85\x45\x4f\
+\x7e\xff\xcb\x81\xf5\x69\x39\xb9\xbd\x59\x15\xc0\x62\x09\xf4\xf5\
+\x31\xfe\xfd\xb9\x27\x6a\xe0\x21\x26\x01\xb6\xfa\xb2\x17\x57\xc3\
+\xda\x0c\x10\xa2\x80\xdf\x79\xbc\x56\xa7\x17\x0b\xf8\xbc\x1f\xe1\
+\xb8\xaf\x3a\x56\xb6\xd1\x64\x1a\xf5\xe5\x0f\x3f\xbd\xb9\xff\xc4\
+\xe9\xc9\xe6\xb6\x3e\x63\xe5\xc2\x79\xcc\x9d\xf3\x67\xa3\x39\x39\
+\x0e\xc2\xdd\x0e\x95\xa0\x9e\x23\x67\x9c\xf5\x9a\x93\x57\x5c\xf2\
+\xdc\x9f\xdf\x7e\x7f\x38\xae\xaf\x63\xe3\x77\x1f\xbe\xfd\x2b\x7c\
+\x79\x0d\x74\x16\x8f\x7b\x02\xef\x0c\xd9\xb6\xef\x77\xfd\x82\x23\
+\x26\xcc\x78\x3d\x77\xea\xa4\xf7\xa0\x19\xbf\x3f\x61\x5d\xe0\x7b\
+\x07\xdf\xc3\xb8\x8b\x12\x67\x4d\xb1\xd3\xb8\x72\x56\xa6\xbb\x23\
+\xb9\x96\xb1\xb9\xb2\xa3\xf9\xbd\x41\x01\x06\xb5\xe2\x52\x2e\x8e\
+\x5e\xc9\x74\x0f\x51\xe0\x4d\x21\x6f\x68\x6c\x9a\xb7\xf7\xe8\x89\
+\x4d\xd8\x4f\x2e\x9b\x3b\x8b\xa5\x54\xa9\x98\xf0\xe0\x40\x53\x87\
+\x5a\x6d\x0a\xf1\xf7\xfb\xd6\xcd\xd9\x09\x4d\x70\xcf\x1b\x38\xaf\
+\x43\xad\x89\x79\xe0\x85\x3f\x9e\xc4\x8d\x1d\x3d\xcd\xcf\x84\x51\
+\xd1\xc6\x27\x36\xac\xc3\x78\x9f\x2d\xa0\x9d\xa0\xce\xfe\x1d\x07\
+\x72\x5b\xbf\xdb\xf5\x72\x52\x5a\xc6\xb0\xdf\x33\xdf\x43\x85\x57\
+\x9f\x7d\x5c\x1d\xe4\xe7\xfb\x16\x3c\xc4\xbf\x45\x7d\x67\x23\x71\
+\x19\xd6\x68\x80\x10\xbc\xf9\xe3\x4e\x81\xbe\x5e\xa2\x92\xc1\xe8\
+\x64\xfa\xcb\xff\x7a\xef\xc3\xd2\x8a\x4a\x97\xbe\x0c\xba\xc3\x35\
+\xef\xf7\xff\xf2\xc7\x3a\x7b\x5b\xf9\x07\x70\xf8\x11\x08\xcb\x80\
+\xe0\xcd\x0a\xb7\xc3\xe3\xcd\x04\xff\xd1\x18\x49\xb8\xe0\xd0\xa9\
+\xb3\x4f\x6e\xfb\xf1\x27\x5f\x34\x41\x60\x80\x34\xd0\x86\x4b\x61\
+\x38\x5a\xea\x09\x5b\x6f\x30\x04\xfc\xf3\xa3\x4f\x7f\x49\xcd\xce\
+\x0d\x1c\x13\x39\xdc\xf8\xf4\xc6\xf5\x38\x12\xfb\x3b\x08\x77\x60\
+\x10\xd6\x07\xde\x38\xf0\xfd\x84\xe6\x87\x96\xa5\x88\xdb\x81\x67\
+\x34\x1a\x47\x56\xd6\xd4\x46\xed\x39\x72\x7c\xfd\xc9\xb8\x84\x98\
+\xe7\x1e\xda\xc0\x32\x1a\x4d\xcc\xbf\x3e\xd9\xda\x39\x63\x38\x6e\
+\x44\x54\xfb\x93\xf7\xaf\x9b\x03\xd7\xa2\xa1\xe9\x39\x9b\x2d\x6b\
+\x68\x6a\x9e\xf3\xf0\x4b\x7f\xb9\x6c\x4b\xb7\x97\x9b\x2b\xf3\x8f\
+\x17\x9e\x2a\xe7\xf3\x78\x1f\xc3\x21\x0e\xea\xb0\xdf\x63\xeb\xf4\
+\xfa\x61\x9f\xfd\xf7\xc7\xcf\xe2\x92\x53\xa2\xc0\x54\x5d\xda\x1c\
+\x32\x94\x19\x1d\x39\xdc\xf0\xec\x43\x1b\x2a\xe0\x61\x0c\xa8\x0e\
+\x64\x95\x37\xfa\xdf\xa3\xcf\x6e\xc8\x16\x0e\x76\xde\xfd\x11\x9f\
+\xa3\x84\x0f\xe3\xd9\xa7\x1e\xb8\x77\x07\xd6\x25\xeb\xcb\x4c\xd1\
+\x3a\x9d\x9e\xf9\x6a\xe7\x1e\xfc\x7f\xe2\x7e\x51\x7c\xb3\xe3\xcd\
+\x4a\x08\xfe\x16\x8f\x31\x3b\x34\x8e\x84\x70\x0a\xf9\xbf\xb3\x26\
+\x8d\xff\xdc\xc3\xd5\x55\x13\x19\x1a\xcc\xd4\x35\x34\xf2\x61\xc4\
+\x85\x79\x81\xa4\xa0\xcb\x60\xb3\x58\x97\xe2\x3e\xca\xaa\xab\x39\
+\x70\x1d\x16\x95\xfd\x4d\x52\x32\xc2\x6a\xc0\xf7\x15\xbe\x27\xc8\
+\xfc\x10\xb7\x0a\x17\x8c\x8f\x3b\xf4\x25\x33\x8f\x9d\x3b\xff\xcf\
+\x57\xb6\x7c\xf8\xaf\x13\xb1\xf1\xa3\x1f\x5f\xbf\x86\x25\x97\x4a\
+\x2f\x99\x9f\x51\x11\xe1\xba\xcd\xeb\xd7\xe0\x6c\x33\xce\x02\x5e\
+\x96\xd8\xd0\x60\x30\x38\x65\xe6\x15\xe0\x6c\xe4\x25\xc4\x22\x11\
+\xf3\xfc\xc3\xf7\x9b\xa0\xbf\xc5\x1a\x57\x18\x24\x8d\xe6\x87\x0b\
+\xd7\xfa\xc1\xf7\x7f\x3e\x35\x2b\x27\xc4\x5a\xcc\x0f\xb2\xfa\x8e\
+\x45\xb8\xec\x87\xc1\xdf\xf8\x95\xcc\xcf\x35\xe0\xbc\xf2\xca\x2b\
+\xe6\x87\x44\x1f\xd1\x2e\x11\x8b\xce\x06\xfa\x78\x87\xa5\xe5\xe4\
+\x7a\xa8\xd5\x1a\x41\x5f\x4d\xc1\x36\x36\x37\xb3\x15\xf6\xb6\x62\
+\x2f\x77\xb7\x7d\x70\x88\x33\x40\x1a\x16\xab\x33\x18\x1a\x67\x79\
+\xba\x3f\x04\x1d\xd0\xc1\xa4\xba\x3b\x3b\xaf\x3f\x11\x17\x2f\xc9\
+\x2e\x28\x62\x6b\xb4\x5a\x43\x90\x9f\x0f\x76\x34\xb8\x63\xa2\x1b\
+\xac\xab\xa3\x4c\x4a\xcb\xd8\x00\xa3\x34\xa7\x96\x56\x15\x6b\xdf\
+\xd1\x93\x01\xde\x1e\xee\x22\x77\x67\x27\x0c\xb2\xee\xb7\x00\x6f\
+\x82\x20\x86\x04\x38\xc3\xe3\x92\x96\x93\xf7\xd8\x2b\x6f\x7f\xb0\
+\x25\xee\x42\x8a\x3f\xf4\x3d\xfc\x3b\xe6\xcc\x64\xe6\x4f\x9f\x62\
+\x3a\x7f\x31\xd5\x94\x57\x54\xa2\x59\x30\x7d\x72\xcb\x43\xab\x57\
+\x66\xc1\x00\xec\x6e\x78\x4e\x35\xa8\xe7\x0d\x5c\xa0\x54\xb5\x8d\
+\xfb\x60\xdb\x8e\x17\xdb\xda\x3b\x6c\xcc\x6d\xcc\xff\x3d\xf2\x00\
+\xe3\xe7\xe9\xd9\xa6\x6a\x6f\xff\x85\xc7\xe5\x82\x01\x62\xf1\xb5\
+\x3a\x6d\x38\xf4\x5f\x0f\x6d\xfb\xe1\xa7\xb5\xf0\x1c\x9c\xf1\xb7\
+\x8a\xa5\xaf\x39\x93\x27\x6a\x27\x8f\x19\x85\xf1\x9a\x2b\x41\xfd\
+\xbe\x79\x61\x30\x41\x06\xa8\x7f\xd0\x3b\xd8\xd9\xee\xf4\xf5\x74\
+\x1f\x9d\x92\x95\xe3\xa1\xd6\x68\xfa\x24\xbb\xad\x4e\xaf\xe7\x66\
+\xe6\x17\xd8\xcd\x9e\x34\x3e\x05\x3a\x01\x34\x33\x1d\xa0\xab\xb9\
+\x7f\x96\xa3\x83\xbd\x5f\x7a\x6e\x7e\xd0\x85\xf4\x4c\x1b\xe8\x1c\
+\x7c\x66\x4d\x1a\x8f\x3b\x26\x4e\x75\x9d\xbe\x84\x49\xaf\xd7\xcf\
+\xce\x29\x2c\xf6\xc4\x8e\xca\x68\x32\xb1\x2f\xa4\x67\x05\x82\x81\
+\x0b\x09\x0d\xf0\xdf\x0f\xe7\xd1\x58\x11\x04\x41\xdc\x08\xb2\xc6\
+\xe6\x96\xe9\x2f\xbc\xf6\xd6\xbb\xd8\x57\x61\x43\x58\x50\x00\xf3\
+\xd8\x7d\xab\xb1\x8f\xea\x08\xf4\xf5\xae\x9e\x3d\x79\x42\xda\x88\
+\xf0\x61\xdf\xc2\xf1\x13\xa0\x06\x50\xcf\xfe\x8b\x05\xfd\x50\x44\
+\x5c\x72\xca\xfa\xd3\xf1\x49\x97\xca\x1a\x2d\x9d\x33\xd3\x64\x27\
+\x95\x1a\x12\x52\xd2\x93\xec\xe5\xb2\x73\x02\x3e\x5f\x5b\x5e\x55\
+\xbd\xe8\xf5\x7f\x7f\xf6\xe1\x81\x93\x67\xa6\x9b\x7f\x96\x55\x98\
+\x1f\x3e\x9f\x67\xfa\xbf\x87\x1f\xc8\xe7\xf3\xf9\x18\xaf\x89\x26\
+\x88\xb8\x0e\xd6\xba\x04\x36\x20\x80\x69\xb8\xeb\xa9\xfb\xef\xdd\
+\x23\x97\x4a\xfa\x2c\x86\x46\xd5\xd6\x6e\xf3\xec\xab\x6f\xbc\x67\
+\x30\x1a\xc3\xe0\xf0\x5a\x59\x74\xd1\xb8\xbc\x74\xf7\x92\x05\x38\
+\xba\x62\x38\x1c\x0e\x76\x10\x12\xd0\xa5\x0c\xaa\xdd\x4c\x1a\x3d\
+\x6a\xfd\xe4\xd1\xa3\x3a\xeb\xa9\x21\x60\xde\xf8\x3f\xfe\x7a\x70\
+\xc1\xfb\xdb\x76\x60\x51\x3d\x82\x20\x88\x1b\x42\xd5\xde\x1e\xf3\
+\xc2\xeb\x6f\x6d\x35\x1f\x32\x62\x1b\x1b\xe6\xf1\xf5\x6b\xf0\x21\
+\x2e\x57\x7d\x08\x8a\x16\xd9\x08\xb1\x66\x03\xc6\x19\xe2\xae\xd4\
+\xcb\x06\x6f\x30\xf0\x92\x83\xb1\x99\xfe\xd5\xae\x3d\x38\xb3\xd1\
+\x89\xbf\xb7\x27\x73\xcf\x92\x05\xa6\xe2\x8a\xca\x34\x67\x47\x87\
+\xe4\xa2\xb2\x8a\xe8\xf7\xbe\xd8\xf1\xf9\x8b\xff\x7c\xe7\xad\xb2\
+\xca\x2a\xcc\x8a\x6f\x55\x2c\x9c\x31\xd5\x24\x11\x8b\x71\x30\xbb\
+\xbd\xab\x85\xb8\x1e\x64\x80\xfa\x17\x53\x90\x9f\xcf\xe6\x3f\x3c\
+\xfa\xd0\x97\x7d\x99\x23\x08\x46\x59\xb2\x37\xff\xf3\xf9\x36\x83\
+\xc1\x80\xdb\x1f\xaf\xb6\xee\x8d\x1d\x4b\x93\x87\x8b\xf3\xd1\xb9\
+\x53\x26\xd6\x36\x36\xe3\x6a\x19\x33\x17\xb4\x0a\x1f\x5c\x81\x72\
+\xf9\x82\x39\x9f\x4c\x19\x1b\x93\x80\x6b\xf3\xb8\x7c\x87\xc1\xd3\
+\xf1\x17\xd3\x22\x5e\x7d\xef\xdf\xb9\xf0\x18\x8d\xd6\x65\x15\xe8\
+\x09\x82\x20\x7a\xa2\xd5\xe9\x22\x12\x53\xd3\xef\x6e\x55\xb5\x5d\
+\xaa\x69\xb1\x71\xf5\x0a\xc6\x4e\x2e\xc7\x78\x32\xcc\xed\xf3\x0f\
+\x10\x9a\x1e\x3c\xfe\xcd\xac\xb5\xd1\x64\x72\x29\x2a\x2b\xdf\xf0\
+\xc3\xbe\x83\x1b\x70\x10\x86\xfd\x90\x50\x20\x30\x3d\xfd\xe0\x7a\
+\x7c\xce\x27\x30\x48\xfb\x88\xcd\x62\x19\xcf\x24\x24\x4d\x4e\xc9\
+\xca\x0e\xc6\x0d\x27\x78\x4d\xd7\xb3\xad\x03\xa9\x58\xcc\xdc\x39\
+\x77\x16\x96\x06\xc1\xe2\xb0\xbf\xf9\x1b\x12\xbf\x85\x96\xc0\xfa\
+\x1f\x0d\x98\x9f\xe4\x11\xe1\xc3\x58\xc9\x69\x19\xc3\xdb\x3b\xd4\
+\x42\x73\x7b\x6f\x81\x2e\x85\x55\xdf\xd4\x24\xcf\x2d\x2c\x9e\x38\
+\x76\x44\x54\x35\x87\xcd\xc6\xec\xa9\x38\xca\xba\x92\x0b\x41\x7e\
+\xbe\xde\xc7\xcf\x9d\xf7\x0a\xf1\xf7\x73\x81\xd7\x85\xc1\x86\x69\
+\x20\x9c\x7a\xbe\x04\x97\xc3\x29\x0b\xf6\xf7\x13\xc2\x88\xca\xbb\
+\xa6\xbe\xa1\xb3\x7e\x8e\x11\x3a\x98\x86\xe6\x66\xdb\x9c\x82\xc2\
+\x39\x6a\xad\x6e\xa9\x9f\x97\x47\x21\x18\x24\xac\xb6\x4c\x01\xb2\
+\x04\x41\xf4\x84\xd5\xd0\xd4\x3c\xeb\xa3\xed\xdf\x3e\xd3\xd6\xd1\
+\x15\xb7\x33\x7e\x64\x34\x73\xd7\x82\x39\xd8\x27\x3d\x0b\xc2\x3c\
+\x4f\x97\xf5\x39\x00\xf6\x63\x4e\x89\xa9\x19\x7f\xbb\x98\x99\xf5\
+\x5c\x8b\x52\xb9\xa1\xb6\xa1\x71\x5a\x7b\x87\xc6\xd9\x60\x34\xa8\
+\x03\xbc\xbd\x0a\x5f\x7a\xec\xa1\xad\x0a\x3b\xdb\xbf\xc0\xb5\xbf\
+\x72\x38\x6c\xcd\x85\x8c\xec\xf9\x67\x12\x92\x63\x70\xb9\xbe\xeb\
+\x5b\x58\x17\xf7\xdd\x75\x87\x2e\xd0\xd7\x1b\xeb\x9d\x7d\x02\xa2\
+\xbc\x59\x37\x00\x19\xa0\x81\x41\x25\x93\x48\x72\xc1\x04\x69\x12\
+\x52\xd2\xa2\x3b\xd4\xbd\x6e\x82\x18\x34\x28\x60\x56\x6c\xcb\xaa\
+\xaa\xc3\x46\x0e\x0f\x6b\x07\x13\x83\xe9\xd0\xaf\x34\x41\x2a\x3e\
+\x8f\x97\xe5\xed\xe1\xe6\xf4\xf3\xc1\x23\x41\x51\x61\x21\xde\x30\
+\x64\xf2\xe0\x70\x38\x25\x70\x0e\xcd\x4c\x37\x5a\x01\x9f\x5f\x1c\
+\x19\x1a\x2c\x48\xcf\xc9\x0b\x6a\x56\xb6\x4a\xbb\x4c\x90\x09\x7f\
+\x86\x43\x56\x7e\xa1\x6b\x75\x7d\x7d\x4c\x88\xbf\x6f\x1b\x5c\x87\
+\xc1\xd4\x7d\x92\x5c\x92\x20\x88\xc1\x07\xf4\x17\x8b\x77\x1f\x3a\
+\xba\x39\x35\x3b\x37\x18\x8f\x3b\xe3\x54\x1e\x79\x90\xb1\x11\x0a\
+\xbf\x82\x43\x5c\xaa\xc1\xfe\xe6\x4a\x44\x3b\xf7\x1f\xfe\xea\xc0\
+\xc9\xd3\x73\x43\xfc\x7c\x83\x26\x8d\x19\xe5\x6a\x34\x18\x6d\x66\
+\x4d\x1e\x1f\x37\x7b\xd2\x84\xd7\x27\x8c\x8a\xfe\x4c\x64\x23\xc4\
+\x9b\x7d\x2e\xa8\xb9\xa6\xbe\x71\xce\xe9\xf8\xc4\xb9\x25\x15\x95\
+\x98\xea\xc3\xaa\x66\x7e\x10\x7f\x6f\x2f\x66\xe3\x3d\x77\xed\x81\
+\x87\xb8\x94\xd8\x73\x33\x0b\x71\x1d\xc8\x00\x0d\x1c\x4a\xa9\x58\
+\x5c\x04\x26\xa8\xe3\x44\x5c\xc2\x04\xbd\xc1\x80\xf9\x55\x7a\x1b\
+\x56\x65\x4d\xad\x43\x69\x65\x95\xff\x88\xf0\x30\x1d\xd6\x29\x33\
+\xb7\xf7\xa4\x41\x61\x6f\xd7\x52\x5d\x5b\xef\xbe\xe5\xf3\xed\x91\
+\x27\xe2\xe2\x3d\xbc\xdd\xdd\x9c\x9d\x1c\xec\x31\xf7\x06\x6e\xa1\
+\xec\x46\x25\x10\xf0\xcb\x26\xc6\x8c\x50\x76\x74\xa8\x5d\x0b\x4a\
+\xcb\x9c\xa0\xad\xb3\xa3\xd1\xeb\xf5\xdc\x92\xf2\x4a\x67\xe8\xe8\
+\xfc\x46\x47\x0e\xc7\xcc\xa3\x68\xb6\x08\x82\xb0\x72\x60\xa0\x64\
+\x9f\x5b\x54\xbc\xe2\xc7\x5f\x0f\xde\xa1\xd5\xea\x3a\x97\xca\xef\
+\x5e\xb2\x90\x89\x1a\x16\x82\x33\xc5\x7f\x00\x61\xc6\xe6\xcb\x66\
+\x2b\xf0\x39\x85\xa5\x65\x1b\xb7\xef\xfc\xf9\xbe\xba\x86\x46\xbb\
+\xa4\xb4\x0c\xee\x0f\xfb\x0e\xb2\x97\xcd\x9d\x95\x20\x16\xd9\x60\
+\x0c\xd1\x6e\x16\x8b\x85\x71\x2e\xd8\x3f\x75\xce\x38\xc7\x5f\x4c\
+\x7d\x1c\x0c\xd0\xb8\x0e\x75\xe7\x06\x13\xab\xe3\xe5\xc7\x37\xb5\
+\xc8\xa4\x12\xcc\xe8\xff\x13\x88\x76\x7e\xdd\x20\x14\x03\x34\xb0\
+\x94\x82\xd5\xd8\xfe\xcc\xc6\xfb\x30\x62\xbf\x4f\xc0\x99\x1a\xcc\
+\x7e\xfa\xe1\x97\x5f\x3f\xaa\x6a\x6b\xc7\x0c\xd1\xbf\x99\x6d\x62\
+\xb3\x58\x09\xe3\x46\x44\x26\xf1\x78\xdc\x76\x2c\x12\xf8\xd1\xf6\
+\x6f\xe6\xc6\x25\x5f\xc4\x32\x21\x9e\xa0\x9e\xc6\xac\x50\x28\x10\
+\x7c\xbd\x7e\xc5\xb2\xd7\x5e\x7e\xfc\xe1\x2f\x31\xaf\x11\xc6\x05\
+\xe1\x09\xfc\x39\x67\xe2\x93\x86\x83\x19\xc2\x4a\xf4\x9d\x3b\x3c\
+\x08\x82\xb0\x6a\x6c\xca\xab\x6b\x56\x1e\x3d\x13\xbb\x00\x37\x67\
+\x60\x43\x68\x80\x3f\xb3\x78\xe6\x34\x5c\x6a\xff\x14\x84\xe6\x07\
+\x77\xaa\xf6\x04\x33\xe8\xbb\xfc\x77\xcf\xaf\x0f\xaa\xda\xbb\x9e\
+\x83\xdc\xb3\x78\x81\xde\xd1\xc1\x3e\x1e\x1e\x1e\x04\x75\x16\x36\
+\xed\xa6\xad\xbd\x7d\x5a\x66\x5e\x41\x38\x0c\xc0\x70\x23\x87\xd5\
+\xb1\x68\xe6\x54\xc6\xc3\xd5\x05\x73\xfe\x60\xfe\x23\x9a\x7d\xbf\
+\x09\x68\x06\x68\xe0\x51\xc2\x07\xbb\xa2\xb8\xac\x62\x6a\x5d\x63\
+\xa3\x3d\x2e\x2b\x99\xdb\x7b\x13\x56\x65\x6d\x9d\x63\x61\x49\x59\
+\x70\x78\x48\x20\x4b\x24\x14\xe2\xe8\xa9\x67\xb1\x54\x2d\x8c\xac\
+\xec\xab\xeb\xea\x03\x8a\x4a\xcb\x3d\x71\x14\x95\x9a\x95\x33\xcc\
+\xcd\xd9\x51\x02\x06\x4d\x05\x26\x07\xd7\xe7\xbb\x93\x91\xb5\xc2\
+\x71\x9e\x93\xc2\x21\x77\xfc\xc8\x68\xd5\xd9\xc4\xe4\x11\x3a\x9d\
+\x9e\x1b\x11\x1a\xcc\x7a\x62\xc3\x5a\x96\xc2\xde\x0e\x53\xd6\xe3\
+\xf6\xcb\xcb\x3a\x29\x82\x20\xac\x07\xa3\xd1\x18\x51\x51\x5d\xbb\
+\x62\xe7\xaf\x87\x36\xc4\x5d\x48\x89\xc0\x01\x12\x06\xe9\xbe\xfc\
+\xc4\xc3\x06\x1b\xa1\x10\x67\x89\x71\x9b\x3b\x16\x29\xbd\x2c\x66\
+\x10\x9e\xe7\x97\x96\x95\xb3\x79\xe7\xfe\xc3\x73\xf1\x39\xa8\xc5\
+\xb3\xa6\x99\x56\x2c\x9a\x87\xc6\x07\xb3\xd5\x63\x8c\xe2\x65\x9c\
+\x3a\x9f\xf8\x0a\xf4\x43\x63\x7a\xe6\x05\xb2\x16\xb0\x08\xf6\x73\
+\x9b\xee\x4f\x85\xc1\x28\x2e\x7d\x9d\x06\x51\xf0\xf3\x4d\x40\x06\
+\x68\xe0\x31\xb1\x59\x2c\x9d\xaf\xa7\xbb\xe6\x4c\x42\xf2\x74\x34\
+\x13\xd0\xd6\x17\x6b\xd8\x2c\x30\x58\x76\x17\x32\xb2\x46\x0c\x0f\
+\x0e\x34\xca\x24\x12\x5c\x27\xc6\xed\xf8\x9d\x1d\x10\x9b\xcd\x6e\
+\x77\xb0\xb3\x53\x9c\x8e\x4f\x1c\x83\xcb\x71\xa8\xd8\xe4\x8b\xa3\
+\xec\x6d\x6d\xed\xe0\xb5\xe9\xc0\xf4\x60\x2d\x99\xee\x9a\x4c\x18\
+\x4b\x54\x2b\x95\x88\xcf\x4e\x18\x19\x2d\x4b\xcd\xce\xf5\x2f\x2c\
+\x29\x15\xc5\x5d\x4c\x65\xc1\xb5\x6a\x67\x85\x02\xe3\x80\xb2\x3a\
+\xaf\x24\x08\xc2\x9a\xe0\x35\xb5\x28\x97\xc4\xa7\xa4\xae\xdd\xbe\
+\x6b\xcf\xfa\x8c\xdc\x7c\xff\x4e\xf3\x23\x11\x33\xaf\x3c\xfd\x98\
+\xde\xc5\x51\x51\x0e\xd7\xe0\xec\xcf\x2f\xa0\xcb\x32\x3c\x43\x9f\
+\x13\x74\x31\x33\x7b\xd3\x3b\x9f\x7d\xf9\xa8\x39\x24\x80\xb5\x70\
+\xc6\x54\x66\xed\xb2\x25\x98\xc1\x1e\xeb\x59\x75\x67\x78\xee\x86\
+\xd7\xd0\xd4\xbc\xfc\xeb\x9f\xf7\x6e\xaa\xa8\xae\xb9\xb4\x24\x6f\
+\x4d\x3c\xf5\xc0\xbd\x3a\x77\x67\x27\x34\x3f\xbf\x99\x19\x23\x7e\
+\x1f\x32\x40\x96\x81\x1a\x0c\x49\xa6\x4a\xd5\x36\xa1\xa2\xa6\xd6\
+\xb5\x7b\xad\xbc\x0f\x60\xa9\xda\xda\x45\x60\xb4\xc6\x46\x84\x06\
+\xab\xed\xe4\x32\xdc\x1d\x86\xa6\x06\x47\x0d\x2a\x30\x62\x8e\xd0\
+\x01\x4d\x68\x56\x2a\xb1\x2c\x06\x76\x26\xac\xe4\xf4\xcc\x60\x18\
+\xb9\xf9\x06\xf8\x78\xa3\xa1\xc9\x07\xf5\x44\x2f\xb2\xb1\x39\x3c\
+\x32\x7c\x98\x1b\x74\x74\x3e\xf5\x8d\x4d\xe2\xac\xbc\x02\x99\x9f\
+\xb7\x57\x87\xc2\xde\x0e\xab\xd1\xf7\x8c\x21\x22\x08\x62\x68\xc3\
+\x83\x01\x5c\xc8\xbb\x5b\xb7\x7f\x7c\xf8\x74\xec\x14\x4c\xc7\x81\
+\xe6\xc7\xc9\xc1\x81\xf9\xeb\x33\x9b\xdb\xdc\x9c\x9d\xb0\x0f\xf9\
+\x2f\xe8\x6f\xa0\x9e\x46\x06\xeb\x75\x85\x42\x5f\xf3\xf0\xfb\xdb\
+\xbe\x7e\x54\xab\xeb\xec\xff\x58\x4b\x66\xcf\x00\xf3\xb3\x18\x07\
+\x5e\x18\x2c\x8d\x45\x9b\x6b\x41\xdd\x70\x0c\x06\x83\xf7\xeb\x1f\
+\x7d\xb6\xa3\xb8\xa2\xc2\xcd\x60\x30\xf6\x45\x0c\xa5\x45\x33\x26\
+\x3a\x92\x59\x36\x77\xe6\x09\x78\x88\x06\x08\x83\xc1\x89\x9b\x84\
+\x62\x80\x2c\x07\xf5\xca\x45\xf3\x5e\x0e\xf6\xf3\x2d\xe2\xf1\xb8\
+\x7d\x16\xc4\x86\x1d\x52\x5b\x47\x87\xf0\xff\x5e\x7f\xfb\x8f\x95\
+\x35\xb5\x77\x42\x93\x0f\x08\xb7\x8d\x1a\xf9\x7c\x5e\x55\x4c\x64\
+\x38\x9a\xa2\x4b\xe0\xf5\x5f\xfc\xf0\xd3\x08\x8d\x56\x3b\x1a\x0e\
+\xaf\x96\x58\xcc\x04\x66\xe7\x4f\xf7\x2e\x5f\x72\x56\x24\xb2\x51\
+\x63\x0c\xd1\xae\xfd\x87\xa6\x95\x56\x56\xdd\x0b\xe7\xfc\xbb\x2e\
+\x21\x08\xc2\x0a\x90\x96\x54\x54\xcc\xcb\x2f\x2e\xf5\xea\xce\xd5\
+\x33\x72\x78\x18\xf3\xc6\x8b\xcf\xd6\x3b\x2b\x1c\x30\xcb\xfc\xdb\
+\xa0\xbf\x76\x5e\xf9\x3f\x38\x58\xac\xf4\x74\x7c\xe2\x73\x60\x9c\
+\x1e\xed\x7e\xde\x8a\x85\xf3\x8c\xab\x97\x2e\x6c\x84\xf3\x18\xd4\
+\xfb\x05\xe8\xb2\x1b\x3c\x5c\x63\x97\x57\x5c\xba\xaa\xb2\xb6\xd6\
+\x11\x2b\xc2\x9b\x9b\xad\x06\x1b\xa1\xd0\x74\xff\xca\x65\x18\xef\
+\x83\x7f\x4f\x9a\x6d\xbf\x45\x68\x06\xc8\x72\x30\xb1\xd9\xec\x72\
+\x30\x13\x41\x05\x25\x65\x3e\xad\x2a\x95\x18\x3b\x02\xf3\xb9\xde\
+\xa6\x73\x76\xe7\xf0\xe9\x73\xb3\x03\x7d\x7d\x0c\x4e\x0e\xf6\x4a\
+\x16\x8b\xc5\x86\x91\x97\x2b\x74\x40\x61\x17\x32\xb2\x42\xf4\x06\
+\x43\xcf\x9f\xcd\xf2\xf6\x70\x77\xf7\x74\x75\xc1\xd1\x18\x06\x2e\
+\x5e\xb9\xce\xac\x85\xe7\x0f\x6b\x55\xb5\x05\x15\x96\x96\xdb\xe2\
+\xd6\xf8\x94\xcc\xec\x28\xf8\x5d\x3c\xdd\x5d\x9c\x31\x8b\x74\xf7\
+\xd2\x19\x41\x10\x43\x17\x41\x87\x5a\x1b\xd2\xac\x54\x4e\x9a\x3e\
+\x7e\x0c\x7f\xd3\x9a\x55\xfa\x59\x93\xc6\xd7\xc0\x80\x0e\x77\x27\
+\xbd\x09\x3a\xdc\x79\x55\x0f\xa0\x9f\x09\xfc\xf5\xd8\xc9\xbf\x6f\
+\xff\x71\xf7\x4a\x9c\xc5\x71\x74\xb0\x37\x3d\xbf\xe9\x7e\xe3\x94\
+\xb1\x31\x18\x77\xb8\x0b\x84\x9b\x31\xae\xdc\x26\x2f\x69\x69\x55\
+\x4d\x7e\xfe\xb5\x37\xff\xa3\xd1\x68\x3b\x0d\x93\xb9\xdd\x6a\xb8\
+\x6f\xf9\x52\x43\x58\x50\x20\xee\xd4\x45\x73\x78\x65\x0e\x25\xe2\
+\x06\x21\x03\x64\x61\x28\xec\xec\x0e\x80\x71\x08\xce\x2e\x28\xf4\
+\x6f\xef\xca\x0f\xd4\x67\x1f\x6e\xec\x38\x60\xe4\x35\xfe\xfc\xc5\
+\xb4\x05\x60\x82\x22\x73\x0a\x8a\x02\x32\xf3\x0a\xc2\xc6\x8d\x88\
+\x74\x4a\xcd\xca\xb9\xec\xe7\x3a\xd8\xda\xda\x0d\x0b\xf4\xaf\x06\
+\x93\x96\x09\x66\x07\xb3\x58\x5f\x16\xbc\x58\xdf\xd8\x34\x9c\xc5\
+\x66\x47\xa5\x64\x65\x3b\x42\x47\xc6\xc2\x04\x8f\x69\xd9\xb9\x01\
+\xf6\x72\xd9\x68\x6f\x77\x37\xac\x1b\xd6\x33\xe8\x9a\x20\x88\xa1\
+\x87\x5a\x26\x11\x67\x8e\x89\x8a\x88\x84\x81\x95\xc8\x46\x28\x2c\
+\x80\xb6\xe7\x41\xef\x83\x3a\xcb\xee\x5c\x81\xf8\xc7\x5f\x0f\x7d\
+\xbe\xeb\xc0\xe1\xf9\x18\xf3\x33\x63\xc2\x38\xd3\x73\x0f\xdd\x6f\
+\x74\x73\x76\xac\x84\x73\x18\x27\xf4\x12\xe8\xca\xb8\x16\x6e\x4b\
+\x6b\xeb\xcc\xcd\x7f\x7a\x75\x67\x1f\xc6\x4b\x5a\x34\x01\x3e\xde\
+\xa6\x8d\xf7\xac\xc0\x3e\x78\x01\x08\xcd\x21\x05\x3e\xdf\x22\x64\
+\x80\x2c\x10\x57\x27\xc7\xfd\x0a\x7b\x7b\x9f\x84\xd4\xb4\x28\x4c\
+\x68\x68\x6e\xee\x33\x5a\x55\x6d\xe2\x73\x89\x17\x02\xd3\x72\xf2\
+\xc2\xca\xab\x6a\x1c\x56\x2d\x9e\xcf\x01\x23\xc4\x82\x76\xf3\x15\
+\x0c\x93\x5f\x5c\xca\xfc\x72\xe4\x78\x14\xb4\x45\x07\xf9\xf9\xc0\
+\xa8\x8e\x97\x67\x3e\xd5\x49\x8b\x4a\x15\x73\xf0\xe4\x99\x18\xb9\
+\x54\xea\x58\xd7\xd0\xc8\x80\x49\xc2\xf4\xf7\xbc\xd4\xec\x5c\xb7\
+\x60\x5f\x9f\x48\x18\xd9\xe1\x14\x38\xc5\x04\x11\xc4\xd0\x06\x73\
+\xfa\xe0\xcc\xcd\x07\x20\xcc\xd9\x83\x4b\xea\x57\xbd\x41\x9f\x3a\
+\x9f\xf8\xe1\xe1\x33\xe7\x66\xe8\xf4\x7a\xc9\xe3\xf7\xad\xe9\x8c\
+\xf9\xe1\x71\xb9\xd8\xaf\x60\x2d\x30\x2c\xe7\xf0\x9b\x50\x00\x18\
+\x58\x4d\xd8\x77\xec\xe4\x33\x19\xb9\xf9\x41\x70\x68\x75\xe6\x07\
+\x79\xf1\xb1\x87\x34\xd0\xcf\xe2\x4c\xfc\xbf\x41\x54\x90\xfa\x36\
+\xa0\x18\x20\xcb\xc4\x10\x13\x19\xfe\x8f\x87\xd7\xac\xfa\xdc\x7c\
+\xdc\xa7\xe0\x4c\x10\xd6\xce\x01\xc3\xc2\xd5\x68\xb5\xbc\x82\x92\
+\x52\xd6\xa6\x35\x97\xea\x0d\x76\x82\xd7\xe0\x5a\xfb\xf1\xd8\xf8\
+\xb1\xaf\xbe\xff\xf1\xbf\xa1\x23\xc2\x0c\xae\x97\x82\xb5\xa5\x62\
+\x71\xa5\xc2\xde\x4e\xe9\xe6\x8c\x9b\x31\xba\xae\xc7\xaf\xb8\xa6\
+\xff\xe6\xc7\x5b\xa7\xc1\xa8\x6d\x03\x1c\x7a\x60\x1b\x41\x10\x43\
+\x1a\x0c\x70\x46\xf3\x82\xba\xd6\xec\x84\xe4\x42\x46\xd6\x28\x5b\
+\x99\xcc\xfe\xcd\x17\x9f\xc3\x80\x5e\x7c\x0e\x2e\x91\x6d\x02\x61\
+\x35\xf8\xcb\x66\x98\xcd\x70\x9b\x95\xca\xe0\x83\x27\xce\x4c\x35\
+\x1f\x5b\x1d\xcb\x17\xcc\x31\x79\xb9\xb9\xe2\xac\xcf\x5d\x20\x9a\
+\x55\xbf\x4d\x68\x06\xc8\x42\x61\xb1\x58\x2a\x3e\x9f\x1f\x12\x9f\
+\x92\x36\xba\x2f\x4a\x65\x5c\x03\xf8\xb1\x2c\x86\xcf\xe3\x63\x55\
+\x61\x56\x5b\x7b\x07\x93\x57\x7c\xd9\xf2\x3b\x98\x20\x3d\x57\xa9\
+\x52\x49\x86\x87\x04\xb9\x38\x39\xd8\xa3\xdb\xc1\x99\x1d\xbd\x50\
+\xc0\x6f\xe2\xb0\x39\x61\xf3\xa7\x4f\x0e\x56\xb5\x77\xf0\xf3\xbb\
+\x9e\x87\x26\x88\x05\x23\x3c\xee\xc5\xcc\xec\xd0\xe9\xe3\xc6\x64\
+\x73\x38\x6c\x3c\x41\xa3\x16\x82\xb0\x5e\xf8\x95\x35\xb5\xf7\x42\
+\xff\x36\xf7\xde\xe5\x4b\x24\x22\x1b\x1b\x5c\xf2\xc2\x9d\x4c\xaf\
+\x83\x32\x40\x57\x4d\xe6\x07\xcf\x59\xff\xe9\xb7\x3f\xfe\xa1\xa2\
+\xc6\x3a\xb7\xbc\xfb\x7a\x7a\x30\x4f\x6e\x58\x87\x3b\x71\xdf\x02\
+\x61\xbf\x4b\x4b\x5f\xb7\x09\x19\x20\xcb\xc5\x24\x10\xf0\xd9\x60\
+\x48\x30\x1e\x67\x98\xb9\xad\xcf\xb1\x11\x0a\xb5\xd0\x21\x55\x4c\
+\x18\x19\x1d\x1f\x19\x1a\xdc\x78\x21\x23\xdb\x56\xd9\xaa\xea\xce\
+\xec\xdc\xd9\xe9\x60\xb2\x46\x1f\x0f\x77\x41\x90\xaf\x8f\x23\x1c\
+\xe2\x34\xb7\x06\x5e\x67\x07\x18\xa2\x9c\x0e\xb5\xa6\x3a\xc4\xdf\
+\xd7\x6e\xf2\xe8\x18\xe7\xaa\xba\x3a\x56\x6d\x7d\x43\xe7\x73\x70\
+\x99\xad\xa6\xbe\x21\x24\x26\x32\x3c\x1f\xae\xbd\x6c\xf9\x8c\x20\
+\x08\xab\x80\x63\x32\x99\x1c\x55\xed\xed\x93\x6d\x04\xc2\xc9\x81\
+\xbe\xde\x75\xd0\x86\xb3\xdc\x18\xef\x83\x79\x6c\x30\xdf\xcf\x6f\
+\x96\xbd\xe0\x39\xbe\xd9\x05\x85\x4f\x7d\xbb\x7b\xdf\x43\x99\x79\
+\x5d\x79\x85\xcc\xa7\xac\x06\x1e\x8f\xcb\xbc\xf2\xe4\xa3\xad\x12\
+\xb1\xa8\x7b\x37\xdd\xff\xe2\x13\x88\x5b\x86\x0c\x90\x05\xc3\x61\
+\xb3\x31\xeb\xb2\xdb\xb1\x73\xe7\x67\x9a\x9b\xfa\x8c\xc8\x61\x21\
+\x8c\x9b\x93\x23\x83\xe6\x67\xf9\xfc\xd9\x5f\x39\x3a\xd8\x7d\xc6\
+\xe5\x72\x8f\x4f\x19\x1b\x93\x56\x51\x53\xeb\x5b\x59\x5d\xdb\x59\
+\x05\xde\x7c\x39\x1a\x1a\xf6\xcc\x89\xe3\xf0\x18\xcb\x78\xe0\x8c\
+\x8e\x09\x5e\x6b\x03\x97\xc7\x2d\x12\xf0\x78\x29\xb6\x32\x69\xe9\
+\x94\x31\x31\x81\x7e\x5e\x9e\xb2\xb3\x89\xc9\xf8\x14\x56\x45\x75\
+\x8d\x42\x28\x10\x28\xc0\x38\xd5\xc0\xb5\x18\x20\x49\x10\xc4\xd0\
+\x86\xad\xd6\x68\x63\xf2\x4b\x4a\xd6\xa7\x65\xe7\xde\xab\xd5\xeb\
+\x16\xb8\x39\x3b\x0d\xe3\xf3\x78\xc7\xe1\x1c\xe6\xf6\x39\x09\xc2\
+\xec\xf1\x57\x4b\xe2\x87\xc5\x97\xff\x7c\x26\x21\x69\xfd\xfe\x13\
+\x67\xe6\x67\x17\x14\xf9\x18\x4d\x7d\x92\x29\xdf\xe2\xb9\x6f\xf9\
+\x12\x53\x54\x58\x28\xe6\xfc\x79\x0d\x44\x39\x7f\x7a\x09\x32\x40\
+\x96\x8d\x06\x3a\x8f\xd0\x43\xa7\xce\x2e\x84\xc7\x7d\x3b\xea\x31\
+\x99\x98\x97\x1e\xdf\xc4\x8c\x8c\x08\x2b\x80\x0e\xea\x43\xe8\xa0\
+\xce\x41\x6b\x11\x98\x30\xac\x5a\xdf\x5a\x5d\xd7\xe0\x59\x59\x5d\
+\xe3\xfc\xd8\xbd\xab\x59\x46\xa3\x91\xc9\xcc\x2b\x60\xfc\xbc\x3c\
+\xb4\x70\xed\xc7\x70\xdd\xa5\xd1\x08\xbc\x48\x2c\x9d\x81\x23\x39\
+\x9c\xe5\x51\xc3\xf9\xc9\x59\xf9\x85\xec\xda\x86\xc6\xce\xb4\xf6\
+\xc5\xe5\x15\x2e\x1e\x2e\x2e\xb8\xd3\x03\x33\x51\xf7\x4c\x6c\x46\
+\x10\xc4\xd0\x22\x10\xb4\xea\xc0\xc9\xd3\x1b\x4e\xc5\x27\x2e\x1c\
+\x1d\x15\x31\x2e\xd8\xcf\x17\x73\x89\x1d\x01\xfd\x08\xc2\x1b\x39\
+\xf6\x1d\x57\x5b\xca\x11\xa4\x64\xe5\xfc\x79\xfb\xce\xdd\xf7\x9f\
+\x4f\x4e\x89\x6e\x68\x6e\x96\x43\x9b\xd5\xcd\xfc\x20\x61\x41\x01\
+\xcc\x03\xab\xee\xc2\x3a\x68\xd8\xd7\x62\x36\x6c\xa2\x97\x20\x03\
+\x64\xe1\x74\xa8\xd5\xe1\xa7\xce\x27\xce\x35\x67\x47\xed\x33\x30\
+\xde\xa7\xa4\xbc\x82\x99\x33\x65\x62\x15\x97\xc3\xc1\x0f\x19\x96\
+\xb3\x40\xd4\x70\x5c\x10\x15\x1a\x62\x84\xd7\xe2\xb1\x64\xf6\x0c\
+\xa7\xe2\xb2\x0a\x56\x4e\x61\x31\x93\x57\x5c\x6a\x9a\x39\x61\x5c\
+\x0d\x87\xc3\xc1\x9d\x1e\x57\xae\xdb\x2b\x0d\x46\x63\xd5\xcf\x07\
+\x8f\x4e\x3c\x9d\x90\xe8\x6c\x9e\x3d\x62\x69\xb4\x5a\x7e\x63\x73\
+\x8b\x1d\x18\x20\xbe\xc2\xce\x0e\xd7\xfe\x71\x1a\x9c\x20\x88\xa1\
+\x03\xbf\x59\xa9\x5c\x9e\x98\x9a\x71\xf7\xae\x03\x87\xef\x69\x6c\
+\x6e\x1e\xf3\xf0\xda\xbb\x65\xae\x4e\x8e\x4d\x70\x0e\x67\x7d\xfe\
+\x03\xc2\xfe\xe5\x6a\x81\xce\x08\x1f\xfa\x89\xc8\xd7\x3f\xfa\x74\
+\x4b\x55\x6d\x9d\xc2\x5a\x67\x7d\x10\x1b\xa1\x80\x79\xe5\xc9\xc7\
+\x1a\x84\x42\xc1\x37\x70\x88\xc1\xe1\x57\x16\x8f\x25\x6e\x03\x32\
+\x40\x16\x0e\xb8\x06\x97\xda\x86\xc6\xf0\x92\xf2\x4a\x77\x73\x53\
+\x9f\x51\x5d\x57\xcf\x08\x85\x42\x63\xb0\x9f\x0f\x26\x2e\xc4\x29\
+\xea\x6e\xd4\x5c\x2e\xb7\x3c\x2c\x30\xc0\x08\x43\x35\x0f\xe8\xd4\
+\x14\x0d\x4d\xcd\x2c\xb5\x46\xc3\x29\x2c\x2d\x0f\x19\x11\x1e\x86\
+\x6b\xd4\x58\xd7\x07\x9f\x77\x29\xc0\x19\x5e\x3b\x8b\xcb\xe5\x88\
+\xe2\x92\x52\x26\x61\x20\x74\x57\x53\x67\xce\x20\xbb\xca\xea\x5a\
+\x77\xb9\x54\xe2\xe0\xe4\x60\x8f\x09\x20\x71\x39\x8c\x02\xfa\x08\
+\x62\x70\x23\x00\xe3\x12\x55\x5d\x5b\xb7\x70\xfb\xce\xdd\xcf\xee\
+\x3f\x71\x7a\xc6\xf4\x71\xa3\x1d\xd7\x2c\x5b\xac\xe3\xf3\x78\x98\
+\xad\x18\x6f\xe0\x58\xd6\x02\x0b\x9a\x5e\xf3\xf3\x0e\x83\x25\xa7\
+\x33\x09\xc9\xcf\xc7\x5d\x48\x19\x85\x9b\x2e\xcc\xcd\x56\xc9\xa6\
+\x35\xab\x8c\xc1\xfe\xbe\xfb\xe0\x21\x1a\x20\x5a\xfa\xea\x65\xc8\
+\x00\x59\x38\x3c\x2e\x57\x2b\x95\x48\x44\x27\x62\xe3\xa7\x99\x9b\
+\xfa\x94\x8c\x9c\x3c\x89\xc2\xce\xce\xd5\xc7\xd3\x3d\x11\x0e\xab\
+\x40\xdd\x1d\x55\x2b\x87\xc3\x29\x87\xce\xc9\x78\xfc\xdc\xf9\x90\
+\xc6\xe6\x16\x39\xe6\x28\x82\x11\x9a\xdd\x2f\x47\x8e\x4f\x0f\x0d\
+\xf0\x47\x33\x83\x9d\x15\xe6\xfa\xc1\x91\x1e\x6e\x29\x33\xc8\xa4\
+\x92\xb6\xc3\xa7\xcf\xad\xc6\x0a\xf3\xd8\x84\xed\x08\x18\x28\xdb\
+\xa4\xb4\x8c\x88\xe2\xf2\x8a\xa8\xb0\xa0\x80\x6a\xf8\x3d\x65\x60\
+\x84\xf0\x79\x98\x47\x84\x20\x88\x41\x04\xf4\x0b\xf6\x4d\x2d\xca\
+\x39\x60\x5c\x1e\x78\xef\x8b\x1d\x4f\x95\x56\x56\xb9\x3e\xb8\x6a\
+\x39\x67\xe6\xa4\xf1\x38\xcb\x1b\x07\xc2\xcd\x12\x98\x1b\x08\x2b\
+\xc0\x5f\x0f\x69\xb3\xb2\x75\xf2\x5f\xb7\x7c\xf8\x8f\xee\x82\xa8\
+\x5d\xcd\xd6\xc7\x98\xa8\x08\xe6\xee\xc5\x0b\xf0\x6f\x87\xbb\xbe\
+\x30\x56\x8a\xe8\x65\xc8\x00\x59\x38\x60\x22\x5a\x25\x22\x11\xf7\
+\x5c\x62\xf2\xa2\xb6\x8e\x0e\x1b\x73\x73\x9f\x81\x4b\x55\x59\xf9\
+\x85\x22\x0f\x57\x97\x30\x37\x67\x27\x9c\x05\xc2\x8c\xa3\xdd\x26\
+\x48\x09\x2f\xa8\x51\x6c\x23\x94\x25\xa4\xa6\x8d\xc2\xdd\x60\xd8\
+\x88\xcf\x39\x75\x3e\x31\xb4\xac\xaa\x6a\x4a\x4c\xe4\x70\x2e\x18\
+\x19\x5c\x12\x43\x23\x64\xe2\xb0\xd9\xa6\xba\x86\xa6\x95\xc5\x15\
+\x15\xb2\x2b\x93\x3a\x62\x07\x57\x59\x53\xeb\x74\xf0\xe4\xd9\x65\
+\xd0\x79\x86\xfb\x79\x7b\xd6\x09\xf8\x7c\x0c\xa6\xc6\xe5\xb4\xcb\
+\x2a\x45\x13\x04\x61\x99\xa0\xf9\xa9\xae\xab\x5f\xf2\xaf\x8f\xb7\
+\xfe\xeb\x64\x5c\xc2\x58\xfc\x5c\x3f\xb0\xf2\x4e\x66\xc6\xc4\x71\
+\xb8\xcc\x85\xb3\x3e\x78\x03\xc7\x5d\x5e\x3d\x0b\xa0\x5e\x0d\xa9\
+\x52\xd5\x36\x61\xef\x91\xe3\x4f\x66\x17\x14\x61\x1d\x41\xab\x35\
+\x3f\x72\x99\x94\xf9\xe3\xe3\x0f\x57\xf3\x79\xbc\xa7\xe1\x10\xfb\
+\xe1\x6b\x2d\x17\x12\xb7\x01\x19\xa0\x41\x00\x97\xc3\xe1\x0b\x05\
+\x02\xa7\xe4\xf4\xcc\x48\x30\x07\xd8\xd4\xa7\x1d\x03\xc6\x1b\x5d\
+\xcc\xc8\x72\x1e\x39\x3c\x4c\x23\x97\x4a\x30\x6f\xcf\xa5\xd2\x17\
+\xf0\xf3\x55\x62\x30\x64\x67\x12\x92\x16\xa8\x35\x5a\x7e\x8f\xd7\
+\xc3\xaa\xa8\xae\x15\x5e\xcc\xc8\x1e\x3e\x61\x54\xb4\x82\xc7\xe5\
+\x5e\x80\xb6\xce\xf5\xea\xb0\x40\x7f\xf7\x94\xcc\x6c\xbf\x16\x65\
+\xab\x08\xcd\x12\xb6\xf5\x80\x65\x80\x0e\xb3\xa0\xb4\xcc\x6b\xef\
+\xd1\x13\x2b\xf4\x7a\x43\x90\xaf\x97\x47\x0b\x7c\xf0\x6b\xe0\xdc\
+\x55\xf3\x81\x10\x04\x61\x31\x88\xab\x6a\xeb\xee\xda\xf2\xf9\xf6\
+\x57\x8b\xcb\x2b\x5c\xb1\x3f\x78\x78\xed\x2a\x66\xc6\x84\x71\xf8\
+\xf9\xc5\xbc\x3e\x38\xf3\x53\x88\x17\x5e\x07\xdc\x20\x61\xdf\xd8\
+\xdc\x32\x7b\xef\xd1\xe3\x4f\xec\x3d\x7a\x72\x3a\xb6\x75\x9d\xb2\
+\x3e\xe0\x6f\x68\x7a\xfa\x81\xfb\x30\xe1\x21\x96\x10\xc1\x78\xcc\
+\xce\x19\x75\xa2\xf7\x21\x03\x34\x08\x80\x0f\x44\x83\x8f\x87\x5b\
+\xf6\xa1\xd3\x67\xd7\x6b\xb5\x9d\xc1\xd0\x7d\xde\x39\xe0\x28\x0e\
+\x7e\xde\x24\x6f\x77\x37\x85\x9b\x8b\x73\x21\xfc\x40\xac\xcc\x8c\
+\x26\xc8\xc0\xe1\xb0\xa5\xb5\xf5\x8d\x23\x0a\xcb\xca\x3d\x3b\x2f\
+\xfe\xdf\xeb\x61\x35\x2b\x95\xfc\xf8\xd4\xb4\xa0\xf1\x23\xa2\x42\
+\x05\x02\xfe\x45\x68\xab\xe7\x70\x38\x09\xfe\xde\x5e\x21\x60\x82\
+\xdc\xb1\x46\x18\x5e\xd7\x79\xf5\x6f\x61\x61\x0d\xb4\x03\x27\xce\
+\xdc\x31\x2c\xc0\x9f\xad\xb0\xb7\xc3\x65\x38\x9c\x09\xa2\xf8\x20\
+\x82\xb0\x3c\x78\x0d\x4d\xcd\x8b\x7f\x3a\x78\xe4\xd1\x0b\x19\x59\
+\xa1\x9d\x37\xee\x07\xef\x63\x26\x8e\x1a\x81\x03\xa6\x27\x41\x58\
+\x12\x03\x0b\x28\x5f\x0b\x9c\x11\xb6\x31\x9a\x4c\x58\x3c\xf9\xd9\
+\x57\xde\xf9\xf0\x8d\xcc\xbc\x82\x00\x68\xb3\x5a\xf3\x83\x2c\x98\
+\x3e\xc5\x34\x77\xea\x44\xfc\xbb\x3d\x01\xfa\x3d\xf3\x48\xdc\x06\
+\x64\x80\x06\x09\xd0\xb9\x68\x26\xc6\x8c\xcc\x3a\x79\x3e\x61\x81\
+\xd9\x04\xf5\x29\x38\x92\x43\xe2\x53\x52\xc3\x2e\xa4\x67\xde\x33\
+\x61\x54\xb4\x80\xcb\xe5\xe2\x87\x51\x09\x86\xc6\xe4\xa4\x70\xe0\
+\x1f\x3a\x75\xb6\x3b\x3f\xd1\xa5\x0e\x0b\x9f\xd7\xaa\x6a\xe3\x97\
+\x55\x56\x39\x4f\x1a\x3d\x12\x03\xb7\x77\x83\x5a\x6c\x65\xb2\x5f\
+\x6d\x84\xc2\xd0\xfc\xe2\x12\x5f\xb5\xa6\x33\x1e\xe8\x9a\xe0\x52\
+\xd9\x99\xc4\xa4\xb1\x72\xa9\x34\xc8\xcf\xcb\x13\x67\x92\xd0\x7c\
+\x11\x04\x61\x41\xd4\x36\x34\xde\xfd\xe3\xaf\x07\x9f\x3c\x1d\x9f\
+\x18\xc3\xe7\xf1\xd9\x2f\x6c\xba\x9f\x19\x39\x3c\x0c\x97\xbe\x67\
+\x81\x30\x67\x0d\x6e\x8a\xb8\x26\x3a\xbd\x3e\xec\x9b\x9f\x7f\xd9\
+\xfe\xfe\xb6\x1d\x6f\x9e\x8a\x4f\x9c\x68\xad\xc5\x4d\x7b\x02\xfd\
+\x1d\xf3\xec\xc6\xf5\xf8\x77\x9b\x02\xc2\xac\xcf\xb4\xf4\xd5\x87\
+\x90\x01\x1a\x3c\xe8\xc0\x40\x54\x5f\xcc\xc8\x5e\xd5\xac\x54\xfe\
+\x26\x9e\xa6\x0f\xc0\x8e\x88\x85\x71\x3e\x4d\x2d\x4a\x7e\x6c\x52\
+\x4a\x74\x78\x70\x60\x88\x5c\x2a\xc1\x65\xad\x32\x99\x44\xdc\x21\
+\x16\xd9\x78\x67\xe5\x15\x7a\x9a\x5f\x4b\x77\xc7\xd5\xf9\xbc\xba\
+\x86\x46\x01\x7e\x98\x5d\x9d\x1c\x71\xf7\x02\x3e\x47\xe7\xe3\xe1\
+\x76\xc1\x64\x32\x05\xa4\xe5\xe4\x85\x98\xaf\xbb\x16\x9d\x39\x83\
+\x72\x8b\x8a\x7d\x39\x6c\x76\x78\xa0\xaf\x4f\x1e\xf8\xaa\x0a\xf3\
+\x39\x82\x20\x06\x90\x96\xd6\xd6\x3b\x0f\x9e\x3c\xf3\xf7\x83\xa7\
+\xce\xae\xb3\x93\xc9\xfc\xe1\x73\xce\x7d\xf4\xde\x7b\x54\xfe\xde\
+\x5e\x47\xe1\xf4\x7c\x10\xee\xea\xbc\x56\x0c\x1f\x6e\x71\x8f\x7a\
+\xfb\xd3\x6d\x87\xf7\x1e\x39\xb1\x31\x2d\x3b\x2f\x18\x67\x85\xb1\
+\x9f\xb9\xca\xf2\xb8\x55\x21\xb6\xb1\x61\xfe\xfa\xcc\x63\x8d\xd0\
+\xcf\x7f\x09\x87\x3b\x41\x14\x02\xd0\xc7\x90\x01\x1a\x5c\x68\xc6\
+\x8f\x8c\x8a\xcb\xc8\xc9\x9f\x85\x5b\xc9\xcd\x6d\xfd\x01\x4b\xd5\
+\xde\x2e\x48\x48\x49\x73\xb7\x93\xcb\x9c\x3d\xdc\x5c\x5b\xd9\x2c\
+\x56\x69\x80\x8f\x77\xb9\x44\x2c\xb2\x2b\x2c\x2d\x73\xd6\x5c\x65\
+\x69\x4e\x22\xb2\x69\x8b\x0e\x1f\x86\x9d\x62\x35\x08\x83\x9b\x5b\
+\x95\x6d\x6d\x93\x30\x96\xe9\x06\xb6\xb7\xb2\x70\x44\x58\x54\x56\
+\xee\x2a\x12\x0a\x03\xfd\xbd\x3d\xf7\x43\x1b\xe5\xc0\x20\x88\x81\
+\x41\xa0\xd6\x68\x47\x1e\x38\x79\xfa\x83\xdd\x07\x8f\xdd\xe3\xea\
+\xec\x14\xb9\x6e\xd9\x22\xf1\xa8\x88\xf0\xac\xe8\xb0\xd0\xff\x48\
+\x44\xa2\x97\xe1\x1a\xbc\x69\x5f\x33\xbf\x0f\xce\xf8\x1c\x39\x7d\
+\xee\xad\x9d\xfb\x0f\x3d\x96\x96\x93\x1b\x08\x03\x2b\x19\x2e\xb5\
+\x9b\x8d\x8f\x55\x9b\x1f\xe4\x85\x4d\x0f\x68\x7c\x3c\x3d\x52\xe1\
+\x21\x2e\x7d\x51\xdc\x4f\x3f\x40\x06\x68\x70\x61\xe2\x70\x38\x35\
+\xcd\x4a\xe5\x94\x8a\xea\x1a\xf7\xdf\x5b\x4a\xea\x6d\x30\x89\x61\
+\x5e\x51\x89\x53\x53\x4b\x8b\xaf\xaf\xa7\x87\x48\x28\x10\x14\xc0\
+\xe8\xaf\xd0\x59\xa1\x30\x95\x57\xd7\x28\x54\x6d\x6d\x3d\x83\x9c\
+\x59\x6a\xad\x56\x37\x7b\xf2\x84\x4a\x30\x3e\x98\xc5\x14\x77\x80\
+\x70\xd4\x6a\xf5\xc2\xe3\xb1\xf1\x23\x30\xf0\xb9\xf3\xaa\xeb\xc3\
+\xc2\x80\xec\x82\x92\x52\x67\x4f\x37\xd7\x48\x17\x47\xc5\x5e\x68\
+\xa3\xdd\x61\x04\xd1\x8f\xc0\x67\xda\xb9\xb2\xa6\x6e\xc5\x8f\xbf\
+\x1e\xf8\x03\x0c\x48\xc6\x3f\x70\xf7\x72\xc5\xc8\xe1\xc3\x8a\xa0\
+\x2f\xfa\x08\x4e\x63\x11\x53\xdc\xa5\x84\x99\xdf\xaf\x79\xd3\x6e\
+\x6b\x6f\x9f\xfe\xc3\xbe\x03\xaf\x1d\x3e\x13\x3b\x05\xbe\x87\x7b\
+\x8f\x59\x63\xab\x37\x3e\xc8\xe2\x59\xd3\x8d\xb3\x26\x8f\xc7\x98\
+\x47\x34\x3f\x94\xef\xa7\x9f\x20\x03\x34\xf8\x30\x06\xf8\x78\x55\
+\x96\x56\x56\x8d\x2a\xab\xac\x76\x85\xe3\xfe\xec\x40\x58\xb8\xf3\
+\xab\xa2\xaa\xc6\x31\xbb\xa0\xc8\x5b\x2a\x16\xb9\x81\x29\xa9\xf0\
+\x70\x75\xae\xb4\x97\xcb\xf4\xb5\x0d\x8d\xf2\x16\x55\xab\xa4\x7b\
+\x7b\x3c\xbe\xb2\xa8\xd0\x10\xb6\xad\x4c\x8a\xa9\xef\x75\xad\xaa\
+\xb6\x69\x07\x4f\x9d\x5d\x9a\x5b\x58\xec\x7b\x13\xd3\xdd\x2c\x9c\
+\x5d\x4a\x4c\x4d\xf7\x19\x37\x22\xca\x5d\x22\x16\x25\x40\xdb\x75\
+\x63\x0b\x08\x82\xe8\x1d\xc0\xa8\x78\xc0\x60\xeb\x8e\x9f\x0e\x1e\
+\x79\x50\x61\x67\x17\xbd\x69\xcd\x2a\x0d\x7c\x06\xb1\x24\xc3\x17\
+\x20\x4c\xd0\x87\x09\x0e\x7b\xa6\xca\xf8\x0d\xed\x1d\xea\xc9\xc7\
+\xce\xc5\x3d\xb6\xe7\xf0\xf1\xd9\xad\x30\x48\x32\x37\x13\x66\x82\
+\xfd\x7d\xb1\xca\x3b\x96\x1e\xfa\x07\x88\xf2\xfd\xf4\x23\x64\x80\
+\x06\x21\x1c\x36\xbb\x4c\x6c\x63\x13\x5a\x58\x5a\xee\xab\x6c\x55\
+\x49\xcc\xcd\xfd\x05\x0b\xb3\x3a\x37\x36\x35\xdb\xa6\xe7\xe6\x79\
+\xb6\xb4\xaa\x9c\x3c\xdd\x5c\xd4\x01\x3e\xde\x4d\x60\x78\x84\x25\
+\xe5\x95\xb6\x6a\xb5\x46\x80\x06\xc7\x68\x32\xb2\xc1\x28\xc9\x14\
+\xf6\x76\x36\x0d\xcd\xcd\xe3\xce\xc4\x27\xdd\x15\x9f\x9a\x1e\x85\
+\x95\xe1\xcd\xdf\xeb\x46\xe9\xdc\x2a\x7f\xfa\x7c\x62\xe8\x8c\x89\
+\xe3\x8c\x7c\x1e\x0f\x83\x03\xaf\x56\x3c\x91\x20\x88\xde\x81\x0d\
+\xe6\xc7\xb3\xa6\xbe\x61\x56\x4a\x56\xce\xe2\xa9\x63\x47\xbb\x8d\
+\x1b\x19\x75\x1e\xda\xb1\x72\x3b\xc6\xf5\xe1\x6c\x45\x33\xe8\xf7\
+\x10\x15\x96\x95\xad\xf8\xe6\xe7\xbd\xab\x95\x2a\xd5\xcd\x7e\xee\
+\x87\x3c\x62\x91\x88\x79\xf5\xb9\x27\x33\x05\x7c\xde\x36\x38\xfc\
+\x01\xf4\x7b\xb9\x92\x88\x5e\x84\x0c\xd0\xe0\xc4\x04\xa6\x42\xd9\
+\xd0\xd8\x34\x0c\x03\x85\xe1\xb8\xdf\xa7\x91\xd1\xe0\xe0\x92\x58\
+\x41\x69\xa9\x7b\x71\x59\x05\xd6\xeb\xb1\x19\x19\x1e\x26\x2d\xaf\
+\xae\x96\x95\x57\xd7\xd8\x74\x07\x35\xaa\xda\xdb\x44\xf9\xc5\xa5\
+\xa1\xf1\x17\x53\xc7\xa6\xe7\xe4\x05\xb7\x28\x5b\x6f\xd5\xb0\x75\
+\x2e\x87\xe5\x14\x14\x07\x4e\x18\x35\x02\x77\xa2\x61\xac\x01\xee\
+\x38\x21\x08\xa2\xf7\xc0\x62\xc7\xb8\xbc\x3e\xbc\xb1\xb9\x65\x24\
+\x9b\xcd\xf6\x88\x1c\x16\x52\x2b\x97\x4a\x70\x16\x17\x77\x74\xfe\
+\x04\x6a\x00\xdd\xd0\x8d\xba\xad\xbd\x7d\xc1\x81\x13\x67\xd6\x80\
+\x89\xc2\x8d\x0f\xc4\x15\xbc\xf4\xd8\x43\x4a\x0f\x17\x67\x8c\x9d\
+\xc2\x12\x21\xf8\x77\x25\xfa\x11\x32\x40\x83\x14\x16\x8b\x55\xe6\
+\xee\xea\xac\x28\x2a\xab\x08\xac\x6b\x68\xb4\x37\x37\xf7\x37\x9d\
+\xbb\xc4\x6a\xe1\xe7\xe7\x14\x16\xb9\x9c\x4b\xba\x68\x1f\x35\x2c\
+\x44\x54\xd7\xd8\xc4\x6d\x55\xb5\xa1\x29\xeb\x3c\x8f\xd3\xde\x98\
+\xc5\xfa\x06\xe3\x7e\xae\x4b\x7d\x53\x93\x04\xe4\x16\x35\x2c\x54\
+\x03\x26\x08\xd3\xec\xd3\x4c\x10\x41\xdc\x3e\x1c\xbd\x5e\x1f\xa2\
+\x54\xb5\x8d\x2d\xaf\xaa\x99\xd1\xa2\x52\x45\xb9\x38\x2a\x74\x72\
+\xa9\x34\x11\xfa\x9a\x43\x70\x1e\xe3\x7c\x8a\x41\x37\xbc\x2d\x1b\
+\x06\x2c\x31\x7b\x8f\x9e\x7c\xfa\xd7\x13\xa7\xa6\x99\x63\x7e\x88\
+\x1e\x2c\x9b\x37\xcb\x38\x6d\xdc\x18\xcc\x90\x8d\xb3\x3f\x98\x33\
+\x8d\xe8\x67\xc8\x00\x0d\x62\x44\x42\x61\x8d\x9d\x4c\xea\x74\x21\
+\x3d\x6b\x78\x5f\x57\x8b\xff\x1d\x3a\x67\x83\xc0\xf4\x08\x53\xb3\
+\x73\x79\x8c\xa9\x73\xb6\xc6\x7c\xaa\xf7\x29\xa9\xa8\x74\x02\x79\
+\x85\x07\x07\xb2\x84\x02\x01\x9a\x20\xda\x31\x41\x10\xb7\x0e\x07\
+\x06\x2a\xce\x59\xf9\x85\xeb\x2f\x64\x66\xad\xf3\x74\x75\x75\xf3\
+\xf3\xf2\xc8\xe1\x72\x38\x78\x73\xc6\x0d\x0c\x37\x3b\xd3\xca\x6b\
+\xef\x50\x4f\x3c\x74\xea\xec\xb3\xc7\xce\xc6\x4d\xbe\x85\x25\xef\
+\x21\x4f\x64\x68\x30\xf3\xc8\xda\xbb\x71\x19\xf1\x9f\x20\xdc\x29\
+\x4b\x0c\x00\x98\x6f\xc5\xfc\x90\x18\x8c\x18\x8c\xc6\x65\x5b\xbf\
+\xdb\xf9\xfc\x91\x33\xb1\xa3\x6f\x22\xb0\x78\x48\xe0\xe5\xee\x56\
+\xbd\xf1\xee\xbb\xbe\x0f\xf4\xf5\xde\x02\xa3\xd4\x22\x73\x33\x41\
+\x10\x37\x87\x00\x0c\x50\xb8\xde\xa0\x5f\xcf\xe7\xf1\x30\x48\x19\
+\x8d\x0f\x26\x32\xc4\x72\x16\x37\x03\x5f\xaf\xd7\xfb\xa9\xb5\x5a\
+\xf7\x77\x3f\xdf\xfe\x51\x46\x5e\xbe\xbf\x5e\x7f\xfb\xb3\xbe\x43\
+\x0d\x0f\x57\x17\xe6\xb5\x17\x9e\x2a\x15\xf0\xf9\x8f\xc2\x21\x2e\
+\x2d\x52\xbe\x9f\x01\x82\x0c\xd0\x10\x40\xad\xd1\xac\x7a\xf1\x8d\
+\x2d\xef\x96\x57\x55\x3b\x99\x9b\xac\x06\x7b\x5b\xb9\x72\xe9\xec\
+\x19\xfb\xe6\x4e\x9d\x84\xdb\x47\xeb\xba\x5a\x09\x82\xb8\x05\xe4\
+\xa0\x36\x90\xbe\xf3\xe8\xc6\xc1\x81\x97\xb8\x43\xad\x8e\xfc\x76\
+\xf7\xbe\xd7\x8e\xc7\xc6\x8f\xd5\xea\x74\x5c\x6b\x1b\x90\xdd\x08\
+\x32\xa9\xc4\xf4\xc6\x8b\xcf\xaa\xed\xe5\xf2\xe7\xe0\x10\x83\x9e\
+\x6b\x3b\x4f\x10\x03\x02\xad\xcb\x0e\x01\x84\x02\xc1\xbe\x3f\x3d\
+\xf1\xc8\x73\xf0\xd5\xea\x72\xe4\x34\x36\xb7\xc8\x4e\x27\x24\xcd\
+\x87\xce\x16\xf3\x91\xf4\x6b\x5e\x24\x82\x18\x62\x60\x3c\xdd\xcd\
+\x9a\x1f\x34\x3a\xce\x65\x55\xd5\x6b\x37\x3c\xfb\xd2\xa9\x03\x27\
+\xcf\x4c\xd2\x68\xb5\x3c\x32\x3f\xbf\x85\xcf\xe3\x99\x5e\x7a\xf4\
+\x21\x1d\x98\x1f\x9c\xf5\xd9\x03\x22\xf3\x33\xc0\x50\x0c\xd0\xd0\
+\x40\x0b\xe6\xa7\x25\xd8\xcf\xc7\x70\x22\x2e\x61\x82\xb9\xcd\x8a\
+\x60\x09\x8a\xcb\x2a\xdc\x5c\x9d\x14\x01\x72\x99\x14\x03\x36\x6f\
+\xb6\x13\x27\x08\xe2\x16\xa8\xac\xa9\x5d\xff\xc1\xb6\xaf\x3f\xfd\
+\x61\xdf\xc1\x55\x98\x1e\x03\x9a\xc8\xf8\x5c\x83\xc7\x37\xac\x33\
+\x0c\x0f\x09\x2a\x87\x87\x0b\x40\x37\xbb\xbc\x48\xf4\x01\x64\x80\
+\x86\x0e\xad\x0a\x7b\xbb\xea\xa2\xb2\xf2\x29\x75\x8d\x8d\xf6\xb8\
+\xfb\xca\xdc\x3e\xe4\xe9\x50\xab\x59\x15\xd5\xd5\x82\x84\xd4\xf4\
+\x00\x91\x8d\x4d\x8c\xaf\xa7\xc7\x19\x68\xa6\x2d\xf2\x04\xd1\x47\
+\x98\x4c\x26\xfb\xf3\x17\x53\xff\xf9\xef\x1d\xdf\x3d\x5d\x52\x51\
+\xe9\x8a\x9b\x30\x68\xd6\xe7\xda\xac\x58\x38\xd7\x34\x67\xf2\x04\
+\xcc\xf0\x3c\x0d\x84\x33\x3f\x14\x7b\x62\x01\x50\x0c\xd0\xd0\x82\
+\x6f\x30\x18\x22\x9f\xfc\xcb\x6b\x07\xea\x1b\x9b\x6c\x0d\x56\xb6\
+\xf5\x94\xc5\x62\x99\xa4\x12\x71\xfb\xe8\xc8\xe1\x19\xeb\x57\x2c\
+\x7b\x86\xc7\xe5\xc6\x42\x33\x25\x16\x23\x88\x5e\x04\x0c\xcf\xe6\
+\xb3\x09\xc9\x8b\xe2\x2e\xa6\x8e\xa8\xa9\xab\xb7\x27\xe3\x73\x7d\
+\x26\x8c\x8a\x66\x9e\xd8\xb0\x0e\x77\x7c\x6d\x06\xc5\x75\x36\x12\
+\x16\x01\xcd\x00\x0d\x2d\x0c\x6c\x36\xbb\x76\xca\x98\x51\xd9\x69\
+\x39\xf9\x13\x1b\x9b\x5b\x30\xa8\xd1\x9a\xe8\xdc\x8e\x5f\x5a\x59\
+\xe5\x52\xd7\xd0\x18\x11\xec\xe7\xd3\x20\x14\x08\x30\x77\x09\x2d\
+\x89\x11\xc4\xed\x63\x73\xe4\x4c\xec\xe7\xfb\x8e\x9e\x5c\x9e\x94\
+\x96\x31\xbc\x59\xa9\x94\x92\xf9\xb9\x3e\x41\x7e\x3e\x58\xe4\x34\
+\x19\xfa\xe5\x77\xe1\xf0\x30\xe8\x86\xf3\x28\x11\x7d\x0f\x19\xa0\
+\xa1\x07\x96\x8a\x28\xf4\xf1\x70\x17\xc3\x48\xcd\xdf\x0a\x4d\x10\
+\x83\xcb\x7f\xa5\x15\x55\x6e\x5e\x6e\x6e\xbe\xde\x1e\x6e\x18\xd8\
+\x89\x53\xcf\x34\x13\x44\x10\xb7\x00\x98\x1c\xa7\xda\x86\xc6\x65\
+\xb1\x49\x17\x9f\xfc\x6e\xef\xfe\x65\xe5\x55\xd5\xce\xe6\xbc\x63\
+\x64\x7e\xae\x83\xbb\x8b\x13\xf3\x97\xa7\x36\x17\xf0\xf9\xbc\xff\
+\xc2\x21\x8a\x6a\x18\x5a\x18\x64\x80\x86\x26\x06\x7b\x5b\x79\x19\
+\x8c\x3a\x7c\xcb\x2a\xab\x3c\xda\xda\x3b\x6c\xcc\xed\xd6\x04\x2b\
+\x21\x35\xdd\xcd\x60\x30\xb8\x07\xfb\xfb\xb6\x72\xd8\xec\x4c\x68\
+\xa3\xf5\x5e\x82\xb8\x41\xf4\x7a\xfd\xb0\x8a\x9a\xda\xe5\x29\x99\
+\x39\xab\x8f\x9c\x89\xbd\xf3\x97\x23\xc7\x67\xe1\x0c\x2b\xcd\xfa\
+\xfc\x3e\x76\x72\x39\xf3\x8f\x17\x9e\xaa\x96\x88\x44\x3f\xc2\xe1\
+\x0e\x10\x96\xee\x21\x2c\x0c\x8a\x01\x1a\xc2\x18\x8c\xc6\x19\xdf\
+\xff\xb2\xff\xf9\xfd\x27\x4e\x4f\x55\x6b\x34\x7c\x73\xb3\x55\x01\
+\xc6\xc7\x38\x69\xcc\xa8\xc4\x75\xcb\x96\x6c\x91\x88\x45\x3f\x43\
+\x53\x47\xd7\x19\x82\x20\xae\x46\x87\x5a\x33\xb1\xa1\xb9\x39\x2c\
+\xaf\xb0\x78\xcc\x89\xb8\x84\xa9\xd9\x05\x85\x3e\x64\x7a\x6e\x1c\
+\xe8\x67\x98\xd7\x5f\x78\x5a\xe9\xa4\x70\xf8\x16\x0e\x3f\x01\x25\
+\x77\x9e\x20\x2c\x0e\x32\x40\x43\x1c\x30\x3e\xf7\x6c\xfd\x7e\xd7\
+\x13\x27\xe3\x12\x62\xac\xb5\x13\xc3\xe0\xe8\x11\xe1\xc3\xb2\xee\
+\x5d\xbe\xf4\x6d\x67\x85\xc3\x29\x38\x2e\x80\x66\x5a\x8b\x27\x88\
+\xff\xc1\xd1\x68\xb5\xd1\xad\xaa\xb6\x80\x93\xe7\x13\xee\x39\x79\
+\x3e\x71\x3c\x05\x38\xdf\x3c\x7c\x1e\x8f\xf9\xdb\x33\x8f\x6b\x7d\
+\xbd\x3c\x70\xe6\xe7\x6d\x50\x52\xe7\x09\xc2\x22\x21\x03\x34\xf4\
+\xe1\xb4\xb4\xaa\xee\xfd\xf0\xcb\xaf\x9f\xbf\x98\x99\x1d\x6c\x6e\
+\xeb\x37\x64\x12\x09\xc3\xe5\x72\x30\x61\xa1\xb9\xe5\x72\x1c\xec\
+\x6c\x99\x86\xa6\x66\xf3\x51\xdf\x81\x26\xc8\xd9\x51\xd1\xb8\x7a\
+\xe9\xc2\xaf\x23\x43\x83\xf7\x0b\x05\x82\x73\xd0\x4c\x5b\xe5\x09\
+\x6b\x47\x0a\xc6\x27\xa4\x43\xad\x76\x3b\x1d\x9f\xb4\x76\xef\xd1\
+\x13\xb3\x9b\x5a\x94\x52\xf3\x39\xe2\x26\xc0\x3e\xe6\xe5\xc7\x1f\
+\x36\x85\x07\x07\x62\x2e\xb2\xff\x03\xa5\x74\x9e\x20\x2c\x16\x32\
+\x40\xd6\x81\x5d\x4d\x7d\xfd\x9a\xd7\x3e\xfc\xf4\x4f\x95\x35\xb5\
+\x0a\x73\x5b\xbf\x81\x85\xff\x66\x4e\x1c\xc7\xc4\xa7\xa4\x31\x71\
+\x17\x52\x18\x9d\x4e\xdf\xd9\x59\x0c\x0f\x09\x62\xfe\xb8\x79\x93\
+\xf1\xcb\x9d\xbb\x99\x5f\x8f\x9d\xec\xdc\xb2\xdf\xd7\x23\x4e\xfc\
+\xb9\x0a\x3b\xdb\x96\xbf\x3d\xfb\xf8\x63\x76\x72\xdb\xf3\x2c\x16\
+\x83\xc5\x54\xdb\xbb\xce\x12\x84\x55\xc0\x86\xcf\x99\x33\x7c\x0e\
+\x5d\x5a\x5a\x5b\x43\x77\x1e\x38\xbc\xf9\x64\x6c\xfc\x68\x23\x7c\
+\xf6\x68\xc6\xe7\xd6\xc0\x7e\xe5\x99\x8d\xf7\x19\x46\x47\x46\xa4\
+\xc3\xe1\x4a\x50\x1e\x88\x6e\xae\x16\x0e\x19\x20\xeb\x21\x2c\x39\
+\x3d\xf3\x91\x2d\x9f\x6f\x7f\x60\x20\xe2\x81\x70\xa6\xe7\xc9\xfb\
+\xd7\x31\x3e\x1e\xee\x4c\x42\x4a\xba\x29\x25\x33\x5b\x13\xe8\xeb\
+\xd5\x32\x7b\xf2\x44\x9c\x1a\x32\xec\x3f\x7e\x4a\xbc\xfb\xf0\x31\
+\x5b\xa5\x4a\x25\xee\x8f\x02\x8a\xd8\x61\xad\x5a\x3c\x7f\xcf\x82\
+\x69\x53\x3e\xe1\xf3\x79\x67\xa1\x09\x67\x83\xe8\xc3\x40\x0c\x65\
+\xf8\x60\x72\xec\x0d\x06\x83\x7d\x6a\x56\xee\xfa\xad\xdf\xfd\xf8\
+\x40\x5d\x63\x93\xad\xf9\x1c\x71\x1b\x3c\xb2\x76\x95\x6e\xea\xb8\
+\x31\x98\x72\x63\x0e\x08\x03\x9e\x69\xd7\xe9\x20\x80\x0c\x90\x15\
+\x01\xff\xeb\xd1\x9f\x7c\xf3\xfd\xbf\x8f\x9d\x3b\x1f\x6d\x3e\xee\
+\xf7\xd1\xde\x1f\x37\x6f\x62\x22\x42\x83\x35\xf0\x10\xd7\xc6\xb7\
+\x82\xb0\xf2\x74\x2b\xc8\xb6\xb4\xb2\xea\xa9\x7f\x7f\xf5\xdf\x3b\
+\x8b\xcb\xca\xdd\xfa\x2b\x89\x23\x26\x4e\x7c\x76\xe3\x86\xb7\x42\
+\x03\xfc\x70\xbd\x1e\xb7\xa9\x52\xce\x20\x62\xa8\x81\x25\x2a\x78\
+\x1d\x6a\x4d\xf4\x97\x3b\x7f\x7e\xeb\xd4\xf9\x84\x18\x83\xc1\x88\
+\xb3\x40\x34\xdb\xd3\x0b\xdc\xbd\x64\x81\xf1\x8e\x39\x33\x71\xc6\
+\x67\x0d\xe8\x02\x88\xcc\xcf\x20\x81\x0c\x90\x75\x81\x9d\xde\xf0\
+\xa7\xff\xf6\xcf\x93\x95\x35\xb5\xb2\x81\xe8\x00\x79\x3c\x2e\x06\
+\x09\x36\xf9\x79\x79\x7e\x03\x87\x7f\x05\x61\x05\x77\x7c\x13\xe2\
+\x6b\xe1\x35\x36\xb7\x3c\xfb\xfe\xb6\xaf\x37\x64\xe4\xe6\xf9\xc3\
+\x71\x9f\x83\x33\x41\x58\x44\x36\x6a\x58\x48\xf6\x9d\xf3\x66\x6d\
+\xf3\x72\x77\x7b\x1f\x9a\xa9\x03\x23\x86\x04\xf0\x19\xb7\x83\x81\
+\xc5\x9a\x2d\x9f\x6f\x7f\x19\x67\x57\x3b\xd4\x6a\x01\x9a\x1f\xf3\
+\x39\x32\x40\xb7\xc9\xa2\x99\x53\x99\xb5\xcb\x96\x64\xc3\xc3\x7f\
+\x80\xbe\x06\xd1\xe6\x8a\x41\x04\x19\x20\xeb\x03\x6b\xf6\x84\xbe\
+\xf8\xc6\x96\x43\xc5\x65\xe5\x8e\x03\x51\x2e\x43\x61\x6f\xa7\x79\
+\xe7\x4f\xff\xf7\xb5\x80\xcf\x7f\x0e\x0e\x1b\xbb\x5a\x2f\x61\x57\
+\x53\xdf\xf0\xea\x9f\xdf\x7e\x7f\x0d\x98\x21\x99\xb9\xad\x4f\x41\
+\x13\xc4\xe7\xf1\xf4\xb6\x32\x69\xab\xc2\xde\xbe\x09\xbe\x2a\x47\
+\x0e\x1f\x16\x3f\x3c\x38\x68\xbf\x4c\x2a\x89\x87\xf3\x68\xd2\x68\
+\x66\x88\x18\x34\x68\xb4\xda\x91\xb1\x49\x17\x1f\x39\x76\xee\xfc\
+\xf4\xe6\xd6\x56\x69\x5d\x7d\x83\x1d\xc5\xf8\xf4\x2e\x77\xcc\x99\
+\x89\xb3\x3f\x59\xf0\x10\xb7\xba\x7f\x0a\x6a\xc3\x76\x62\xf0\x40\
+\x06\xc8\x3a\xe1\x40\x67\x18\xfd\xde\xd6\xed\x5f\xc6\xa7\xa4\x05\
+\xf7\x47\xcc\x4d\x4f\x30\x37\xcf\xfd\xab\x96\x9f\x9b\x39\x71\xdc\
+\xeb\x70\xb8\xaf\xab\xf5\x32\x22\x6a\xeb\x1b\x9e\x7d\xe6\xd5\x37\
+\x56\x41\x47\x8e\x19\x67\xfb\x0d\x34\x43\x5c\x2e\xc7\x60\x2f\x97\
+\x2b\xbb\xcd\x90\xb7\xbb\x5b\xf9\xd2\x39\x33\xbe\x80\xd3\x3f\x75\
+\x5d\x45\x10\x16\x09\xbb\xbe\xb1\x69\x45\xdc\x85\x94\x3b\x33\x72\
+\xf3\x87\x95\x56\x54\xba\xd5\x37\x35\xcb\xc9\xf4\xf4\x3e\xcb\xe6\
+\xce\x62\x56\x2d\x9e\x8f\xe6\x07\xfb\x05\x54\x3d\xb6\x13\x83\x0b\
+\xca\x04\x6d\x9d\x98\xe0\x46\x5f\x35\x3a\x2a\x22\xbd\xa5\x55\x35\
+\xac\xb4\xb2\xd2\xc5\xd8\x8f\x33\x41\xd8\x21\x97\x55\x56\x49\x67\
+\x4c\x1c\xc7\xe3\x72\x38\xb8\x1d\xfd\xca\x91\x53\x93\x58\x24\x6a\
+\x9a\x39\x61\x9c\x38\x25\x33\xc7\xb7\xa5\xb5\xb5\x3f\x4d\x10\x0b\
+\xff\x16\x98\x3d\xbb\xae\xa1\xd1\xbe\xbc\xaa\xda\xa5\xa8\xb4\xdc\
+\x2b\x26\x6a\xb8\x50\x2a\x16\xd7\xc0\xf9\x92\xae\xcb\x08\xc2\x22\
+\xe0\x74\xa8\x35\xe3\x63\x93\x2e\xbe\x9c\x94\x9e\x71\xff\xd1\xb3\
+\x71\x4b\xcf\x26\x5d\x88\x29\x2e\xab\x70\x6f\xef\x50\x0b\xe1\x3c\
+\x99\x9f\x5e\xe6\xee\xc5\x0b\x98\xbb\x16\xcc\xc1\x65\xaf\x6d\x20\
+\x5c\xca\xc7\x7e\x81\x18\x84\x90\x01\xb2\x62\xc0\x04\x95\x46\x86\
+\x86\x94\x6a\x34\x5a\xef\xfc\xe2\x12\xaf\xfe\x1c\x29\xb6\xab\xd5\
+\xc2\xd0\x00\x3f\x7b\x17\x47\x85\x00\x0e\x31\x20\x1a\x03\xa3\xbb\
+\xc1\x18\x9c\x06\x81\x80\x5f\x39\x7d\xfc\x18\x1d\x98\x34\xb7\xc2\
+\xd2\xf2\x7e\x59\x0e\xbb\x0a\x2c\xac\x7b\xd4\xd4\xac\x54\x8c\x1f\
+\x19\x8d\xcb\x75\x27\xba\x9a\x09\x62\xe0\x30\x9a\x4c\x2e\x55\xb5\
+\x75\xab\x12\x52\xd3\x1e\x8b\x4b\x4e\xb9\xe3\xd7\xe3\xa7\x66\x25\
+\xa7\x65\x86\x57\xd6\xd4\x3a\xc1\xe7\xd9\x2a\xb3\xbe\xf7\x07\x6b\
+\xee\x58\xc4\x2c\x9d\x33\xa3\x08\x1e\xe2\x06\x0e\xac\xef\x55\x86\
+\xed\xc4\xe0\x84\x0c\x90\x95\xc3\x66\xb3\x8a\x86\x05\x05\xd4\x1b\
+\x8c\x46\x97\x9c\x82\x22\x5f\x68\xea\x2f\x13\xc4\xe2\x70\xb8\xe2\
+\x66\x65\x8b\x1f\x8c\x60\x1d\xf8\x7c\x9e\x88\xcf\xe3\xb7\x81\x29\
+\x43\x23\x84\x81\x84\xf8\xb5\x86\xcd\x66\x17\x8e\x1c\x1e\xd6\xe0\
+\xe2\xe8\x68\x9f\x9c\x9e\xe1\x8c\x85\x4e\xf1\xc9\xfd\x0d\xdc\x58\
+\x44\x81\xbe\xde\x1a\x30\x6c\x39\x78\xd8\xd5\x4a\x10\xfd\x8f\x46\
+\xab\x1d\x75\xfe\x42\xca\xd3\xfb\x8e\x9d\x5a\xb1\xe7\xf0\xf1\xd9\
+\xb9\x45\xc5\xbe\xf0\x19\x12\x98\x07\x30\x34\xe3\xd3\x47\xdc\xbb\
+\x7c\x29\xb3\x68\xe6\x34\x34\x3f\x18\xef\xf3\x1d\x08\xb7\xbd\x13\
+\x83\x18\x32\x40\x84\x09\x4d\x46\x68\x80\x5f\x3d\x74\xa0\x4e\xd9\
+\xfd\x68\x82\x8a\xcb\x2b\xd8\x17\x32\xb2\xe4\x49\xa9\x19\x23\x54\
+\x6d\xed\xbe\x02\x3e\xdf\xc7\xde\x56\xee\x05\xaf\x07\xcd\x0f\xe6\
+\x07\x52\x83\x30\x00\x39\xcb\xdb\xdd\xad\x6e\x74\x54\x04\x37\x29\
+\x2d\xc3\x55\xad\xd1\xe0\xac\x51\x7f\x77\xf4\xac\xf2\xaa\x1a\x11\
+\xbc\x0e\x9e\x83\x9d\x2d\x66\x78\xc5\xad\xfb\x04\xd1\x9f\x70\xdb\
+\x3b\xd4\x13\x8e\xc7\x9e\x7f\xf2\xf3\xef\x76\xae\x81\xf7\xa3\xb3\
+\xb9\x9d\xe8\x63\xee\x5f\x79\xa7\x71\xde\xb4\xc9\x38\xdb\x83\x01\
+\xcf\xdb\x41\x54\xdc\x74\x08\x40\x06\x88\x40\x8c\x9d\x26\x28\xd0\
+\xbf\x02\x6c\x85\x1b\x8c\x28\xbd\xfb\x71\xa6\xa5\x73\x89\xa9\xa0\
+\xa4\xcc\xeb\x4c\x42\xd2\xe8\xb6\x0e\xf5\x48\x7f\x2f\x4f\xa9\x40\
+\xc0\xc7\x75\xf5\x6a\x10\xce\x06\x61\x01\xd3\x4c\xb9\x54\x92\x3f\
+\x6d\xfc\x18\x03\x63\x62\x8c\x4d\x2d\x4a\x49\x7f\xc7\x38\x34\x2b\
+\x95\xd2\xaa\xda\x7a\x27\x57\x27\x05\x47\x22\x16\xdb\x70\xb9\x9c\
+\x2a\x68\xa6\xdd\x61\x44\x9f\x83\x4b\x5e\x4a\x95\x6a\xf2\xa1\x53\
+\x67\x1f\xff\xe6\xe7\xbd\x77\xf4\x67\xcc\x9e\xb5\xb3\x69\xf5\x4a\
+\xdd\xac\x49\xe3\xcb\xe1\x21\xce\xfc\x7c\x0c\xa2\x98\x9f\x21\x02\
+\x19\x20\xa2\x1b\x23\x9b\xc5\x2a\x1e\x16\xe8\x8f\xc1\x7d\x81\xd9\
+\xf9\x85\xde\x5d\xcd\xfd\x67\x30\x70\x0a\x3f\xbf\xb8\x44\x7a\x3a\
+\x21\x29\xd8\xcf\xcb\x93\xe7\x68\x6f\x57\x64\xde\x82\x8e\x5b\x15\
+\x51\x95\x7c\x1e\xef\x68\x78\x70\x60\x99\xab\xb3\x13\xbb\xb6\xbe\
+\xd1\xa1\xb1\xb9\x45\x0e\xed\xfd\xf6\x1a\xeb\x1b\x9b\xec\x62\x93\
+\x53\xc6\x17\x96\x96\xc5\x04\xfa\x7a\x37\x40\x93\x1b\xc8\x19\x0c\
+\x24\xc7\xbc\x7c\x47\x86\x88\xe8\x0d\xf0\x3d\x2d\xd2\x1b\x0c\x7e\
+\x1d\x6a\x75\x64\x69\x45\xd5\xfc\xff\xee\xf9\xf5\xc9\x83\x27\xcf\
+\x4c\x36\x9f\x23\xfa\x81\xcd\xf7\xad\xd1\x4d\x1d\x37\x1a\x67\x7b\
+\xbe\x04\xbd\x09\xa2\x99\xdf\x21\x04\x6d\x83\x27\xae\x04\x3b\xd7\
+\x80\x6f\x76\xef\xfb\x66\xff\xf1\x53\x91\x5a\x9d\x8e\xdb\x9f\xc1\
+\xd1\xdd\x80\xf9\x69\x5e\xbe\x60\xce\xee\xc9\x63\x62\xb6\x70\xd8\
+\xec\x42\x68\xba\xb2\x70\xa9\x63\x5d\x43\xe3\x03\xef\x7d\xb1\xe3\
+\x21\x30\x4d\x9e\x03\x91\xcf\x08\xc1\x2d\xfd\x21\x01\xfe\x45\x0b\
+\xa6\x4f\xde\x1d\xe8\xeb\x73\x4c\x28\xe0\x57\x73\xd8\x1c\x3d\x9b\
+\xcd\x6a\x07\x53\x84\x33\x44\x98\x5d\x9a\x20\xae\x85\xd0\x68\x34\
+\x62\x3e\x2e\xb9\xc9\x68\xe2\x99\x98\xae\xcf\x1a\x7c\xe6\x30\x73\
+\xb3\x6b\x62\x6a\xfa\xb2\xdd\x87\x8e\x2e\xc4\x92\x15\x03\xf1\x39\
+\xb4\x56\x30\x61\xeb\x73\x1b\x37\x68\xa2\xc2\x42\x31\xe6\x07\xe3\
+\x7d\x68\xa6\x60\x08\x42\x06\x88\xb8\x16\x76\xdf\xef\x3d\x70\x14\
+\x4c\x50\x68\xbb\x5a\xdd\x1d\x60\xd9\xaf\x60\x3e\x9e\x51\xc3\xc3\
+\x33\xd6\xaf\x58\xf6\x96\x9d\x5c\x86\x15\x96\x71\xc6\x45\xd7\x79\
+\xb2\x0b\xb1\x46\xab\x5d\x89\x59\x6e\xb3\xf3\x0b\x5d\xf0\x75\x62\
+\xe3\x40\xdd\x28\x58\x2c\x96\x89\x0d\xc2\xf2\x1a\xa3\x23\x23\x52\
+\x96\xcd\x9b\xb9\xc5\x56\x26\x4b\x04\x23\x84\xbb\xc7\x70\xab\x3f\
+\x65\x98\xb6\x5e\xf0\x3d\xc9\x87\xf7\xa6\x04\x74\x69\xe9\xb6\xbd\
+\x43\x1d\x12\x77\x21\x65\xed\xd1\xb3\x71\xd3\xcb\xab\xaa\x9d\xf5\
+\x7a\x3d\xe6\xe8\xc2\x7e\x99\xcc\xce\x00\x21\xb2\x11\x32\x2f\x3d\
+\xb6\x49\x1d\xe8\xeb\x8d\x79\x7e\x70\xab\xfb\x7b\x9d\x27\x88\x21\
+\x07\x19\x20\xe2\x7a\x70\x8e\x9d\x8b\x3b\xbc\x63\xd7\x2f\x63\xdb\
+\x3a\x3a\x84\x03\xd1\x29\xa3\xa9\x10\xf0\xf9\xba\x51\x11\x61\x25\
+\x9b\xef\x5b\xb3\x0a\x8e\xb1\x53\xc2\xe0\xe8\x9e\x6f\xdc\xa8\x84\
+\xd4\xf4\xbf\x7f\xf4\xe5\x37\xd3\xbb\x4d\x10\x32\xd0\x37\x91\x6e\
+\x43\xf4\xa7\x27\x1f\xf9\x47\x48\x80\xff\x17\xf0\x62\x70\xd7\x08\
+\xa5\xca\xb7\x2e\xb0\x0e\x17\x96\xa0\x91\xb4\xb6\xb5\x8d\x39\x1d\
+\x9f\x74\xdf\xaf\xc7\x4e\xce\xa6\x22\xa4\x96\x89\xad\x4c\xca\xfc\
+\xe9\x89\x47\xf4\x1e\xae\x2e\xc7\xe1\xf0\x5d\xd0\xd5\x12\xb5\x12\
+\x43\x04\x32\x40\xc4\xef\x21\xca\x2d\x2a\x7e\xfb\xa3\xed\xdf\xde\
+\x59\x59\x53\xab\x30\xb7\xf5\x1b\x68\x22\xf0\x2b\x87\xc3\x36\xca\
+\x24\x92\xb6\xd7\x5e\x78\xfa\x3f\x76\x72\xd9\xbf\xa1\xa9\xe7\x16\
+\x54\x5c\xfe\x92\x19\x8d\xa6\xb0\x4f\xbe\xf9\xee\xc7\x53\xf1\x89\
+\x8e\x96\x50\xec\xb1\xfb\xb5\x63\xad\xb1\x91\xc3\x87\x15\x3c\x76\
+\xef\xea\x3f\xb0\xd9\xec\x3d\x9d\x27\x89\x21\x0f\xfc\xf3\x65\x19\
+\xb9\x79\xcf\xec\x3b\x7a\x72\x79\x51\x59\xb9\x87\xde\x60\xe0\x60\
+\x8e\x9e\x81\x5a\x56\x26\xae\x8f\xab\x93\x23\xf3\xc7\xc7\x1f\xc6\
+\xe5\xf7\x8f\xe0\x10\xfb\x18\x8c\x87\xa4\x98\xbe\x21\x0c\x19\x20\
+\xe2\x46\x50\xd4\x35\x34\x3e\xf2\xc1\x97\xdf\xdc\x97\x95\x5f\x80\
+\xdb\xe4\xfb\x9d\x6e\x33\x81\xb1\x41\x1b\x57\xaf\x38\x1d\x11\x12\
+\xfc\x2f\x38\x3c\x03\xea\xf9\x06\xc6\x04\x70\xae\x2d\xad\xaa\x87\
+\x3e\xfd\xf6\x87\xd5\x09\x29\x69\x9e\x96\x72\xa3\xc1\x59\xac\x59\
+\x93\xc6\x15\xaf\xbb\x73\xe9\x1b\x70\xf8\x39\x88\x3e\x78\x43\x0f\
+\xcc\x22\xee\x76\x31\x33\xfb\x89\x23\x67\x62\xe7\xb7\x77\xa8\x6d\
+\xea\x1b\x1b\xed\xe0\xfd\x28\x21\xd3\x63\xd9\xf8\x7a\x7a\x30\x2f\
+\x6d\x7e\x88\x81\x41\x16\x16\x68\xde\x01\x2a\x02\x91\xf9\x19\xe2\
+\xd0\x2e\x30\xe2\x46\x68\x17\x8b\x6c\x72\x46\x84\x87\xb6\x55\xd5\
+\xd6\x79\x62\xb6\x59\x73\x7b\x7f\x82\x37\x0f\x16\x66\x90\x4e\xcb\
+\xce\x75\xd7\x6a\x75\x23\x83\xfd\x7c\xb4\x6c\x36\x1b\x47\x69\xdd\
+\xb1\x35\xf8\xb5\x45\x28\xe0\x67\x8e\x1f\x19\x9d\x1c\x12\xe0\xeb\
+\x96\x70\x31\xcd\x1b\x46\xde\x03\x7e\xe3\x31\xc0\xe8\xbf\xa8\xbc\
+\x42\x5e\x5c\x56\x11\x65\x34\x9a\x82\x1d\x1d\xec\x9b\x78\x5c\x2e\
+\x6e\xf3\x47\x23\x84\xb1\x21\x0e\x70\xf3\x74\x01\xa3\x27\x00\x61\
+\x9c\x13\xc5\x0b\x0d\x12\xe0\x7f\x67\x07\x03\x84\xe5\x3f\x1f\x3c\
+\xfa\xd6\xc9\xf3\x89\x1b\x4e\x9e\x4f\x98\x92\x5f\x54\xe2\x55\x07\
+\xe6\x07\x4b\xaa\xe0\xff\x1e\x2e\x23\xf3\x63\xa1\x84\x07\x07\x9a\
+\xfe\xb8\x79\x93\x49\x2c\x12\x3d\x09\x87\x98\xdd\x19\x77\x7d\x91\
+\xf9\xb1\x02\x68\x06\x88\xb8\x19\x5c\x1b\x9a\x9a\xef\xde\xf2\xf9\
+\xf6\xc7\x73\x0a\x8b\xba\xb7\xc9\x0f\x08\xe6\xb8\xa0\xdc\xb5\xcb\
+\x96\x7c\x6d\x6f\x2b\xc7\xb4\xf4\x57\xe6\xe6\x10\x81\xc2\x61\xe4\
+\xbd\xfe\xbb\x3d\xbf\xde\xf9\xcb\xd1\x13\x8e\x5d\xcd\x03\x0b\xce\
+\x64\x39\x3b\x2a\x1a\x43\x03\xfc\xf2\x9d\x1c\xec\x6b\xf1\x18\x73\
+\x2e\xe9\x74\x3a\xbe\x4e\xaf\xc7\xda\x68\x7a\x89\x58\xd4\x1a\x13\
+\x39\xfc\x88\xab\x93\x23\x16\x59\xc4\x78\x27\x62\x60\xe0\xa2\x29\
+\x05\x13\x13\x56\xdb\xd0\x18\xde\xd2\xda\xea\x0c\xc7\x1c\x2e\x97\
+\xab\x05\xd7\xc3\x52\x6b\xb5\xf6\xf5\x8d\x4d\xb6\xaa\xf6\x76\x69\
+\x49\x79\xa5\x57\x7a\x4e\x5e\x60\x7f\x17\xef\x25\x6e\x0f\x18\x28\
+\x99\x9e\xbc\x7f\x1d\x6e\x6d\x7f\x1a\xb4\x17\x84\x69\x37\x28\x4e\
+\xcf\x4a\x20\x03\x44\xdc\x2c\x9e\x55\xb5\x75\x6b\x5e\x79\xe7\x83\
+\x3f\x34\xb5\x28\xa5\xe6\xb6\x01\x01\xcd\x43\x68\x80\x7f\xd1\xfc\
+\x69\x93\x0f\x46\x84\x06\xff\x2a\x14\xf0\xb1\x03\xeb\x09\x8e\xba\
+\x43\x40\xa3\x5a\x55\x6d\x23\x76\xec\xda\xb3\xfc\x54\x7c\xa2\x9b\
+\x25\xef\xb2\xc1\xdf\x09\x77\xbf\x0d\x0f\x0e\xca\x5b\xb5\x68\xfe\
+\x97\x3e\x9e\xee\xef\x43\x73\x7b\xd7\x59\xa2\x8f\x61\x1b\x0c\x06\
+\xdf\xd2\xca\xaa\xc5\x35\x75\xf5\x7e\x6a\x8d\x56\x04\xe6\x46\x06\
+\x8f\x5d\xca\xab\x6b\x5d\xc1\x00\x49\xf1\x7d\xc3\xe1\x70\x0c\xf8\
+\x55\xd5\xd6\x86\xe7\x6d\x74\x3a\x3d\x06\x3a\x13\x83\x8c\xe5\xf3\
+\x66\xeb\x57\x2c\x9a\x87\xc5\x8d\xff\x06\xda\x09\xc2\x9d\x9a\x74\
+\x43\xb4\x22\xc8\x00\x11\xb7\x82\x77\x41\x49\xe9\xc3\x2f\xbe\xb1\
+\xe5\x79\x3c\x18\x48\x33\x81\x86\xc1\xde\x56\xae\x9c\x14\x33\x32\
+\x7e\xf6\x94\x89\x5b\x15\x76\xb6\xd8\x91\xf5\xdc\x2a\x8f\xe0\x0d\
+\xca\x0b\x34\x5d\xd5\xd6\xee\xfd\xdd\xde\xfd\x6b\x4f\xc4\xc6\xbb\
+\x59\x72\x5c\x06\xfe\x5e\xb3\x27\x4d\x28\xb9\x7f\xd5\x9d\x98\x7d\
+\x16\x55\x0f\xa2\x0f\xeb\xad\x81\x41\xf2\x62\x30\xbe\x12\x36\x8b\
+\x85\xa9\x14\xb4\x9d\xad\x66\xe0\x8f\x2a\xd3\x68\x34\x23\x1a\x9b\
+\x5b\x66\xe7\x17\x97\xba\x1f\x3d\x1b\x37\xa9\xb8\xbc\xc2\x4d\xad\
+\xd1\xe0\xd2\x24\x2d\x5d\x0d\x41\x9e\xdd\xb8\xbe\x6d\x74\x54\xc4\
+\x45\x78\x88\xa5\x2d\x30\xe6\x87\x66\x7d\xac\x10\x32\x40\xc4\xad\
+\x80\x37\x05\x8f\xf8\x94\xb4\x57\x3f\xd8\xf6\xf5\x2a\xbc\x51\x74\
+\x35\x0f\x0c\x68\x16\x44\x42\xa1\x26\x3a\x7c\x58\xe6\xdd\x4b\x16\
+\x7c\xe0\x68\x6f\xb7\x0b\x9a\xb1\x96\xd8\x95\xe0\xeb\x16\x83\xd6\
+\xb7\xaa\xda\x42\xbf\xdf\x77\x60\xde\xd1\xb3\xb1\x9e\x96\xb0\x63\
+\xec\x6a\xe0\xef\xe5\xe6\xec\x54\x7f\xef\xf2\xa5\x9f\xdb\xcb\x65\
+\xd5\x42\xa1\x50\xc9\xe7\xf1\xda\x78\x5c\x6e\x3b\x97\xcb\x51\x71\
+\xb9\xdc\x06\x36\x9b\x5d\x03\x2f\x1c\xf3\x0c\x51\xcc\xc2\xb5\x91\
+\x76\xa8\xd5\xb3\x95\xaa\xb6\x10\xf8\x9b\x96\x3a\xda\xdb\xa7\xb3\
+\x58\x4c\x05\xb4\x1b\xc1\x14\xf9\x18\xf4\x86\x49\x69\x39\xb9\x33\
+\xb7\x7c\xfe\xe5\x5c\x8d\x56\x67\xb1\xb3\x83\xc4\xed\x63\x27\x97\
+\x31\x7f\x7e\xf2\x91\x52\x37\x67\xe7\x53\x70\xf8\x13\x08\xfb\x0a\
+\xc2\x4a\x21\x03\x44\xdc\x2a\x18\xd8\xe9\x76\x3a\x21\x69\xcb\x8e\
+\x5d\x7b\x66\x59\xc2\x72\x18\x6e\x95\xf7\xf3\xf4\xac\xd8\xb4\x76\
+\xd5\x3b\xee\xce\x4e\x07\xa1\x0d\xb7\xca\x63\x1d\xb1\xab\x61\x0f\
+\x7a\xa0\xaa\xb6\x6e\xd2\xae\xfd\x87\x87\x9f\x8a\x4f\xf4\xb2\xd4\
+\x1b\x1f\xfe\x6e\xb8\x2c\xe6\xac\x50\x34\x2a\xec\x6c\x9b\xe4\x32\
+\xa9\xd2\xde\xd6\xb6\xd1\xd5\x51\x51\xe1\xe2\xe4\x58\x28\x97\x4a\
+\x2a\xb9\x1c\x8e\x06\xcc\x90\x51\x64\x23\x6c\x10\x08\x04\x05\x6c\
+\x16\x0b\x03\xac\x69\xe9\xac\x6b\xf6\xc7\x1f\xb4\x45\xa3\xd1\x46\
+\x7f\xf4\xd5\xb7\xca\xb1\x23\xa2\xce\x83\x49\xce\xb1\xb7\x95\x1b\
+\x0d\x06\x43\xd4\x3b\x9f\x6f\x9f\x9e\x5f\x5c\x62\x11\x31\x62\x44\
+\xdf\xe1\xef\xed\xc5\xbc\xb4\x79\x53\x9a\x44\x64\xd3\x6d\x7c\xb0\
+\xa8\x31\x61\xc5\x90\x01\x22\x6e\x07\xbc\xb9\xf8\x9e\x49\x4c\xfe\
+\xe7\xb7\x3f\xef\x9d\x61\x29\xc9\xdd\x78\x3c\xae\xfe\x91\xb5\xf7\
+\x7c\x11\x13\x19\xbe\x9f\xcf\xe3\x25\x41\x13\x56\x71\xbe\xd6\x1b\
+\x3d\x08\x74\x57\x71\x79\xc5\xec\xc3\xa7\xcf\x79\x9c\x88\x8b\xf7\
+\xd2\xeb\x3b\x77\xed\x0c\x78\x22\xc5\x9b\x01\x4d\x12\xfc\xae\xfa\
+\xa8\x61\x21\xd9\x53\xc7\x8d\x3e\xe4\xe5\xe6\x9a\x2c\x14\x08\x1a\
+\x58\x6c\x96\x01\xcc\x91\x96\xc7\xe5\x36\x73\x38\x9c\x4a\xb8\xb4\
+\x09\x64\x4d\x3b\xcc\x14\xf0\x7f\x9c\x9f\x99\x57\xf0\xaf\x43\xa7\
+\xcf\x3a\xc4\x25\xa7\xb0\xd0\x28\x73\xd8\x1c\xa3\xc1\x68\x60\x77\
+\xff\xaf\x89\xa1\xcd\x94\xb1\x31\xa6\x4d\xab\x57\xa6\xc2\x67\xe0\
+\x1d\x38\xc4\x5c\x5c\xf8\x39\x20\xac\x1c\x32\x40\x44\x6f\xe0\x1f\
+\x7f\x31\xf5\x6f\x5f\xfe\xf8\xf3\x3c\x4b\x31\x41\x68\x08\x70\xf9\
+\x08\x3a\xbd\x6d\x41\x7e\x3e\xdb\xe0\x18\xeb\x72\x5d\xaf\xd3\xf3\
+\x00\x2d\xae\xae\xab\xbb\x27\x36\x39\xc5\x76\xef\xd1\x13\xbe\xed\
+\xed\x1d\xc2\x81\xaa\x31\xd6\x1b\xf4\x9c\x39\x1a\x35\x3c\x2c\x65\
+\x62\xcc\x88\x3d\x8e\x0e\xf6\x17\xe0\xe6\xdf\x0e\xc6\xc8\xc8\x66\
+\xb1\x35\x6c\x36\x4b\x05\xd7\xe1\x72\x21\xce\x16\xf5\xa5\x31\xe2\
+\x41\x57\x23\x02\x5b\xd9\x9d\xa9\x5b\x07\x3f\x17\x63\x71\x70\xe9\
+\x0e\x7f\x2e\xea\x5a\x9d\x11\x1a\x51\x01\x3c\x5f\x6a\x32\x19\xe5\
+\x06\x83\xd1\xc6\xc4\x98\xf0\xff\xc2\xc2\x13\x6c\x36\xc7\x04\x0f\
+\xd4\xf0\xfd\x94\x20\xdc\x35\x87\xfd\x9a\x0d\x48\xd6\xd6\xde\x11\
+\xbd\xe3\xe7\x5f\x1e\x3f\x11\x1b\x3f\x1a\xda\x07\x95\xa9\x25\x6e\
+\x1f\xfc\x0c\xac\x5e\xba\xd0\xb4\x78\xd6\xf4\x1c\x38\xdc\x0c\xc2\
+\xa5\xaf\x2b\x63\x04\x09\x2b\x85\x0c\x10\xd1\x5b\xb8\xa7\x64\xe6\
+\xfc\xe5\xc3\xed\x5f\xaf\x6c\x69\x55\x89\x2d\xe5\x46\x83\x1d\xe0\
+\x98\xa8\x88\xb4\xd5\x77\x2c\xfa\xd4\x59\xe1\x80\x01\xd2\x78\xd3\
+\x45\x23\x74\xad\xa0\x47\x0c\x98\xf6\x84\xdf\xe1\xdf\x7b\x0e\x1f\
+\x0b\x3b\x72\x26\xd6\xb1\x3b\xc6\x69\x28\xdd\x3c\x31\x3b\xb5\x9f\
+\x97\x67\xf9\xa4\xd1\x23\x4f\x47\x84\x06\x1f\xb4\x95\x49\x53\xc0\
+\x18\x35\xa3\xd5\x30\xff\x92\x46\xf8\xe3\x61\x02\x25\xbc\x59\xa0\
+\xba\x8d\x0a\xfe\xdd\xb0\xd3\xf8\xbd\x8e\x03\xbf\x0d\x6e\x09\xc7\
+\x98\x2b\x0c\x26\xf6\x6c\x55\xb5\x45\x56\xd4\xd4\xfa\xe9\x74\x3a\
+\x46\x2e\x93\x56\xcb\x24\x92\x72\x01\x9f\x5f\xdf\x35\x3b\xc5\x6e\
+\x85\xff\x15\xfe\x9c\xae\x1e\xe9\xd2\x77\xef\xdc\xb1\x27\xec\x50\
+\x6b\x7c\x4b\x2a\x2a\x27\x9e\x4d\x4c\x9e\x9d\x9c\x9e\x19\xd6\xa2\
+\x6c\x95\xa0\x39\xc5\xff\x2f\xce\x7c\x0d\x0b\xf4\x2f\x98\x3e\x61\
+\xec\x21\x57\x47\x45\x1e\xb4\x73\xe1\xda\xf0\xf3\x17\x52\xc7\x65\
+\xe4\xe6\x07\x0c\x74\x8c\x1a\x31\x30\x88\x6c\x84\xa6\xa7\x1e\xb8\
+\x4f\x17\x19\x1a\x5c\x0e\x87\x0b\x41\x98\x33\x8c\x6e\x78\xc4\x25\
+\xc8\x00\x11\xbd\x89\x5b\x7e\x71\xe9\xff\xfd\xf9\x9d\xf7\x1f\xc6\
+\xa5\x05\x4b\x32\x41\x58\x93\x0b\x6e\xba\xaa\xa5\xb3\x67\xc4\xce\
+\x99\x32\x71\x03\xb4\xe1\xae\xaa\xce\x1b\x6e\xe7\x45\x57\x27\xbc\
+\xa1\xa9\xf9\xdd\x6d\x3f\xfe\x34\x3e\x29\x2d\x83\x67\xa9\xc1\xd2\
+\xbd\x41\xf7\xdf\x88\xc5\x06\xc1\x57\x3b\x99\xac\x35\xc0\xc7\xbb\
+\x24\x2c\x28\x20\x2d\xc0\xc7\xeb\x82\x83\x9d\x6d\xb6\x8d\x40\x58\
+\x0e\x46\xa5\x11\xce\xb7\x83\xba\x67\x6f\xae\x66\x24\xb1\x5f\x11\
+\xb7\x77\x74\x44\x9f\x8a\x4f\x7a\x50\xd9\xda\x3a\xd1\x49\xa1\x70\
+\x1a\x1d\x19\xce\x13\x8b\x44\xac\x82\x92\x32\xe6\x42\x46\x26\x53\
+\x51\x5d\xc3\x9c\x4d\xbc\x60\x7e\xca\xff\x5e\x83\xf9\xb0\x13\x4c\
+\x59\x60\x7e\x48\xb3\x37\xc4\x0d\xe3\xe5\xee\x66\x7a\x6e\xe3\x7a\
+\x8d\xb3\xa3\x22\x13\x0e\xa7\x80\x54\x9d\x27\x08\xa2\x07\x64\x80\
+\x88\xde\x04\x6f\x50\xce\xb5\xf5\x0d\x1b\x37\xff\xf9\xef\xaf\x58\
+\x92\x01\x32\x3f\x64\x70\xb6\x40\x26\x11\xb7\x85\x05\x05\xd6\x6c\
+\x58\x79\xe7\xcb\x42\x01\xff\x20\x34\x2b\xbb\xce\xfe\x06\x5c\x66\
+\xc1\x84\x8a\xd3\xc0\x08\x3d\xb6\xe3\xa7\x3d\x33\xe1\x86\x3d\x68\
+\x97\xc4\xae\x47\xcf\xbf\x11\x82\x46\x84\x6d\x8e\x95\xc1\x98\x2a\
+\x0e\x9b\x6d\xc4\x20\xeb\x9e\x26\xe5\xca\xe7\xf4\x04\xff\xf7\x58\
+\xfb\xaa\x43\xad\x11\xe8\x74\x3a\x6e\xb7\x91\xd9\xb0\x62\x19\x0b\
+\x0c\x28\xd3\xd4\xa2\x64\xb6\x7e\xbf\x8b\x39\x7f\xe1\x7f\x71\xa8\
+\xd7\xfb\x7e\x08\x19\x20\xe2\x46\x98\x35\x69\x3c\xb3\xfe\xae\x65\
+\x35\x5c\x2e\xe7\x07\x38\x7c\x11\x84\x89\x0e\x09\xe2\x37\x90\x01\
+\x22\x7a\x1b\x34\x08\x0e\x6d\xed\x1d\x77\x3c\xf6\xf2\xdf\xde\xc5\
+\x2a\xf2\x5d\xcd\x96\x41\xf7\x4d\x16\x63\x63\xdc\x9d\x9d\xeb\x82\
+\xfd\x7d\xaa\x57\x2e\x9c\xff\x99\x44\x2c\xda\x06\xcd\xd7\xda\x35\
+\x65\x03\xb2\x03\xf9\x6a\xb5\xba\xb9\xbb\x0e\x1c\x7e\x70\xf7\xa1\
+\xa3\x8e\x96\x9c\x50\xd1\x92\x19\x3f\x32\x9a\x49\x48\x4d\x63\x74\
+\x3a\xda\xb9\x4f\xf4\x1e\x36\x42\x01\xb3\xf1\x9e\x95\xa6\x09\xa3\
+\xa2\x31\xce\xe7\x4d\xd0\x79\x10\xce\xf4\x12\xc4\x55\x21\x03\x44\
+\xf4\x15\x76\x5a\x9d\x6e\xf6\xe3\x7f\xfe\xfb\x27\xb8\x45\xde\x12\
+\x8d\x02\x9a\x21\x34\x42\xb8\x75\x7e\xda\xf8\xd1\xe7\xe0\xc6\xbc\
+\x53\x28\x10\x60\x9c\xd0\xb5\xc0\x58\x12\x07\x90\x27\x98\x1f\xc7\
+\x23\xa7\xcf\xbd\xb1\xe3\xa7\x5f\x28\xc6\x84\x20\x06\x18\x5f\x4f\
+\x77\xe6\xd9\x8d\x1b\x94\x8e\x0e\xf6\x5f\xc1\xe1\xc7\xa0\x42\x10\
+\x66\x76\x26\x88\x6b\x42\x06\x88\xe8\x4b\x24\x7a\x83\x61\xce\x5b\
+\x9f\x7c\xf1\x56\x6a\x76\x8e\xbb\xa5\x96\x0c\x40\x23\x64\x27\x97\
+\xb5\x86\xf8\xfb\x15\x0e\x0f\x09\xca\x8c\x0e\x0b\x49\xb7\xb7\xb5\
+\xfd\x00\x4e\x61\xdc\xc0\xb5\x3e\x20\x68\x7a\xc6\x19\x0c\x86\x11\
+\x27\xe2\x12\x1e\xdc\xfe\xe3\xcf\xc1\x1d\x1a\xcd\x90\x5c\x1e\x23\
+\x08\x4b\x06\x97\x54\xef\x5f\x79\xe7\x51\x78\x88\xf9\x7d\x70\x49\
+\xbb\x00\x44\x37\x36\xe2\x77\x21\x03\x44\xf4\x35\x18\xff\xb1\xf4\
+\xe0\xc9\x33\x8f\xfc\x7c\xf0\xc8\xa8\x81\x4e\x98\x78\x2d\xba\x97\
+\xc6\xb0\xc8\xaa\x8f\x87\x7b\xe5\x8c\x09\x63\x4f\x86\xf8\xfb\x56\
+\x39\x3b\x2a\xbe\x81\xe6\x2c\xd0\xb5\xd6\x6b\x14\xa0\xf1\x06\xa3\
+\x71\xcc\xc5\x8c\xac\x39\x9f\x7c\xfb\x43\x74\x53\x73\x0b\x19\x21\
+\x82\xe8\x63\x44\x36\x36\xa6\x47\xd7\xdd\x63\x8c\x89\x0c\xc7\xdc\
+\x3e\x07\x40\x18\x51\x8f\x59\xd1\x09\xe2\x86\x20\x03\x44\xf4\x17\
+\x73\x31\xd9\xe0\x57\x3b\xf7\x2c\x4a\xcb\xc9\x0d\x30\xb7\x59\x24\
+\xdd\x66\x48\x61\x67\xdb\x72\xc7\xdc\x59\x07\xc6\x44\x45\x9c\x91\
+\x4a\xc4\x27\xa0\x29\x03\xdb\xaf\x81\x1b\x68\x2c\x28\xba\xa4\xa2\
+\x32\xf0\xeb\x9f\xf6\x4e\x4c\xcb\xce\x71\xed\x0e\xfe\xb5\xc4\x25\
+\x40\x82\x18\xac\x04\xfb\xfb\x1a\x9e\x79\xf0\xbe\x26\x5b\x99\xec\
+\x43\x38\xdc\x0a\xc2\xd2\x26\xd6\x94\xe0\x93\xe8\x05\xc8\x00\x11\
+\xfd\x89\x4f\xab\xaa\x6d\xf1\x97\x3b\x7f\x5e\x7b\x36\x21\x79\xc4\
+\x60\x48\x32\x88\x66\x28\xc8\xd7\xa7\x74\xe5\xa2\x79\xbf\x84\x05\
+\x05\xec\x80\x63\x0c\xac\xbc\x1e\xb8\x6b\x0c\x2b\xd0\x4f\xab\xae\
+\xab\xf7\x3b\x11\x1b\x3f\xea\xc8\xd9\xd8\x30\xf8\xbd\x45\x64\x82\
+\x08\xe2\xf6\x59\xb5\x68\x7e\xc7\xb2\x79\xb3\x72\xe1\x21\xee\xf2\
+\xfa\x17\x48\x83\xed\x04\x71\xb3\x70\x5e\x79\xe5\x15\xf3\x43\x82\
+\xe8\x73\x9a\x05\x7c\xfe\xc5\xe8\xf0\x61\x4d\x7a\xbd\xc1\xad\xa4\
+\xa2\xca\x59\xaf\xb7\xcc\xb8\xa0\x1e\xb0\x1a\x9a\x9a\x6d\xd3\x73\
+\xf3\x82\xb9\x1c\xae\xb3\x8f\xa7\x7b\x2d\x9b\xcd\xc6\xac\xd2\xd7\
+\x1a\x6d\x62\x6e\x21\x3c\x1f\x2b\x11\x8b\x8e\x87\x07\x07\xd6\x4f\
+\x1b\x37\xa6\xdd\x49\xe1\xc0\x2a\x2e\xaf\x10\xab\x35\x5a\x8c\x1d\
+\x22\x23\x44\x10\x37\x89\xb3\x42\x61\xfa\xeb\x33\x8f\x55\x8c\x8d\
+\x8e\x3c\x04\x87\xdf\x82\xde\x03\xd1\xac\x0f\x71\xcb\x90\x01\x22\
+\xfa\x1b\x03\x87\xcd\x4e\x07\x63\x50\x6c\x2b\x97\x7a\xd6\xd4\x37\
+\x48\x94\xad\x2a\x89\xf9\x9c\xc5\xd2\xa1\x56\x0b\xd1\x04\xd5\x35\
+\x34\x86\x87\x05\x05\x54\xf1\x00\x68\x6e\x00\x5d\x6f\x0a\x15\xe3\
+\x86\x32\xc1\xf4\x1d\xf2\xf7\xf6\xac\x9b\x39\x61\x1c\x47\x2c\xb2\
+\x91\x65\x15\x14\x4a\x8c\x83\xb8\xc4\x06\x41\xf4\x37\xf3\xa7\x4f\
+\xd1\x3c\xf7\xd0\x86\x7c\x3b\xb9\x1c\x77\x79\xbd\x0e\xc2\xad\xee\
+\x04\x71\x5b\xd0\x12\x18\x31\x90\xf8\x55\xd7\xd5\x3f\xf2\xe9\x37\
+\x3f\x2c\xc9\x2a\x28\xf0\x1d\x0c\x99\x96\x71\x49\x4c\x2a\x11\xb7\
+\x2f\x9a\x3e\xf5\xec\xbc\x69\x93\x5f\xe9\x2c\xe1\xc0\x66\xab\xd8\
+\x5d\xf5\xb4\x70\xdb\xed\xf5\xb2\x4b\x3b\x83\xd6\xe5\x16\x15\xdf\
+\xff\xf7\xf7\x3f\xf6\xc1\xed\xf3\xb4\x2c\x46\x10\xd7\x46\x26\x91\
+\x30\x4f\x3f\x70\x5f\xc3\xb0\x20\x7f\xac\xe5\xf5\x3e\xe8\xbf\x9d\
+\x27\x08\xa2\x17\x20\x03\x44\x0c\x34\x68\x02\xc2\xdf\xdd\xfa\xd5\
+\x77\x49\x69\x19\xde\x5a\x9d\x8e\x3b\x18\x4c\x01\x1a\x21\xcc\x88\
+\x2c\x93\x4a\xda\x26\x8f\x1e\x75\x7e\xdc\xc8\xa8\xfd\xae\x4e\x8e\
+\xe7\x05\x7c\x7e\x39\x18\xa2\x36\xf8\x05\x30\xa9\x62\x07\xe8\xca\
+\x0f\x98\xa8\xb5\xad\x6d\xd1\x67\xdf\xfe\xf8\x87\xc4\xb4\xf4\xb0\
+\xc1\x58\x79\x9e\x20\xfa\x1a\xfc\x7c\x8d\x8e\x1a\xce\x6c\x5a\xb3\
+\xaa\x51\x6c\x63\x83\x41\xce\x9f\x83\xd0\x04\x11\x44\xaf\x41\x06\
+\x88\xb0\x14\x84\x7b\x8f\x9e\x3c\xf3\xed\x9e\xbd\x91\x96\x54\x47\
+\xec\x46\xc1\x0e\x1b\xbf\xe2\x36\xfa\xf0\xe0\xc0\xbc\x3b\xe7\xcd\
+\xfe\xc2\xcf\xdb\x73\x2b\xfc\x12\x58\x66\xa3\xbb\x80\x68\x37\xb2\
+\xfa\xa6\xa6\x79\xef\x6d\xdd\xf1\x7a\x5e\x51\xb1\x57\xa0\xaf\x0f\
+\x2b\xbb\xa0\x90\x0c\x10\x41\x00\xb8\xbd\x7d\xfd\x5d\x77\x30\x53\
+\xc6\xc6\xe0\x6c\xea\x2c\x10\x6e\x3c\xa0\x40\x67\xa2\xd7\x21\x03\
+\x44\x58\x12\xb2\xda\x86\xc6\xb7\xde\xf9\x6c\xdb\x1d\x05\x25\x65\
+\x98\x71\x79\xd0\xd0\x6d\x80\x10\xcc\x2e\x0d\xa3\x56\xb5\x44\x2c\
+\x6e\xf7\x74\x75\xa9\x5a\xbf\x62\xd9\x1b\xb6\x32\xe9\x61\x38\x85\
+\x69\xf9\xf1\x3a\x2c\x0f\x32\x0a\xf4\x2c\x68\x3e\x88\xbb\xe7\xf0\
+\x31\xd6\x8e\x9f\x7e\x81\x87\x04\x61\xbd\x44\x84\x06\x33\x0f\xaf\
+\x59\xd5\xe1\x60\x67\x8b\xa6\x67\x2d\xa8\x1a\x44\x35\x53\x88\x3e\
+\x81\x0c\x10\x61\x69\x38\x1b\x8d\xc6\x59\x27\xe2\xe2\x1f\xf8\xcf\
+\x8e\xef\xb0\x8a\xf3\xa0\xa3\xa7\x19\xc2\xe2\xab\xee\x2e\xce\xb5\
+\x0a\x3b\xdb\xa6\xf0\x90\xa0\xec\xc8\xd0\xe0\x64\xa9\x58\xdc\x04\
+\x3e\x28\xc4\x60\x34\xce\x96\x4b\xa5\x81\xa5\x95\x55\x9c\xd2\x8a\
+\x2a\xd6\x7b\x5f\x60\x7c\x27\x41\x58\x1f\x0e\xb6\xb6\xcc\xba\xe5\
+\x4b\x4c\xe3\x46\x44\x61\xd2\x51\xdc\xda\x7e\x04\x54\x0e\xa2\x1b\
+\x14\xd1\x67\x90\x01\x22\x2c\x11\x39\xc8\xaf\x45\xd9\x7a\xd7\x1b\
+\x1f\x7f\xbe\x31\xaf\xa8\x64\x50\xcd\x06\x5d\x09\x1a\x22\x0e\x87\
+\x6d\x94\x49\x24\x6d\x76\x72\xb9\x52\xc0\xe7\x6b\x55\xed\xed\xa2\
+\xc6\xa6\x66\x79\x77\xb1\xd8\xc1\xb6\xe4\x47\x10\xbd\x01\x97\xcb\
+\x61\x16\xcd\x98\xc6\x2c\x9f\x3f\xbb\x84\xc7\xe3\xed\x82\xa6\x1d\
+\x20\xac\xe3\xd5\x8c\xe7\x09\xa2\x2f\x21\x03\x44\x58\x2a\xb8\x4d\
+\xdc\x13\xde\x9f\x13\xb2\x0b\x8a\x66\xbc\xf2\xce\x07\xeb\xb1\x71\
+\xb0\x1a\x85\x9e\xb3\x42\x3d\x21\xe3\x43\x58\x2b\x91\xa1\xc1\xcc\
+\x83\x77\xdf\xa5\x75\x52\x38\xe0\xd4\xe7\x1e\x50\x3a\x08\xcd\x0f\
+\x41\xf4\x0b\x64\x80\x08\x4b\xc7\x06\x14\xa8\xd6\x68\x66\xbd\xbb\
+\xf5\xab\xa7\x52\xb3\x73\x9c\x2d\xb5\xa8\x2a\x41\x10\xbf\x8f\xa3\
+\x83\xbd\x69\xdd\xb2\xc5\xcc\x98\xe8\xc8\xfd\x70\x78\x12\xf4\x2b\
+\x08\x77\x78\x61\xd0\x33\x41\xf4\x1b\x64\x80\x88\xc1\x82\x0d\xbc\
+\x57\xd7\x15\x95\x95\x8f\xff\xf8\xeb\xef\xe6\x14\x95\x55\x60\x4e\
+\x1d\x82\x20\x06\x09\xb8\xdc\xb5\x74\xce\x4c\xdd\xb2\x39\xb3\xca\
+\xe0\x31\xe6\xf3\xc1\x8d\x01\xc9\x20\xdc\x29\x49\x10\xfd\x0e\x19\
+\x20\x62\xb0\x11\xae\xd5\xe9\x16\x1e\x39\x13\x3b\x7f\xdf\xd1\x13\
+\xc3\xeb\x1a\x9b\x6c\xcd\xed\x04\x41\x58\x28\xe3\x46\x44\x99\xd6\
+\xdd\xb9\xa4\xca\xc1\xce\xf6\x20\x1c\xa2\xe9\xc1\xbc\x3e\x98\x27\
+\x8b\x20\x06\x0c\x32\x40\xc4\x60\x65\x5e\x6d\x43\x23\x9a\xa0\xb1\
+\xc7\x63\xe3\x23\x30\xab\xb2\xb9\x9d\x20\x08\x0b\xc1\xd3\xd5\x85\
+\x79\x68\xf5\x4a\x65\x90\x9f\x4f\x1e\x1c\xee\x05\x7d\x0c\xc2\x5a\
+\x79\x04\x31\xe0\x90\x01\x22\x06\x33\x02\xd0\xcc\xac\xfc\xc2\x47\
+\x0e\x9e\x3c\xe3\x13\x9b\x7c\x31\x14\x1b\xe1\x3d\x4d\x81\xc5\x04\
+\x31\x80\xd8\xdb\xca\x71\x5b\x7b\xeb\xb8\xe8\xa8\x22\x16\x8b\x75\
+\x11\x9a\x7e\x02\xfd\xdc\x79\x92\x20\x2c\x04\x32\x40\xc4\x50\x40\
+\x06\xef\xe3\x29\xc7\xce\xc5\xbd\xf6\xf3\xa1\x63\xee\x0d\x4d\x4d\
+\xd2\xee\x12\x13\x04\x41\xf4\x1f\x42\x81\xc0\x74\xc7\x9c\x19\x86\
+\x85\x33\xa7\x95\xf2\xb8\x5c\x5c\xea\xfa\x00\x74\x1a\x84\xd9\xd0\
+\x09\xc2\xa2\x20\x03\x44\x0c\x25\x84\x1a\x8d\xf6\xed\x3d\x47\x8e\
+\xcf\xd9\x7f\xfc\x94\x6b\x87\x5a\x2d\x30\x9a\x4c\xf8\x1e\xa7\x19\
+\x21\x82\xe8\x43\xd8\x6c\xb6\x69\xfa\x84\xb1\x86\xbb\x17\xcd\x6f\
+\x91\x4a\xc4\x98\xbd\x19\xd3\x56\xa4\x80\xb4\x78\x9e\x20\x2c\x11\
+\x32\x40\xc4\x50\x04\x0b\x8e\x6e\xd9\xb1\xeb\x97\x3b\x4e\xc4\xc5\
+\x77\x26\x51\x24\x13\x44\x10\xbd\x0f\xe6\xb7\x0a\x0f\x0e\x64\xee\
+\x5d\xbe\xd4\xe4\xe5\xe6\x8a\x39\x7c\x36\x80\xce\x81\x0c\x78\x9e\
+\x20\x2c\x19\x32\x40\xc4\x50\x45\x02\x92\x77\xa8\x35\xeb\xb7\xef\
+\xda\xfd\xc8\xd1\x33\xb1\xae\x5d\xcd\x04\x41\xf4\x06\xc3\x83\x83\
+\x98\xbb\x16\xce\x31\x85\xf8\xfb\x5d\x80\xc3\x8f\x40\x98\xc9\xb9\
+\x15\x44\xb5\xbb\x88\x41\x01\x19\x20\x62\x28\x83\xb3\x3e\x76\x20\
+\x2f\xb5\x46\x33\xf3\xdd\xad\x5f\xbd\x9c\x94\x96\x21\xeb\x3c\x43\
+\x10\xc4\x2d\xd1\xc3\xf8\x9c\x82\xc3\xed\xa0\xe3\xa0\x06\x10\xe5\
+\xf3\x21\x06\x15\x64\x80\x08\x6b\x00\x03\xa2\x71\x29\x2c\xbc\x5d\
+\xad\x8e\xfe\x70\xdb\x37\x7f\x4c\x4e\xcf\x90\x19\x8c\x46\x2c\xb7\
+\x41\x10\xc4\x0d\x10\x1e\x1c\x68\x5a\xb1\x70\x2e\x03\xc6\x67\x1f\
+\x1c\x62\x22\xc3\x54\x50\x19\x88\xea\x76\x11\x83\x12\x32\x40\x84\
+\x35\x81\x46\x48\x01\x1a\xdd\xa1\x56\x87\xed\x3b\x76\x6a\xdd\x4f\
+\x07\x0e\x07\xe9\xf4\x7a\xda\x31\x46\x10\xd7\x20\x22\x24\xd8\xb4\
+\x6a\xf1\x3c\x55\x80\x8f\xf7\x31\x38\xfc\x1e\x84\x65\x2b\x50\x2a\
+\x10\x41\x0c\x5a\xc8\x00\x11\xd6\x8a\x13\x68\x82\x56\xa7\x0b\x4c\
+\x48\x49\x9f\xf5\xc9\x37\xdf\x4f\xc2\x5d\x63\x5d\xa7\x08\x82\xc0\
+\xa5\xae\xd5\x77\x2c\xac\xf7\xf3\xf2\x8c\x85\xc3\xdd\xa0\x4c\x50\
+\x3c\x88\x02\x9c\x89\x21\x01\x19\x20\xc2\xda\xc1\x60\xe9\x71\x7a\
+\xbd\x61\x72\x56\x41\x41\xe4\xfb\xdb\xbe\x9e\xd3\xdc\xa2\xa4\xac\
+\xd2\x84\x55\x82\xf5\xba\x26\x8c\x1a\xc1\xdc\x39\x6f\x76\x95\x8b\
+\xa3\xe2\x2c\x34\x9d\x01\x61\x90\x33\xc6\xfb\x10\xc4\x90\x82\x0c\
+\x10\x41\x74\x21\x02\x45\x1b\x0c\x86\x15\x25\x15\x55\x2e\xdb\x7e\
+\xd8\x35\x33\xbf\xa4\x54\x4e\x09\x15\x09\x6b\x40\x26\x95\x98\x66\
+\x4f\x9a\xc0\x2c\x98\x31\xa5\x48\x6c\x63\x93\x08\x4d\x98\xbd\xb9\
+\xbb\x6e\x17\x41\x0c\x49\xc8\x00\x11\xc4\xe5\x70\x41\x1e\xf0\xb9\
+\x78\xa2\xb2\xa6\xce\xfd\xe0\xc9\xd3\x11\x67\x93\x2e\x78\xaa\xda\
+\xda\xb1\x1a\x3d\xe5\x12\x22\x86\x14\x9e\x6e\xae\xa6\x45\x33\xa7\
+\x69\x26\xc5\x8c\x28\xe0\x70\x38\xd9\xd0\x14\x07\xfa\x11\x54\x02\
+\xa2\x9b\x03\x31\xa4\x21\x03\x44\x10\xd7\x46\x08\xba\xb7\xa1\xa9\
+\x79\xe6\xd9\xc4\xe4\x80\x63\xe7\xce\x7b\x54\xd5\xd6\x39\x90\x11\
+\x22\x06\x3b\x51\xc3\x42\x4c\x4b\xe6\xcc\x54\x86\x05\xfa\xe3\x2e\
+\xae\x7c\x10\xd6\xea\xfa\x16\xa4\x03\x11\x84\x55\x40\x06\x88\x20\
+\x6e\x8c\x98\x0e\xb5\x66\xed\xf9\x8b\xa9\xd3\xc1\x0c\xc9\x72\x0a\
+\x8a\x9c\x35\x5a\x2d\x8f\xcc\x10\x31\x58\x10\x8b\x6c\x4c\xb3\x26\
+\x8e\xd7\xcc\x9c\x38\xae\xc1\x49\xe1\xd0\x02\x4d\xb8\xbc\xb5\x0d\
+\x74\x14\xcf\x13\x84\xb5\x41\x06\x88\x20\x6e\x0e\x0c\x9a\x1e\x5f\
+\x5c\x5e\xf1\xda\x89\xd8\x78\xcf\xb8\x0b\x29\x22\xa5\x4a\x25\x34\
+\x18\x8c\x6c\x32\x43\x84\xa5\x81\x35\xba\x22\x42\x83\x8c\x33\x27\
+\x4e\xe8\x18\x19\x1e\xaa\xe6\x70\x38\x59\xd0\xfc\x1e\xe8\x00\x88\
+\xb6\xb1\x13\x56\x0d\x19\x20\x82\xb8\x35\xd0\xec\xd8\x18\x8c\xc6\
+\xa7\x93\x52\x33\x36\xec\x3e\x7c\xd4\x3b\xaf\xa8\x84\x12\x2b\x12\
+\x16\x81\x83\xad\x2d\x33\x75\xfc\x68\x66\xd6\xc4\xf1\x3a\x7b\x5b\
+\x79\x29\x34\xbd\x03\xfa\x0e\xd4\x08\xa2\xca\xec\x04\x01\x90\x01\
+\x22\x88\xdb\x43\x0c\xb2\x01\x79\xa8\x35\x9a\x75\x87\x4f\xc7\xae\
+\xde\x77\xec\x84\x63\x63\x73\x0b\xcd\x06\x11\xfd\x0a\x87\xc3\x61\
+\x46\x45\x84\x33\xd3\xc7\x8f\x31\x45\x0d\x0b\x29\x62\xb1\x58\x18\
+\xd3\xf3\x09\xa8\x0d\xd4\x0e\x52\x83\xa8\xc3\x27\x08\x33\x64\x80\
+\x08\xa2\x77\xc0\xdd\x63\xf6\x66\xb9\xb5\xb4\xb6\x2e\xfc\x61\xdf\
+\xc1\x8d\x87\x4f\x9f\x13\xd1\xd2\x18\xd1\x97\x04\xfb\xfb\x32\xe3\
+\x47\x44\x31\x93\xc6\x8c\x6a\x90\x88\x44\x3b\xa1\x09\x93\x16\x62\
+\x60\x73\x13\xa8\x1e\x44\x9d\x3c\x41\x5c\x05\x32\x40\x04\xd1\xfb\
+\x60\x22\x45\x17\x90\x2f\x7c\xbe\xec\xf2\x8a\x4a\x9e\xda\x75\xe0\
+\xf0\xc8\xe4\xf4\x4c\x9c\x2d\x22\x88\xdb\x26\xc4\xdf\x8f\x19\x37\
+\x32\x4a\x3f\x61\x54\x74\xad\x4c\x22\xc1\x4a\xec\x98\xac\x10\x8b\
+\x91\x56\x82\xaa\x40\x1d\x20\x82\x20\xae\x03\x19\x20\x82\xe8\x5b\
+\xd0\x0c\xc5\x80\x9c\xf5\x7a\x7d\x50\x7e\x49\xe9\xd4\xdd\x87\x8e\
+\x8d\x49\x4a\xcb\xb0\xed\x3c\x4b\x10\x37\x00\x8b\xc5\x62\x02\x7c\
+\xbc\x98\x49\xa3\x47\xea\x26\x8e\x1a\x51\x20\x11\x8b\x0f\x41\xf3\
+\x79\x10\xee\xe6\x42\xf3\x53\x03\xa2\x12\x15\x04\x71\x13\x90\x01\
+\x22\x88\xfe\xc3\x11\x34\x0c\xe4\xaf\xd3\xeb\x15\x95\x35\xb5\xc1\
+\xdf\xed\xd9\xbf\xf4\x42\x46\xa6\x2d\x55\xa6\x27\xae\x46\x90\x9f\
+\x0f\x33\x36\x3a\xd2\x04\xc6\xa7\x50\x2e\x95\x62\x31\xd2\x0c\x50\
+\x39\x28\x0d\x54\x00\x22\xd3\x43\x10\xb7\x08\x19\x20\x82\x18\x18\
+\x30\xc9\xa2\x3f\x68\x8e\x56\xab\xb3\x2d\xaf\xae\x09\x3e\x15\x9f\
+\x38\xf6\x64\x5c\xbc\x5b\x5b\x7b\x07\xc6\x13\x11\x56\x88\x54\x2c\
+\x66\x46\x0e\x0f\x33\x8d\x8a\x08\xeb\x88\x08\x0d\xce\x17\x0a\x04\
+\x58\x8b\x0b\x77\x6e\x15\x83\xb0\x36\x17\x9a\x1e\x4a\x56\x48\x10\
+\xbd\x00\x19\x20\x82\x18\x78\x30\x48\x3a\x02\x34\x0b\x3e\x8f\x5e\
+\x4d\x2d\x4a\x87\xec\x82\xa2\xa0\xa3\x67\xce\x85\xa6\xe7\xe6\x8b\
+\xe9\x33\x3a\x74\x31\x2f\x6d\x99\xc6\x44\x45\x74\x8c\x8e\x8c\x28\
+\x70\x71\x52\x60\x39\x8a\x06\x10\xee\xdc\xc2\x59\x9e\xfd\xe6\x63\
+\x9a\xe9\x21\x88\x5e\x86\x0c\x10\x41\x58\x1e\xce\xa0\x29\xa0\x59\
+\x5a\x9d\xce\xa1\xba\xae\x5e\x98\x91\x9b\xe7\x7e\x22\x36\xc1\xab\
+\xac\xaa\x4a\x4a\x05\x5a\x07\x37\x72\xa9\xd4\x14\x15\x16\xa2\x1f\
+\x3f\x22\xba\x6e\x58\x90\x7f\x9e\x80\xcf\x6f\x86\x66\x34\x39\x38\
+\xc3\x73\x04\x84\x79\x7b\x08\x82\xe8\x63\xc8\x00\x11\x84\x65\x83\
+\x66\xc7\x01\x84\x86\x68\x5e\xb3\x52\xe9\x55\x5a\x51\x25\x4e\xcd\
+\xce\x75\x3a\x9b\x90\xec\xd2\xd8\xd2\x42\x45\x5a\x2d\x1c\x77\x17\
+\x67\x53\x58\x50\x80\x3e\x32\x34\xa4\x29\xc8\xcf\xbb\x0a\x0c\x10\
+\xee\xd6\xc2\x19\x1e\x2c\x45\xf1\x3d\x28\x07\x84\x39\x7a\x08\x82\
+\xe8\x47\xc8\x00\x11\xc4\xe0\x03\x0d\xd1\x22\xd0\x5d\xc5\xe5\x15\
+\x7e\x45\x65\x15\xbc\xcc\xbc\x02\xc9\xf9\x0b\x29\x76\x54\x9f\x6c\
+\x60\x61\xb1\x58\x26\x3f\x2f\x4f\x26\x22\x24\x48\x1b\x1e\x1c\xa8\
+\xf4\xf7\xf1\x6a\x15\x09\x85\x18\xb3\x83\x39\x79\x4e\x83\x30\x39\
+\x61\x0a\x88\xb2\x31\x13\xc4\x00\x43\x06\x88\x20\x06\x37\x38\x43\
+\xe4\x04\x5a\x0c\xba\xbf\xb0\xb4\xcc\x2b\xbf\xb8\x94\x57\x5d\x57\
+\xcf\xae\xac\xa9\xe5\x95\x55\x56\xf3\x1a\x9b\x9b\xb9\x46\x30\x45\
+\x64\x8c\x7a\x0f\x34\x3a\x12\x91\x8d\xc9\xcb\xdd\xcd\xe8\xed\xee\
+\xae\xf3\x74\x73\xd1\x79\xba\xba\x18\x7c\x3c\xdd\x4d\x7c\x1e\x4f\
+\x0f\x97\x14\x81\xbe\x06\xed\x03\xe1\x92\x16\xb6\x11\x04\x61\x41\
+\x90\x01\x22\x88\xa1\x01\x9a\x9b\xee\xad\xf4\xf8\xd8\x1d\x34\x13\
+\xb4\x4c\xab\xd3\x8d\x2e\xaf\xac\xb6\xaf\xa9\x6f\x60\x57\xd7\xd7\
+\x33\x60\x8e\x98\xea\xda\xae\xaf\x4d\x2d\x98\x46\x86\xb8\x1e\x36\
+\x42\x01\xe3\xe1\xe2\xc2\x78\xb8\xb9\x30\x60\x72\x18\x2f\x37\x57\
+\xc6\xc3\xd5\xc5\x68\x6f\x2b\xc7\x3f\x1e\x2e\x5f\x61\x35\x75\xcc\
+\xcb\x93\x0a\x6a\x05\x75\x83\xb3\x3c\xd4\xc1\x12\x84\x85\x42\x06\
+\x88\x20\x86\x26\x68\x86\x04\x20\xdc\x6e\x8f\xc9\x18\x7b\xe6\x19\
+\xc2\x6d\xf6\x72\x50\x20\x7c\xfe\xc7\x37\xb5\x28\x27\x56\x54\xd7\
+\x04\x95\x54\x54\xca\x2b\x6b\x6a\x39\x60\x94\x98\xc6\xe6\x66\x30\
+\x47\x4a\xa6\xbd\xc3\xba\x42\x53\x84\x02\x01\xe3\xe7\xe5\xc1\xf8\
+\x7a\x7a\x30\x41\xbe\x3e\x26\x3f\x6f\xcf\x76\x67\x85\x03\x6e\x3d\
+\xc7\xe5\x2b\xcc\xc3\x93\x09\xc2\x18\x1e\xec\x38\xd1\xe0\xe0\xcc\
+\x8e\x16\x84\x7f\x28\x7c\x4c\x1d\x2a\x41\x0c\x12\xc8\x00\x11\x84\
+\x75\x82\x4b\x67\x68\x8e\x24\x66\xe1\xe3\xee\xdd\x65\xf8\x55\x01\
+\xc2\xa4\x8d\x63\x9a\x95\xad\x11\x0d\x4d\xcd\x1e\x95\xb5\xb5\xe2\
+\xaa\x9a\x3a\x4e\x79\x55\x35\x03\x46\x89\x29\xad\xac\x1a\x94\x4b\
+\x6a\x62\x91\x88\x51\xd8\xd9\x32\xf6\x20\xf8\x6a\x72\xb4\xb7\x67\
+\x7c\x3c\xdc\x8d\x9e\xee\xae\x1d\x0e\xb6\xf2\x3c\xb8\xe4\x67\x50\
+\x2c\x08\xeb\x68\x61\xfc\x8e\x06\xa4\x02\xa1\xf1\x41\xa3\x43\x5b\
+\xd2\x09\x62\x08\x40\x06\x88\x20\x88\x2b\x41\x63\x83\xb3\x46\x32\
+\x10\x16\x77\xc5\xd9\x22\xac\x78\xdf\x9d\xa0\x11\xcf\x77\x16\x7f\
+\xd5\x6a\x75\xc1\xf5\x4d\x4d\x31\x79\x45\x25\x61\xd9\x05\x85\xce\
+\x85\xa5\xe5\x82\xa2\x32\x4c\x54\x3c\xf0\xf8\x7a\xba\x33\xce\x0a\
+\x05\xe3\xe6\xec\xc4\xb8\xbb\x38\x99\xdc\x5c\x9c\x35\x5e\xae\x2e\
+\x55\x3c\x1e\x0f\x67\x71\x2e\x82\xb0\x60\x68\x1d\x08\x0d\x0e\x76\
+\x84\x68\x6c\xd0\xe8\x60\x3d\x2d\xdc\x96\x8e\xed\x04\x41\x0c\x51\
+\xc8\x00\x11\x04\x71\x2b\xa0\x09\x42\x53\x84\x3b\xd2\x5c\x41\x58\
+\xe6\x03\x8b\xbd\xe2\xec\x11\x47\xa7\xd3\xd9\xd5\x37\x35\xc7\xa4\
+\xe7\xe4\x4d\xbc\x90\x91\xe5\x96\x5b\x58\xcc\x57\xaa\x54\xbd\x36\
+\x63\x24\xb6\xb1\x61\x6c\xe5\x32\xc6\x0e\x64\x6f\x2b\x37\xd9\xcb\
+\xe5\x8c\x93\xa3\x42\x07\x06\x47\xe9\xea\xe4\x58\x29\x95\x88\x31\
+\xa1\x60\x16\x08\xdd\x18\x6e\x39\x47\x70\x89\x0a\x1f\xa3\xe9\xa9\
+\x05\x61\x86\xe5\x76\x10\xcd\xe8\x10\x84\x15\x42\x06\x88\x20\x88\
+\xde\x06\x8d\x0e\x2e\xab\x61\xa9\x8f\x50\x90\x1d\x88\x6b\x34\x1a\
+\x05\x3a\xbd\x5e\xa6\xd5\xea\x1c\xe0\xab\x1c\x8e\xc5\x20\x21\xf4\
+\x40\x1c\xe8\x87\xd0\x38\xb1\x18\x13\x88\xc5\x18\xe1\x1b\x18\x59\
+\x2c\x96\x8e\xc5\x66\x6b\x79\x5c\xae\x86\xc7\xe5\xa8\xb9\x5c\x6e\
+\x07\x97\xc3\x69\xe7\x80\xe0\x5a\xac\x76\x8e\x33\x34\xb8\x44\x85\
+\x9d\x58\xf7\x0c\x0e\xb6\xa3\xb1\xa9\x30\x8b\x66\x72\x08\x82\xb8\
+\x2a\x64\x80\x08\x82\xe8\x2f\x78\x20\x5c\x56\xc3\x4a\xf8\xb8\xac\
+\x26\x02\x61\xa0\x76\xe7\xac\x11\xa8\x7b\x86\x08\x3b\xa5\x9e\x01\
+\xc6\x68\x60\x50\x68\x6e\x30\x06\x07\x0d\x10\x7e\xc5\x36\x0a\x3c\
+\x26\x08\xe2\x96\x20\x03\x44\x10\x04\x41\x10\x84\xd5\xd1\x73\x6b\
+\x2c\x41\x10\x04\x41\x10\x84\x55\x40\x06\x88\x20\x08\x82\x20\x08\
+\xab\x83\x0c\x10\x41\x10\x04\x41\x10\x56\x07\x19\x20\x82\x20\x08\
+\x82\x20\xac\x0e\x32\x40\x04\x41\x10\x04\x41\x58\x1d\x64\x80\x08\
+\x82\x20\x08\x82\xb0\x3a\xc8\x00\x11\x04\x41\x10\x04\x61\x75\x90\
+\x01\x22\x08\x82\x20\x08\xc2\xea\x20\x03\x44\x10\x04\x41\x10\x84\
+\xd5\x41\x06\x88\x20\x08\x82\x20\x08\xab\x83\x0c\x10\x41\x10\x04\
+\x41\x10\x56\x07\x19\x20\x82\x20\x08\x82\x20\xac\x0e\x32\x40\x04\
+\x41\x10\x04\x41\x58\x1d\x64\x80\x08\x82\x20\x08\x82\xb0\x3a\xc8\
+\x00\x11\x04\x41\x10\x04\x61\x75\x90\x01\x22\x08\x82\x20\x08\xc2\
+\xea\x20\x03\x44\x10\x04\x41\x10\x84\xd5\x41\x06\x88\x20\x08\x82\
+\x20\x08\xab\x83\x0c\x10\x41\x10\x04\x41\x10\x56\x07\x19\x20\x82\
+\x20\x08\x82\x20\xac\x0e\x32\x40\x04\x41\x10\x04\x41\x58\x1d\x64\
+\x80\x08\x82\x20\x08\x82\xb0\x3a\xc8\x00\x11\x04\x41\x10\x04\x61\
+\x75\x90\x01\x22\x08\x82\x20\x08\xc2\xea\x20\x03\x44\x10\x04\x41\
+\x10\x84\xd5\x41\x06\x88\x20\x08\x82\x20\x08\xab\x83\x0c\x10\x41\
+\x10\x04\x41\x10\x56\x07\x19\x20\x82\x20\x08\x82\x20\xac\x0c\x86\
+\xf9\x7f\x79\x3c\x99\xf3\x83\x77\xfd\xda\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x34\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x00\xe6\x49\x44\x41\x54\x78\x9c\xed\
+\xdc\x21\x0e\xc2\x50\x10\x04\xd0\xd5\x13\x6e\xc5\x91\xb1\x60\xb8\
+\x13\xba\x98\xa2\xc1\x34\xd3\xf0\xdf\x4b\xd6\x37\x33\x6b\x2a\xfe\
+\xce\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5f\x64\x1f\x0a\x32\x33\
+\xf7\x99\x79\xce\xcc\x45\x03\x9d\xf0\xb7\x7d\x94\x50\x0c\x7f\x53\
+\x42\x3f\xfc\x4d\x09\xfd\xf0\x37\x25\x1c\x1b\xfe\xe3\x87\xf0\x3f\
+\x73\x3b\xf0\x5b\x96\x93\x1f\x37\xff\x33\xaf\x99\xb9\xb6\x3f\xfa\
+\x5f\x44\xf8\xc2\x5f\x52\x6c\xbe\xf0\x97\x14\x9b\x2f\xfc\x25\xc5\
+\xe6\x0b\x7f\x49\xb1\xf9\xc2\x5f\x52\x6c\xbe\xf0\x97\x14\x9b\x2f\
+\xfc\x25\xd9\xfc\x22\xe1\x17\x09\xbf\x4c\x01\x27\xa0\x84\x13\x50\
+\xc2\x09\xc4\x3f\x40\x5f\x94\xd0\x17\x25\xf4\x45\x09\x7d\x51\x42\
+\x5f\x94\xd0\x17\x25\xf4\x45\x09\x7d\x51\x42\x5f\x94\xd0\x17\x25\
+\xf4\x45\x09\x7d\x51\x42\x5f\x94\xd0\x17\x25\xf4\xc5\x23\xbd\xbe\
+\x78\xa6\xda\x17\x0f\xb5\xfb\xe2\x54\x41\x5f\x1c\xeb\xe8\x8b\x73\
+\x35\x7d\x71\xb0\x09\x00\x00\x00\x00\x00\x00\x00\x80\xe1\x0d\xbe\
+\x43\xfd\x08\xb0\xc0\x01\x73\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x01\x32\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x00\xe4\x49\x44\x41\x54\x78\x9c\xed\
+\xdc\xb1\x4d\x03\x61\x10\x84\xd1\x8d\x7f\xd1\xd2\x54\xed\x14\x12\
+\x5a\x72\x01\x47\x62\x72\x2c\x19\x8d\xe4\x7d\x4f\xba\x06\xe6\x5b\
+\x84\x93\xbb\x19\x00\x00\x00\x00\x00\x00\x00\x00\x58\xe7\x3c\x1e\
+\x4a\xe3\x7f\xce\xcc\xf7\xcc\x7c\x28\xd0\x19\xff\x7a\x3c\x22\x14\
+\xc7\xbf\x44\xe8\x8f\x7f\x89\xd0\x1f\xff\x12\xe1\x7f\xdd\xfe\x30\
+\xfe\xef\xf3\xe5\xd7\xd1\xeb\x65\x66\xee\x4f\x44\xf0\x8f\x59\x84\
+\xf7\x14\x7f\x09\x7d\x11\xa1\x2f\x22\xf4\x45\x84\xbe\x88\xd0\x17\
+\x11\xfa\x22\x42\x5f\x44\xe8\x8b\x08\x7d\x11\xa1\x2f\x22\xf4\x45\
+\x84\xbe\x88\xd0\x17\x11\xfa\x22\x42\x5f\x44\x10\x60\xad\xb8\x7e\
+\xe3\xaf\x14\x97\x6f\xfc\x95\xe2\xf2\x8d\xbf\x52\x5c\xbe\xf1\x57\
+\x8a\xcb\x37\xfe\x4a\x71\xf9\xc6\x5f\x29\x2e\xdf\xf8\x2b\xc5\xe5\
+\x1b\x7f\xa5\xb8\xfc\xae\x9b\x97\xf4\xba\x8e\xd7\x54\xfb\x8e\x17\
+\xb5\xfb\x8e\x4f\x15\xf4\x1d\x1f\xeb\xe8\x3b\x3e\x57\xd3\x77\x7c\
+\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe6\x59\x3f\x2f\x50\xfd\
+\x08\x6a\xe3\x89\xe2\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x05\x96\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x5a\x00\x00\x00\x5a\x08\x06\x00\x00\x00\x38\xa8\x41\x02\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x05\x48\x49\x44\x41\x54\x78\x9c\xed\
+\x9d\xd1\x8b\x15\x55\x1c\xc7\x3f\x44\xed\xd5\x87\x22\x59\xd4\x4c\
+\x41\x49\x36\x9f\x62\x75\x43\x97\xa0\xda\x7c\x0a\x1f\x0a\xea\x0f\
+\x10\x5f\x12\x82\xd2\x6a\x8b\xb5\x20\xda\x95\xea\xc5\x50\xb6\x97\
+\xcd\x7d\x4a\x28\x89\xa8\x2d\xc8\x90\x1e\x2a\xa2\xc0\x7c\xd0\xda\
+\x4a\x49\x7a\x0b\x7c\xb0\x74\xb5\x34\xdc\xed\xee\xde\x89\x03\xbf\
+\x0b\x97\xed\x9e\x33\x73\x67\xce\x9c\x33\x67\x66\xbe\xf0\x83\x8b\
+\xde\x3b\xf3\x3b\x1f\x7e\xfb\x3b\xbf\xf3\x9b\x73\xee\x85\x5a\xb5\
+\x6a\xd5\xaa\x55\xab\x56\xad\xaa\xab\x01\x8c\x00\xe3\xc0\x0c\x70\
+\x0e\x98\x03\xfe\x05\x2e\x02\x5f\x01\xef\x01\x13\xc0\xe3\x40\xbf\
+\x6f\x87\x43\xd3\x56\x60\x4a\xa0\x46\x3d\xd8\x22\xf0\x2d\xf0\x34\
+\x70\x87\xef\x41\x14\x59\xf7\x01\x27\x80\x56\x8f\x80\xbb\xd9\xdf\
+\xc0\x1b\xc0\x2a\xdf\x83\x2a\x5a\x8a\x38\x04\x34\x2d\x00\x5e\x6e\
+\x97\x81\xdd\xbe\x07\x58\x04\x6d\x06\xce\xe4\x00\x78\xb9\xcd\x54\
+\x39\x9d\x0c\x01\x97\x1c\x40\x6e\xdb\xaf\xc0\x46\x2a\x08\xf9\xaf\
+\x84\x13\xdc\xd7\xc0\x73\xc0\x30\xb0\x06\xb8\x4d\x6c\x8d\xfc\xdb\
+\xf3\xf2\x9e\xc5\x04\xd7\xfb\x5d\xfe\x8a\x2a\xa1\xcd\x09\x22\xf9\
+\x06\xf0\x7a\x8f\x25\x5b\xbf\x7c\xe6\x9f\x98\x6b\xff\x06\xac\xa6\
+\x02\x13\xdf\x99\x18\x10\xef\x03\xeb\x32\xdc\xe3\x6e\xe0\x78\xcc\
+\x3d\x54\x0d\x7e\x0b\x25\xd6\xa1\x98\x34\x31\x6a\xf1\x5e\x2f\xc6\
+\xa4\x93\x57\x28\x71\x9d\xdc\x34\x40\x7e\x22\x87\x7b\x3e\x69\x80\
+\x7d\x13\xb8\x87\x12\xea\x84\x21\xba\x6c\x46\xf2\x72\xbd\x64\xb8\
+\xef\x87\x94\x4c\x83\x86\x15\x9f\xca\xc9\x79\xeb\x03\xcd\xbd\x97\
+\x80\x2d\x94\x48\x53\x86\xea\x22\xcb\xc4\x97\x54\xeb\x0d\xd5\xc8\
+\xdb\x94\xa8\xd2\x98\xd3\x0c\x52\x95\x63\xae\xf4\xa6\xc6\x87\x4b\
+\x52\x97\x07\xaf\x11\xcd\x00\x9b\x8e\x5b\x9b\xab\x0d\x13\xe3\x83\
+\x94\x40\xe3\x9a\xc1\xa9\xd5\x9c\x6b\x7d\xa3\xf1\xe5\x55\x4a\xa0\
+\x4f\x34\x83\x53\xcb\x6a\xd7\x7a\xc1\xd0\x74\x0a\x5e\xe7\x35\x83\
+\x53\x7d\x0a\xd7\x7a\x40\xe3\xcb\x2f\x94\x40\x97\x35\x83\xf3\xd1\
+\x6f\x58\xab\xf1\x45\xf9\x18\xbc\x16\x34\x83\xeb\xf3\x54\x01\x75\
+\xf3\x65\x9e\x12\x28\xd2\x58\xed\x4f\x0d\x3a\x4c\x45\x75\x44\xd7\
+\xa0\xa3\x02\xa4\x32\x6b\x8a\xea\x88\xae\x41\x47\x21\x44\xf4\x0a\
+\x60\x3f\x70\x5a\xba\x70\x51\x49\xed\x06\xf0\x3d\xb0\x4f\xca\x43\
+\xa7\xda\x00\xcc\x16\x00\x42\xe4\xd8\x7e\x94\xb1\x3b\x8b\xe4\x2a\
+\x42\x8e\x3a\x60\x3b\x89\xec\xfd\x05\x18\x6c\xe4\xd9\x9e\x75\x01\
+\xfa\x74\x01\x06\x1a\x79\xb6\x53\x2e\x40\x5f\x2f\xc0\x40\x23\xcf\
+\xa6\x18\xe4\x2e\xdf\x83\x8c\x0a\x62\x35\x68\x6a\xd0\xf8\x8e\xc2\
+\x3a\xa2\x71\x0b\x69\x49\xca\xb4\x49\x60\x2f\xf0\x88\xec\x5a\x5a\
+\x25\x7d\xf2\x5b\xe5\xf5\x26\x60\x27\xf0\x14\x70\x14\xf8\xa9\x63\
+\x7f\x4a\x9d\x3a\xd0\xc3\x55\x9b\x1b\xf7\x64\x7c\xfa\xbe\x5e\xce\
+\xc9\xd4\xa0\xf9\xff\xd3\x93\xa9\x10\xf7\xd9\x45\x81\x58\x0b\x38\
+\x26\xdb\x78\x83\x54\x14\x80\x5d\x00\x1e\x26\x70\x45\x05\xb7\x8f\
+\x80\x3b\x29\x81\x8a\x9c\x2a\x46\x7b\x18\x47\x43\x2a\x8a\x83\xb2\
+\xc9\xe7\x7c\xc7\xc9\xdc\x05\x79\x7d\x4e\xfe\x6f\x42\x2a\x13\xa7\
+\x6d\xd2\xa8\x80\xd6\xec\xe1\x3c\xe1\xfd\xc0\x34\x70\x2d\xc5\x7d\
+\xae\x4a\x99\xa7\x0e\x3b\xe5\xae\x22\x46\xf2\xee\x04\x7e\x2b\x38\
+\x5f\x58\xbc\xef\x49\x39\x4e\x5d\x19\xd0\xa3\x31\xfe\xae\x94\x85\
+\xc9\x62\x4e\x7f\x49\x47\xa4\x47\x5f\x6a\xd0\xc7\x63\x7c\xdd\x22\
+\xab\xb9\xbc\xfd\x50\xab\xcc\x81\xb2\x82\xbe\x00\xdc\x6e\xf0\x73\
+\xd8\xb0\xef\x2f\x0f\xfb\x13\xd8\x51\x36\xd0\xad\x98\x3a\x79\xd8\
+\x53\xdf\xfc\xba\x4d\xd8\x51\x01\xec\x58\x4c\xba\x70\x19\xc9\xdd\
+\x22\xdb\x4a\x1a\xf1\x0d\xf9\xa6\x61\x59\xbd\xd2\x51\x4e\x4e\x92\
+\xb3\x33\x4f\x90\xbe\x07\x31\x65\xf0\x6d\xb2\x00\xfe\xb5\xed\x70\
+\xc8\xa0\x97\x0c\x5d\xb8\xa1\x9c\x4a\xb8\x2c\xa5\xdf\x60\xa8\xa0\
+\xbf\x34\xf8\x65\x73\x31\x62\xcb\x3e\x0f\x15\xf4\x1e\xc3\xb2\xda\
+\x55\x6f\x7b\x0c\xb8\x4b\x6c\xcc\x70\xa2\xa1\x5d\x1d\x6d\x0b\x0d\
+\xf4\x92\xe1\xc9\xc8\xb4\x23\xc8\xbb\xba\xdc\xfb\x40\xcc\xe7\xde\
+\x09\x0d\xf4\x0f\x1a\x7f\x1a\x29\x1b\x44\x36\x20\x23\x47\xac\x4d\
+\x9f\x9d\x4b\x7b\x5e\xc7\x17\xe8\x49\x8d\x3f\x3b\x3d\x42\x4e\x02\
+\x3a\x92\xd3\xc3\xc1\x80\xde\xab\xf1\xe7\xa0\x47\xc8\x4a\x2f\x27\
+\xb8\xce\x78\x48\xa0\x47\x34\xfe\x7c\xea\x11\xf2\x2e\x79\x5f\xdc\
+\xb5\x66\x42\x02\xbd\xa9\xc7\x93\xb9\x9d\xb6\xd0\xa5\x5a\x98\x77\
+\x04\x39\xf5\xc9\x5c\x5f\xa0\xfb\x35\xfe\x24\xe9\x6b\x8c\xf5\x00\
+\xca\x36\xe4\x76\xff\x23\x18\xd0\x7d\x1a\x7f\x4c\x75\x6c\xdb\x54\
+\x14\x77\xd3\xa3\xd2\x3b\xe9\x8c\xfc\xc7\x62\xc6\xbf\xfc\x33\x49\
+\x6c\x3e\x24\xd0\x8d\x1c\x40\x77\x82\xcb\x0b\x72\x70\xa0\xd7\x66\
+\x48\x1d\x6a\x51\x11\x97\x0a\x6c\xa7\x8b\x60\x53\xc7\xbd\x19\x26\
+\xc3\x24\x79\x37\x2f\xc8\xc1\x4d\x86\x23\x19\xcb\xbb\xb4\xb0\xb3\
+\x42\x0e\xae\xbc\x7b\x46\xe3\xcf\x44\x0f\xd7\xe8\x15\xb6\x0d\xc8\
+\xca\x5e\x0b\x09\xf4\xb4\xa5\x25\x78\x92\x49\x2f\xcb\xc4\xd7\xcd\
+\x1e\x0a\xe9\xb0\xd0\xac\xc6\x9f\x86\xec\x20\x8a\x2c\x46\xb6\xad\
+\x48\x56\x76\x25\x6d\x53\xc9\xe7\xf1\xb7\x8d\x1a\x9f\x8e\xa6\xb8\
+\x96\x0e\xb6\x4d\xc8\x71\x8f\xde\x8c\xda\x57\xc0\x3c\x3d\x94\xf2\
+\x7a\xf3\x52\xfa\xad\x13\x3b\x60\x19\x72\x2b\xcb\xb6\xb1\x86\x3c\
+\xe5\xf5\x01\xfa\x3b\x83\x5f\x27\x3d\x06\x80\xce\x3e\x23\xa3\x36\
+\x78\x84\x3d\xa4\xf1\x69\x6b\x4e\xbf\x7c\x91\xd6\x9a\xf2\x55\xce\
+\x99\xd5\x90\x33\xd1\xa7\x1c\x4f\x90\xef\x1a\x7c\x3a\x52\x00\xc0\
+\x6d\x53\x5f\x4a\x5e\x5a\xad\x00\xce\x16\x00\xf2\xac\x6c\xe6\x29\
+\xb5\x06\xa4\xb7\xe0\x0b\xf2\x1f\x55\xfa\x65\x8c\x1d\x1e\x37\x39\
+\x6e\xa7\x62\xda\x2e\xd1\xe5\x0a\xf2\x15\xf9\xee\xd3\x4a\x6a\xc0\
+\x51\x75\x74\xb6\x4a\xe9\xc2\x34\x41\x1e\xce\xa9\xf4\x53\xd7\x7c\
+\x2b\xaf\xa3\x15\xa1\x6a\x50\xf6\xc2\xd9\xf8\x19\xbf\x96\x2c\x46\
+\xac\xd4\xc9\x65\xd5\x36\xd9\xa6\x35\x97\x32\x0f\x4f\xe5\x7d\x1a\
+\xab\x6c\xea\x93\xe3\x19\xed\x9f\x5a\x55\x4f\x41\xd4\x63\x31\xd5\
+\x46\x55\xa6\x5e\xff\x0c\x7c\x2c\xef\x51\xad\xce\xd4\x5f\xc5\xfc\
+\x1f\xf0\x51\xba\x65\x62\x1f\x7e\xc0\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x0b\
+\x05\x03\x9b\x27\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x5f\x00\x69\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x05\x78\x4f\x27\
+\x00\x72\
+\x00\x65\x00\x6c\x00\x6f\x00\x61\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\x38\x5a\xa7\
+\x00\x68\
+\x00\x6f\x00\x6d\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x06\xba\xa1\x47\
+\x00\x6f\
+\x00\x70\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x06\xeb\x91\xa7\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x5f\x00\x6f\x00\x75\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x07\x6f\x9c\xa7\
+\x00\x61\
+\x00\x70\x00\x70\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x07\x9e\x5a\x47\
+\x00\x62\
+\x00\x61\x00\x63\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x08\x5d\x84\xe7\
+\x00\x66\
+\x00\x6f\x00\x72\x00\x77\x00\x61\x00\x72\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x0a\x9f\x57\xa7\
+\x00\x73\
+\x00\x73\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x09\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x06\x12\
+\x00\x00\x00\x46\x00\x00\x00\x00\x00\x01\x00\x00\x0a\xdf\
+\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x0e\x54\
+\x00\x00\x00\x78\x00\x00\x00\x00\x00\x01\x00\x00\x10\x49\
+\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x16\x2f\
+\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00\xff\x2a\
+\x00\x00\x00\xca\x00\x00\x00\x00\x00\x01\x00\x01\x00\x62\
+\x00\x00\x00\xe6\x00\x00\x00\x00\x00\x01\x00\x01\x01\x98\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x09\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x90\x98\xa5\xbc\xc8\
+\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x06\x12\
+\x00\x00\x01\x90\x98\xa5\xbc\xc8\
+\x00\x00\x00\x46\x00\x00\x00\x00\x00\x01\x00\x00\x0a\xdf\
+\x00\x00\x01\x90\x98\xa5\xbc\xc8\
+\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x0e\x54\
+\x00\x00\x01\x90\x98\xa5\xbc\xc8\
+\x00\x00\x00\x78\x00\x00\x00\x00\x00\x01\x00\x00\x10\x49\
+\x00\x00\x01\x90\x98\xa5\xbc\xc8\
+\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x16\x2f\
+\x00\x00\x01\x90\x98\xa5\xbc\xc8\
+\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00\xff\x2a\
+\x00\x00\x01\x90\x98\xa5\xbc\xc8\
+\x00\x00\x00\xca\x00\x00\x00\x00\x00\x01\x00\x01\x00\x62\
+\x00\x00\x01\x90\x98\xa5\xbc\xc8\
+\x00\x00\x00\xe6\x00\x00\x00\x00\x00\x01\x00\x01\x01\x98\
+\x00\x00\x01\x90\x98\xa5\xbc\xc8\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,256 @@
+import html
+import sqlite3
+from string import Template
+from PyQt5.QtCore import *
+from PyQt5.QtWebEngineCore import QWebEngineUrlRequestJob, QWebEngineUrlScheme, QWebEngineUrlSchemeHandler
+
+SCHEME = b'cedars'
+HISTORY_PAGE_ROWS = 2000
+NEW_TAB_TILES = 12
+ERROR_REDIRECT_SECONDS = 5
+# The crash page tries the page again on its own, so unattended screens recover
+CRASH_RETRY_SECONDS = 30
+
+# Templates are parsed once at import; every request only substitutes values
+LAYOUT = Template("""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+$head<title>$title</title>
+<style>
+body { font-family: Arial, sans-serif; color: #333; margin: 0; padding: 20px 40px; }
+h1 { font-size: 28px; margin-bottom: 20px; }
+p, td, th { color: #666; font-size: 16px; }
+a { color: #1a5fb4; text-decoration: none; }
+a:hover { text-decoration: underline; }
+form input[type=search] { font-size: 18px; padding: 7px 12px; width: 60%; border-radius: 15px; border: 1px solid #ccc; }
+table { border-collapse: collapse; width: 100%; }
+td, th { text-align: left; padding: 4px 8px; border-bottom: 1px solid #eee; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; max-width: 600px; }
+.tiles { display: flex; flex-wrap: wrap; gap: 12px; margin-top: 30px; }
+.tile { width: 180px; padding: 12px; border: 1px solid #ccc; border-radius: 15px; overflow: hidden; white-space: nowrap; text-overflow: ellipsis; }
+.centered { text-align: center; }
+</style>
+</head>
+<body>
+$body
+</body>
+</html>
+""")
+
+ERROR_BODY = Template("""<div class="centered">
+<h1>$message</h1>
+<p>You will be redirected to the main page shortly.</p>
+</div>""")
+
+CRASH_BODY = Template("""<div class="centered">
+<h1>$message</h1>
+<p>$url</p>
+<p><a href="$url">Try again</a> &middot; trying again automatically in $seconds seconds</p>
+<p>Renderer exit code $exit_code</p>
+</div>""")
+
+NEW_TAB_BODY = Template("""<div class="centered">
+<form action="https://www.google.com/search" method="get">
+<input type="search" name="q" placeholder="Search Google" autofocus>
+</form>
+<div class="tiles">$tiles</div>
+<p><a href="cedars://history">History</a> &middot; <a href="cedars://settings">Settings</a></p>
+</div>""")
+
+TILE = Template("""<a class="tile" href="$url" title="$url">$title</a>""")
+
+HISTORY_BODY = Template("""<h1>History</h1>
+<form action="cedars://history" method="get">
+<input type="search" name="q" value="$query" placeholder="Search history">
+<label><input type="checkbox" name="text" value="1"$contents onchange="this.form.submit()"> Page contents</label>
+</form>
+<table>
+<tr><th>Last visited</th><th>Title</th><th>URL</th><th>Visits</th></tr>
+$rows
+</table>""")
+
+HISTORY_ROW = Template("""<tr><td>$time</td><td><a href="$url" title="$hint">$title</a></td><td>$url</td><td>$visits</td></tr>""")
+
+SETTINGS_BODY = Template("""<h1>Settings</h1>
+<table>
+$rows
+</table>""")
+
+SETTINGS_ROW = Template("""<tr><th>$name</th><td>$value</td></tr>""")
+
+
+def register_scheme():
+    # Must run before the QApplication is created
+    scheme = QWebEngineUrlScheme(SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Host)
+    # LocalScheme keeps web pages from linking into internal pages
+    scheme.setFlags(QWebEngineUrlScheme.SecureScheme | QWebEngineUrlScheme.LocalScheme)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+def error_url(message):
+    url = QUrl('cedars://error')
+    query = QUrlQuery()
+    query.addQueryItem('message', message)
+    url.setQuery(query)
+    return url
+
+
+def crash_url(page_url, message, exit_code):
+    url = QUrl('cedars://crashed')
+    query = QUrlQuery()
+    query.addQueryItem('url', page_url)
+    query.addQueryItem('message', message)
+    query.addQueryItem('code', str(exit_code))
+    url.setQuery(query)
+    return url
+
+
+def escape(value):
+    return html.escape(str(value), quote=True)
+
+
+class QueryTask(QRunnable):
+    def __init__(self, work):
+        super().__init__()
+        self.work = work
+
+    def run(self):
+        self.work()
+
+
+class InternalPageHandler(QWebEngineUrlSchemeHandler):
+    # Rows for a page that is built from a history query, by request id
+    rowsFetched = pyqtSignal(int, list)
+
+    def __init__(self, history, settings, home_url, page_text=None, parent=None):
+        super().__init__(parent)
+        self.history = history
+        # Full-text search of page contents for the history page, if there is an index
+        self.page_text = page_text
+        # Callable returning (name, value) pairs for the settings page
+        self.settings = settings
+        self.home_url = home_url
+        # Rendered pages that never change, keyed by URL; only pages without a query are kept,
+        # so every error and crash message does not stay resident
+        self.cache = {}
+        self.pages = {
+            'error': self.error_page,
+            'crashed': self.crash_page,
+            'newtab': self.new_tab_page,
+            'settings': self.settings_page,
+        }
+        # Pages that can take a long query are answered once it has run off the GUI thread
+        self.queried_pages = {
+            'history': (self.history_rows, self.history_page),
+        }
+        self.jobs = {}
+        self.next_request = 0
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.rowsFetched.connect(self.rows_fetched)
+
+    def requestStarted(self, job):
+        url = job.requestUrl()
+        if url.host() in self.queried_pages:
+            self.query(job, url)
+            return
+        render = self.pages.get(url.host())
+        if render is None:
+            job.fail(QWebEngineUrlRequestJob.UrlNotFound)
+            return
+        key = url.toString()
+        data = self.cache.get(key)
+        if data is None:
+            data, cacheable = render(QUrlQuery(url))
+            if cacheable and not url.hasQuery():
+                self.cache[key] = data
+        # The buffer is owned by the job, which reads it in chunks as the page streams in
+        buffer = QBuffer(job)
+        buffer.setData(data)
+        buffer.open(QIODevice.ReadOnly)
+        job.reply(b'text/html', buffer)
+
+    def query(self, job, url):
+        fetch, build = self.queried_pages[url.host()]
+        query = QUrlQuery(url)
+        self.next_request += 1
+        request_id = self.next_request
+        self.jobs[request_id] = (job, build, query)
+        # The tab may be closed or navigate away while the query runs
+        job.destroyed.connect(lambda obj=None, request_id=request_id: self.jobs.pop(request_id, None))
+
+        def work():
+            try:
+                rows = fetch(query)
+            except sqlite3.Error:
+                rows = []
+            self.rowsFetched.emit(request_id, rows)
+        self.pool.start(QueryTask(work))
+
+    @pyqtSlot(int, list)
+    def rows_fetched(self, request_id, rows):
+        entry = self.jobs.pop(request_id, None)
+        if entry is None:
+            return
+        job, build, query = entry
+        buffer = QBuffer(job)
+        buffer.setData(build(query, rows))
+        buffer.open(QIODevice.ReadOnly)
+        job.reply(b'text/html', buffer)
+
+    def render(self, title, body, head=''):
+        return LAYOUT.substitute(title=escape(title), head=head, body=body).encode('utf-8')
+
+    def error_page(self, query):
+        message = query.queryItemValue('message', QUrl.FullyDecoded) or "Page not available."
+        head = f'<meta http-equiv="refresh" content="{ERROR_REDIRECT_SECONDS};url={escape(self.home_url)}">\n'
+        return self.render("Error", ERROR_BODY.substitute(message=escape(message)), head), True
+
+    def crash_page(self, query):
+        url = query.queryItemValue('url', QUrl.FullyDecoded)
+        # Only offer to go back to web pages
+        if QUrl(url).scheme() not in ('http', 'https'):
+            url = self.home_url
+        message = query.queryItemValue('message', QUrl.FullyDecoded) or "The page crashed."
+        head = f'<meta http-equiv="refresh" content="{CRASH_RETRY_SECONDS};url={escape(url)}">\n'
+        body = CRASH_BODY.substitute(message=escape(message), url=escape(url), seconds=CRASH_RETRY_SECONDS,
+                                     exit_code=escape(query.queryItemValue('code')))
+        return self.render("Page crashed", body, head), True
+
+    def new_tab_page(self, query):
+        most_visited = self.history.most_visited(NEW_TAB_TILES) if self.history is not None else []
+        tiles = ''.join(TILE.substitute(url=escape(url), title=escape(title or url))
+                        for url, title, visit_count, last_visit in most_visited)
+        return self.render("New Tab", NEW_TAB_BODY.substitute(tiles=tiles)), False
+
+    def full_text(self, query):
+        return bool(query.queryItemValue('text')) and self.page_text is not None
+
+    def history_rows(self, query):
+        # Runs on the query thread, with that thread's own connection
+        if self.history is None:
+            # Kiosks keep no history
+            return []
+        search = query.queryItemValue('q', QUrl.FullyDecoded)
+        if self.full_text(query) and search.strip():
+            return self.page_text.search(search, HISTORY_PAGE_ROWS)
+        return self.history.recent_urls(None, search, HISTORY_PAGE_ROWS)
+
+    def history_page(self, query, matches):
+        search = query.queryItemValue('q', QUrl.FullyDecoded)
+        rows = []
+        for match in matches:
+            row_id, url, title, visit_count, last_visit = match[:5]
+            rows.append(HISTORY_ROW.substitute(
+                time=QDateTime.fromSecsSinceEpoch(int(last_visit)).toString("yyyy-MM-dd hh:mm"),
+                url=escape(url), title=escape(title or url), visits=visit_count,
+                hint=escape(match[5] if len(match) > 5 else url)))
+        body = HISTORY_BODY.substitute(query=escape(search), contents=' checked' if self.full_text(query) else '',
+                                       rows='\n'.join(rows))
+        return self.render("History", body)
+
+    def settings_page(self, query):
+        rows = ''.join(SETTINGS_ROW.substitute(name=escape(name), value=escape(value))
+                       for name, value in self.settings())
+        return self.render("Settings", SETTINGS_BODY.substitute(rows=rows)), False
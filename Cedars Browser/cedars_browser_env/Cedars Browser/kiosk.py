@@ -0,0 +1,255 @@
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from PyQt5.QtCore import *
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import QApplication, QMainWindow, QStackedLayout, QWidget
+from PyQt5.QtWebEngineWidgets import QWebEnginePage, QWebEngineProfile, QWebEngineView
+from crash_recovery import shared_recovery
+from internal_pages import InternalPageHandler, SCHEME
+from memory_budget import shared_monitor
+from pdf_batch import read_urls
+from tab_lifecycle import TabLifecycleManager
+
+KIOSK_FLAG = '--kiosk'
+DEFAULT_INTERVAL = 60
+DEFAULT_HEALTH_PORT = 8765
+# Local only unless --health-address says otherwise
+DEFAULT_HEALTH_ADDRESS = '127.0.0.1'
+# The next page starts loading this long before it is due, or halfway through shorter slots
+PRELOAD_LEAD_SECONDS = 15
+# Health turns to "stale" when nothing has loaded for this many rotations
+STALE_ROTATIONS = 3
+
+
+def parse_schedule(lines, default_interval):
+    # Each line is a URL, optionally followed by how many seconds it stays up
+    schedule = []
+    for line in lines:
+        fields = line.split()
+        seconds = default_interval
+        if len(fields) > 1:
+            try:
+                seconds = float(fields[1])
+            except ValueError:
+                pass
+        schedule.append((QUrl.fromUserInput(fields[0]), max(1.0, seconds)))
+    return schedule
+
+
+class HealthHandler(BaseHTTPRequestHandler):
+    # Runs on the server's threads, so it only reads the snapshot the GUI thread publishes
+    def do_GET(self):
+        health = self.server.kiosk.health
+        if self.path == '/metrics':
+            # Scrapers want the numbers even when the display is unhealthy
+            body = metrics_text(health).encode('utf-8')
+            content_type = 'text/plain; version=0.0.4'
+            status = 200
+        elif self.path in ('/', '/health'):
+            body = json.dumps(health).encode('utf-8')
+            content_type = 'application/json'
+            status = 200 if health['status'] == 'ok' else 503
+        else:
+            self.send_error(404)
+            return
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def metrics_text(health):
+    # Prometheus text format; with --health-address 0.0.0.0 one server can scrape many displays
+    lines = []
+    for name, value in (('up', int(health['status'] == 'ok')),
+                        ('last_load_timestamp_seconds', health['last_successful_load'] or 0),
+                        ('renderer_memory_bytes', health['renderer_memory_kb'] * 1024),
+                        ('rotations_total', health['rotations']),
+                        ('skipped_rotations_total', health['skipped_rotations']),
+                        ('failed_loads_total', health['failed_loads']),
+                        ('renderer_crashes_total', health['renderer_crashes'])):
+        lines.append(f'cedars_kiosk_{name} {value}')
+    return '\n'.join(lines) + '\n'
+
+
+class KioskWindow(QMainWindow):
+    # Two views are stacked with StackAll, so the hidden one keeps rendering under the one on
+    # show. The next page loads there and is raised only once it has loaded, so a rotation
+    # never shows a blank or half-drawn page.
+    def __init__(self, schedule, profile=None):
+        super().__init__()
+        self.schedule = schedule
+        self.profile = profile or QWebEngineProfile.defaultProfile()
+        self.lifecycle = TabLifecycleManager(self)
+        self.memory = shared_monitor()
+        self.recovery = shared_recovery()
+
+        container = QWidget(self)
+        self.stack = QStackedLayout(container)
+        self.stack.setStackingMode(QStackedLayout.StackAll)
+        self.front = self.create_view()
+        self.back = self.create_view()
+        self.setCentralWidget(container)
+        self.setCursor(Qt.BlankCursor)
+
+        self.index = 0
+        # Schedule index the back view is loading, whether it has loaded, and whether a load
+        # we stopped ourselves is still to report back
+        self.back_index = None
+        self.back_ready = False
+        self.back_finished = False
+        self.back_cancelled = False
+        self.rotations = 0
+        self.skipped_rotations = 0
+        self.failed_loads = 0
+        self.last_load = None
+        self.health = {}
+
+        self.preload_timer = QTimer(self)
+        self.preload_timer.setSingleShot(True)
+        self.preload_timer.timeout.connect(self.preload)
+        self.rotate_timer = QTimer(self)
+        self.rotate_timer.setSingleShot(True)
+        self.rotate_timer.timeout.connect(self.rotate)
+        self.memory.sampled.connect(self.update_health)
+        self.update_health()
+
+    def create_view(self):
+        view = QWebEngineView()
+        page = QWebEnginePage(self.profile, view)
+        # Matches the window, so nothing flashes white before the first paint
+        page.setBackgroundColor(QColor(Qt.black))
+        page.setAudioMuted(True)
+        view.setPage(page)
+        self.stack.addWidget(view)
+        self.lifecycle.track(page)
+        self.memory.track(page, self.lifecycle)
+        self.recovery.track(page)
+        view.loadFinished.connect(lambda ok, view=view: self.load_finished(view, ok))
+        view.urlChanged.connect(lambda url: self.update_health())
+        return view
+
+    def start(self):
+        self.front.setUrl(self.schedule[0][0])
+        self.schedule_next()
+
+    def next_index(self):
+        return (self.index + 1) % len(self.schedule)
+
+    def schedule_next(self):
+        seconds = self.schedule[self.index][1]
+        self.preload_timer.start(int(max(0, seconds - min(PRELOAD_LEAD_SECONDS, seconds / 2)) * 1000))
+        self.rotate_timer.start(int(seconds * 1000))
+
+    @pyqtSlot()
+    def preload(self):
+        self.back_index = self.next_index()
+        self.back_ready = False
+        self.back_finished = False
+        self.back_cancelled = False
+        self.back.setUrl(self.schedule[self.back_index][0])
+
+    def load_finished(self, view, ok):
+        if view is self.back:
+            if self.back_cancelled:
+                # Stopped by a skipped rotation; not a failure of the page
+                self.back_cancelled = False
+                return
+            self.back_finished = True
+        if not ok:
+            self.failed_loads += 1
+        elif view is self.front:
+            self.last_load = time.time()
+        elif view is self.back and self.back_index is not None:
+            self.back_ready = True
+        self.update_health()
+
+    @pyqtSlot()
+    def rotate(self):
+        if self.back_ready:
+            self.front, self.back = self.back, self.front
+            self.stack.setCurrentWidget(self.front)
+            self.front.raise_()
+            self.index = self.back_index
+            self.last_load = time.time()
+            self.rotations += 1
+        else:
+            # Keep showing the current page rather than a slow or broken one
+            if self.back_index is not None and not self.back_finished:
+                self.back_cancelled = True
+                self.back.stop()
+            self.index = self.next_index()
+            self.skipped_rotations += 1
+        self.back_index = None
+        self.back_ready = False
+        self.schedule_next()
+        self.update_health()
+
+    @pyqtSlot()
+    def update_health(self):
+        # Replaced whole, so the HTTP threads always see a consistent snapshot
+        longest = max(seconds for url, seconds in self.schedule)
+        stale = self.last_load is None or time.time() - self.last_load > longest * STALE_ROTATIONS
+        self.health = {
+            'status': 'stale' if stale else 'ok',
+            'current_url': self.front.url().toString(),
+            'scheduled_url': self.schedule[self.index][0].toString(),
+            'last_successful_load': self.last_load,
+            'renderer_memory_kb': self.memory.total_pss_kb(),
+            'renderers': self.memory.usage(),
+            'rotations': self.rotations,
+            'skipped_rotations': self.skipped_rotations,
+            'failed_loads': self.failed_loads,
+            'renderer_crashes': self.recovery.crash_count,
+        }
+
+
+def serve_health(kiosk, port, address=DEFAULT_HEALTH_ADDRESS):
+    # Returns None if the port cannot be bound; the display matters more than its monitoring
+    try:
+        server = ThreadingHTTPServer((address, port), HealthHandler)
+    except OSError as error:
+        print(f"Health endpoint on port {port} not started: {error}", file=sys.stderr)
+        return None
+    server.daemon_threads = True
+    server.kiosk = kiosk
+    threading.Thread(target=server.serve_forever, name='kiosk-health', daemon=True).start()
+    return server
+
+
+def main(arguments):
+    # Custom schemes must already be registered by the caller
+    parser = argparse.ArgumentParser(prog='Cedars_Browser.py --kiosk',
+                                     description="Show a rotating list of pages fullscreen.")
+    parser.add_argument(KIOSK_FLAG, dest='source', required=True, metavar='FILE',
+                        help="file with one URL per line, optionally followed by seconds on screen")
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL,
+                        help="seconds each page stays up unless its line says otherwise")
+    parser.add_argument('--health-port', type=int, default=DEFAULT_HEALTH_PORT,
+                        help="port of the /health and /metrics endpoint; 0 turns it off")
+    parser.add_argument('--health-address', default=DEFAULT_HEALTH_ADDRESS,
+                        help="address the endpoint listens on; 0.0.0.0 lets other machines scrape it")
+    args = parser.parse_args(arguments)
+
+    schedule = parse_schedule(read_urls(args.source), args.interval)
+    if not schedule:
+        return 1
+    app = QApplication(sys.argv[:1])
+    QApplication.setApplicationName('Cedars Browser')
+    # Error and crash pages; kiosks have no history, so only those are reachable
+    internal_pages = InternalPageHandler(None, list, schedule[0][0].toString(), parent=app)
+    QWebEngineProfile.defaultProfile().installUrlSchemeHandler(SCHEME, internal_pages)
+    window = KioskWindow(schedule)
+    window.showFullScreen()
+    if args.health_port:
+        serve_health(window, args.health_port, args.health_address)
+    QTimer.singleShot(0, window.start)
+    return app.exec_()
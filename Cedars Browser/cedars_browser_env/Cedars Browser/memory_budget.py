@@ -0,0 +1,158 @@
+from PyQt5.QtCore import *
+from PyQt5.QtWebEngineWidgets import QWebEnginePage
+
+SAMPLE_INTERVAL_MS = 10 * 1000
+# Total proportional set size all renderers together may use
+DEFAULT_BUDGET_MB = 2048
+
+
+def read_process_memory(pid):
+    # Returns (rss_kb, pss_kb) for a process, or None once it has exited.
+    # smaps_rollup gives PSS, which splits shared pages fairly between renderers.
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as smaps:
+            fields = dict(line.split(':', 1) for line in smaps if ':' in line)
+        return int(fields['Rss'].split()[0]), int(fields['Pss'].split()[0])
+    except (OSError, KeyError, ValueError):
+        pass
+    # Older kernels have no smaps_rollup; fall back to RSS only
+    try:
+        with open(f'/proc/{pid}/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    rss = int(line.split()[1])
+                    return rss, rss
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class MemorySampleTask(QRunnable):
+    def __init__(self, pids, done):
+        super().__init__()
+        self.pids = pids
+        self.done = done
+
+    def run(self):
+        samples = {}
+        for pid in self.pids:
+            memory = read_process_memory(pid)
+            if memory is not None:
+                samples[pid] = memory
+        self.done.emit(samples)
+
+
+class RendererMemoryMonitor(QObject):
+    sampled = pyqtSignal()
+    budgetExceeded = pyqtSignal(int)
+    samplesReady = pyqtSignal(dict)
+
+    def __init__(self, parent=None, budget_mb=DEFAULT_BUDGET_MB, interval_ms=SAMPLE_INTERVAL_MS):
+        super().__init__(parent)
+        self.budget_kb = budget_mb * 1024
+        # page -> TabLifecycleManager that owns it, used for LRU order and discarding
+        self.pages = {}
+        # pid -> (rss_kb, pss_kb) from the latest sample
+        self.samples = {}
+        self.sampling = False
+        # Spare and prerendered pages, whose renderers count against the budget too
+        self.pools = []
+
+        self.samplesReady.connect(self.apply_samples)
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.sample)
+        self.timer.start()
+
+    def track(self, page, lifecycle):
+        self.pages[page] = lifecycle
+
+    def untrack(self, page):
+        self.pages.pop(page, None)
+
+    def track_pool(self, pool):
+        self.pools.append(pool)
+
+    def pages_by_pid(self):
+        by_pid = {}
+        for page in self.pages:
+            pid = page.renderProcessPid()
+            if pid > 0:
+                by_pid.setdefault(pid, []).append(page)
+        return by_pid
+
+    @pyqtSlot()
+    def sample(self):
+        # Reading smaps_rollup walks every mapping of the renderer, so do it off the GUI thread
+        if self.sampling:
+            return
+        pids = set(self.pages_by_pid())
+        for pool in self.pools:
+            pids |= pool.pids()
+        if not pids:
+            self.samples = {}
+            return
+        self.sampling = True
+        QThreadPool.globalInstance().start(MemorySampleTask(pids, self.samplesReady))
+
+    @pyqtSlot(dict)
+    def apply_samples(self, samples):
+        self.sampling = False
+        self.samples = samples
+        self.sampled.emit()
+        total = self.total_pss_kb()
+        if total > self.budget_kb:
+            self.budgetExceeded.emit(total)
+            self.enforce_budget(total)
+
+    def total_pss_kb(self):
+        return sum(pss for rss, pss in self.samples.values())
+
+    def usage(self):
+        # Per-renderer numbers for exporting, largest first
+        by_pid = self.pages_by_pid()
+        usage = []
+        for pid, (rss, pss) in self.samples.items():
+            pages = by_pid.get(pid, [])
+            usage.append({
+                'pid': pid,
+                'rss_kb': rss,
+                'pss_kb': pss,
+                'urls': [page.url().toString() for page in pages],
+            })
+        return sorted(usage, key=lambda entry: entry['pss_kb'], reverse=True)
+
+    def enforce_budget(self, total):
+        # Spare pages go before any tab is discarded
+        for pool in self.pools:
+            total -= pool.memory_kb()
+            pool.drain()
+        if total <= self.budget_kb:
+            return
+        by_pid = self.pages_by_pid()
+        candidates = []
+        for page, lifecycle in self.pages.items():
+            if page.lifecycleState() != QWebEnginePage.Discarded and lifecycle.can_suspend(page):
+                candidates.append((lifecycle.last_active.get(page, 0), page, lifecycle))
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        for last_active, page, lifecycle in candidates:
+            if total <= self.budget_kb:
+                break
+            pid = page.renderProcessPid()
+            if not lifecycle.discard(page):
+                continue
+            # Renderers may be shared by several pages; credit this page its share
+            sharing = by_pid.get(pid, [page])
+            total -= self.samples.get(pid, (0, 0))[1] // len(sharing)
+
+
+shared_monitor_instance = None
+
+
+def shared_monitor():
+    # One budget covers the renderers of every window in the process
+    global shared_monitor_instance
+    if shared_monitor_instance is None:
+        shared_monitor_instance = RendererMemoryMonitor(QCoreApplication.instance())
+    return shared_monitor_instance
@@ -0,0 +1,126 @@
+import json
+import os
+import time
+from PyQt5.QtCore import *
+from PyQt5 import sip
+from PyQt5.QtWebEngineWidgets import QWebEngineScript
+
+# The log is rotated to <name>.1 once it grows past this
+MAX_LOG_BYTES = 10 * 1024 * 1024
+
+# Navigation Timing and Paint Timing for the page's main document, in ms from navigation start
+PAGE_TIMING_SCRIPT = """
+(function () {
+    var result = {};
+    var navigation = performance.getEntriesByType('navigation')[0];
+    if (navigation) {
+        result.dns_ms = navigation.domainLookupEnd - navigation.domainLookupStart;
+        result.connect_ms = navigation.connectEnd - navigation.connectStart;
+        result.tls_ms = navigation.secureConnectionStart > 0 ? navigation.connectEnd - navigation.secureConnectionStart : 0;
+        result.ttfb_ms = navigation.responseStart;
+        result.response_ms = navigation.responseEnd - navigation.responseStart;
+        result.dom_interactive_ms = navigation.domInteractive;
+        result.dom_content_loaded_ms = navigation.domContentLoadedEventEnd;
+        result.load_event_ms = navigation.loadEventEnd;
+        result.transfer_size = navigation.transferSize;
+    }
+    performance.getEntriesByType('paint').forEach(function (entry) {
+        result[entry.name.replace(/-/g, '_') + '_ms'] = entry.startTime;
+    });
+    return result;
+})()
+"""
+
+
+class LogWriteTask(QRunnable):
+    def __init__(self, path, line):
+        super().__init__()
+        self.path = path
+        self.line = line
+
+    def run(self):
+        try:
+            if os.path.getsize(self.path) > MAX_LOG_BYTES:
+                os.replace(self.path, self.path + '.1')
+        except OSError:
+            pass
+        with open(self.path, 'a', encoding='utf-8') as log:
+            log.write(self.line + '\n')
+
+
+class NavigationTimer(QObject):
+    # Times each main-frame navigation as seen by the browser (load started, first
+    # progress, load finished) and adds the page's own timing entries once it has loaded
+    navigationMeasured = pyqtSignal(QObject, dict)
+
+    def __init__(self, log_path, parent=None):
+        super().__init__(parent)
+        self.log_path = log_path
+        # view -> timings of the navigation in progress
+        self.current = {}
+        # view -> the last completed measurement
+        self.last = {}
+        # One writer keeps log lines in order and off the GUI thread
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+    def watch(self, view):
+        view.loadStarted.connect(lambda view=view: self.load_started(view))
+        view.loadProgress.connect(lambda progress, view=view: self.load_progress(view, progress))
+        view.loadFinished.connect(lambda ok, view=view: self.load_finished(view, ok))
+        view.destroyed.connect(lambda obj=None, view=view: self.forget(view))
+
+    def forget(self, view):
+        self.current.pop(view, None)
+        self.last.pop(view, None)
+
+    def load_started(self, view):
+        self.current[view] = {'started': time.monotonic(), 'time': time.time()}
+
+    def load_progress(self, view, progress):
+        timings = self.current.get(view)
+        if timings is not None and progress > 0 and 'first_progress' not in timings:
+            timings['first_progress'] = time.monotonic()
+
+    def load_finished(self, view, ok):
+        timings = self.current.pop(view, None)
+        if timings is None:
+            return
+        started = timings['started']
+        record = {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(timings['time'])),
+            'url': view.url().toString(),
+            'ok': ok,
+            'first_progress_ms': round((timings['first_progress'] - started) * 1000, 1)
+            if 'first_progress' in timings else None,
+            'load_finished_ms': round((time.monotonic() - started) * 1000, 1),
+        }
+        if ok and view.url().scheme() in ('http', 'https'):
+            view.page().runJavaScript(PAGE_TIMING_SCRIPT, QWebEngineScript.ApplicationWorld,
+                                      lambda result, view=view, record=record: self.page_timing(view, record, result))
+        else:
+            self.finish(view, record)
+
+    def page_timing(self, view, record, result):
+        if isinstance(result, dict):
+            for name, value in result.items():
+                record[name] = round(value, 1) if isinstance(value, float) else value
+        self.finish(view, record)
+
+    def finish(self, view, record):
+        self.pool.start(LogWriteTask(self.log_path, json.dumps(record)))
+        # The tab may have closed while the page timing was being read
+        if not sip.isdeleted(view):
+            self.last[view] = record
+            self.navigationMeasured.emit(view, record)
+
+
+def summary(record):
+    # One line for the toolbar HUD
+    parts = []
+    for label, name in (('TTFB', 'ttfb_ms'), ('FCP', 'first_contentful_paint_ms'),
+                        ('DCL', 'dom_content_loaded_ms'), ('Load', 'load_finished_ms')):
+        value = record.get(name)
+        if value is not None:
+            parts.append(f"{label} {value:.0f} ms")
+    return ' · '.join(parts) if parts else "No timing"
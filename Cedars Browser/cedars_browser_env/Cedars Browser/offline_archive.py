@@ -0,0 +1,295 @@
+import base64
+import hashlib
+import os
+import sqlite3
+import time
+import uuid
+from email.header import Header
+from email.parser import BytesParser
+from PyQt5.QtCore import *
+from PyQt5.QtWebEngineCore import QWebEngineUrlRequestJob, QWebEngineUrlScheme, QWebEngineUrlSchemeHandler
+from PyQt5.QtWebEngineWidgets import QWebEngineDownloadItem
+
+SCHEME = b'cedars-offline'
+
+# Pages are saved as MHTML by Chromium, then split into their parts. Each part's body
+# is stored once under its SHA-256, so script and style bundles shared by many pages
+# take space only once; the SQLite index maps URLs to the parts that rebuild them.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL DEFAULT '',
+    saved_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS parts (
+    page_id INTEGER NOT NULL REFERENCES pages(id),
+    position INTEGER NOT NULL,
+    content_type TEXT NOT NULL,
+    content_location TEXT NOT NULL DEFAULT '',
+    content_id TEXT NOT NULL DEFAULT '',
+    hash TEXT NOT NULL,
+    PRIMARY KEY (page_id, position)
+);
+CREATE INDEX IF NOT EXISTS parts_hash ON parts(hash);
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL
+);
+"""
+
+
+def register_scheme():
+    # Must run before the QApplication is created. Chromium only renders MHTML from
+    # local schemes, which also keeps web pages from reading the archive.
+    scheme = QWebEngineUrlScheme(SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Host)
+    scheme.setFlags(QWebEngineUrlScheme.SecureScheme | QWebEngineUrlScheme.LocalScheme)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+def offline_url(url):
+    result = QUrl('cedars-offline://page')
+    query = QUrlQuery()
+    query.addQueryItem('url', url)
+    result.setQuery(query)
+    return result
+
+
+def split_mhtml(data):
+    # Returns [(content_type, content_location, content_id, body)] with bodies decoded
+    message = BytesParser().parsebytes(data)
+    parts = []
+    for part in message.get_payload() if message.is_multipart() else [message]:
+        parts.append((part.get_content_type(), part.get('Content-Location', ''),
+                      part.get('Content-ID', ''), part.get_payload(decode=True) or b''))
+    return parts
+
+
+def build_mhtml(url, title, saved_at, parts):
+    # parts: [(content_type, content_location, content_id, body)], the first being the page
+    boundary = f'----MultipartBoundary--{uuid.uuid4().hex}----'
+    date = QDateTime.fromSecsSinceEpoch(int(saved_at)).toUTC().toString(Qt.RFC2822Date)
+    lines = [
+        'From: <Saved by Cedars Browser>',
+        f'Snapshot-Content-Location: {url}',
+        f"Subject: {Header(title, 'utf-8').encode()}",
+        f'Date: {date}',
+        'MIME-Version: 1.0',
+        'Content-Type: multipart/related;',
+        f'\ttype="{parts[0][0] if parts else "text/html"}";',
+        f'\tboundary="{boundary}"',
+        '',
+    ]
+    chunks = ['\r\n'.join(lines).encode('utf-8')]
+    for content_type, content_location, content_id, body in parts:
+        headers = [f'--{boundary}', f'Content-Type: {content_type}']
+        if content_id:
+            headers.append(f'Content-ID: {content_id}')
+        headers.append('Content-Transfer-Encoding: base64')
+        if content_location:
+            headers.append(f'Content-Location: {content_location}')
+        chunks.append(('\r\n' + '\r\n'.join(headers) + '\r\n\r\n').encode('utf-8'))
+        chunks.append(base64.encodebytes(body))
+    chunks.append(f'\r\n--{boundary}--\r\n'.encode('utf-8'))
+    return b''.join(chunks)
+
+
+class ArchiveTask(QRunnable):
+    def __init__(self, work):
+        super().__init__()
+        self.work = work
+
+    def run(self):
+        self.work()
+
+
+class OfflineArchive(QObject):
+    pageSaved = pyqtSignal(str)
+    saveFailed = pyqtSignal(str)
+    pageAssembled = pyqtSignal(int, bytes)
+
+    def __init__(self, directory, profile, parent=None):
+        super().__init__(parent)
+        self.directory = directory
+        self.database_path = os.path.join(directory, 'archive.db')
+        os.makedirs(os.path.join(directory, 'incoming'), exist_ok=True)
+        connection = self.connect()
+        connection.executescript(SCHEMA)
+        connection.commit()
+        connection.close()
+        self.reader = self.connect()
+        # Ingesting writes and assembling reads run one at a time, off the GUI thread
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        # MHTML file being written -> (url, title)
+        self.saving = {}
+        profile.downloadRequested.connect(self.download_requested)
+
+    def connect(self):
+        connection = sqlite3.connect(self.database_path, check_same_thread=False)
+        connection.execute('PRAGMA journal_mode = WAL')
+        connection.execute('PRAGMA busy_timeout = 5000')
+        return connection
+
+    def blob_path(self, digest):
+        return os.path.join(self.directory, 'objects', digest[:2], digest)
+
+    def save(self, page):
+        url = page.url().toString()
+        path = os.path.join(self.directory, 'incoming', uuid.uuid4().hex + '.mhtml')
+        self.saving[os.path.normcase(os.path.abspath(path))] = (url, page.title())
+        page.save(path, QWebEngineDownloadItem.MimeHtmlSaveFormat)
+
+    @pyqtSlot(QWebEngineDownloadItem)
+    def download_requested(self, item):
+        key = os.path.normcase(os.path.abspath(item.path()))
+        if not item.isSavePageDownload() or key not in self.saving:
+            return
+        item.finished.connect(lambda item=item, key=key: self.download_finished(item, key))
+        item.accept()
+
+    def download_finished(self, item, key):
+        url, title = self.saving.pop(key)
+        if item.state() != QWebEngineDownloadItem.DownloadCompleted:
+            self.saveFailed.emit(url)
+            return
+        self.pool.start(ArchiveTask(lambda: self.ingest(key, url, title)))
+
+    def ingest(self, path, url, title):
+        try:
+            with open(path, 'rb') as mhtml:
+                parts = split_mhtml(mhtml.read())
+        except OSError:
+            self.saveFailed.emit(url)
+            return
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        connection = self.connect()
+        try:
+            rows = []
+            for content_type, content_location, content_id, body in parts:
+                digest = hashlib.sha256(body).hexdigest()
+                rows.append((content_type, content_location, content_id, digest))
+                known = connection.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone()
+                if known is None:
+                    self.write_blob(digest, body)
+                    connection.execute("INSERT OR IGNORE INTO blobs (hash, size) VALUES (?, ?)",
+                                       (digest, len(body)))
+            with connection:
+                previous = connection.execute("SELECT id FROM pages WHERE url = ?", (url,)).fetchone()
+                if previous is not None:
+                    connection.execute("DELETE FROM parts WHERE page_id = ?", (previous[0],))
+                    connection.execute("DELETE FROM pages WHERE id = ?", (previous[0],))
+                page_id = connection.execute(
+                    "INSERT INTO pages (url, title, saved_at) VALUES (?, ?, ?)",
+                    (url, title, time.time())).lastrowid
+                connection.executemany(
+                    "INSERT INTO parts (page_id, position, content_type, content_location, content_id, hash) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(page_id, position) + row for position, row in enumerate(rows)])
+            if previous is not None:
+                self.drop_unreferenced(connection)
+        finally:
+            connection.close()
+        self.pageSaved.emit(url)
+
+    def write_blob(self, digest, body):
+        path = self.blob_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as blob:
+            blob.write(body)
+        os.replace(temporary, path)
+
+    def drop_unreferenced(self, connection):
+        rows = connection.execute(
+            "SELECT hash FROM blobs WHERE NOT EXISTS (SELECT 1 FROM parts WHERE parts.hash = blobs.hash)").fetchall()
+        with connection:
+            connection.executemany("DELETE FROM blobs WHERE hash = ?", rows)
+        for (digest,) in rows:
+            try:
+                os.remove(self.blob_path(digest))
+            except OSError:
+                pass
+
+    def remove(self, url):
+        def work():
+            connection = self.connect()
+            try:
+                with connection:
+                    connection.execute("DELETE FROM parts WHERE page_id IN (SELECT id FROM pages WHERE url = ?)", (url,))
+                    connection.execute("DELETE FROM pages WHERE url = ?", (url,))
+                self.drop_unreferenced(connection)
+            finally:
+                connection.close()
+        self.pool.start(ArchiveTask(work))
+
+    def has(self, url):
+        # Primary key lookup, cheap enough for the GUI thread
+        return self.reader.execute("SELECT 1 FROM pages WHERE url = ?", (url,)).fetchone() is not None
+
+    def pages(self, limit=1000):
+        return self.reader.execute(
+            "SELECT url, title, saved_at FROM pages ORDER BY saved_at DESC LIMIT ?", (limit,)).fetchall()
+
+    def assemble(self, request_id, url):
+        # Rebuilds the MHTML for url on the archive thread; pageAssembled carries b'' if missing
+        def work():
+            connection = self.connect()
+            try:
+                page = connection.execute(
+                    "SELECT id, title, saved_at FROM pages WHERE url = ?", (url,)).fetchone()
+                data = b''
+                if page is not None:
+                    rows = connection.execute(
+                        "SELECT content_type, content_location, content_id, hash FROM parts "
+                        "WHERE page_id = ? ORDER BY position", (page[0],)).fetchall()
+                    parts = []
+                    for content_type, content_location, content_id, digest in rows:
+                        with open(self.blob_path(digest), 'rb') as blob:
+                            parts.append((content_type, content_location, content_id, blob.read()))
+                    data = build_mhtml(url, page[1], page[2], parts)
+            except OSError:
+                data = b''
+            finally:
+                connection.close()
+            self.pageAssembled.emit(request_id, data)
+        self.pool.start(ArchiveTask(work))
+
+
+class OfflinePageHandler(QWebEngineUrlSchemeHandler):
+    def __init__(self, archive, parent=None):
+        super().__init__(parent)
+        self.archive = archive
+        self.jobs = {}
+        self.next_request = 0
+        archive.pageAssembled.connect(self.reply)
+
+    def requestStarted(self, job):
+        url = QUrlQuery(job.requestUrl()).queryItemValue('url', QUrl.FullyDecoded)
+        if not url:
+            job.fail(QWebEngineUrlRequestJob.UrlNotFound)
+            return
+        self.next_request += 1
+        request_id = self.next_request
+        self.jobs[request_id] = job
+        # The tab may be closed or navigate away while the page is assembled
+        job.destroyed.connect(lambda obj=None, request_id=request_id: self.jobs.pop(request_id, None))
+        self.archive.assemble(request_id, url)
+
+    @pyqtSlot(int, bytes)
+    def reply(self, request_id, data):
+        job = self.jobs.pop(request_id, None)
+        if job is None:
+            return
+        if not data:
+            job.fail(QWebEngineUrlRequestJob.UrlNotFound)
+            return
+        buffer = QBuffer(job)
+        buffer.setData(data)
+        buffer.open(QIODevice.ReadOnly)
+        job.reply(b'multipart/related', buffer)
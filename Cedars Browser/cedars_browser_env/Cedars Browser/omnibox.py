@@ -0,0 +1,349 @@
+import bisect
+import heapq
+import re
+import time
+from array import array
+from PyQt5.QtCore import *
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
+from PyQt5.QtWidgets import QCompleter
+
+MAX_SUGGESTIONS = 8
+BOOKMARK_BONUS = 200
+# Above this many prefix candidates, walking entries in frecency order finds matches sooner
+CANDIDATE_LIMIT = 2000
+# Cap on entries examined per keystroke when walking in frecency order
+SCAN_LIMIT = 20000
+SCAN_CHUNK = 1000
+# Re-sort the frecency ranking after this many updates
+RERANK_AFTER = 2000
+# Longer tokens are session ids and hashes nobody types
+MAX_WORD_LENGTH = 24
+
+# (max age in days, weight) buckets in the spirit of Firefox's frecency
+RECENCY_WEIGHTS = ((4, 100), (14, 70), (31, 50), (90, 30))
+OLD_WEIGHT = 10
+
+WORD_SEPARATORS = re.compile(r'[^0-9a-z]+')
+
+
+def frecency(visit_count, last_visit, bookmarked, now):
+    age_days = (now - last_visit) / 86400
+    weight = OLD_WEIGHT
+    for max_age, bucket_weight in RECENCY_WEIGHTS:
+        if age_days < max_age:
+            weight = bucket_weight
+            break
+    return visit_count * weight + (BOOKMARK_BONUS if bookmarked else 0)
+
+
+def normalize_url(url):
+    # What people type: no scheme, no www.
+    url = url.lower()
+    for prefix in ('https://', 'http://'):
+        if url.startswith(prefix):
+            url = url[len(prefix):]
+            break
+    if url.startswith('www.'):
+        url = url[4:]
+    return url
+
+
+def words_of(text):
+    return [word for word in WORD_SEPARATORS.split(text.lower()) if 0 < len(word) <= MAX_WORD_LENGTH]
+
+
+class IndexEntry:
+    __slots__ = ('url', 'title', 'visit_count', 'last_visit', 'bookmarked', 'score', 'text')
+
+    def __init__(self, url):
+        self.url = url
+        self.title = ''
+        self.visit_count = 0
+        self.last_visit = 0
+        self.bookmarked = False
+        self.score = 0
+        self.text = ''
+
+
+class FrecencyIndex:
+    # Word-prefix index: every word of a URL or title maps to the ids of its entries,
+    # and a sorted word list turns a typed prefix into a contiguous range of words.
+    def __init__(self):
+        self.entries = []
+        self.ids = {}
+        self.postings = {}
+        self.words = []
+        self.new_words = set()
+        # Entry ids by descending score as of the last rerank, plus ids touched since
+        self.ranked = []
+        self.touched = set()
+
+    def update(self, url, title=None, visit_count=None, last_visit=None, bookmarked=None,
+               add_visits=0, now=None):
+        now = now or time.time()
+        entry_id = self.ids.get(url)
+        if entry_id is None:
+            entry_id = self.ids[url] = len(self.entries)
+            entry = IndexEntry(url)
+            self.entries.append(entry)
+        else:
+            entry = self.entries[entry_id]
+        if title is not None:
+            entry.title = title
+        if visit_count is not None:
+            entry.visit_count = visit_count
+        entry.visit_count += add_visits
+        if last_visit is not None:
+            entry.last_visit = last_visit
+        elif add_visits:
+            entry.last_visit = now
+        if bookmarked is not None:
+            entry.bookmarked = bookmarked
+        entry.score = frecency(entry.visit_count, entry.last_visit, entry.bookmarked, now)
+
+        words = words_of(normalize_url(url) + ' ' + entry.title)
+        text = ' ' + ' '.join(words)
+        if text != entry.text:
+            # Words that disappear leave stale postings; matches are re-checked against text
+            for word in set(words) - set(entry.text.split()):
+                posting = self.postings.get(word)
+                if posting is None:
+                    posting = self.postings[word] = array('I')
+                    self.new_words.add(word)
+                posting.append(entry_id)
+            entry.text = text
+
+        self.touched.add(entry_id)
+
+    def remove(self, url):
+        entry_id = self.ids.pop(url, None)
+        if entry_id is not None:
+            entry = self.entries[entry_id]
+            entry.score = -1
+            entry.text = ''
+
+    def maybe_rerank(self):
+        if len(self.touched) > RERANK_AFTER:
+            self.rerank()
+
+    def rerank(self, now=None):
+        now = now or time.time()
+        for entry in self.entries:
+            if entry.score >= 0:
+                entry.score = frecency(entry.visit_count, entry.last_visit, entry.bookmarked, now)
+        entries = self.entries
+        self.ranked = sorted(self.ids.values(), key=lambda entry_id: entries[entry_id].score, reverse=True)
+        self.touched = set()
+        if self.new_words:
+            self.words = sorted(self.postings)
+            self.new_words = set()
+
+    def matching(self, tokens, entry_ids):
+        # Words only ever match at their start, hence the leading space
+        needles = [' ' + token for token in tokens]
+        entries = self.entries
+        if len(needles) == 1:
+            needle = needles[0]
+            return [entries[entry_id] for entry_id in entry_ids if needle in entries[entry_id].text]
+        return [entries[entry_id] for entry_id in entry_ids
+                if all(needle in entries[entry_id].text for needle in needles)]
+
+    def search(self, query, limit=MAX_SUGGESTIONS):
+        query = normalize_url(query.strip())
+        tokens = words_of(query)
+        if not tokens:
+            return []
+
+        # Look up the token with the fewest candidates; a token nothing starts with ends the search
+        counted = []
+        for token in set(tokens):
+            words, total = self.prefix_words(token)
+            if not total:
+                return []
+            counted.append((total, token, words))
+        counted.sort()
+        # Rarest first, so entries that do not match are rejected on the first check
+        checks = [token for total, token, words in counted]
+        total, token, words = counted[0]
+        if total > CANDIDATE_LIMIT:
+            return self.scan(tokens, checks, limit)
+
+        candidate_ids = set()
+        for word in words:
+            candidate_ids.update(self.postings[word])
+        return self.best(tokens, self.matching(checks, candidate_ids), limit)
+
+    def prefix_words(self, prefix):
+        # Words starting with prefix and how many postings they have, counted only as far
+        # as CANDIDATE_LIMIT; past that the words are not needed
+        words = [word for word in self.new_words if word.startswith(prefix)]
+        total = sum(len(self.postings[word]) for word in words)
+        position = bisect.bisect_left(self.words, prefix)
+        while total <= CANDIDATE_LIMIT and position < len(self.words) and self.words[position].startswith(prefix):
+            words.append(self.words[position])
+            total += len(self.postings[self.words[position]])
+            position += 1
+        return words, total
+
+    def scan(self, tokens, checks, limit):
+        # Common or very short prefixes match early in frecency order, so stop once
+        # enough candidates have been collected
+        wanted = limit * 4
+        matches = self.matching(checks, self.touched)
+        for start in range(0, min(len(self.ranked), SCAN_LIMIT), SCAN_CHUNK):
+            if len(matches) >= wanted:
+                break
+            chunk = [entry_id for entry_id in self.ranked[start:start + SCAN_CHUNK]
+                     if entry_id not in self.touched]
+            matches.extend(self.matching(checks, chunk))
+        return self.best(tokens, matches, limit)
+
+    def best(self, tokens, matches, limit):
+        # Entries whose URL starts with what was typed are what autocomplete should put first
+        leading = ' ' + tokens[0]
+        def rank(entry):
+            return entry.score * (2 if entry.text.startswith(leading) else 1)
+        return heapq.nlargest(limit, matches, key=rank)
+
+
+class OmniboxIndexWorker(QObject):
+    suggestionsReady = pyqtSignal(int, list)
+
+    def __init__(self):
+        super().__init__()
+        self.index = FrecencyIndex()
+        # Written from the GUI thread so stale queries can be skipped
+        self.latest_generation = 0
+
+    @pyqtSlot(object)
+    def load(self, loader):
+        # loader yields (url, title, visit_count, last_visit, bookmarked) tuples
+        now = time.time()
+        for url, title, visit_count, last_visit, bookmarked in loader():
+            self.index.update(url, title, visit_count, last_visit, bookmarked, now=now)
+        self.index.rerank(now)
+
+    @pyqtSlot(str, str)
+    def record_visit(self, url, title):
+        self.index.update(url, title or None, add_visits=1)
+        self.index.maybe_rerank()
+
+    @pyqtSlot(str, str, bool)
+    def set_bookmarked(self, url, title, bookmarked):
+        self.index.update(url, title or None, bookmarked=bookmarked)
+        self.index.maybe_rerank()
+
+    @pyqtSlot(list)
+    def remove(self, urls):
+        for url in urls:
+            self.index.remove(url)
+
+    @pyqtSlot(int, str)
+    def query(self, generation, text):
+        if generation != self.latest_generation:
+            return
+        results = [(entry.url, entry.title) for entry in self.index.search(text)]
+        self.suggestionsReady.emit(generation, results)
+
+
+class OmniboxIndex(QObject):
+    # Index building, updates and lookups all run on a worker thread so typing never waits
+    loadRequested = pyqtSignal(object)
+    visitRecorded = pyqtSignal(str, str)
+    bookmarkChanged = pyqtSignal(str, str, bool)
+    removeRequested = pyqtSignal(list)
+    queryRequested = pyqtSignal(int, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self.worker_thread = QThread()
+        self.worker = OmniboxIndexWorker()
+        self.worker.moveToThread(self.worker_thread)
+        self.loadRequested.connect(self.worker.load)
+        self.visitRecorded.connect(self.worker.record_visit)
+        self.bookmarkChanged.connect(self.worker.set_bookmarked)
+        self.removeRequested.connect(self.worker.remove)
+        self.queryRequested.connect(self.worker.query)
+        self.suggestionsReady = self.worker.suggestionsReady
+        self.worker_thread.start(QThread.LowPriority)
+        QCoreApplication.instance().aboutToQuit.connect(self.stop)
+
+    def load(self, loader):
+        self.loadRequested.emit(loader)
+
+    def record_visit(self, url, title=''):
+        self.visitRecorded.emit(url, title)
+
+    def set_bookmarked(self, url, title='', bookmarked=True):
+        self.bookmarkChanged.emit(url, title, bookmarked)
+
+    def remove(self, url):
+        self.removeRequested.emit([url])
+
+    @pyqtSlot(list)
+    def remove_all(self, urls):
+        self.removeRequested.emit(urls)
+
+    def query(self, text):
+        self.generation += 1
+        self.worker.latest_generation = self.generation
+        self.queryRequested.emit(self.generation, text)
+        return self.generation
+
+    @pyqtSlot()
+    def stop(self):
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+
+
+class OmniboxCompleter(QCompleter):
+    suggestionClicked = pyqtSignal()
+
+    def __init__(self, line_edit, index):
+        super().__init__(line_edit)
+        self.index = index
+        self.pending_generation = 0
+        self.suggestion_model = QStandardItemModel(self)
+        self.setModel(self.suggestion_model)
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.setCompletionRole(Qt.UserRole)
+        self.setWidget(line_edit)
+
+        line_edit.textEdited.connect(self.request_suggestions)
+        index.suggestionsReady.connect(self.show_suggestions)
+        # Keyboard selection reaches the URL bar through returnPressed; clicks need their own signal
+        self.popup().clicked.connect(lambda index: self.suggestionClicked.emit())
+
+    @pyqtSlot(str)
+    def request_suggestions(self, text):
+        if text.strip():
+            self.pending_generation = self.index.query(text)
+        else:
+            self.pending_generation = 0
+            self.popup().hide()
+
+    @pyqtSlot(int, list)
+    def show_suggestions(self, generation, results):
+        if generation != self.pending_generation or not self.widget().hasFocus():
+            return
+        self.suggestion_model.clear()
+        for url, title in results:
+            item = QStandardItem(f"{title} — {url}" if title else url)
+            item.setData(url, Qt.UserRole)
+            self.suggestion_model.appendRow(item)
+        if results:
+            self.complete()
+        else:
+            self.popup().hide()
+
+
+shared_index_instance = None
+
+
+def shared_index():
+    # Every window suggests from the same history
+    global shared_index_instance
+    if shared_index_instance is None:
+        shared_index_instance = OmniboxIndex(QCoreApplication.instance())
+    return shared_index_instance
@@ -0,0 +1,90 @@
+from PyQt5.QtCore import *
+from PyQt5.QtWebEngineWidgets import QWebEnginePage, QWebEngineProfile
+from memory_budget import shared_monitor
+from prerender import SpeculativePage
+
+DEFAULT_POOL_SIZE = 2
+# Refilling waits for a quiet moment after a page is handed out, and warms one page at a time
+REFILL_DELAY_MS = 2000
+
+
+class WarmPagePool(QObject):
+    # Hidden pages that already have a renderer process and have loaded about:blank, so a
+    # new tab or popup skips renderer startup on its first navigation
+    def __init__(self, profile, size=DEFAULT_POOL_SIZE, parent=None):
+        super().__init__(parent)
+        self.profile = profile
+        self.size = size
+        self.pages = []
+        self.warming = None
+        self.refill_timer = QTimer(self)
+        self.refill_timer.setSingleShot(True)
+        self.refill_timer.setInterval(REFILL_DELAY_MS)
+        self.refill_timer.timeout.connect(self.refill)
+        self.schedule_refill()
+
+    def set_size(self, size):
+        self.size = size
+        while len(self.pages) > size:
+            self.pages.pop().deleteLater()
+        self.schedule_refill()
+
+    def take(self):
+        # Returns a warm page, or None if the pool is empty; the caller becomes its owner
+        if not self.pages:
+            self.schedule_refill()
+            return None
+        page = self.pages.pop(0)
+        page.history().clear()
+        self.schedule_refill()
+        return page
+
+    def schedule_refill(self):
+        if len(self.pages) < self.size and self.warming is None:
+            self.refill_timer.start()
+
+    @pyqtSlot()
+    def refill(self):
+        if len(self.pages) >= self.size or self.warming is not None:
+            return
+        page = SpeculativePage(self.profile, self)
+        self.warming = page
+        page.loadFinished.connect(lambda ok, page=page: self.page_warmed(page, ok))
+        page.load(QUrl('about:blank'))
+
+    def page_warmed(self, page, ok):
+        if page is not self.warming:
+            return
+        self.warming = None
+        if ok and len(self.pages) < self.size:
+            self.pages.append(page)
+        else:
+            page.deleteLater()
+        self.schedule_refill()
+
+    def drain(self):
+        # Gives the memory back, e.g. when renderers are over budget; refilled on next use
+        self.refill_timer.stop()
+        for page in self.pages:
+            page.deleteLater()
+        self.pages = []
+
+    def pids(self):
+        return {page.renderProcessPid() for page in self.pages if page.renderProcessPid() > 0}
+
+    def memory_kb(self):
+        # Proportional set size of the pooled renderers as of the last memory sample
+        samples = shared_monitor().samples
+        return sum(samples.get(pid, (0, 0))[1] for pid in self.pids())
+
+
+shared_pool_instance = None
+
+
+def shared_pool():
+    # Pages are created on the default profile, which every window shares
+    global shared_pool_instance
+    if shared_pool_instance is None:
+        shared_pool_instance = WarmPagePool(QWebEngineProfile.defaultProfile(), parent=QCoreApplication.instance())
+        shared_monitor().track_pool(shared_pool_instance)
+    return shared_pool_instance
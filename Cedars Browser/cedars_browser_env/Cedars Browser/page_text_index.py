@@ -0,0 +1,205 @@
+import hashlib
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from PyQt5.QtCore import *
+from PyQt5.QtWebEngineWidgets import QWebEnginePage
+from history_store import open_database
+
+# Pages are extracted this long after they finish loading, one at a time,
+# and only while no other page is loading
+EXTRACT_DELAY_MS = 3000
+EXTRACT_INTERVAL_MS = 1000
+MAX_TEXT_LENGTH = 512 * 1024
+# Pruning of entries whose history expired runs in small chunks
+PRUNE_INTERVAL = 60 * 60
+PRUNE_CHUNK = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_documents (
+    id INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS page_texts (
+    url TEXT PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES page_documents(id),
+    indexed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS page_texts_document ON page_texts(document_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS page_fts USING fts5(title, body);
+"""
+
+
+def match_expression(text):
+    # Each word is quoted so FTS5 takes punctuation and operators in it literally; the
+    # last one matches as a prefix, since it is often still being typed
+    words = ['"' + word.replace('"', '""') + '"' for word in text.split()]
+    if words:
+        words[-1] += '*'
+    return ' '.join(words)
+
+
+class PageTextIndex(QObject):
+    # Text extraction is scheduled on the GUI thread; hashing and FTS5 indexing happen
+    # on a worker thread with its own connection to the history database.
+    def __init__(self, history, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.queue = queue.Queue()
+        self.loading = set()
+        # page -> (url, earliest extraction time)
+        self.pending = {}
+        # Page whose text is being extracted, if any
+        self.extracting = None
+
+        connection = open_database(history.path)
+        connection.executescript(SCHEMA)
+        connection.commit()
+        self.worker = threading.Thread(target=self.index_loop, args=(connection,),
+                                       name='page-text-indexer', daemon=True)
+        self.worker.start()
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(EXTRACT_INTERVAL_MS)
+        self.timer.timeout.connect(self.extract_next)
+        self.timer.start()
+
+    def watch(self, view):
+        # The view's page can be replaced, e.g. by a prerendered one
+        view.loadStarted.connect(lambda view=view: self.loading.add(view.page()))
+        view.loadFinished.connect(lambda ok, view=view: self.page_loaded(view.page(), ok))
+        self.watch_page(view.page())
+
+    def watch_page(self, page):
+        page.destroyed.connect(lambda obj=None, page=page: self.forget(page))
+
+    def forget(self, page):
+        self.loading.discard(page)
+        self.pending.pop(page, None)
+        if page is self.extracting:
+            self.extracting = None
+
+    def page_loaded(self, page, ok):
+        self.loading.discard(page)
+        url = page.url()
+        if ok and url.scheme() in ('http', 'https'):
+            self.pending[page] = (url, time.monotonic() + EXTRACT_DELAY_MS / 1000)
+
+    @pyqtSlot()
+    def extract_next(self):
+        if self.extracting is not None or self.loading or not self.pending:
+            return
+        now = time.monotonic()
+        for page, (url, ready_at) in list(self.pending.items()):
+            if ready_at > now:
+                continue
+            del self.pending[page]
+            # Skip pages that navigated away or were frozen in the meantime
+            if page.url() != url or page.lifecycleState() != QWebEnginePage.Active:
+                continue
+            self.extracting = page
+            title = page.title()
+            page.toPlainText(lambda text, url=url, title=title: self.text_extracted(url, title, text))
+            return
+
+    def text_extracted(self, url, title, text):
+        self.extracting = None
+        if text.strip():
+            self.queue.put(('index', url.toString(), title, text[:MAX_TEXT_LENGTH]))
+
+    @pyqtSlot(list)
+    def prune(self, urls):
+        self.queue.put(('prune', urls))
+
+    def close(self):
+        if self.worker.is_alive():
+            self.queue.put(('stop',))
+            self.worker.join()
+
+    def index_loop(self, connection):
+        next_sweep = time.monotonic() + PRUNE_INTERVAL
+        while True:
+            try:
+                operation = self.queue.get(timeout=max(0, next_sweep - time.monotonic()))
+            except queue.Empty:
+                operation = ('sweep',)
+            kind = operation[0]
+            if kind == 'stop':
+                break
+            # A locked or full database loses this operation, never the thread
+            try:
+                if kind == 'sweep':
+                    # Incremental sweep for anything the expiry notifications missed
+                    if self.sweep(connection) < PRUNE_CHUNK:
+                        next_sweep = time.monotonic() + PRUNE_INTERVAL
+                elif kind == 'index':
+                    self.index_text(connection, *operation[1:])
+                elif kind == 'prune':
+                    urls = operation[1]
+                    for start in range(0, len(urls), PRUNE_CHUNK):
+                        self.remove_urls(connection, urls[start:start + PRUNE_CHUNK])
+            except sqlite3.Error as error:
+                print(f"Page text index: {kind} failed: {error}", file=sys.stderr)
+                if kind == 'sweep':
+                    next_sweep = time.monotonic() + PRUNE_INTERVAL
+        connection.close()
+
+    def index_text(self, connection, url, title, text):
+        digest = hashlib.sha1(text.encode('utf-8', 'replace')).hexdigest()
+        with connection:
+            row = connection.execute("SELECT id FROM page_documents WHERE hash = ?", (digest,)).fetchone()
+            if row is None:
+                document_id = connection.execute(
+                    "INSERT INTO page_documents (hash) VALUES (?)", (digest,)).lastrowid
+                connection.execute("INSERT INTO page_fts (rowid, title, body) VALUES (?, ?, ?)",
+                                   (document_id, title, text))
+            else:
+                # Same content already indexed under another URL or an earlier visit
+                document_id = row[0]
+            previous = connection.execute(
+                "SELECT document_id FROM page_texts WHERE url = ?", (url,)).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO page_texts (url, document_id, indexed_at) VALUES (?, ?, ?)",
+                (url, document_id, time.time()))
+            if previous is not None and previous[0] != document_id:
+                self.drop_unreferenced(connection, [previous[0]])
+
+    def remove_urls(self, connection, urls):
+        with connection:
+            rows = connection.execute(
+                f"SELECT document_id FROM page_texts WHERE url IN ({','.join('?' * len(urls))})",
+                urls).fetchall()
+            connection.executemany("DELETE FROM page_texts WHERE url = ?", [(url,) for url in urls])
+            self.drop_unreferenced(connection, {row[0] for row in rows})
+
+    def drop_unreferenced(self, connection, document_ids):
+        for document_id in document_ids:
+            referenced = connection.execute(
+                "SELECT 1 FROM page_texts WHERE document_id = ? LIMIT 1", (document_id,)).fetchone()
+            if referenced is None:
+                connection.execute("DELETE FROM page_fts WHERE rowid = ?", (document_id,))
+                connection.execute("DELETE FROM page_documents WHERE id = ?", (document_id,))
+
+    def sweep(self, connection):
+        rows = connection.execute(
+            "SELECT url FROM page_texts WHERE url NOT IN (SELECT url FROM urls) LIMIT ?",
+            (PRUNE_CHUNK,)).fetchall()
+        if rows:
+            self.remove_urls(connection, [row[0] for row in rows])
+        return len(rows)
+
+    def search(self, text, limit=50):
+        # Rows are shaped like HistoryStore.recent_urls, best match first, plus a snippet.
+        # All words must appear; pages whose history expired are not returned.
+        expression = match_expression(text)
+        if not expression:
+            return []
+        return self.history.reader().execute(
+            "SELECT urls.id, urls.url, COALESCE(NULLIF(urls.title, ''), page_fts.title), urls.visit_count, "
+            "urls.last_visit, snippet(page_fts, 1, '[', ']', '...', 12) FROM page_fts "
+            "JOIN page_texts ON page_texts.document_id = page_fts.rowid "
+            "JOIN urls ON urls.url = page_texts.url "
+            "WHERE page_fts MATCH ? ORDER BY rank LIMIT ?",
+            (expression, limit)).fetchall()
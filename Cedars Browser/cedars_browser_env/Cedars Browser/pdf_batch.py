@@ -0,0 +1,172 @@
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from PyQt5.QtCore import *
+from PyQt5.QtGui import QPageLayout, QPageSize
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtWebEngineWidgets import QWebEnginePage, QWebEngineProfile
+
+PDF_FLAG = '--pdf'
+DEFAULT_TIMEOUT = 60
+MAX_NAME_LENGTH = 80
+
+
+def read_urls(source):
+    # One URL per line from a file, or from stdin when source is '-'; blank lines and # comments skipped
+    stream = sys.stdin if source == '-' else open(source, encoding='utf-8')
+    try:
+        return [line.strip() for line in stream if line.strip() and not line.lstrip().startswith('#')]
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def url_slug(url):
+    qurl = QUrl.fromUserInput(url)
+    return re.sub(r'[^0-9A-Za-z]+', '-', qurl.host() + qurl.path()).strip('-')[:MAX_NAME_LENGTH] or 'page'
+
+
+def output_name(index, url):
+    return f'{index:05d}-{url_slug(url)}.pdf'
+
+
+class PdfJob:
+    __slots__ = ('index', 'url', 'path', 'page', 'timer', 'started', 'loaded', 'done')
+
+    def __init__(self, index, url, path):
+        self.index = index
+        self.url = url
+        self.path = path
+        self.page = None
+        self.timer = None
+        self.started = 0
+        self.loaded = 0
+        self.done = False
+
+
+class PdfBatch(QObject):
+    # Renders up to `concurrency` pages at once. Every page gets its own renderer, so
+    # loading and layout run in parallel while this thread only hands out work.
+    finished = pyqtSignal()
+
+    def __init__(self, urls, output_dir, concurrency, timeout, layout, parent=None):
+        super().__init__(parent)
+        # Off the record, so batch runs leave the browsing profile alone
+        self.profile = QWebEngineProfile(self)
+        self.output_dir = output_dir
+        self.concurrency = max(1, concurrency)
+        self.timeout_ms = int(timeout * 1000)
+        self.layout = layout
+        self.pending = [PdfJob(index, url, os.path.join(output_dir, output_name(index, url)))
+                        for index, url in enumerate(urls)]
+        self.pending.reverse()
+        self.running = set()
+        self.succeeded = 0
+        self.failed = 0
+        self.started = time.perf_counter()
+
+    def start(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.fill()
+
+    def fill(self):
+        while self.pending and len(self.running) < self.concurrency:
+            self.start_job(self.pending.pop())
+        if not self.pending and not self.running:
+            self.report_summary()
+            self.finished.emit()
+
+    def start_job(self, job):
+        self.running.add(job)
+        job.started = time.perf_counter()
+        job.page = QWebEnginePage(self.profile, self)
+        job.page.loadFinished.connect(lambda ok, job=job: self.job_loaded(job, ok))
+        job.page.pdfPrintingFinished.connect(lambda path, ok, job=job: self.job_printed(job, ok))
+        job.timer = QTimer(self)
+        job.timer.setSingleShot(True)
+        job.timer.timeout.connect(lambda job=job: self.job_done(job, False, 'timed out'))
+        job.timer.start(self.timeout_ms)
+        job.page.load(QUrl.fromUserInput(job.url))
+
+    def job_loaded(self, job, ok):
+        # Redirects and late frames can report more than once; the first result counts
+        if job.done or job.loaded:
+            return
+        if not ok:
+            self.job_done(job, False, 'load failed')
+            return
+        job.loaded = time.perf_counter()
+        job.page.printToPdf(job.path, self.layout)
+
+    def job_printed(self, job, ok):
+        if not job.done:
+            self.job_done(job, ok, None if ok else 'printing failed')
+
+    def job_done(self, job, ok, error):
+        job.done = True
+        job.timer.stop()
+        job.timer.deleteLater()
+        job.page.deleteLater()
+        self.running.discard(job)
+        now = time.perf_counter()
+        if ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        record = {
+            'index': job.index,
+            'url': job.url,
+            'ok': ok,
+            'output': job.path if ok else None,
+            'load_ms': round((job.loaded - job.started) * 1000, 1) if job.loaded else None,
+            'print_ms': round((now - job.loaded) * 1000, 1) if ok else None,
+            'total_ms': round((now - job.started) * 1000, 1),
+        }
+        if error:
+            record['error'] = error
+        # One JSON line per page as it finishes, so progress can be followed live
+        print(json.dumps(record), flush=True)
+        # Let the finished page go before starting the next one
+        QTimer.singleShot(0, self.fill)
+
+    def report_summary(self):
+        elapsed = time.perf_counter() - self.started
+        total = self.succeeded + self.failed
+        print(json.dumps({'summary': {
+            'pages': total,
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'concurrency': self.concurrency,
+            'elapsed_s': round(elapsed, 2),
+            'pages_per_minute': round(total / elapsed * 60, 1) if elapsed else None,
+        }}), flush=True)
+
+
+def main(arguments):
+    parser = argparse.ArgumentParser(prog='Cedars_Browser.py --pdf',
+                                     description="Render a list of URLs to PDF files without a window.")
+    parser.add_argument(PDF_FLAG, dest='source', required=True, metavar='FILE',
+                        help="file with one URL per line, or - for stdin")
+    parser.add_argument('--output-dir', default='pdf', help="where the PDF files are written")
+    parser.add_argument('--concurrency', type=int, default=os.cpu_count() or 1,
+                        help="pages rendered at the same time (default: number of CPUs)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="seconds allowed per page")
+    parser.add_argument('--landscape', action='store_true')
+    parser.add_argument('--page-size', default='A4', choices=('A4', 'A3', 'Letter', 'Legal'))
+    args = parser.parse_args(arguments)
+
+    urls = read_urls(args.source)
+    # No display is needed; QtWebEngine still needs a platform plugin
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QApplication(sys.argv[:1])
+    page_size = QPageSize(getattr(QPageSize, args.page_size))
+    orientation = QPageLayout.Landscape if args.landscape else QPageLayout.Portrait
+    layout = QPageLayout(page_size, orientation, QMarginsF(10, 10, 10, 10), QPageLayout.Millimeter)
+    batch = PdfBatch(urls, args.output_dir, args.concurrency, args.timeout, layout, app)
+    batch.finished.connect(app.quit)
+    QTimer.singleShot(0, batch.start)
+    app.exec_()
+    return 0 if batch.failed == 0 else 1
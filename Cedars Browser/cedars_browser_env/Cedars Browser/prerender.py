@@ -0,0 +1,171 @@
+import re
+import time
+from collections import OrderedDict
+from PyQt5.QtCore import *
+from PyQt5 import sip
+from PyQt5.QtNetwork import QHostInfo
+from PyQt5.QtWebEngineWidgets import QWebEnginePage, QWebEngineProfile
+from memory_budget import shared_monitor
+
+# A link has to stay under the pointer this long before anything is fetched
+HOVER_DELAY_MS = 200
+MAX_PRERENDERED = 3
+MAX_CONCURRENT_PRERENDERS = 1
+PRERENDER_BUDGET_MB = 300
+# Prerendered pages older than this are stale and thrown away instead of shown
+PRERENDER_TTL = 60
+# Prerendering is a real GET, so links that may change state on the server are never fetched
+UNSAFE_PATH = re.compile(r'log-?out|log-?off|sign-?out|delete|remove|unsubscribe|cancel|revoke', re.IGNORECASE)
+
+
+def safe_to_prerender(url):
+    # Query strings often carry actions (?action=delete), so only plain paths qualify
+    return not url.hasQuery() and not UNSAFE_PATH.search(url.path())
+
+
+def history_signature(page):
+    history = page.history()
+    return history.count(), history.currentItemIndex(), history.currentItem().url()
+
+
+class SpeculativePage(QWebEnginePage):
+    # Every tab page is one of these so that a click on a prerendered link can swap the
+    # finished page into the view instead of loading it again
+    def __init__(self, profile, parent=None):
+        super().__init__(profile, parent)
+        self.loaded = False
+        self.loadStarted.connect(lambda: setattr(self, 'loaded', False))
+        self.loadFinished.connect(lambda ok: setattr(self, 'loaded', ok))
+
+    def acceptNavigationRequest(self, url, navigation_type, is_main_frame):
+        view = self.view()
+        if (is_main_frame and navigation_type == QWebEnginePage.NavigationTypeLinkClicked
+                and getattr(view, 'tabs', None) is not None):
+            page = shared_prerenderer().take(url, self)
+            if page is not None:
+                # Not from inside this page's own callback; the swap deletes it
+                QTimer.singleShot(0, lambda: view.tabs.replace_page(view, page))
+                return False
+        return super().acceptNavigationRequest(url, navigation_type, is_main_frame)
+
+
+class HoverPrerenderer(QObject):
+    # Links hovered long enough are prerendered in a hidden page when they stay on the
+    # same host, where following them is expected; other hosts only get a DNS lookup
+    # so the connection starts sooner.
+    def __init__(self, profile, parent=None):
+        super().__init__(parent)
+        self.profile = profile
+        # url string -> (page, time the prerender started, page the link was on, that page's
+        # history then), least recently used first
+        self.prerendered = OrderedDict()
+        self.loading = set()
+        self.hovered = None
+        self.enabled = True
+        self.hover_timer = QTimer(self)
+        self.hover_timer.setSingleShot(True)
+        self.hover_timer.setInterval(HOVER_DELAY_MS)
+        self.hover_timer.timeout.connect(self.hover_settled)
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        if not enabled:
+            self.hovered = None
+            self.hover_timer.stop()
+            self.drain()
+
+    def link_hovered(self, page, url):
+        # Connected to linkHovered of every tab page; an empty url means the pointer left the link
+        if not url or not self.enabled:
+            self.hovered = None
+            self.hover_timer.stop()
+            return
+        self.hovered = (page, QUrl(url))
+        self.hover_timer.start()
+
+    @pyqtSlot()
+    def hover_settled(self):
+        if self.hovered is None:
+            return
+        page, url = self.hovered
+        self.hovered = None
+        if sip.isdeleted(page) or url.scheme() not in ('http', 'https') or url.toString() in self.prerendered:
+            return
+        if url.adjusted(QUrl.RemoveFragment) == page.url().adjusted(QUrl.RemoveFragment):
+            return
+        if url.host() != page.url().host():
+            QHostInfo.lookupHost(url.host(), lambda info: None)
+            return
+        if len(self.loading) >= MAX_CONCURRENT_PRERENDERS or not safe_to_prerender(url):
+            return
+        self.prerender(url, page)
+
+    def prerender(self, url, source):
+        while len(self.prerendered) >= MAX_PRERENDERED or (
+                self.prerendered and self.memory_kb() > PRERENDER_BUDGET_MB * 1024):
+            self.evict(next(iter(self.prerendered)))
+        page = SpeculativePage(self.profile, self)
+        page.setAudioMuted(True)
+        # The tab's back/forward list goes in first, so the swapped-in page can go back. Reading
+        # it back navigates to the tab's current entry, which the load below replaces at once.
+        data = QByteArray()
+        QDataStream(data, QIODevice.WriteOnly) << source.history()
+        QDataStream(data, QIODevice.ReadOnly) >> page.history()
+        key = url.toString()
+        self.prerendered[key] = (page, time.monotonic(), source, history_signature(source))
+        self.loading.add(page)
+        page.loadFinished.connect(lambda ok, key=key, page=page: self.prerender_finished(key, page, ok))
+        page.load(url)
+
+    def prerender_finished(self, key, page, ok):
+        self.loading.discard(page)
+        if not ok and self.prerendered.get(key, (None,))[0] is page:
+            self.evict(key)
+
+    def take(self, url, source):
+        # Returns the prerender of url, handing ownership to the caller, or None.
+        # One still loading is handed over too; it is further along than a fresh load.
+        key = url.toString()
+        entry = self.prerendered.get(key)
+        if entry is None:
+            return None
+        page, started, prerendered_from, signature = entry
+        if time.monotonic() - started > PRERENDER_TTL:
+            self.evict(key)
+            return None
+        # Its history is only right for the tab it was hovered in, as that tab was then
+        if prerendered_from is not source or history_signature(source) != signature:
+            return None
+        del self.prerendered[key]
+        self.loading.discard(page)
+        page.setAudioMuted(False)
+        return page
+
+    def evict(self, key):
+        page = self.prerendered.pop(key)[0]
+        self.loading.discard(page)
+        page.deleteLater()
+
+    def drain(self):
+        for key in list(self.prerendered):
+            self.evict(key)
+
+    def pids(self):
+        return {entry[0].renderProcessPid() for entry in self.prerendered.values()
+                if entry[0].renderProcessPid() > 0}
+
+    def memory_kb(self):
+        samples = shared_monitor().samples
+        return sum(samples.get(pid, (0, 0))[1] for pid in self.pids())
+
+
+shared_prerenderer_instance = None
+
+
+def shared_prerenderer():
+    global shared_prerenderer_instance
+    if shared_prerenderer_instance is None:
+        shared_prerenderer_instance = HoverPrerenderer(QWebEngineProfile.defaultProfile(),
+                                                       QCoreApplication.instance())
+        shared_monitor().track_pool(shared_prerenderer_instance)
+    return shared_prerenderer_instance
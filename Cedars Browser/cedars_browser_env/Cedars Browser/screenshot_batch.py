@@ -0,0 +1,236 @@
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import sys
+import time
+from PyQt5.QtCore import *
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtWebEngineWidgets import QWebEnginePage, QWebEngineProfile, QWebEngineView
+from pdf_batch import read_urls, url_slug
+
+SCREENSHOT_FLAG = '--screenshot'
+DEFAULT_TIMEOUT = 60
+DEFAULT_SETTLE_MS = 1000
+# How long a view whose load was stopped may take to report it before it is reused anyway
+STOP_GRACE_MS = 2000
+
+
+class EncodeTask(QRunnable):
+    # Hashing and PNG encoding run on the pool while the views go on loading
+    def __init__(self, index, url, image, path, previous_hash, timings, done):
+        super().__init__()
+        self.index = index
+        self.url = url
+        self.image = image
+        self.path = path
+        self.previous_hash = previous_hash
+        self.timings = timings
+        self.done = done
+
+    def run(self):
+        started = time.perf_counter()
+        bits = self.image.constBits()
+        bits.setsize(self.image.byteCount())
+        digest = hashlib.sha1(bits.asstring()).hexdigest()
+        written = None
+        self.timings['unchanged'] = digest == self.previous_hash
+        if digest != self.previous_hash:
+            if self.image.save(self.path, 'PNG'):
+                written = self.path
+        self.timings['encode_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        self.done.emit(self.index, self.url, digest, written, self.timings)
+
+
+class CaptureSlot:
+    __slots__ = ('view', 'timer', 'index', 'started', 'loaded', 'busy', 'stopping')
+
+    def __init__(self, view, timer):
+        self.view = view
+        self.timer = timer
+        self.index = None
+        self.started = 0
+        self.loaded = 0
+        self.busy = False
+        # Set while waiting for the loadFinished of a load that was stopped
+        self.stopping = False
+
+
+class ScreenshotService(QObject):
+    # A fixed set of offscreen views is reused for every capture, so the per-shot cost is a
+    # navigation and a grab; with an interval each URL is captured again once it comes due
+    imageEncoded = pyqtSignal(int, str, str, object, dict)
+    finished = pyqtSignal()
+
+    def __init__(self, urls, output_dir, concurrency, size, settle_ms, timeout, interval, parent=None):
+        super().__init__(parent)
+        self.profile = QWebEngineProfile(self)
+        self.urls = urls
+        self.output_dir = output_dir
+        self.settle_ms = settle_ms
+        self.timeout_ms = int(timeout * 1000)
+        self.interval = interval
+        # (due time, index) of the captures still to do
+        self.due = [(0, index) for index in range(len(urls))]
+        # index -> hash of the last image written for that URL
+        self.hashes = {}
+        self.encoding = 0
+        self.failed = 0
+        self.pool = QThreadPool(self)
+        self.imageEncoded.connect(self.image_encoded)
+        self.wake_timer = QTimer(self)
+        self.wake_timer.setSingleShot(True)
+        self.wake_timer.timeout.connect(self.dispatch)
+
+        self.slots = []
+        for _ in range(max(1, min(concurrency, len(urls)))):
+            view = QWebEngineView()
+            view.setPage(QWebEnginePage(self.profile, view))
+            view.page().setAudioMuted(True)
+            view.resize(size)
+            view.show()
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            slot = CaptureSlot(view, timer)
+            view.loadFinished.connect(lambda ok, slot=slot: self.loaded(slot, ok))
+            timer.timeout.connect(lambda slot=slot: self.timer_fired(slot))
+            self.slots.append(slot)
+
+    def start(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.dispatch()
+
+    @pyqtSlot()
+    def dispatch(self):
+        now = time.monotonic()
+        for slot in self.slots:
+            if slot.busy:
+                continue
+            if not self.due or self.due[0][0] > now:
+                break
+            due, index = heapq.heappop(self.due)
+            self.capture(slot, index)
+        if self.due and not all(slot.busy for slot in self.slots):
+            # An idle view waits for the next capture to come due
+            self.wake_timer.start(max(0, int((self.due[0][0] - now) * 1000)))
+        elif not self.due and self.idle():
+            self.finished.emit()
+
+    def idle(self):
+        return not self.encoding and not any(slot.busy for slot in self.slots)
+
+    def capture(self, slot, index):
+        slot.busy = True
+        slot.index = index
+        slot.started = time.perf_counter()
+        slot.loaded = 0
+        slot.timer.start(self.timeout_ms)
+        slot.view.load(QUrl.fromUserInput(self.urls[index]))
+
+    def loaded(self, slot, ok):
+        if not slot.busy:
+            return
+        if slot.stopping:
+            # The stopped load reporting back; only now can the view take the next URL
+            slot.stopping = False
+            self.slot_done(slot, None)
+            return
+        if slot.loaded:
+            return
+        if not ok:
+            self.slot_done(slot, {'ok': False, 'error': 'load failed'})
+            return
+        slot.loaded = time.perf_counter()
+        # Give scripts and web fonts time to finish drawing
+        slot.timer.start(self.settle_ms)
+
+    def timer_fired(self, slot):
+        if not slot.busy:
+            return
+        if slot.stopping:
+            # The stopped load never reported back
+            slot.stopping = False
+            self.slot_done(slot, None)
+            return
+        if not slot.loaded:
+            # Stopping makes the view emit loadFinished(False) later, which would end the next
+            # capture as failed; the slot stays busy until that has arrived
+            self.report(slot.index, self.urls[slot.index], {
+                'ok': False, 'error': 'timed out', 'total_ms': round((time.perf_counter() - slot.started) * 1000, 1)})
+            slot.stopping = True
+            slot.timer.start(STOP_GRACE_MS)
+            slot.view.stop()
+            return
+        grab_started = time.perf_counter()
+        image = slot.view.grab().toImage()
+        timings = {
+            'ok': True,
+            'load_ms': round((slot.loaded - slot.started) * 1000, 1),
+            'grab_ms': round((time.perf_counter() - grab_started) * 1000, 1),
+        }
+        name = f'{slot.index:05d}-{url_slug(self.urls[slot.index])}-{time.strftime("%Y%m%d-%H%M%S")}.png'
+        self.encoding += 1
+        self.pool.start(EncodeTask(slot.index, self.urls[slot.index], image, os.path.join(self.output_dir, name),
+                                   self.hashes.get(slot.index), timings, self.imageEncoded))
+        self.slot_done(slot, None)
+
+    def slot_done(self, slot, failure):
+        index = slot.index
+        slot.busy = False
+        slot.timer.stop()
+        if failure is not None:
+            failure['total_ms'] = round((time.perf_counter() - slot.started) * 1000, 1)
+            self.report(index, self.urls[index], failure)
+        if self.interval:
+            heapq.heappush(self.due, (time.monotonic() + self.interval, index))
+        QTimer.singleShot(0, self.dispatch)
+
+    @pyqtSlot(int, str, str, object, dict)
+    def image_encoded(self, index, url, digest, written, timings):
+        self.encoding -= 1
+        if written is not None:
+            self.hashes[index] = digest
+        timings['output'] = written
+        if written is None and not timings['unchanged']:
+            timings['ok'] = False
+            timings['error'] = 'could not write image'
+        self.report(index, url, timings)
+        if not self.due and self.idle():
+            self.finished.emit()
+
+    def report(self, index, url, record):
+        if not record['ok']:
+            self.failed += 1
+        print(json.dumps(dict({'index': index, 'url': url, 'time': time.strftime('%Y-%m-%dT%H:%M:%S')}, **record)),
+              flush=True)
+
+
+def main(arguments):
+    parser = argparse.ArgumentParser(prog='Cedars_Browser.py --screenshot',
+                                     description="Capture a list of URLs to PNG files without a window.")
+    parser.add_argument(SCREENSHOT_FLAG, dest='source', required=True, metavar='FILE',
+                        help="file with one URL per line, or - for stdin")
+    parser.add_argument('--output-dir', default='screenshots', help="where the PNG files are written")
+    parser.add_argument('--concurrency', type=int, default=os.cpu_count() or 1,
+                        help="pages loaded at the same time (default: number of CPUs)")
+    parser.add_argument('--width', type=int, default=1920)
+    parser.add_argument('--height', type=int, default=1080)
+    parser.add_argument('--settle', type=int, default=DEFAULT_SETTLE_MS, metavar='MS',
+                        help="wait after loadFinished before grabbing")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="seconds allowed per load")
+    parser.add_argument('--interval', type=float, default=0, metavar='SECONDS',
+                        help="capture every URL again this often; runs until interrupted")
+    args = parser.parse_args(arguments)
+
+    urls = read_urls(args.source)
+    if not urls:
+        return 0
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QApplication(sys.argv[:1])
+    service = ScreenshotService(urls, args.output_dir, args.concurrency, QSize(args.width, args.height),
+                                args.settle, args.timeout, args.interval, app)
+    service.finished.connect(app.quit)
+    QTimer.singleShot(0, service.start)
+    app.exec_()
+    return 0 if service.failed == 0 else 1
@@ -0,0 +1,103 @@
+import getpass
+import json
+import os
+from PyQt5.QtCore import *
+from PyQt5.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+# Only QtCore and QtNetwork are imported here so a second launch can hand its URLs
+# to the running browser without loading QtWebEngine at all
+CONNECT_TIMEOUT_MS = 200
+# A browser that is still starting up only answers once its first window is built
+REPLY_TIMEOUT_MS = 30000
+NEW_WINDOW_FLAG = '--new-window'
+
+
+def server_name():
+    # One running browser per user
+    return f'cedars-browser-{getpass.getuser()}'
+
+
+def parse_arguments(arguments):
+    # URLs and files named on the command line; Qt's own options start with '-'
+    new_window = NEW_WINDOW_FLAG in arguments
+    urls = [QUrl.fromUserInput(argument, os.getcwd()).toString()
+            for argument in arguments if not argument.startswith('-')]
+    return urls, new_window or not urls
+
+
+def forward_to_running_instance(arguments):
+    # None if no browser is running and this process should start one; True if the running
+    # browser took the URLs; False if it is running but did not answer in time
+    socket = QLocalSocket()
+    socket.connectToServer(server_name())
+    if not socket.waitForConnected(CONNECT_TIMEOUT_MS):
+        return None
+    urls, new_window = parse_arguments(arguments)
+    message = json.dumps({'urls': urls, 'new_window': new_window}) + '\n'
+    socket.write(message.encode('utf-8'))
+    # Wait for the acknowledgement so the URLs are not lost if the browser is shutting down
+    if socket.waitForBytesWritten(REPLY_TIMEOUT_MS) and socket.waitForReadyRead(REPLY_TIMEOUT_MS):
+        accepted = bytes(socket.readLine()).strip() == b'ok'
+        socket.disconnectFromServer()
+        return accepted
+    if socket.state() == QLocalSocket.UnconnectedState:
+        # The browser closed while we were talking to it
+        return None
+    # Alive but busy; a second browser would fight it for the socket, so give up instead
+    socket.abort()
+    return False
+
+
+class SingleInstanceServer(QObject):
+    urlsReceived = pyqtSignal(list, bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self.accept_connections)
+        # socket -> bytes received so far
+        self.buffers = {}
+
+    def listen(self):
+        name = server_name()
+        if self.server.listen(name):
+            return True
+        if self.server.serverError() == QAbstractSocket.AddressInUseError:
+            # Only a socket left behind by a browser that crashed may be removed, never a live one
+            probe = QLocalSocket()
+            probe.connectToServer(name)
+            if probe.waitForConnected(CONNECT_TIMEOUT_MS):
+                probe.abort()
+                return False
+            QLocalServer.removeServer(name)
+            return self.server.listen(name)
+        return False
+
+    @pyqtSlot()
+    def accept_connections(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            self.buffers[socket] = b''
+            socket.readyRead.connect(lambda socket=socket: self.read_message(socket))
+            socket.disconnected.connect(lambda socket=socket: self.drop(socket))
+
+    def read_message(self, socket):
+        self.buffers[socket] += bytes(socket.readAll())
+        if b'\n' not in self.buffers[socket]:
+            return
+        line = self.buffers[socket].split(b'\n', 1)[0]
+        try:
+            message = json.loads(line.decode('utf-8'))
+            urls = [str(url) for url in message.get('urls', [])]
+            new_window = bool(message.get('new_window'))
+        except (ValueError, AttributeError):
+            socket.disconnectFromServer()
+            return
+        socket.write(b'ok\n')
+        socket.flush()
+        self.urlsReceived.emit(urls, new_window)
+
+    def drop(self, socket):
+        self.buffers.pop(socket, None)
+        socket.deleteLater()
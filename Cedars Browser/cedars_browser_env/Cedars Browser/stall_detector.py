@@ -0,0 +1,148 @@
+import collections
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+import tracing
+from PyQt5.QtCore import *
+from navigation_timing import LogWriteTask
+
+HEARTBEAT_MS = 50
+# A heartbeat this much later than due counts as a stall
+STALL_THRESHOLD_MS = 100
+# Upper bounds of the stall duration histogram, in ms; longer stalls go in the last bucket
+HISTOGRAM_BOUNDS = (250, 500, 1000, 2500, 5000)
+MAX_SAMPLES = 50
+RECENT_STALLS = 20
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+# Decorators wrap slots in frames of their own; the slot underneath is the one to blame
+WRAPPER_FILES = {os.path.abspath(tracing.__file__)}
+
+
+def frame_name(frame):
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+def offending_slot(frame):
+    # Python frames of a stalled GUI thread hang off app.exec_(); the outermost one after
+    # the script's own module frame is the slot or event handler Qt called into
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    for frame in frames[1:]:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(APP_DIR) and filename not in WRAPPER_FILES:
+            return frame_name(frame)
+    return frame_name(frames[-1]) if frames else None
+
+
+class StallDetector(QObject):
+    # A heartbeat timer runs on the GUI thread and a watchdog thread checks that it keeps
+    # beating. While it is late the watchdog samples the GUI thread's Python stack, so a
+    # freeze can be traced to the slot that caused it.
+    stallDetected = pyqtSignal(dict)
+
+    def __init__(self, log_path, interval_ms=HEARTBEAT_MS, threshold_ms=STALL_THRESHOLD_MS, parent=None):
+        super().__init__(parent)
+        self.log_path = log_path
+        self.interval = interval_ms / 1000
+        self.threshold_ms = threshold_ms
+        self.threshold = threshold_ms / 1000
+        self.gui_thread = threading.get_ident()
+        self.beat = 0
+        self.last_beat = time.monotonic()
+        # Stack samples of the current stall, appended by the watchdog: (beat, slot, stack, top frame)
+        self.samples = []
+        self.stall_count = 0
+        self.longest_ms = 0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.recent = collections.deque(maxlen=RECENT_STALLS)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.heartbeat)
+        self.stopping = threading.Event()
+        self.watchdog = threading.Thread(target=self.watch, name='stall-watchdog', daemon=True)
+
+    def start(self):
+        self.last_beat = time.monotonic()
+        self.timer.start()
+        self.watchdog.start()
+
+    def stop(self):
+        self.timer.stop()
+        self.stopping.set()
+
+    def watch(self):
+        # Wakes often enough to catch a stall while it is still happening
+        while not self.stopping.wait(self.threshold / 2):
+            beat, last_beat = self.beat, self.last_beat
+            if time.monotonic() - last_beat < self.interval + self.threshold or len(self.samples) >= MAX_SAMPLES:
+                continue
+            frame = sys._current_frames().get(self.gui_thread)
+            if frame is None:
+                continue
+            self.samples.append((beat, offending_slot(frame), traceback.format_stack(frame), frame_name(frame)))
+            del frame
+
+    @pyqtSlot()
+    def heartbeat(self):
+        now = time.monotonic()
+        lag = now - self.last_beat - self.interval
+        beat = self.beat
+        self.beat += 1
+        self.last_beat = now
+        samples, self.samples = self.samples, []
+        if lag < self.threshold:
+            return
+        # Samples taken before this beat belong to this stall
+        samples = [sample for sample in samples if sample[0] == beat]
+        self.record(round(lag * 1000, 1), samples)
+
+    def record(self, duration_ms, samples):
+        self.stall_count += 1
+        self.longest_ms = max(self.longest_ms, duration_ms)
+        bucket = 0
+        while bucket < len(HISTOGRAM_BOUNDS) and duration_ms > HISTOGRAM_BOUNDS[bucket]:
+            bucket += 1
+        self.histogram[bucket] += 1
+        stall = {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'duration_ms': duration_ms,
+            'slot': samples[0][1] if samples else None,
+            'samples': len(samples),
+            # Where the GUI thread was found, most often first
+            'hot_frames': collections.Counter(sample[3] for sample in samples).most_common(5),
+            'stack': ''.join(samples[0][2]) if samples else None,
+        }
+        self.recent.append(stall)
+        if tracing.enabled:
+            tracing.complete('gui_stall', 'stall', tracing.now_us() - int(duration_ms * 1000),
+                             {'slot': stall['slot']})
+        self.pool.start(LogWriteTask(self.log_path, json.dumps(stall)))
+        self.stallDetected.emit(stall)
+
+    def histogram_rows(self):
+        # [(label, count)] for the metrics pages
+        rows = []
+        lower = self.threshold_ms
+        for bound, count in zip(HISTOGRAM_BOUNDS, self.histogram):
+            rows.append((f"{lower}-{bound} ms", count))
+            lower = bound
+        rows.append((f"over {HISTOGRAM_BOUNDS[-1]} ms", self.histogram[-1]))
+        return rows
+
+    def summary(self):
+        if not self.stall_count:
+            return "none"
+        slots = collections.Counter(stall['slot'] for stall in self.recent if stall['slot'])
+        worst = f", mostly in {slots.most_common(1)[0][0]}" if slots else ""
+        return f"{self.stall_count}, longest {self.longest_ms:.0f} ms{worst}"
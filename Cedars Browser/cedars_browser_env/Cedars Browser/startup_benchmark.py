@@ -0,0 +1,142 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Each run is a fresh process so imports and Qt initialisation are measured cold
+DEFAULT_RUNS = 5
+LOAD_TIMEOUT_MS = 30000
+
+TEST_PAGE = b"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Startup benchmark</title></head>
+<body><h1>Startup benchmark</h1><p>Served from the local benchmark server.</p></body></html>
+"""
+
+
+class TestPageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(TEST_PAGE)))
+        self.end_headers()
+        self.wfile.write(TEST_PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_child(url):
+    # Runs inside the benchmarked process; prints one JSON object with phase durations in ms
+    phases = []
+    start = last = time.perf_counter()
+
+    def mark(name):
+        nonlocal last
+        now = time.perf_counter()
+        phases.append((name, (now - last) * 1000))
+        last = now
+
+    import PyQt5.QtWebEngineWidgets
+    mark('import_webengine')
+    from PyQt5.QtCore import QEvent, QObject, QStandardPaths, QTimer, Qt
+    from PyQt5.QtWidgets import QApplication
+    import Cedars_Browser
+    mark('import_app')
+
+    # Keeps benchmark runs out of the real profile's history and caches
+    QStandardPaths.setTestModeEnabled(True)
+    Cedars_Browser.register_schemes()
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+    app = QApplication(sys.argv[:1])
+    QApplication.setApplicationName('Cedars Browser')
+    mark('qapplication')
+
+    window_start = time.perf_counter()
+    window = Cedars_Browser.MainWindow(url, phase=lambda name: mark('main_window.' + name))
+    window.show()
+    phases.append(('main_window', (time.perf_counter() - window_start) * 1000))
+    last = time.perf_counter()
+
+    result = {'load_ok': None}
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                app.removeEventFilter(self)
+                mark('first_paint')
+            return False
+
+    def load_finished(ok):
+        if result['load_ok'] is None:
+            result['load_ok'] = ok
+            mark('first_load_finished')
+            app.quit()
+
+    first_paint = FirstPaint()
+    app.installEventFilter(first_paint)
+    window.browser.loadFinished.connect(load_finished)
+    QTimer.singleShot(LOAD_TIMEOUT_MS, app.quit)
+    app.exec_()
+
+    result['phases_ms'] = {name: round(duration, 2) for name, duration in phases}
+    result['total_ms'] = round((last - start) * 1000, 2)
+    print(json.dumps(result))
+
+
+def run_benchmark(runs, script):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), TestPageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+
+    results = []
+    try:
+        for _ in range(runs):
+            output = subprocess.run([sys.executable, script, '--child', url], env=env,
+                                    stdout=subprocess.PIPE, check=True, text=True).stdout
+            # Qt may write its own diagnostics to stdout; the result is the last line
+            results.append(json.loads(output.strip().splitlines()[-1]))
+    finally:
+        server.shutdown()
+
+    names = []
+    for result in results:
+        for name in result['phases_ms']:
+            if name not in names:
+                names.append(name)
+    median = {name: round(statistics.median(result['phases_ms'][name] for result in results
+                                            if name in result['phases_ms']), 2)
+              for name in names}
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'runs': results,
+        'median_ms': median,
+        'median_total_ms': round(statistics.median(result['total_ms'] for result in results), 2),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure Cedars Browser startup, phase by phase.")
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    parser.add_argument('--child', metavar='URL', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child)
+        sys.exit(0)
+
+    report = run_benchmark(args.runs, os.path.abspath(__file__))
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
@@ -0,0 +1,93 @@
+import time
+from PyQt5.QtCore import *
+from PyQt5.QtWebEngineWidgets import QWebEnginePage
+
+# Background tabs are frozen after this long without being shown
+FREEZE_AFTER_MS = 5 * 60 * 1000
+CHECK_INTERVAL_MS = 15 * 1000
+# Discard background tabs once less than this fraction of system memory is available
+MEMORY_PRESSURE_RATIO = 0.15
+# How many tabs to discard per check while under pressure
+PRESSURE_DISCARD_BATCH = 3
+
+
+def available_memory_ratio():
+    # /proc/meminfo only exists on Linux; elsewhere we never report pressure
+    try:
+        with open('/proc/meminfo') as meminfo:
+            fields = dict(line.split(':', 1) for line in meminfo)
+        total = int(fields['MemTotal'].split()[0])
+        available = int(fields['MemAvailable'].split()[0])
+    except (OSError, KeyError, ValueError):
+        return None
+    return available / total if total else None
+
+
+class TabLifecycleManager(QObject):
+    def __init__(self, parent=None, freeze_after_ms=FREEZE_AFTER_MS,
+                 pressure_ratio=MEMORY_PRESSURE_RATIO):
+        super().__init__(parent)
+        self.freeze_after_ms = freeze_after_ms
+        self.pressure_ratio = pressure_ratio
+        # page -> monotonic time it was last in the foreground
+        self.last_active = {}
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(CHECK_INTERVAL_MS)
+        self.timer.timeout.connect(self.check)
+        self.timer.start()
+
+    def track(self, page):
+        self.last_active[page] = time.monotonic()
+
+    def untrack(self, page):
+        self.last_active.pop(page, None)
+
+    def activate(self, page):
+        # Frozen pages resume and discarded pages reload when set back to Active
+        if page.lifecycleState() != QWebEnginePage.Active:
+            page.setLifecycleState(QWebEnginePage.Active)
+        self.last_active[page] = time.monotonic()
+
+    def deactivate(self, page):
+        if page in self.last_active:
+            self.last_active[page] = time.monotonic()
+
+    def background_pages(self):
+        # Least recently used first
+        pages = [page for page in self.last_active if self.can_suspend(page)]
+        return sorted(pages, key=self.last_active.get)
+
+    def can_suspend(self, page):
+        # Qt refuses to freeze or discard a visible page; keep audible tabs playing
+        return not page.isVisible() and not page.recentlyAudible()
+
+    def freeze(self, page):
+        if page.lifecycleState() == QWebEnginePage.Active and self.can_suspend(page):
+            page.setLifecycleState(QWebEnginePage.Frozen)
+
+    def discard(self, page):
+        if page.lifecycleState() != QWebEnginePage.Discarded and self.can_suspend(page):
+            page.setLifecycleState(QWebEnginePage.Discarded)
+            return True
+        return False
+
+    def discard_lru(self, count=1):
+        discarded = 0
+        for page in self.background_pages():
+            if discarded >= count:
+                break
+            if self.discard(page):
+                discarded += 1
+        return discarded
+
+    @pyqtSlot()
+    def check(self):
+        ratio = available_memory_ratio()
+        if ratio is not None and ratio < self.pressure_ratio:
+            self.discard_lru(PRESSURE_DISCARD_BATCH)
+
+        idle_before = time.monotonic() - self.freeze_after_ms / 1000
+        for page in self.background_pages():
+            if self.last_active[page] <= idle_before:
+                self.freeze(page)
@@ -0,0 +1,123 @@
+import os
+import pickle
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from content_blocker import (AhoCorasick, FilterEngine, anchored_host, base_domain, literal_keyword,
+                             parse_filter, pattern_to_regex)
+
+
+def engine(*lines):
+    return FilterEngine(lines)
+
+
+class ParseFilterTest(unittest.TestCase):
+    def test_skips_comments_cosmetic_and_unsupported_rules(self):
+        for line in ('', '! comment', '[Adblock Plus 2.0]', 'example.com##.ad', 'example.com#@#.ad',
+                     '/banner[0-9]+/', '||example.com^$popup', '||example.com^$redirect=noop.js'):
+            self.assertIsNone(parse_filter(line), line)
+
+    def test_exception_and_options(self):
+        rule, exception = parse_filter('@@||cdn.example.com^$script,~third-party,domain=a.com|~b.a.com')
+        self.assertTrue(exception)
+        self.assertEqual(rule.pattern, '||cdn.example.com^')
+        self.assertEqual(rule.types, {'script'})
+        self.assertIs(rule.third_party, False)
+        self.assertEqual(rule.domains, ('a.com',))
+        self.assertEqual(rule.excluded_domains, ('b.a.com',))
+
+    def test_type_aliases_and_negated_types(self):
+        rule, exception = parse_filter('/ads/banner$xhr,~css')
+        self.assertFalse(exception)
+        self.assertEqual(rule.types, {'xmlhttprequest'})
+        self.assertEqual(rule.excluded_types, {'stylesheet'})
+
+    def test_pattern_is_lowered_unless_match_case(self):
+        self.assertEqual(parse_filter('/Ads/Banner')[0].pattern, '/ads/banner')
+        self.assertEqual(parse_filter('/Ads/Banner$match-case')[0].pattern, '/Ads/Banner')
+
+
+class PatternTest(unittest.TestCase):
+    def test_pattern_to_regex(self):
+        self.assertEqual(pattern_to_regex('|https://a.b/x|'), r'^https://a\.b/x$')
+        self.assertIn('.*', pattern_to_regex('/ads/*/banner'))
+
+    def test_anchored_host(self):
+        self.assertEqual(anchored_host('||ads.example.com^'), ('ads.example.com', '^'))
+        self.assertEqual(anchored_host('||ads.example.com/path'), ('ads.example.com', '/path'))
+        self.assertEqual(anchored_host('||ads.example*'), (None, None))
+        self.assertEqual(anchored_host('/ads/'), (None, None))
+
+    def test_literal_keyword(self):
+        self.assertEqual(literal_keyword('/advert*/banner^'), '/advert')
+        self.assertIsNone(literal_keyword('*/a^'))
+
+    def test_base_domain(self):
+        self.assertEqual(base_domain('www.example.com'), 'example.com')
+        self.assertEqual(base_domain('news.bbc.co.uk'), 'bbc.co.uk')
+
+    def test_aho_corasick_finds_overlapping_keywords(self):
+        automaton = AhoCorasick(['ads', 'adserver', 'server'])
+        self.assertEqual(automaton.search('http://adserver.net/'), {'ads', 'adserver', 'server'})
+        self.assertEqual(automaton.search('http://example.com/'), set())
+
+
+class FilterEngineTest(unittest.TestCase):
+    def test_host_anchored_rule_matches_subdomains_only(self):
+        rules = engine('||ads.example.com^')
+        self.assertTrue(rules.should_block('https://ads.example.com/x.js', 'ads.example.com', 'script'))
+        self.assertTrue(rules.should_block('https://a.ads.example.com/', 'a.ads.example.com', 'image'))
+        self.assertFalse(rules.should_block('https://notads.example.com/', 'notads.example.com', 'image'))
+
+    def test_keyword_rule(self):
+        rules = engine('/banner/*.gif')
+        self.assertTrue(rules.should_block('https://a.com/banner/top.gif', 'a.com', 'image'))
+        self.assertFalse(rules.should_block('https://a.com/banner/top.png', 'a.com', 'image'))
+
+    def test_third_party_and_type_options(self):
+        rules = engine('||tracker.net^$third-party,script')
+        url = 'https://tracker.net/t.js'
+        self.assertTrue(rules.should_block(url, 'tracker.net', 'script', 'news.com'))
+        self.assertFalse(rules.should_block(url, 'tracker.net', 'script', 'www.tracker.net'))
+        self.assertFalse(rules.should_block(url, 'tracker.net', 'image', 'news.com'))
+
+    def test_domain_option(self):
+        rules = engine('/promo.$domain=shop.com|~help.shop.com')
+        url = 'https://cdn.net/promo.js'
+        self.assertTrue(rules.should_block(url, 'cdn.net', 'script', 'www.shop.com'))
+        self.assertFalse(rules.should_block(url, 'cdn.net', 'script', 'help.shop.com'))
+        self.assertFalse(rules.should_block(url, 'cdn.net', 'script', 'other.com'))
+
+    def test_exception_rule(self):
+        rules = engine('||ads.example.com^', '@@||ads.example.com/allowed/')
+        self.assertTrue(rules.should_block('https://ads.example.com/x', 'ads.example.com', 'image'))
+        self.assertFalse(rules.should_block('https://ads.example.com/allowed/x', 'ads.example.com', 'image'))
+
+    def test_document_exception_allows_every_request_of_the_page(self):
+        rules = engine('||ads.example.com^', '@@||trusted.org^$document')
+        url = 'https://ads.example.com/x.js'
+        self.assertFalse(rules.should_block(url, 'ads.example.com', 'script', 'www.trusted.org',
+                                            'https://www.trusted.org/page'))
+        self.assertTrue(rules.should_block(url, 'ads.example.com', 'script', 'news.com', 'https://news.com/'))
+
+    def test_document_exception_with_other_types_keeps_both(self):
+        rules = engine('||cdn.net^', '@@||cdn.net^$document,script')
+        self.assertFalse(rules.should_block('https://cdn.net/a.js', 'cdn.net', 'script', 'news.com',
+                                            'https://news.com/'))
+        self.assertFalse(rules.should_block('https://cdn.net/a.png', 'cdn.net', 'image', 'cdn.net',
+                                            'https://cdn.net/'))
+        self.assertTrue(rules.should_block('https://cdn.net/a.png', 'cdn.net', 'image', 'news.com',
+                                           'https://news.com/'))
+
+    def test_survives_pickling(self):
+        rules = pickle.loads(pickle.dumps(engine('/banner/*.gif$match-case', '@@||ok.org^$document')))
+        self.assertTrue(rules.should_block('https://a.com/banner/x.gif', 'a.com', 'image'))
+        self.assertFalse(rules.should_block('https://a.com/BANNER/x.gif', 'a.com', 'image'))
+        self.assertFalse(rules.should_block('https://a.com/banner/x.gif', 'a.com', 'image', 'ok.org',
+                                            'https://ok.org/'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Spans recorded on the Python side, exported in Chrome's trace-event format so they can
+# be loaded into chrome://tracing or Perfetto next to a Chromium trace. Timestamps come
+# from the same monotonic clock Chromium uses, so both line up on one timeline.
+RING_SIZE = 100000
+
+# Set CEDARS_TRACE=1 to record from startup; otherwise toggled from the options menu
+enabled = bool(os.environ.get('CEDARS_TRACE'))
+# deque.append with a maxlen is atomic, so every thread records without taking a lock;
+# the oldest events fall off once the ring is full
+events = deque(maxlen=RING_SIZE)
+# thread id -> name, kept so threads that have since exited are still labelled
+thread_names = {}
+
+
+def now_us():
+    return time.monotonic_ns() // 1000
+
+
+def enable(on=True):
+    global enabled
+    enabled = on
+
+
+def complete(name, category, start_us, args=None):
+    # Records a span that started at start_us (from now_us) and ends now
+    tid = threading.get_ident()
+    if tid not in thread_names:
+        thread_names[tid] = threading.current_thread().name
+    events.append((name, category, start_us, now_us() - start_us, tid, args))
+
+
+class span:
+    __slots__ = ('name', 'category', 'args', 'start')
+
+    def __init__(self, name, category='browser', args=None):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        if enabled:
+            self.start = now_us()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.start is not None:
+            complete(self.name, self.category, self.start, self.args)
+
+
+def traced(category='browser'):
+    # Decorator; while tracing is off the only cost is one global lookup per call
+    def decorate(function):
+        name = function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return function(*args, **kwargs)
+            start = now_us()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                complete(name, category, start)
+        return wrapper
+    return decorate
+
+
+def trace_events():
+    pid = os.getpid()
+    result = []
+    seen_threads = set()
+    for name, category, start, duration, tid, args in list(events):
+        if tid not in seen_threads:
+            seen_threads.add(tid)
+            result.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                           'args': {'name': thread_names.get(tid, f'thread {tid}')}})
+        event = {'name': name, 'cat': category, 'ph': 'X', 'ts': start, 'dur': duration, 'pid': pid, 'tid': tid}
+        if args:
+            event['args'] = args
+        result.append(event)
+    result.insert(0, {'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                      'args': {'name': 'Cedars Browser (Python)'}})
+    return result
+
+
+def dump(path):
+    with open(path, 'w', encoding='utf-8') as output:
+        json.dump({'traceEvents': trace_events(), 'displayTimeUnit': 'ms'}, output)
+    return path